@@ -0,0 +1,211 @@
+"""
+Ekstraksi arsip .zip berisi banyak dokumen anjab/ABK (kiriman unit kerja) tanpa unzip ke disk.
+
+- Anggota dibaca langsung dari arsip ke memori (bytes), lalu diekstrak di process pool
+  dengan paralelisme terbatas; jumlah anggota yang sedang diproses dibatasi 2x --proses
+  agar memori tetap terbatas.
+- Hasil per anggota di-stream sebagai NDJSON (satu baris JSON per anggota) ke stdout
+  begitu selesai, urutan = urutan selesai:
+    {"anggota": "unit/a.docx", "status": "ok", "jenis": "anjab", "data": {...}}
+    {"anggota": "unit/b.doc", "status": "gagal", "error": "..."}
+    {"anggota": "foto.jpg", "status": "dilewati", "alasan": "bukan dokumen .doc/.docx"}
+  Baris terakhir: {"selesai": true, "ok": n, "gagal": n, "dilewati": n, "detik": x}
+- Batas: jumlah anggota, ukuran tak terkompresi per anggota dan total (dicek dari header
+  zip lalu ditegakkan lagi saat membaca, untuk arsip yang header-nya berbohong).
+- Jenis (anjab/ABK) per anggota ditentukan probe_identitas.py. .doc (kecuali yang
+  terbaca native dengan ANJAB_DOC_READER=native) ditulis sementara ke ruang kerja untuk konversi LibreOffice.
+
+Contoh:
+    python scripts/arsip_zip.py kiriman.zip --proses 4 > hasil.ndjson
+    python scripts/ekstrakanjab.py kiriman.zip          # sama, lewat extractor
+"""
+import io
+import os
+import sys
+import json
+import time
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+EKSTENSI_DOKUMEN = (".doc", ".docx")
+MAKS_ANGGOTA = 200
+MAKS_MB_ANGGOTA = 64
+MAKS_MB_TOTAL = 512
+
+
+class ArsipDitolak(ValueError):
+    pass
+
+# -------------------- WORKER --------------------
+
+def _baca_doc_bytes(nama, data):
+    """Document dari bytes .doc: pembaca native (bila diaktifkan), else LibreOffice lewat file sementara."""
+    from bacadoc import dokumen_dari_doc, DocTidakDidukung, pembaca_native
+    if pembaca_native():
+        try:
+            return dokumen_dari_doc(data)
+        except DocTidakDidukung:
+            pass
+    import ruang_kerja
+    from ekstrakanjab import read_doc
+    with ruang_kerja.direktori("zip_") as d:
+        path = os.path.join(d, os.path.basename(nama) or "anggota.doc")
+        with open(path, "wb") as fh:
+            fh.write(data)
+        return read_doc(path)[0]
+
+def proses_anggota(nama, data):
+    """Dijalankan di process pool. return (jenis, data hasil); exception = gagal."""
+    from probe_identitas import probe
+    try:
+        jenis = probe(nama, data)["jenis"]
+    except Exception:
+        jenis = "unknown"  # biar extractor penuh yang menentukan
+    if jenis == "abk":
+        from ekstrakabk import extract_docx
+        return "abk", extract_docx(io.BytesIO(data))
+    import ekstrakanjab
+    from bacaformat import tebak_format, dokumen_dari_format
+    fmt = tebak_format(data)  # dari isi, bukan ekstensi anggota
+    if fmt == "docx" or (fmt != "ole" and nama.lower().endswith(".docx")):
+        from docx import Document
+        doc = Document(io.BytesIO(data))
+    elif fmt in ("rtf", "html", "mht"):
+        doc = dokumen_dari_format(data, fmt)
+    else:
+        doc = _baca_doc_bytes(nama, data)
+    return "anjab", ekstrakanjab.extract_from_doc(doc, ekstrakanjab.doc_lines(doc), os.path.basename(nama))
+
+# -------------------- ARSIP --------------------
+
+def _layak(nama):
+    dasar = os.path.basename(nama)
+    return (nama.lower().endswith(EKSTENSI_DOKUMEN) and not dasar.startswith(("~$", "."))
+            and not nama.startswith("__MACOSX/"))
+
+def daftar_anggota(zf, maks_anggota, maks_byte_anggota, maks_byte_total):
+    """return (list ZipInfo yang diproses, list baris "dilewati"). Raise ArsipDitolak."""
+    proses, lewati, total = [], [], 0
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        if not _layak(info.filename):
+            lewati.append({"anggota": info.filename, "status": "dilewati", "alasan": "bukan dokumen .doc/.docx"})
+            continue
+        if info.flag_bits & 0x1:
+            lewati.append({"anggota": info.filename, "status": "dilewati", "alasan": "anggota terenkripsi"})
+            continue
+        if info.file_size > maks_byte_anggota:
+            lewati.append({"anggota": info.filename, "status": "dilewati",
+                           "alasan": f"ukuran melebihi {maks_byte_anggota // (1024 * 1024)} MB"})
+            continue
+        proses.append(info)
+        total += info.file_size
+    if len(proses) > maks_anggota:
+        raise ArsipDitolak(f"Arsip berisi {len(proses)} dokumen, maksimal {maks_anggota}")
+    if total > maks_byte_total:
+        raise ArsipDitolak(f"Total ukuran dokumen {total // (1024 * 1024)} MB melebihi {maks_byte_total // (1024 * 1024)} MB")
+    return proses, lewati
+
+def baca_anggota(zf, info, batas):
+    """Baca isi anggota dengan batas byte aktual (tidak percaya header)."""
+    buf = io.BytesIO()
+    with zf.open(info) as fh:
+        for potong in iter(lambda: fh.read(1 << 20), b""):
+            if buf.tell() + len(potong) > batas:
+                raise ArsipDitolak("Ukuran tak terkompresi melebihi batas (header zip tidak konsisten)")
+            buf.write(potong)
+    return buf.getvalue()
+
+def ekstrak_arsip(path, proses=1, maks_anggota=MAKS_ANGGOTA, maks_mb_anggota=MAKS_MB_ANGGOTA,
+                  maks_mb_total=MAKS_MB_TOTAL):
+    """Generator baris hasil per anggota (dict), berurutan sesuai selesai. Raise ArsipDitolak."""
+    maks_byte_anggota = int(maks_mb_anggota * 1024 * 1024)
+    sisa_total = int(maks_mb_total * 1024 * 1024)
+    try:
+        zf = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise ArsipDitolak(f"Arsip zip tidak valid: {e}")
+    with zf:
+        anggota, lewati = daftar_anggota(zf, maks_anggota, maks_byte_anggota, sisa_total)
+        yield from lewati
+
+        def muat(info):
+            nonlocal sisa_total
+            data = baca_anggota(zf, info, min(maks_byte_anggota, sisa_total))
+            sisa_total -= len(data)
+            return data
+
+        def hasil_ok(info, jenis, data):
+            return {"anggota": info.filename, "status": "ok", "jenis": jenis, "data": data}
+
+        def hasil_gagal(info, e):
+            return {"anggota": info.filename, "status": "gagal", "error": str(e)}
+
+        if proses <= 1:
+            for info in anggota:
+                try:
+                    yield hasil_ok(info, *proses_anggota(info.filename, muat(info)))
+                except Exception as e:
+                    yield hasil_gagal(info, e)
+            return
+
+        antre = iter(anggota)
+        with ProcessPoolExecutor(max_workers=proses) as pool:
+            jalan = {}
+            while True:
+                # isi pool sampai 2x proses; bytes anggota yang sedang menunggu ikut dibatasi
+                while len(jalan) < proses * 2:
+                    info = next(antre, None)
+                    if info is None:
+                        break
+                    try:
+                        data = muat(info)
+                    except Exception as e:  # batas ukuran, CRC rusak, deflate rusak (BadZipFile/zlib.error)
+                        yield hasil_gagal(info, e)
+                        continue
+                    jalan[pool.submit(proses_anggota, info.filename, data)] = info
+                if not jalan:
+                    break
+                selesai, _ = wait(jalan, return_when=FIRST_COMPLETED)
+                for fut in selesai:
+                    info = jalan.pop(fut)
+                    try:
+                        yield hasil_ok(info, *fut.result())
+                    except Exception as e:
+                        yield hasil_gagal(info, e)
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Ekstraksi arsip .zip berisi dokumen anjab/ABK (output NDJSON).")
+    ap.add_argument("arsip")
+    ap.add_argument("--proses", type=int, default=os.cpu_count() or 1, help="jumlah proses ekstraksi paralel")
+    ap.add_argument("--maks-anggota", type=int, default=MAKS_ANGGOTA, help="jumlah dokumen maksimal")
+    ap.add_argument("--maks-mb-anggota", type=float, default=MAKS_MB_ANGGOTA, help="ukuran tak terkompresi maks per dokumen")
+    ap.add_argument("--maks-mb", type=float, default=MAKS_MB_TOTAL, help="total ukuran tak terkompresi maks")
+    args = ap.parse_args(sys.argv[1:] if argv is None else argv)
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+
+    t0 = time.perf_counter()
+    hitung = {"ok": 0, "gagal": 0, "dilewati": 0}
+    try:
+        for baris in ekstrak_arsip(args.arsip, args.proses, args.maks_anggota, args.maks_mb_anggota, args.maks_mb):
+            hitung[baris["status"]] += 1
+            sys.stdout.write(json.dumps(baris, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    except (ArsipDitolak, OSError) as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        return 1
+    print(json.dumps(dict(selesai=True, detik=round(time.perf_counter() - t0, 3), **hitung), ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,953 @@
+"""
+Pembaca native .doc (Word 97-2003, format biner) tanpa LibreOffice.
+
+Alur:
+  OLE2/CFB -> stream WordDocument + 0Table/1Table (+ Data)
+  -> FIB -> piece table (CLX) -> teks dokumen utama
+  -> properti paragraf (PlcfBtePapx/FKP): tabel (fInTable/fTtp/itap), list (ilfo/ilvl), indent
+  -> definisi list (PlfLst/PlfLfo)
+  -> python-docx Document yang dibangun di memori.
+
+Hasil akhirnya objek Document biasa, jadi semua extractor di ekstrakanjab.py
+(doc.tables, cell.paragraphs, numPr/numbering_part, paragraph_format, iter_block_items)
+berjalan tanpa perubahan, sama seperti dokumen hasil konversi LibreOffice.
+
+Dokumen yang tidak bisa ditangani (terenkripsi, format pra-Word 97, struktur rusak)
+memunculkan DocTidakDidukung; pemanggil sebaiknya fallback ke LibreOffice.
+Numbering/indent yang diwarisi dari style dan properti piece (fast-save) tidak
+dibangun ulang: dokumen yang memakainya juga memunculkan DocTidakDidukung, bukan
+menghasilkan klasifikasi paragraf yang diam-diam berbeda.
+
+Jalur ini opt-in (ANJAB_DOC_READER=native, lihat pembaca_native); default tetap
+LibreOffice sampai banding_ekstraktor.py menunjukkan kesetaraan pada arsip .doc asli:
+    python scripts/banding_ekstraktor.py bacadoc:extract_info_native arsip_doc/
+"""
+import os
+import re
+import struct
+from bisect import bisect_right
+
+OLE_SIGNATURE = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+ENDOFCHAIN = 0xFFFFFFFE
+MAXREGSECT = 0xFFFFFFFA
+
+
+class DocTidakDidukung(Exception):
+    """Dokumen tidak bisa dibaca native; pemanggil sebaiknya fallback ke LibreOffice."""
+
+
+def pembaca_native() -> bool:
+    """True bila .doc boleh dibaca native (ANJAB_DOC_READER=native); default LibreOffice."""
+    return os.environ.get("ANJAB_DOC_READER", "libreoffice").strip().lower() == "native"
+
+
+# -------------------- OLE2 / CFB --------------------
+
+class _Cfb:
+    """Pembaca minimal Compound File Binary (hanya baca stream berdasarkan nama)."""
+
+    def __init__(self, data: bytes):
+        if len(data) < 512 or data[:8] != OLE_SIGNATURE:
+            raise DocTidakDidukung("Bukan file OLE2/CFB")
+        self.data = data
+        major = struct.unpack_from("<H", data, 0x1A)[0]
+        sector_shift, mini_shift = struct.unpack_from("<HH", data, 0x1E)
+        if sector_shift not in (9, 12):
+            raise DocTidakDidukung("Ukuran sektor CFB tidak valid")
+        self.ssz = 1 << sector_shift
+        self.mini_ssz = 1 << mini_shift
+        (_n_fat, first_dir, _sig, self.mini_cutoff,
+         first_minifat, _n_minifat, first_difat, n_difat) = struct.unpack_from("<8I", data, 0x2C)
+
+        # DIFAT: 109 entri di header + rantai sektor DIFAT
+        difat = list(struct.unpack_from("<109I", data, 0x4C))
+        per_sektor = self.ssz // 4 - 1
+        sid = first_difat
+        for _ in range(n_difat):
+            if sid > MAXREGSECT:
+                break
+            vals = struct.unpack_from(f"<{per_sektor + 1}I", self._sektor(sid))
+            difat.extend(vals[:per_sektor])
+            sid = vals[per_sektor]
+
+        fat_bytes = b"".join(self._sektor(s) for s in difat if s <= MAXREGSECT)
+        self.fat = struct.unpack(f"<{len(fat_bytes) // 4}I", fat_bytes)
+
+        # Directory
+        dir_bytes = self._baca_rantai(first_dir, self.fat, self._sektor)
+        self.entries = {}
+        root = None
+        for off in range(0, len(dir_bytes) - 127, 128):
+            name_len = struct.unpack_from("<H", dir_bytes, off + 0x40)[0]
+            tipe = dir_bytes[off + 0x42]
+            if tipe not in (1, 2, 5) or name_len < 2 or name_len > 64:
+                continue
+            name = dir_bytes[off:off + name_len - 2].decode("utf-16-le", "replace")
+            start, size = struct.unpack_from("<IQ", dir_bytes, off + 0x74)
+            if major == 3:
+                size &= 0xFFFFFFFF
+            if tipe == 5:
+                root = (start, size)
+            elif tipe == 2:
+                self.entries.setdefault(name.lower(), (start, size))
+
+        self._mini_stream = None
+        self._minifat = None
+        self._root = root
+        self._first_minifat = first_minifat
+
+    def _sektor(self, sid: int) -> bytes:
+        off = (sid + 1) * self.ssz
+        if off >= len(self.data):
+            raise DocTidakDidukung("Sektor CFB di luar file")
+        return self.data[off:off + self.ssz]
+
+    @staticmethod
+    def _baca_rantai(start, fat, baca_sektor, size=None) -> bytes:
+        chunks, sid, guard = [], start, 0
+        while sid <= MAXREGSECT and sid != ENDOFCHAIN:
+            if sid >= len(fat) or guard > len(fat):
+                raise DocTidakDidukung("Rantai sektor CFB rusak")
+            chunks.append(baca_sektor(sid))
+            sid = fat[sid]
+            guard += 1
+        out = b"".join(chunks)
+        return out if size is None else out[:size]
+
+    def _mini_sektor(self, sid: int) -> bytes:
+        off = sid * self.mini_ssz
+        return self._mini_stream[off:off + self.mini_ssz]
+
+    def ada(self, name: str) -> bool:
+        return name.lower() in self.entries
+
+    def stream(self, name: str) -> bytes:
+        ent = self.entries.get(name.lower())
+        if ent is None:
+            raise DocTidakDidukung(f"Stream '{name}' tidak ada")
+        start, size = ent
+        if size < self.mini_cutoff:
+            if self._mini_stream is None:
+                if self._root is None:
+                    raise DocTidakDidukung("Root entry CFB tidak ada")
+                self._mini_stream = self._baca_rantai(self._root[0], self.fat, self._sektor, self._root[1])
+                mf = self._baca_rantai(self._first_minifat, self.fat, self._sektor)
+                self._minifat = struct.unpack(f"<{len(mf) // 4}I", mf)
+            return self._baca_rantai(start, self._minifat, self._mini_sektor, size)
+        return self._baca_rantai(start, self.fat, self._sektor, size)
+
+
+# -------------------- SPRM --------------------
+
+SPRM_P_ILVL = 0x260A
+SPRM_P_ILFO = 0x460B
+SPRM_P_FINTABLE = 0x2416
+SPRM_P_FTTP = 0x2417
+SPRM_P_ITAP = 0x6649
+SPRM_P_FINNERTABLECELL = 0x244B
+SPRM_P_FINNERTTP = 0x244C
+SPRM_P_DXALEFT80 = 0x840F
+SPRM_P_DXALEFT = 0x845E
+SPRM_P_DXALEFT1_80 = 0x8411
+SPRM_P_DXALEFT1 = 0x8460
+SPRM_P_HUGEPAPX = 0x6646
+SPRM_T_DEFTABLE = 0xD608
+SPRM_P_CHGTABS = 0xC615
+
+_UKURAN_SPRA = {0: 1, 1: 1, 2: 2, 3: 4, 4: 2, 5: 2, 7: 3}
+
+
+def _iter_sprm(grpprl: bytes):
+    """Generate (sprm, operand) dari grpprl (operand variabel: tanpa byte ukuran)."""
+    i, n = 0, len(grpprl)
+    while i + 2 <= n:
+        sprm = struct.unpack_from("<H", grpprl, i)[0]
+        i += 2
+        spra = sprm >> 13
+        if spra != 6:
+            size = _UKURAN_SPRA[spra]
+            yield sprm, grpprl[i:i + size]
+            i += size
+            continue
+        if sprm == SPRM_T_DEFTABLE:
+            if i + 2 > n:
+                return
+            cb = struct.unpack_from("<H", grpprl, i)[0]
+            yield sprm, grpprl[i + 2:i + 1 + cb]
+            i += cb + 1
+            continue
+        if i >= n:
+            return
+        cb = grpprl[i]
+        if sprm == SPRM_P_CHGTABS and cb == 255 and i + 2 <= n:
+            n_del = grpprl[i + 1]
+            j = i + 2 + n_del * 4
+            n_add = grpprl[j] if j < n else 0
+            size = 1 + 1 + n_del * 4 + 1 + n_add * 3
+            i += size
+            continue
+        yield sprm, grpprl[i + 1:i + 1 + cb]
+        i += 1 + cb
+
+
+def _i16(b: bytes) -> int:
+    return struct.unpack_from("<h", b)[0] if len(b) >= 2 else 0
+
+
+def _parse_tdef(op: bytes):
+    """sprmTDefTable -> (batas_kolom[], [(horz_merge, vert_merge), ...])."""
+    if not op:
+        return None
+    n = op[0]
+    need = 1 + 2 * (n + 1)
+    if len(op) < need:
+        return None
+    centers = list(struct.unpack_from(f"<{n + 1}h", op, 1))
+    merges = []
+    for k in range(n):
+        off = need + 20 * k
+        if off + 2 <= len(op):
+            grf = struct.unpack_from("<H", op, off)[0]
+            merges.append((grf & 0x3, (grf >> 5) & 0x3))
+        else:
+            merges.append((0, 0))
+    return centers, merges
+
+
+def _props_papx(grpprl: bytes, data_stream: bytes):
+    props = {}
+    for sprm, op in _iter_sprm(grpprl):
+        if sprm == SPRM_P_HUGEPAPX and len(op) >= 4 and data_stream:
+            fc = struct.unpack_from("<I", op)[0]
+            if fc + 2 <= len(data_stream):
+                cb = struct.unpack_from("<H", data_stream, fc)[0]
+                props.update(_props_papx(data_stream[fc + 2:fc + 2 + cb], b""))
+        elif sprm == SPRM_P_FINTABLE:
+            props["in_table"] = bool(op[0]) if op else False
+        elif sprm == SPRM_P_FTTP:
+            props["ttp"] = bool(op[0]) if op else False
+        elif sprm == SPRM_P_ITAP:
+            props["itap"] = struct.unpack_from("<i", op)[0] if len(op) == 4 else 0
+        elif sprm == SPRM_P_FINNERTABLECELL:
+            props["inner_cell"] = bool(op[0]) if op else False
+        elif sprm == SPRM_P_FINNERTTP:
+            props["inner_ttp"] = bool(op[0]) if op else False
+        elif sprm == SPRM_P_ILVL:
+            props["ilvl"] = op[0] if op else 0
+        elif sprm == SPRM_P_ILFO:
+            props["ilfo"] = _i16(op)
+        elif sprm in (SPRM_P_DXALEFT80, SPRM_P_DXALEFT):
+            props["kiri"] = _i16(op)
+        elif sprm in (SPRM_P_DXALEFT1_80, SPRM_P_DXALEFT1):
+            props["kiri1"] = _i16(op)
+        elif sprm == SPRM_T_DEFTABLE:
+            props["tdef"] = _parse_tdef(op)
+    return props
+
+
+# -------------------- WORD BINARY --------------------
+
+NFC_KE_NUMFMT = {
+    0: "decimal", 1: "upperRoman", 2: "lowerRoman", 3: "upperLetter", 4: "lowerLetter",
+    5: "ordinal", 6: "cardinalText", 7: "ordinalText", 22: "decimalZero", 23: "bullet",
+    255: "none",
+}
+
+# indeks pasangan fc/lcb di FibRgFcLcb97
+FCLCB_STSHF = 1
+FCLCB_PLCFSED = 6
+FCLCB_PLCFBTEPAPX = 13
+FCLCB_CLX = 33
+FCLCB_PLFLST = 73
+FCLCB_PLFLFO = 74
+
+# karakter khusus teks Word
+_KHUSUS_RE = re.compile(r"[\r\x07\x0c\x13\x14\x15\x01\x02\x05\x08\x0b\x1e\x1f]")
+_SURROGATE_RE = re.compile(r"[\ud800-\udfff]")
+
+
+class _WordBiner:
+    def __init__(self, cfb: _Cfb):
+        wd = cfb.stream("WordDocument")
+        if len(wd) < 0x200:
+            raise DocTidakDidukung("Stream WordDocument terlalu pendek")
+        w_ident, n_fib = struct.unpack_from("<HH", wd, 0)
+        if w_ident != 0xA5EC:
+            raise DocTidakDidukung("Bukan dokumen Word biner")
+        if n_fib < 0x00C0:
+            raise DocTidakDidukung("Format Word pra-97 tidak didukung")
+        flags = struct.unpack_from("<H", wd, 0x0A)[0]
+        if flags & 0x0100:
+            raise DocTidakDidukung("Dokumen terenkripsi")
+        self.wd = wd
+        self.table = cfb.stream("1Table" if flags & 0x0200 else "0Table")
+        self.data = cfb.stream("Data") if cfb.ada("Data") else b""
+
+        # FIB bagian variabel: csw/fibRgW, cslw/fibRgLw, cbRgFcLcb/fibRgFcLcbBlob
+        pos = 32
+        csw = struct.unpack_from("<H", wd, pos)[0]
+        pos += 2 + csw * 2
+        cslw = struct.unpack_from("<H", wd, pos)[0]
+        rglw = pos + 2
+        pos += 2 + cslw * 4
+        self._n_fclcb = struct.unpack_from("<H", wd, pos)[0]
+        self._fclcb_off = pos + 2
+        self.ccp_text = struct.unpack_from("<i", wd, rglw + 12)[0]
+
+        self._parse_pieces()
+        self._parse_papx_bins()
+        self._parse_lists()
+        self._parse_gaya()
+        self._parse_section_ends()
+
+    def _fclcb(self, idx):
+        if idx >= self._n_fclcb:
+            return 0, 0
+        return struct.unpack_from("<II", self.wd, self._fclcb_off + 8 * idx)
+
+    # ---------- piece table ----------
+    def _parse_pieces(self):
+        fc, lcb = self._fclcb(FCLCB_CLX)
+        clx = self.table[fc:fc + lcb]
+        pos, plc = 0, None
+        while pos < len(clx):
+            if clx[pos] == 0x01:      # Prc (grpprl piece) -> lewati
+                cb = struct.unpack_from("<H", clx, pos + 1)[0]
+                pos += 3 + cb
+            elif clx[pos] == 0x02:    # Pcdt
+                lcb_pcd = struct.unpack_from("<I", clx, pos + 1)[0]
+                plc = clx[pos + 5:pos + 5 + lcb_pcd]
+                break
+            else:
+                raise DocTidakDidukung("CLX rusak")
+        if plc is None:
+            raise DocTidakDidukung("Piece table tidak ditemukan")
+        n = (len(plc) - 4) // 12
+        cps = struct.unpack_from(f"<{n + 1}i", plc, 0)
+        self.pieces = []  # (cp_awal, cp_akhir, fc, compressed)
+        for k in range(n):
+            fc_raw, prm = struct.unpack_from("<IH", plc, 4 * (n + 1) + 8 * k + 2)
+            if prm:
+                raise DocTidakDidukung("Properti piece (fast-save) tidak didukung")
+            compressed = bool(fc_raw & 0x40000000)
+            fc_real = fc_raw & 0x3FFFFFFF
+            self.pieces.append((cps[k], cps[k + 1], fc_real // 2 if compressed else fc_real, compressed))
+        self._piece_awal = [p[0] for p in self.pieces]
+
+    def teks_utama(self) -> str:
+        """Teks dokumen utama (CP 0..ccpText), satu karakter Python per CP."""
+        chunks = []
+        for cp0, cp1, fc, compressed in self.pieces:
+            if cp0 >= self.ccp_text:
+                break
+            cp1 = min(cp1, self.ccp_text)
+            n = cp1 - cp0
+            if compressed:
+                chunks.append(self.wd[fc:fc + n].decode("cp1252", "replace"))
+            else:
+                raw = self.wd[fc:fc + 2 * n]
+                # per code unit: surrogate pair tetap 2 karakter agar indeks == CP
+                chunks.append("".join(map(chr, struct.unpack(f"<{len(raw) // 2}H", raw))))
+        return "".join(chunks)
+
+    def cp_ke_fc(self, cp: int) -> int:
+        k = bisect_right(self._piece_awal, cp) - 1
+        cp0, _cp1, fc, compressed = self.pieces[max(k, 0)]
+        return fc + (cp - cp0) * (1 if compressed else 2)
+
+    # ---------- PAPX (FKP) ----------
+    def _parse_papx_bins(self):
+        fc, lcb = self._fclcb(FCLCB_PLCFBTEPAPX)
+        n = (lcb - 4) // 8
+        self._run_awal, self._runs = [], []  # runs: (fc_awal, fc_akhir, halaman, b_offset)
+        if n <= 0:
+            return
+        pns = struct.unpack_from(f"<{n}I", self.table, fc + 4 * (n + 1))
+        for pn in pns:
+            page_off = (pn & 0x3FFFFF) * 512
+            page = self.wd[page_off:page_off + 512]
+            if len(page) < 512:
+                continue
+            crun = page[511]
+            rgfc = struct.unpack_from(f"<{crun + 1}I", page, 0)
+            for i in range(crun):
+                b_off = page[4 * (crun + 1) + 13 * i]
+                self._runs.append((rgfc[i], rgfc[i + 1], page_off, b_off))
+        self._runs.sort()
+        self._run_awal = [r[0] for r in self._runs]
+        self._cache_papx = {}
+
+    def props_paragraf(self, fc_mark: int) -> dict:
+        k = bisect_right(self._run_awal, fc_mark) - 1
+        if k < 0:
+            return {}
+        fc0, fc1, page_off, b_off = self._runs[k]
+        if not (fc0 <= fc_mark < fc1) or b_off == 0:
+            return {}
+        key = (page_off, b_off)
+        props = self._cache_papx.get(key)
+        if props is None:
+            off = page_off + b_off * 2
+            cb = self.wd[off]
+            if cb == 0:
+                cb2 = self.wd[off + 1]
+                blob = self.wd[off + 2:off + 2 + 2 * cb2]
+            else:
+                blob = self.wd[off + 1:off + 1 + 2 * cb - 1]
+            props = _props_papx(blob[2:], self.data)  # 2 byte pertama = istd
+            if len(blob) >= 2:
+                self._cek_gaya(struct.unpack_from("<H", blob)[0], props)
+            self._cache_papx[key] = props
+        return props
+
+    # ---------- list (LST/LFO) ----------
+    def _parse_lists(self):
+        self.abstrak = {}   # lsid -> [ {fmt, kiri, gantung} per level ]
+        self.lfo = {}       # ilfo (1-based) -> lsid
+        fc, lcb = self._fclcb(FCLCB_PLFLST)
+        if lcb >= 2:
+            t = self.table
+            c_lst = struct.unpack_from("<h", t, fc)[0]
+            pos = fc + 2
+            lstfs = []
+            for _ in range(max(c_lst, 0)):
+                lsid = struct.unpack_from("<i", t, pos)[0]
+                simple = t[pos + 26] & 0x01
+                lstfs.append((lsid, 1 if simple else 9))
+                pos += 28
+            for lsid, n_lvl in lstfs:
+                levels = []
+                for _ in range(n_lvl):
+                    nfc = t[pos + 4]
+                    cb_chpx, cb_papx = t[pos + 24], t[pos + 25]
+                    pos += 28
+                    pp = _props_papx(t[pos:pos + cb_papx], b"")
+                    pos += cb_papx + cb_chpx
+                    cch = struct.unpack_from("<H", t, pos)[0]
+                    pos += 2 + 2 * cch
+                    kiri, kiri1 = pp.get("kiri"), pp.get("kiri1")
+                    levels.append({
+                        "fmt": NFC_KE_NUMFMT.get(nfc, "decimal"),
+                        "kiri": kiri,
+                        "gantung": -kiri1 if (kiri1 is not None and kiri1 < 0) else None,
+                    })
+                self.abstrak[lsid] = levels
+        fc, lcb = self._fclcb(FCLCB_PLFLFO)
+        if lcb >= 4:
+            lfo_mac = struct.unpack_from("<i", self.table, fc)[0]
+            for k in range(max(lfo_mac, 0)):
+                lsid = struct.unpack_from("<i", self.table, fc + 4 + 16 * k)[0]
+                self.lfo[k + 1] = lsid
+
+    # ---------- style (STSH) ----------
+    def _parse_gaya(self):
+        """
+        self.gaya: istd -> properti list/indent style paragraf (sudah termasuk warisan istdBase).
+        Hanya dipakai untuk mendeteksi paragraf yang bergantung pada style (_cek_gaya).
+        """
+        self.gaya = {}
+        fc, lcb = self._fclcb(FCLCB_STSHF)
+        t = self.table[fc:fc + lcb]
+        if len(t) < 6:
+            return
+        cb_stshi = struct.unpack_from("<H", t)[0]
+        cstd, cb_dasar = struct.unpack_from("<HH", t, 2)
+        pos, mentah = 2 + cb_stshi, {}  # istd -> (istd_base, props)
+        for istd in range(cstd):
+            if pos + 2 > len(t):
+                break
+            cb_std = struct.unpack_from("<H", t, pos)[0]
+            std = t[pos + 2:pos + 2 + cb_std]
+            pos += 2 + cb_std
+            if len(std) < max(cb_dasar, 10) + 2:
+                continue  # slot style kosong
+            stk_base = struct.unpack_from("<H", std, 2)[0]
+            if stk_base & 0x0F != 1:
+                continue  # bukan style paragraf
+            p = cb_dasar
+            p += 2 + 2 * struct.unpack_from("<H", std, p)[0] + 2  # xstzName
+            if p + 4 > len(std):
+                continue
+            cb_upx = struct.unpack_from("<H", std, p)[0]
+            props = _props_papx(std[p + 4:p + 2 + cb_upx], b"")  # UpxPapx: istd + grpprl
+            mentah[istd] = (stk_base >> 4, {k: v for k, v in props.items() if k in ("ilfo", "kiri", "kiri1")})
+        for istd in mentah:
+            rantai, i = [], istd
+            while i in mentah and i not in rantai and len(rantai) < 16:
+                rantai.append(i)
+                i = mentah[i][0]
+            hasil = {}
+            for i in reversed(rantai):
+                hasil.update(mentah[i][1])
+            self.gaya[istd] = hasil
+
+    def _cek_gaya(self, istd: int, props: dict):
+        """Raise DocTidakDidukung bila list/indent paragraf hanya diwarisi dari style."""
+        gaya = self.gaya.get(istd)
+        if not gaya:
+            return
+        if gaya.get("ilfo") and "ilfo" not in props:
+            raise DocTidakDidukung(f"Numbering dari style (istd {istd}) tidak didukung")
+        level = {}
+        levels = self.abstrak.get(self.lfo.get(props.get("ilfo") or 0)) or []
+        if levels:
+            level = levels[min(props.get("ilvl", 0), len(levels) - 1)]
+        for k, dari_level in (("kiri", level.get("kiri")), ("kiri1", level.get("gantung"))):
+            if k in gaya and k not in props and dari_level is None:
+                raise DocTidakDidukung(f"Indent dari style (istd {istd}) tidak didukung")
+
+    def _parse_section_ends(self):
+        fc, lcb = self._fclcb(FCLCB_PLCFSED)
+        n = (lcb - 4) // 16
+        self.section_ends = set(struct.unpack_from(f"<{n + 1}i", self.table, fc)[1:]) if n > 0 else set()
+
+    # ---------- paragraf ----------
+    def iter_paragraf(self):
+        """
+        Generate (teks, terminator, props, page_break) per paragraf dokumen utama.
+        terminator: "\\r" (paragraf), "\\x07" (akhir sel/baris), "\\x0c" (akhir section).
+        Kode field dibuang (hanya hasil field yang dipertahankan).
+        """
+        text = self.teks_utama()
+        buf, page_break = [], False
+        field_stack = []  # True = sedang di bagian kode field
+        pos = 0
+
+        def _teks():
+            s = "".join(buf)
+            if _SURROGATE_RE.search(s):
+                s = s.encode("utf-16-le", "surrogatepass").decode("utf-16-le", "replace")
+            return s
+
+        for m in _KHUSUS_RE.finditer(text):
+            if not (field_stack and field_stack[-1]) and m.start() > pos:
+                buf.append(text[pos:m.start()])
+            pos = m.end()
+            ch = m.group()
+            cp = m.start()
+            if ch == "\x13":
+                field_stack.append(True)
+                continue
+            if ch == "\x14":
+                if field_stack:
+                    field_stack[-1] = False
+                continue
+            if ch == "\x15":
+                if field_stack:
+                    field_stack.pop()
+                continue
+            in_code = bool(field_stack and field_stack[-1])
+            if ch in ("\r", "\x07") or (ch == "\x0c" and (cp + 1) in self.section_ends):
+                props = self.props_paragraf(self.cp_ke_fc(cp))
+                yield _teks(), ch, props, page_break or ch == "\x0c"
+                buf, page_break = [], False
+                continue
+            if in_code:
+                continue
+            if ch == "\x0c":
+                page_break = True
+            elif ch == "\x0b":
+                buf.append("\n")
+            elif ch == "\x1e":
+                buf.append("-")
+            # \x01 \x02 \x05 \x08 \x1f: objek/penanda, dibuang
+        if pos < len(text) and not (field_stack and field_stack[-1]):
+            buf.append(text[pos:])
+        if buf and "".join(buf).strip():
+            yield _teks(), "\r", {}, page_break
+
+
+# -------------------- BLOK (format-agnostik) --------------------
+#
+# Representasi blok yang dipakai builder docx (juga oleh pembaca format lain):
+#   ("p", paragraf) atau ("t", {"baris": [[sel, ...], ...]})
+#   paragraf = {"teks", "num_id", "ilvl", "kiri", "gantung", "page_break"}
+#   sel      = {"paragraf": [paragraf, ...], "span": int, "vmerge": None|"restart"|"continue"}
+#   abstrak  = {abstract_id: [ {"fmt", "kiri", "gantung"} | None per level ]}
+#   num      = {num_id: abstract_id}
+# Kunci opsional (dipakai representasi antara ir_dokumen.py):
+#   paragraf "segmen": [[teks, hyperlink?], ...]   urutan run / hyperlink
+#            "num_pr": bool                         numPr langsung persis (num_id/ilvl None = tidak ditulis)
+#            "gaya_num": [num_id, ilvl]             numbering dari style paragraf
+#   tabel    "kolom": int                           jumlah w:gridCol
+
+def paragraf_baru(teks, num_id=None, ilvl=0, kiri=None, gantung=None, page_break=False):
+    return {"teks": teks, "num_id": num_id, "ilvl": ilvl, "kiri": kiri,
+            "gantung": gantung, "page_break": page_break}
+
+
+def _cluster_batas(batas, toleransi=10):
+    hasil = []
+    for b in sorted(batas):
+        if not hasil or b - hasil[-1] > toleransi:
+            hasil.append(b)
+    return hasil
+
+
+def _susun_tabel(baris_mentah):
+    """
+    baris_mentah: [(sel_paragraf[[...]], tdef|None), ...] -> {"baris": [[sel, ...], ...]}
+    Span kolom dihitung dari grid gabungan batas sel semua baris (seperti konversi LibreOffice),
+    merge horizontal lama digabung ke sel sebelumnya, merge vertikal jadi vmerge.
+    """
+    semua_batas = []
+    for _cells, tdef in baris_mentah:
+        if tdef:
+            semua_batas.extend(tdef[0])
+    grid = _cluster_batas(semua_batas)
+
+    def idx_grid(x):
+        k = bisect_right(grid, x + 10) - 1
+        return max(k, 0)
+
+    rows = []
+    for cells, tdef in baris_mentah:
+        row = []
+        cocok = tdef is not None and len(tdef[0]) == len(cells) + 1
+        for i, paras in enumerate(cells):
+            span, vmerge, horz = 1, None, 0
+            if cocok:
+                span = max(1, idx_grid(tdef[0][i + 1]) - idx_grid(tdef[0][i]))
+                horz, vert = tdef[1][i] if i < len(tdef[1]) else (0, 0)
+                vmerge = "restart" if vert == 3 else ("continue" if vert == 1 else None)
+            if horz in (2, 3) and row:
+                row[-1]["span"] += span
+                row[-1]["paragraf"].extend(p for p in paras if p["teks"].strip())
+                continue
+            row.append({"paragraf": paras or [paragraf_baru("")], "span": span, "vmerge": vmerge})
+        rows.append(row)
+    return {"baris": rows}
+
+
+def baca_blok_doc(data: bytes):
+    """Parse bytes .doc -> (blok, abstrak, num)."""
+    word = _WordBiner(_Cfb(data))
+
+    blok, baris_mentah = [], []
+    sel_aktif, paras_sel = [], []
+    num_dipakai = {}
+
+    def paragraf_dari(teks, props, page_break):
+        ilfo = props.get("ilfo") or 0
+        num_id = ilfo if (0 < ilfo < 0x07FF and ilfo in word.lfo) else None
+        if num_id is not None:
+            num_dipakai[num_id] = word.lfo[num_id]
+        kiri1 = props.get("kiri1")
+        return paragraf_baru(
+            teks, num_id=num_id, ilvl=min(props.get("ilvl", 0), 8),
+            kiri=props.get("kiri"),
+            gantung=-kiri1 if (kiri1 is not None and kiri1 < 0) else None,
+            page_break=page_break,
+        )
+
+    def tutup_tabel():
+        nonlocal baris_mentah, sel_aktif, paras_sel
+        if paras_sel:
+            sel_aktif.append(paras_sel)
+        if sel_aktif:
+            baris_mentah.append((sel_aktif, None))
+        if baris_mentah:
+            blok.append(("t", _susun_tabel(baris_mentah)))
+        baris_mentah, sel_aktif, paras_sel = [], [], []
+
+    for teks, term, props, page_break in word.iter_paragraf():
+        itap = props.get("itap") or (1 if props.get("in_table") else 0)
+        if itap <= 0:
+            if baris_mentah or sel_aktif or paras_sel:
+                tutup_tabel()
+            blok.append(("p", paragraf_dari(teks, props, page_break)))
+            continue
+
+        if itap >= 2:
+            # tabel bersarang: isinya diratakan menjadi paragraf di sel luar
+            if not props.get("inner_ttp"):
+                paras_sel.append(paragraf_dari(teks, props, False))
+            continue
+
+        if props.get("ttp"):
+            if paras_sel:
+                sel_aktif.append(paras_sel)
+                paras_sel = []
+            baris_mentah.append((sel_aktif, props.get("tdef")))
+            sel_aktif = []
+            continue
+
+        paras_sel.append(paragraf_dari(teks, props, False))
+        if term == "\x07":
+            sel_aktif.append(paras_sel)
+            paras_sel = []
+
+    tutup_tabel()
+
+    if not any(
+        (k == "p" and v["teks"].strip()) or k == "t" for k, v in blok
+    ):
+        raise DocTidakDidukung("Tidak ada teks yang terbaca")
+
+    abstrak = {lsid: word.abstrak.get(lsid, []) for lsid in set(num_dipakai.values())}
+    return blok, abstrak, num_dipakai
+
+
+# -------------------- BUILDER python-docx --------------------
+
+def bangun_docx(blok, abstrak=None, num=None, dasar=None):
+    """
+    Bangun python-docx Document di memori dari representasi blok.
+    dasar: template (path / file-like) pengganti template bawaan python-docx.
+    """
+    from docx import Document
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    doc = Document(dasar)
+    body = doc.element.body
+    sect_pr = body.find(qn("w:sectPr"))
+    for child in list(body):
+        if child is not sect_pr:
+            body.remove(child)
+
+    def sisip(el):
+        if sect_pr is not None:
+            sect_pr.addprevious(el)
+        else:
+            body.append(el)
+
+    def elem(tag, **attrs):
+        el = OxmlElement(tag)
+        for k, v in attrs.items():
+            el.set(qn(f"w:{k}"), str(v))
+        return el
+
+    gaya_num = {}
+
+    def id_gaya_num(num_id, ilvl):
+        # style paragraf pembawa numPr (numbering yang diwarisi dari style di dokumen asal)
+        sid = gaya_num.get((num_id, ilvl))
+        if sid is None:
+            sid = gaya_num[(num_id, ilvl)] = f"IrNum{len(gaya_num)}"
+            st = elem("w:style", type="paragraph", styleId=sid)
+            st.append(elem("w:name", val=sid))
+            ppr = elem("w:pPr")
+            num_pr = elem("w:numPr")
+            if ilvl is not None:
+                num_pr.append(elem("w:ilvl", val=ilvl))
+            if num_id is not None:
+                num_pr.append(elem("w:numId", val=num_id))
+            ppr.append(num_pr)
+            st.append(ppr)
+            doc.styles.element.append(st)
+        return sid
+
+    def buat_r(teks, page_break=False):
+        r = elem("w:r")
+        if page_break:
+            r.append(elem("w:br", type="page"))
+        for k, seg in enumerate(teks.split("\n")):
+            if k:
+                r.append(elem("w:br"))
+            if seg:
+                t = elem("w:t")
+                t.text = seg
+                t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+                r.append(t)
+        return r
+
+    def buat_p(par):
+        p = elem("w:p")
+        langsung = par.get("num_pr", par.get("num_id") is not None)
+        if langsung or par.get("kiri") is not None or par.get("gaya_num"):
+            ppr = elem("w:pPr")
+            if par.get("gaya_num"):
+                ppr.append(elem("w:pStyle", val=id_gaya_num(*par["gaya_num"])))
+            if langsung and "num_pr" in par:
+                num_pr = elem("w:numPr")
+                if par.get("ilvl") is not None:
+                    num_pr.append(elem("w:ilvl", val=par["ilvl"]))
+                if par.get("num_id") is not None:
+                    num_pr.append(elem("w:numId", val=par["num_id"]))
+                ppr.append(num_pr)
+            elif langsung:
+                num_pr = elem("w:numPr")
+                num_pr.append(elem("w:ilvl", val=par.get("ilvl") or 0))
+                num_pr.append(elem("w:numId", val=par["num_id"]))
+                ppr.append(num_pr)
+            if par.get("kiri") is not None:
+                ind = elem("w:ind", left=par["kiri"])
+                if par.get("gantung"):
+                    ind.set(qn("w:hanging"), str(par["gantung"]))
+                ppr.append(ind)
+            p.append(ppr)
+        if par.get("segmen"):
+            # hyperlink dipisah: para_text (runs) tidak memuatnya, p.text / cell.text memuat
+            for k, (teks, tautan) in enumerate(par["segmen"]):
+                r = buat_r(teks or "", par.get("page_break") and k == 0)
+                if tautan:
+                    h = elem("w:hyperlink")
+                    h.append(r)
+                    r = h
+                p.append(r)
+            return p
+        teks = par.get("teks") or ""
+        if par.get("page_break") or teks:
+            p.append(buat_r(teks, par.get("page_break")))
+        return p
+
+    def buat_tbl(tabel):
+        rows = tabel["baris"]
+        n_grid = tabel["kolom"] if "kolom" in tabel else max((sum(c["span"] for c in row) for row in rows), default=1)
+        tbl = elem("w:tbl")
+        tbl_pr = elem("w:tblPr")
+        tbl_pr.append(elem("w:tblW", w=0, type="auto"))
+        tbl.append(tbl_pr)
+        grid = elem("w:tblGrid")
+        for _ in range(n_grid):
+            grid.append(elem("w:gridCol", w=1000))
+        tbl.append(grid)
+
+        offset_sebelumnya = set()
+        for row in rows:
+            tr = elem("w:tr")
+            offset, offset_baris = 0, set()
+            for cell in row:
+                tc = elem("w:tc")
+                vmerge = cell.get("vmerge")
+                # continue hanya valid bila baris atas punya sel di offset grid yang sama
+                if vmerge == "continue" and offset not in offset_sebelumnya:
+                    vmerge = None
+                if cell["span"] > 1 or vmerge:
+                    tc_pr = elem("w:tcPr")
+                    if cell["span"] > 1:
+                        tc_pr.append(elem("w:gridSpan", val=cell["span"]))
+                    if vmerge == "restart":
+                        tc_pr.append(elem("w:vMerge", val="restart"))
+                    elif vmerge == "continue":
+                        tc_pr.append(elem("w:vMerge"))
+                    tc.append(tc_pr)
+                for par in cell["paragraf"] or [paragraf_baru("")]:
+                    tc.append(buat_p(par))
+                tr.append(tc)
+                offset_baris.add(offset)
+                offset += cell["span"]
+            tbl.append(tr)
+            offset_sebelumnya = offset_baris
+        return tbl
+
+    for kind, obj in blok:
+        sisip(buat_p(obj) if kind == "p" else buat_tbl(obj))
+
+    if num:
+        numbering = doc.part.numbering_part.element
+        # definisi numbering bawaan template (abstractNum 0-8, num 1-9 di template python-docx)
+        # bertabrakan dengan id dokumen asal; body sudah dikosongkan jadi aman dibuang
+        for el in numbering.findall(qn("w:abstractNum")) + numbering.findall(qn("w:num")):
+            numbering.remove(el)
+        abs_ids = {}
+        for k, abs_key in enumerate(sorted(abstrak or {}, key=str)):
+            abs_ids[abs_key] = k
+            an = elem("w:abstractNum", abstractNumId=k)
+            for ilvl, lvl in enumerate(abstrak[abs_key] or [{"fmt": "decimal"}]):
+                if lvl is None:
+                    continue
+                el = elem("w:lvl", ilvl=ilvl)
+                el.append(elem("w:numFmt", val=lvl.get("fmt") or "decimal"))
+                if lvl.get("kiri") is not None:
+                    ppr = elem("w:pPr")
+                    ind = elem("w:ind", left=lvl["kiri"])
+                    if lvl.get("gantung"):
+                        ind.set(qn("w:hanging"), str(lvl["gantung"]))
+                    ppr.append(ind)
+                    el.append(ppr)
+                an.append(el)
+            numbering.append(an)
+        for num_id, abs_key in sorted(num.items()):
+            if abs_key not in abs_ids:
+                continue
+            n_el = elem("w:num", numId=num_id)
+            n_el.append(elem("w:abstractNumId", val=abs_ids[abs_key]))
+            numbering.append(n_el)
+    return doc
+
+
+def iter_teks_doc(data: bytes):
+    """
+    Iterasi ringan teks .doc tanpa membangun Document (dipakai probe identitas):
+    yield ("p", teks) untuk paragraf di luar tabel, ("baris", [teks_sel, ...]) per baris tabel.
+    Isi tabel bersarang diratakan ke sel luar.
+    """
+    try:
+        word = _WordBiner(_Cfb(data))
+        sel, paras = [], []
+        for teks, term, props, _pb in word.iter_paragraf():
+            itap = props.get("itap") or (1 if props.get("in_table") else 0)
+            if itap <= 0:
+                if sel or paras:
+                    yield "baris", sel + (["\n".join(paras)] if paras else [])
+                    sel, paras = [], []
+                yield "p", teks
+            elif itap >= 2:
+                if not props.get("inner_ttp"):
+                    paras.append(teks)
+            elif props.get("ttp"):
+                yield "baris", sel
+                sel, paras = [], []
+            else:
+                paras.append(teks)
+                if term == "\x07":
+                    sel.append("\n".join(paras))
+                    paras = []
+        if sel or paras:
+            yield "baris", sel + (["\n".join(paras)] if paras else [])
+    except DocTidakDidukung:
+        raise
+    except (struct.error, IndexError, KeyError, ValueError, OverflowError) as e:
+        raise DocTidakDidukung(f"Struktur .doc tidak terbaca: {e}")
+
+
+def extract_info_native(file_path):
+    """Engine kandidat banding_ekstraktor.py: .doc dibaca native tanpa fallback LibreOffice."""
+    import ekstrakanjab
+    doc = dokumen_dari_doc(file_path)
+    return ekstrakanjab.extract_from_doc(doc, ekstrakanjab.doc_lines(doc), file_path)
+
+
+def dokumen_dari_doc(sumber):
+    """
+    Baca .doc (path atau bytes) -> python-docx Document.
+    Raise DocTidakDidukung bila dokumen tidak bisa ditangani native.
+    """
+    if isinstance(sumber, (bytes, bytearray)):
+        data = bytes(sumber)
+    else:
+        with open(sumber, "rb") as fh:
+            data = fh.read()
+    try:
+        blok, abstrak, num = baca_blok_doc(data)
+    except DocTidakDidukung:
+        raise
+    except (struct.error, IndexError, KeyError, ValueError, OverflowError) as e:
+        raise DocTidakDidukung(f"Struktur .doc tidak terbaca: {e}")
+    return bangun_docx(blok, abstrak, num)
+
+
+# -------------------- CLI (debug) --------------------
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("❌ Argumen tidak lengkap: butuh file .doc [output.docx]", file=sys.stderr)
+        sys.exit(1)
+    try:
+        doc = dokumen_dari_doc(sys.argv[1])
+    except DocTidakDidukung as e:
+        print(f"❌ Tidak bisa dibaca native: {e}", file=sys.stderr)
+        sys.exit(2)
+    if len(sys.argv) >= 3:
+        doc.save(sys.argv[2])
+    else:
+        for p in doc.paragraphs:
+            print(p.text)
+        for i, t in enumerate(doc.tables):
+            print(f"--- tabel {i + 1}: {len(t.rows)} baris")
+            for r in t.rows:
+                print(" | ".join(c.text.replace("\n", " / ") for c in r.cells))
@@ -0,0 +1,600 @@
+"""
+Deteksi format dokumen dari isi (magic bytes), bukan ekstensi, plus pembaca native ringan
+untuk format yang sering menyamar sebagai .doc.
+
+Banyak file ".doc" kiriman unit sebenarnya OOXML (zip), RTF, atau HTML/MHT hasil "Save As"
+Word lama. Sebelumnya semua .doc yang gagal dibaca native dikirim ke LibreOffice
+(konversi beberapa detik). Dengan sniffing:
+
+  docx   zip berisi word/document.xml   -> read_docx langsung
+  ole    OLE2/CFB (Word 97-2003 biner)  -> read_doc (bacadoc.py, fallback LibreOffice)
+  rtf    {\\rtf                          -> pembaca RTF di modul ini
+  html   <html / <!DOCTYPE html          -> pembaca HTML di modul ini (termasuk HTML Word)
+  mht    MIME multipart (Web Archive)    -> bagian text/html lalu pembaca HTML
+  lain   (WordML 2003, tidak dikenal)    -> jalur lama (LibreOffice untuk .doc)
+
+Pembaca RTF/HTML menghasilkan representasi blok bacadoc.py (paragraf, tabel grid sel,
+list), lalu dibangun menjadi python-docx Document dengan bacadoc.bangun_docx, sehingga
+extractor berjalan tanpa perubahan. Format nomor list ditebak dari teks nomor yang
+dirender (RTF \\listtext, span mso-list:Ignore HTML Word); \\listtable RTF, style, dan CSS
+selain mso-list, margin-left/text-indent, page-break diabaikan.
+
+Contoh:
+    python scripts/bacaformat.py dokumen.doc     # format + ringkasan isi
+"""
+import io
+import os
+import re
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+from bacadoc import OLE_SIGNATURE, paragraf_baru, _susun_tabel, bangun_docx
+
+
+class FormatTidakDidukung(Exception):
+    pass
+
+# -------------------- SNIFFING --------------------
+
+def _baca_awal(sumber, n=4096):
+    if isinstance(sumber, (bytes, bytearray)):
+        return bytes(sumber[:n])
+    with open(sumber, "rb") as fh:
+        return fh.read(n)
+
+def tebak_format(sumber) -> str:
+    """sumber: path atau bytes. return "docx" | "ole" | "rtf" | "html" | "mht" | "zip" | "lain"."""
+    awal = _baca_awal(sumber)
+    if awal.startswith(b"PK\x03\x04"):
+        import zipfile
+        try:
+            with zipfile.ZipFile(io.BytesIO(sumber) if isinstance(sumber, (bytes, bytearray)) else sumber) as z:
+                return "docx" if "word/document.xml" in z.namelist() else "zip"
+        except zipfile.BadZipFile:
+            return "lain"
+    if awal.startswith(OLE_SIGNATURE):
+        return "ole"
+    if awal.startswith((b"\xff\xfe", b"\xfe\xff")):
+        awal = awal.decode("utf-16", errors="ignore").encode("utf-8")
+    elif awal.startswith(b"\xef\xbb\xbf"):
+        awal = awal[3:]
+    s = awal.lstrip()
+    if s.startswith(b"{\\rtf"):
+        return "rtf"
+    kecil = s[:2048].lower()
+    if kecil.startswith(b"mime-version:") or b"content-type: multipart/related" in kecil:
+        return "mht"
+    if kecil.startswith(b"<!doctype html") or b"<html" in kecil[:512]:
+        return "html"
+    return "lain"  # termasuk WordprocessingML 2003 (<?xml ... w:wordDocument>)
+
+# -------------------- NOMOR LIST --------------------
+
+def _fmt_dari_nomor(nomor: str) -> str:
+    """Tebak numFmt dari teks nomor yang dirender Word (HTML: span mso-list:Ignore, RTF: \\listtext)."""
+    t = nomor.strip().rstrip(".)").strip()
+    if t.isdigit():
+        return "decimal"
+    if len(t) == 1 and t.isalpha():
+        return "lowerLetter" if t.islower() else "upperLetter"
+    if t and all(c in "ivxlcdm" for c in t):
+        return "lowerRoman"
+    if t and all(c in "IVXLCDM" for c in t):
+        return "upperRoman"
+    return "bullet"
+
+# -------------------- RTF --------------------
+
+_RTF_TOKEN = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-fA-F]{2})|\\(.)|([{}])|([^\\{}\r\n]+)|[\r\n]+", re.S)
+
+# destinasi yang isinya bukan teks dokumen
+_RTF_LEWATI = {
+    "fonttbl", "colortbl", "stylesheet", "info", "pict", "object", "objdata", "header", "headerl",
+    "headerr", "headerf", "footer", "footerl", "footerr", "footerf", "footnote", "fldinst", "themedata",
+    "colorschememapping", "datastore", "latentstyles", "listtable", "listoverridetable", "generator",
+    "xmlnstbl", "rsidtbl", "mmathPr", "pgdsctbl", "filetbl", "revtbl", "annotation", "atnid", "atnauthor",
+    "shppict", "nonshppict", "shp", "shpinst", "sp", "sv", "sn", "pntxta", "pntxtb",
+    "xe", "tc", "template", "docvar", "userprops", "nonesttables", "bkmkstart", "bkmkend",
+}
+_RTF_SIMBOL = {
+    "line": "\n", "tab": "\t", "emdash": "\u2014", "endash": "\u2013", "bullet": "\u2022",
+    "lquote": "\u2018", "rquote": "\u2019", "ldblquote": "\u201c", "rdblquote": "\u201d",
+}
+
+def blok_dari_rtf(data: bytes):
+    """bytes RTF -> (blok, abstrak, num) representasi bacadoc.py."""
+    teks_rtf = data.decode("latin-1")
+    codepage = "cp1252"
+    blok, abstrak, baris_mentah, sel_aktif, paras_sel = [], {}, [], [], []
+    tepi, gabung, gabung_sel = [0], [], [0, 0]
+    teks, nomor, hex_tunda = [], [], bytearray()
+    par = {"intbl": False, "ls": None, "ilvl": 0, "li": None, "fi": None, "pagebb": False}
+    page_break = False
+    # state per grup: lewati (destinasi non-teks), uc, tangkap (teks nomor \listtext)
+    stack, lewati_grup, uc, tangkap, lewati_char = [], False, 1, False, 0
+
+    def flush_hex():
+        if hex_tunda:
+            (nomor if tangkap else teks).append(hex_tunda.decode(codepage, errors="replace"))
+            hex_tunda.clear()
+
+    def paragraf_kini():
+        nonlocal page_break
+        flush_hex()
+        fi, ilvl = par["fi"], min(par["ilvl"], 8)
+        gantung = -fi if fi is not None and fi < 0 else None
+        kiri = par["li"] if par["li"] is not None else (0 if gantung else None)
+        if par["ls"] is not None:
+            # format nomor tidak dibaca dari \listtable; ditebak dari teks nomor yang dirender
+            levels = abstrak.setdefault(par["ls"], [])
+            levels.extend([None] * (ilvl + 1 - len(levels)))
+            if levels[ilvl] is None:
+                levels[ilvl] = {"fmt": _fmt_dari_nomor("".join(nomor))}
+        p = paragraf_baru("".join(teks), num_id=par["ls"], ilvl=ilvl, kiri=kiri, gantung=gantung,
+                          page_break=page_break or par["pagebb"])
+        teks.clear()
+        nomor.clear()
+        page_break = False
+        return p
+
+    def tutup_tabel():
+        nonlocal baris_mentah, sel_aktif, paras_sel
+        if paras_sel:
+            sel_aktif.append(paras_sel)
+        if sel_aktif:
+            baris_mentah.append((sel_aktif, None))
+        if baris_mentah:
+            blok.append(("t", _susun_tabel(baris_mentah)))
+        baris_mentah, sel_aktif, paras_sel = [], [], []
+
+    for m in _RTF_TOKEN.finditer(teks_rtf):
+        kata, param, hx, simbol, kurung, polos = m.groups()
+        if kurung == "{":
+            flush_hex()
+            stack.append((lewati_grup, uc, tangkap))
+            continue
+        if kurung == "}":
+            flush_hex()
+            if stack:
+                lewati_grup, uc, tangkap = stack.pop()
+            continue
+        if lewati_grup:
+            continue
+        if hx is not None:
+            if lewati_char:
+                lewati_char -= 1
+            else:
+                hex_tunda.append(int(hx, 16))
+            continue
+        if polos is not None:
+            flush_hex()
+            if lewati_char:
+                n = min(lewati_char, len(polos))
+                polos, lewati_char = polos[n:], lewati_char - n
+            (nomor if tangkap else teks).append(polos)
+            continue
+        if simbol is not None:
+            flush_hex()
+            if simbol == "*":
+                lewati_grup = True  # destinasi opsional yang tidak dikenal
+            elif simbol in "\\{}":
+                teks.append(simbol)
+            elif simbol == "~":
+                teks.append("\xa0")
+            elif simbol == "_":
+                teks.append("-")
+            continue
+        if kata is None:
+            continue
+        flush_hex()
+        n = int(param) if param is not None else None
+        if kata in _RTF_LEWATI:
+            lewati_grup = True
+        elif kata in ("listtext", "pntext"):
+            tangkap = True
+        elif kata == "ansicpg" and n:
+            codepage = f"cp{n}"
+        elif kata == "uc":
+            uc = n or 0
+        elif kata == "u" and n is not None:
+            (nomor if tangkap else teks).append(chr(n + 65536 if n < 0 else n))
+            lewati_char = uc
+        elif kata in _RTF_SIMBOL:
+            (nomor if tangkap else teks).append(_RTF_SIMBOL[kata])
+        elif kata == "pard":
+            par.update(intbl=False, ls=None, ilvl=0, li=None, fi=None, pagebb=False)
+        elif kata == "intbl":
+            par["intbl"] = True
+        elif kata == "ls":
+            par["ls"] = n
+        elif kata == "ilvl":
+            par["ilvl"] = n or 0
+        elif kata == "li":
+            par["li"] = n
+        elif kata == "fi":
+            par["fi"] = n
+        elif kata == "pagebb":
+            par["pagebb"] = True
+        elif kata in ("page", "sect"):
+            page_break = True
+        elif kata == "par":
+            p = paragraf_kini()
+            if par["intbl"]:
+                paras_sel.append(p)
+            else:
+                if baris_mentah or sel_aktif or paras_sel:
+                    tutup_tabel()
+                blok.append(("p", p))
+        elif kata in ("cell", "nestcell"):
+            if teks or hex_tunda or not paras_sel:
+                paras_sel.append(paragraf_kini())
+            if kata == "cell":
+                sel_aktif.append(paras_sel)
+                paras_sel = []
+        elif kata == "row":
+            if paras_sel:
+                sel_aktif.append(paras_sel)
+                paras_sel = []
+            baris_mentah.append((sel_aktif, (list(tepi), list(gabung))))
+            sel_aktif = []
+        elif kata == "trowd":
+            tepi, gabung, gabung_sel = [0], [], [0, 0]
+        elif kata == "trleft":
+            tepi[0] = n or 0
+        elif kata == "clmgf":
+            gabung_sel[0] = 1
+        elif kata == "clmrg":
+            gabung_sel[0] = 2
+        elif kata == "clvmgf":
+            gabung_sel[1] = 3
+        elif kata == "clvmrg":
+            gabung_sel[1] = 1
+        elif kata == "cellx":
+            tepi.append(n or 0)
+            gabung.append(tuple(gabung_sel))
+            gabung_sel = [0, 0]
+    flush_hex()
+    if teks and "".join(teks).strip():
+        blok.append(("p", paragraf_kini()))
+    tutup_tabel()
+    if not any((k == "p" and v["teks"].strip()) or k == "t" for k, v in blok):
+        raise FormatTidakDidukung("Tidak ada teks yang terbaca dari RTF")
+    return blok, abstrak, {k: k for k in abstrak}
+
+# -------------------- HTML --------------------
+
+_TAG_BLOK = {"p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "address", "dt", "dd",
+             "center", "section", "article", "header", "footer", "caption"}
+_TAG_LEWATI = {"script", "style", "title", "head", "xml", "noscript", "template"}
+_FMT_OL = {"1": "decimal", "a": "lowerLetter", "A": "upperLetter", "i": "lowerRoman", "I": "upperRoman"}
+_MSO_LIST = re.compile(r"mso-list:\s*l(\d+)\s+level(\d+)\s+lfo(\d+)", re.I)
+_PANJANG_CSS = re.compile(r"(-?[\d.]+)(in|pt|cm|mm|px|pc|em)")
+_TWIP_PER = {"in": 1440, "pt": 20, "cm": 567, "mm": 56.7, "px": 15, "pc": 240, "em": 240}
+
+
+def _twip_css(gaya: str, properti: str):
+    """Nilai panjang CSS (mis. margin-left:.5in) -> twip, None bila tidak ada."""
+    m = re.search(properti + r":([^;]+)", gaya)
+    if not m:
+        return None
+    n = _PANJANG_CSS.match(m.group(1).strip())
+    try:
+        return int(round(float(n.group(1)) * _TWIP_PER[n.group(2)])) if n else None
+    except ValueError:
+        return None
+
+
+def blok_dari_html(teks_html: str):
+    """HTML (termasuk HTML hasil Word) -> (blok, abstrak, num) representasi bacadoc.py."""
+    from html.parser import HTMLParser
+
+    blok, abstrak, num = [], {}, {}
+    st = {"teks": [], "props": {}, "page_break": False, "lewati": 0, "abaikan": 0, "nomor": [],
+          "tabel": 0, "baris": None, "rows": None, "sel": None, "list": [], "id_list": 0, "mso": {}, "pre": 0}
+    span_abaikan = []  # per <span>: apakah membuka mso-list:Ignore
+
+    def daftar_num(num_id, ilvl, fmt):
+        levels = abstrak.setdefault(num_id, [])
+        while len(levels) <= ilvl:
+            levels.append(None)
+        if levels[ilvl] is None:
+            levels[ilvl] = {"fmt": fmt}
+        num[num_id] = num_id
+
+    def akhiri_paragraf(paksa=False):
+        teks = "".join(st["teks"])
+        if not st["pre"]:
+            teks = re.sub(r"[ \t\r\n\f]+", " ", teks).strip()
+        props = st["props"]
+        st["teks"], st["props"] = [], {}
+        if not teks and not paksa and not st["page_break"]:
+            return
+        p = paragraf_baru(teks, num_id=props.get("num_id"), ilvl=props.get("ilvl", 0),
+                          kiri=props.get("kiri"), gantung=props.get("gantung"), page_break=st["page_break"])
+        st["page_break"] = False
+        if st["sel"] is not None:
+            st["sel"]["paragraf"].append(p)
+        elif teks or p["page_break"]:
+            blok.append(("p", p))
+
+    def tutup_sel():
+        if st["sel"] is not None:
+            akhiri_paragraf()
+            st["baris"].append(st["sel"])
+            st["sel"] = None
+
+    def tutup_baris():
+        tutup_sel()
+        if st["baris"] is not None:
+            st["rows"].append(st["baris"])
+            st["baris"] = None
+
+    def cek_page_break(attrs):
+        gaya = (attrs.get("style") or "").lower().replace(" ", "")
+        if "page-break-before:always" in gaya:
+            akhiri_paragraf()
+            st["page_break"] = True
+        return gaya
+
+    class _Pembaca(HTMLParser):
+        def handle_starttag(self, tag, attrs_list):
+            attrs = {k: (v or "") for k, v in attrs_list}
+            if tag in _TAG_LEWATI:
+                st["lewati"] += 1
+                return
+            if st["lewati"]:
+                return
+            if tag == "span":
+                ignore = "mso-list:ignore" in (attrs.get("style") or "").lower().replace(" ", "")
+                span_abaikan.append(ignore)
+                if ignore:
+                    st["abaikan"] += 1
+                return
+            if tag == "br":
+                gaya = cek_page_break(attrs)
+                if "page-break" not in gaya:
+                    st["teks"].append("\n" if st["pre"] else " \x00 ")
+                return
+            if tag == "table":
+                akhiri_paragraf()
+                st["tabel"] += 1
+                if st["tabel"] == 1:
+                    st["rows"] = []
+                return
+            if st["tabel"] == 1 and tag == "tr":
+                tutup_baris()
+                st["baris"] = []
+                return
+            if st["tabel"] == 1 and tag in ("td", "th"):
+                if st["baris"] is None:
+                    st["baris"] = []
+                tutup_sel()
+                try:
+                    span = max(1, int(attrs.get("colspan") or 1))
+                    rowspan = max(1, int(attrs.get("rowspan") or 1))
+                except ValueError:
+                    span = rowspan = 1
+                st["sel"] = {"paragraf": [], "span": span, "rowspan": rowspan}
+                return
+            if tag in ("ol", "ul"):
+                akhiri_paragraf()
+                fmt = _FMT_OL.get(attrs.get("type"), "decimal") if tag == "ol" else "bullet"
+                if not st["list"]:
+                    st["id_list"] += 1  # list bersarang berbagi num_id list terluar (beda ilvl)
+                st["list"].append((st["id_list"], fmt))
+                return
+            if tag == "li":
+                akhiri_paragraf()
+                if st["list"]:
+                    num_id, fmt = st["list"][-1]
+                    ilvl = min(len(st["list"]) - 1, 8)
+                    daftar_num(num_id, ilvl, fmt)
+                    st["props"] = {"num_id": num_id, "ilvl": ilvl}
+                return
+            if tag in _TAG_BLOK or (st["tabel"] > 1 and tag in ("tr", "td", "th")):
+                akhiri_paragraf()
+                gaya = cek_page_break(attrs)
+                if tag == "pre":
+                    st["pre"] += 1
+                m = _MSO_LIST.search(gaya.replace("level", " level").replace("lfo", " lfo"))
+                if m:
+                    # paragraf list Word: nomor dirender di span mso-list:Ignore
+                    lfo, ilvl = int(m.group(3)), min(int(m.group(2)) - 1, 8)
+                    num_id = st["mso"].setdefault(lfo, 5000 + lfo)
+                    st["props"] = {"num_id": num_id, "ilvl": ilvl, "mso": True}
+                    st["nomor"] = []
+                kiri, indent = _twip_css(gaya, "margin-left"), _twip_css(gaya, "text-indent")
+                if kiri is not None or (indent or 0) < 0:
+                    st["props"]["kiri"] = max(kiri or 0, 0)
+                    if indent is not None and indent < 0:
+                        st["props"]["gantung"] = -indent
+
+        def handle_startendtag(self, tag, attrs):
+            self.handle_starttag(tag, attrs)
+            if tag == "span" and span_abaikan:
+                self.handle_endtag(tag)
+
+        def handle_endtag(self, tag):
+            if tag in _TAG_LEWATI:
+                st["lewati"] = max(0, st["lewati"] - 1)
+                return
+            if st["lewati"]:
+                return
+            if tag == "span":
+                if span_abaikan and span_abaikan.pop():
+                    st["abaikan"] -= 1
+                    props = st["props"]
+                    if props.get("mso") and st["abaikan"] == 0 and "ilvl" in props:
+                        daftar_num(props["num_id"], props["ilvl"], _fmt_dari_nomor("".join(st["nomor"])))
+                return
+            if tag == "table":
+                if st["tabel"] == 1:
+                    tutup_baris()
+                    if st["rows"]:
+                        blok.append(("t", {"baris": _susun_html(st["rows"])}))
+                    st["rows"] = None
+                else:
+                    akhiri_paragraf()
+                st["tabel"] = max(0, st["tabel"] - 1)
+                return
+            if st["tabel"] == 1 and tag == "tr":
+                tutup_baris()
+                return
+            if st["tabel"] == 1 and tag in ("td", "th"):
+                tutup_sel()
+                return
+            if tag in ("ol", "ul"):
+                akhiri_paragraf()
+                if st["list"]:
+                    st["list"].pop()
+                return
+            if tag == "li" or tag in _TAG_BLOK or (st["tabel"] > 1 and tag in ("tr", "td", "th")):
+                akhiri_paragraf()
+                if tag == "pre":
+                    st["pre"] = max(0, st["pre"] - 1)
+
+        def handle_data(self, data):
+            if st["lewati"]:
+                return
+            if st["abaikan"]:
+                st["nomor"].append(data)
+                return
+            st["teks"].append(data)
+
+    pembaca = _Pembaca(convert_charrefs=True)
+    pembaca.feed(teks_html)
+    pembaca.close()
+    if st["rows"] is not None:
+        tutup_baris()
+        if st["rows"]:
+            blok.append(("t", {"baris": _susun_html(st["rows"])}))
+    akhiri_paragraf()
+    # <br> di luar <pre> ditandai \x00 agar tidak ikut dipadatkan spasi
+    for kind, obj in blok:
+        pars = [obj] if kind == "p" else [p for row in obj["baris"] for c in row for p in c["paragraf"]]
+        for p in pars:
+            if "\x00" in p["teks"]:
+                p["teks"] = re.sub(r" ?\x00 ?", "\n", p["teks"]).strip()
+    if not any((k == "p" and v["teks"].strip()) or k == "t" for k, v in blok):
+        raise FormatTidakDidukung("Tidak ada teks yang terbaca dari HTML")
+    return blok, abstrak, num
+
+
+def _susun_html(rows):
+    """Baris HTML (colspan/rowspan) -> grid sel bacadoc (span + vmerge restart/continue)."""
+    hasil, tertunda = [], {}  # offset grid -> (sisa baris, span)
+    for row in rows:
+        baru, offset, k = [], 0, 0
+        while k < len(row) or offset in tertunda:
+            if offset in tertunda:
+                sisa, span = tertunda.pop(offset)
+                if sisa > 1:
+                    tertunda[offset] = (sisa - 1, span)
+                baru.append({"paragraf": [paragraf_baru("")], "span": span, "vmerge": "continue"})
+                offset += span
+                continue
+            sel = row[k]
+            k += 1
+            vmerge = None
+            if sel["rowspan"] > 1:
+                tertunda[offset] = (sel["rowspan"] - 1, sel["span"])
+                vmerge = "restart"
+            baru.append({"paragraf": sel["paragraf"] or [paragraf_baru("")], "span": sel["span"], "vmerge": vmerge})
+            offset += sel["span"]
+        hasil.append(baru)
+    return hasil
+
+
+def _dekode_html(data: bytes) -> str:
+    if data.startswith(b"\xef\xbb\xbf"):
+        return data[3:].decode("utf-8", errors="replace")
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return data.decode("utf-16", errors="replace")
+    m = re.search(rb"charset\s*=\s*[\"']?([A-Za-z0-9_\-]+)", data[:4096])
+    for enc in ([m.group(1).decode("ascii")] if m else []) + ["utf-8"]:
+        try:
+            return data.decode(enc)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return data.decode("cp1252", errors="replace")
+
+
+def html_dari_mht(data: bytes) -> str:
+    """Ambil bagian text/html pertama dari arsip MHT/MHTML (Word "Single File Web Page")."""
+    import email
+    msg = email.message_from_bytes(data)
+    for part in msg.walk():
+        if part.get_content_type() == "text/html":
+            isi = part.get_payload(decode=True) or b""
+            charset = part.get_content_charset()
+            if charset:
+                try:
+                    return isi.decode(charset)
+                except (LookupError, UnicodeDecodeError):
+                    pass
+            return _dekode_html(isi)
+    raise FormatTidakDidukung("Bagian text/html tidak ditemukan di MHT")
+
+# -------------------- API --------------------
+
+def baca_blok_format(sumber, fmt=None):
+    """path/bytes RTF, HTML, atau MHT -> (blok, abstrak, num). Raise FormatTidakDidukung."""
+    if isinstance(sumber, (bytes, bytearray)):
+        data = bytes(sumber)
+    else:
+        with open(sumber, "rb") as fh:
+            data = fh.read()
+    fmt = fmt or tebak_format(data)
+    if fmt == "rtf":
+        return blok_dari_rtf(data)
+    if fmt == "html":
+        return blok_dari_html(_dekode_html(data))
+    if fmt == "mht":
+        return blok_dari_html(html_dari_mht(data))
+    raise FormatTidakDidukung(f"Format {fmt} tidak punya pembaca native")
+
+def iter_teks_format(sumber, fmt=None):
+    """Seperti bacadoc.iter_teks_doc (probe identitas): ("p", teks) / ("baris", [teks_sel, ...])."""
+    blok, _abs, _num = baca_blok_format(sumber, fmt)
+    for kind, obj in blok:
+        if kind == "p":
+            yield "p", obj["teks"]
+        else:
+            for row in obj["baris"]:
+                yield "baris", ["\n".join(p["teks"] for p in c["paragraf"]) for c in row]
+
+def dokumen_dari_format(sumber, fmt=None):
+    """
+    path/bytes RTF, HTML, atau MHT -> python-docx Document. Template mini (ir_dokumen.py):
+    numbering-nya kosong, jadi numId/abstractNumId hasil pembaca tidak bertabrakan dengan
+    definisi list bawaan template python-docx.
+    """
+    from ir_dokumen import template_mini
+    return bangun_docx(*baca_blok_format(sumber, fmt), dasar=io.BytesIO(template_mini()))
+
+# -------------------- CLI (debug) --------------------
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("❌ Argumen tidak lengkap: butuh file dokumen", file=sys.stderr)
+        sys.exit(1)
+    f = sys.argv[1]
+    fmt = tebak_format(f)
+    print(f"{os.path.basename(f)}: {fmt}")
+    if fmt in ("rtf", "html", "mht"):
+        try:
+            blok, _abs, _num = baca_blok_format(f, fmt)
+        except FormatTidakDidukung as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(2)
+        for kind, obj in blok:
+            if kind == "p":
+                print(("  " * obj["ilvl"] + "• " if obj["num_id"] is not None else "") + obj["teks"])
+            else:
+                print(f"--- tabel: {len(obj['baris'])} baris")
+                for row in obj["baris"]:
+                    print(" | ".join(" / ".join(p["teks"] for p in c["paragraf"]) for c in row))
@@ -0,0 +1,230 @@
+"""
+Harness kesetaraan: jalankan ekstraktor acuan (ekstrakanjab.extract_info) dan
+ekstraktor kandidat pada korpus dokumen yang sama, lalu bandingkan JSON per bagian.
+
+Contoh:
+    python scripts/banding_ekstraktor.py kandidat.py:extract_info korpus/ --json laporan.json
+    python scripts/banding_ekstraktor.py modul_baru:extract_info a.docx b.doc --ulang 3
+
+Spesifikasi engine berbentuk "<modul atau path .py>:<nama fungsi>".
+Fungsi menerima path dokumen dan mengembalikan dict berbentuk sama dengan extract_info.
+Exit code 1 bila ada dokumen yang hasilnya berbeda atau gagal.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import importlib.util
+import tracemalloc
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+ACUAN_DEFAULT = "ekstrakanjab:extract_info"
+EKSTENSI_DOKUMEN = (".doc", ".docx")
+
+# -------------------- MUAT ENGINE --------------------
+
+def muat_engine(spec: str):
+    """Muat fungsi dari spesifikasi "<modul|path.py>:<fungsi>"."""
+    modul, sep, fungsi = spec.rpartition(":")
+    if not sep or not modul or not fungsi:
+        raise ValueError(f"Spesifikasi engine tidak valid: {spec} (format <modul>:<fungsi>)")
+    if modul.endswith(".py") or os.path.sep in modul:
+        path = os.path.abspath(modul)
+        nama = "engine_" + os.path.splitext(os.path.basename(path))[0]
+        s = importlib.util.spec_from_file_location(nama, path)
+        if s is None or s.loader is None:
+            raise ValueError(f"Modul engine tidak ditemukan: {path}")
+        mod = importlib.util.module_from_spec(s)
+        s.loader.exec_module(mod)
+    else:
+        mod = importlib.import_module(modul)
+    fn = getattr(mod, fungsi, None)
+    if not callable(fn):
+        raise ValueError(f"Fungsi '{fungsi}' tidak ada di modul {modul}")
+    return fn
+
+def kumpulkan_korpus(paths):
+    """Ekspansi argumen (file/direktori) menjadi daftar dokumen .doc/.docx terurut."""
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                for f in sorted(files):
+                    if f.lower().endswith(EKSTENSI_DOKUMEN) and not f.startswith("~$"):
+                        hasil.append(os.path.join(root, f))
+        else:
+            hasil.append(p)
+    return sorted(dict.fromkeys(hasil))
+
+# -------------------- DIFF --------------------
+
+def _jalur(parent: str, key) -> str:
+    if isinstance(key, int):
+        return f"{parent}[{key}]"
+    return f"{parent}.{key}" if parent else str(key)
+
+def beda_pertama(a, b, path=""):
+    """
+    Cari jalur pertama tempat a dan b berbeda (urutan dokumen dipertahankan).
+    return: None bila sama, atau (path, nilai_acuan, nilai_kandidat).
+    """
+    if type(a) is not type(b):
+        return path, a, b
+    if isinstance(a, dict):
+        for k in a:
+            if k not in b:
+                return _jalur(path, k), a[k], "<tidak ada>"
+            d = beda_pertama(a[k], b[k], _jalur(path, k))
+            if d:
+                return d
+        for k in b:
+            if k not in a:
+                return _jalur(path, k), "<tidak ada>", b[k]
+        return None
+    if isinstance(a, list):
+        for i, (x, y) in enumerate(zip(a, b)):
+            d = beda_pertama(x, y, _jalur(path, i))
+            if d:
+                return d
+        if len(a) != len(b):
+            i = min(len(a), len(b))
+            return (_jalur(path, i),
+                    a[i] if i < len(a) else "<tidak ada>",
+                    b[i] if i < len(b) else "<tidak ada>")
+        return None
+    return None if a == b else (path, a, b)
+
+def banding_per_bagian(acuan: dict, kandidat: dict):
+    """Bandingkan per bagian (key level atas). return: {bagian: None | {path, acuan, kandidat}}."""
+    hasil = {}
+    for k in list(acuan) + [k for k in kandidat if k not in acuan]:
+        d = beda_pertama(acuan.get(k, "<tidak ada>"), kandidat.get(k, "<tidak ada>"), k)
+        hasil[k] = None if d is None else {"path": d[0], "acuan": d[1], "kandidat": d[2]}
+    return hasil
+
+# -------------------- PENGUKURAN --------------------
+
+def ukur(fn, file_path, ulang=1, memori=True):
+    """
+    Jalankan fn(file_path): waktu = minimum dari `ulang` kali (tanpa tracemalloc),
+    memori = puncak alokasi Python pada satu jalan terpisah dengan tracemalloc.
+    """
+    hasil = None
+    terbaik = None
+    for _ in range(max(1, ulang)):
+        t0 = time.perf_counter()
+        hasil = fn(file_path)
+        dt = time.perf_counter() - t0
+        terbaik = dt if terbaik is None else min(terbaik, dt)
+
+    puncak = None
+    if memori:
+        tracemalloc.start()
+        try:
+            fn(file_path)
+            _, puncak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return hasil, terbaik, puncak
+
+def banding_dokumen(acuan_fn, kandidat_fn, file_path, ulang=1, memori=True):
+    laporan = {"file": file_path}
+    try:
+        a, ta, ma = ukur(acuan_fn, file_path, ulang, memori)
+    except Exception as e:
+        laporan.update(status="gagal_acuan", error=str(e))
+        return laporan
+    try:
+        b, tb, mb = ukur(kandidat_fn, file_path, ulang, memori)
+    except Exception as e:
+        laporan.update(status="gagal_kandidat", error=str(e))
+        return laporan
+
+    # normalisasi lewat JSON agar tuple/list dsb dibandingkan seperti output CLI
+    a = json.loads(json.dumps(a, ensure_ascii=False))
+    b = json.loads(json.dumps(b, ensure_ascii=False))
+    bagian = banding_per_bagian(a, b)
+    beda = {k: v for k, v in bagian.items() if v is not None}
+
+    laporan.update(
+        status="sama" if not beda else "beda",
+        bagian_beda=beda,
+        detik_acuan=round(ta, 6),
+        detik_kandidat=round(tb, 6),
+        speedup=round(ta / tb, 3) if tb else None,
+    )
+    if memori:
+        laporan.update(
+            memori_acuan=ma,
+            memori_kandidat=mb,
+            delta_memori=(mb - ma) if (ma is not None and mb is not None) else None,
+        )
+    return laporan
+
+# -------------------- CLI --------------------
+
+def _ringkas(v, n=80):
+    s = json.dumps(v, ensure_ascii=False)
+    return s if len(s) <= n else s[:n - 3] + "..."
+
+def cetak_laporan(laporan_list, out=sys.stdout):
+    for lap in laporan_list:
+        nama = os.path.basename(lap["file"])
+        if lap["status"].startswith("gagal"):
+            print(f"❌ {nama}: {lap['status']} — {lap.get('error')}", file=out)
+            continue
+        mem = ""
+        if lap.get("delta_memori") is not None:
+            mem = f", Δmemori {lap['delta_memori'] / 1024:+.1f} KiB"
+        tanda = "✅" if lap["status"] == "sama" else "❌"
+        print(f"{tanda} {nama}: speedup {lap['speedup']}x "
+              f"({lap['detik_acuan'] * 1000:.1f} ms → {lap['detik_kandidat'] * 1000:.1f} ms){mem}", file=out)
+        for bagian, d in lap.get("bagian_beda", {}).items():
+            print(f"    - {bagian}: beda pertama di {d['path']}", file=out)
+            print(f"        acuan   : {_ringkas(d['acuan'])}", file=out)
+            print(f"        kandidat: {_ringkas(d['kandidat'])}", file=out)
+
+    ok = [l for l in laporan_list if l["status"] == "sama"]
+    speedups = [l["speedup"] for l in laporan_list if l.get("speedup")]
+    print(f"\nTotal {len(laporan_list)} dokumen: {len(ok)} sama, "
+          f"{len(laporan_list) - len(ok)} beda/gagal", file=out)
+    if speedups:
+        speedups.sort()
+        print(f"Speedup median {speedups[len(speedups) // 2]}x "
+              f"(min {speedups[0]}x, maks {speedups[-1]}x)", file=out)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bandingkan ekstraktor kandidat dengan ekstraktor acuan.")
+    ap.add_argument("kandidat", help="engine kandidat, format <modul|path.py>:<fungsi>")
+    ap.add_argument("korpus", nargs="+", help="file .doc/.docx atau direktori korpus")
+    ap.add_argument("--acuan", default=ACUAN_DEFAULT, help=f"engine acuan (default {ACUAN_DEFAULT})")
+    ap.add_argument("--ulang", type=int, default=1, help="jumlah pengulangan untuk pengukuran waktu")
+    ap.add_argument("--tanpa-memori", action="store_true", help="lewati pengukuran memori (tracemalloc)")
+    ap.add_argument("--json", dest="json_out", help="tulis laporan lengkap ke file JSON")
+    args = ap.parse_args(argv)
+
+    acuan_fn = muat_engine(args.acuan)
+    kandidat_fn = muat_engine(args.kandidat)
+    korpus = kumpulkan_korpus(args.korpus)
+    if not korpus:
+        print("❌ Korpus kosong: tidak ada file .doc/.docx", file=sys.stderr)
+        return 1
+
+    laporan_list = [
+        banding_dokumen(acuan_fn, kandidat_fn, f, args.ulang, not args.tanpa_memori)
+        for f in korpus
+    ]
+    cetak_laporan(laporan_list)
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as fh:
+            json.dump(laporan_list, fh, ensure_ascii=False, indent=2)
+    return 0 if all(l["status"] == "sama" for l in laporan_list) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,362 @@
+"""
+Catatan biaya ekstraksi per dokumen + jalur lambat (karantina) untuk dokumen mahal.
+
+Segelintir dokumen patologis (tabel gabungan raksasa, ribuan paragraf list) butuh waktu
+berlipat-lipat dibanding dokumen biasa dan menahan worker. Modul ini menyimpan biaya tiap
+ekstraksi di SQLite, dikunci sha256 isi file, beserta sidik template (siapkan_layout),
+fitur ukuran, dan rincian waktu per fase dari dict `waktu` extractor.
+
+Sebelum ekstraksi, nilai_jalur() memperkirakan biaya:
+  1) riwayat   dokumen yang sama pernah diekstrak dengan versi extractor yang sama
+               (versi_sumber.py) -> median atas dari JENDELA_RIWAYAT pengamatan terakhir
+               (termasuk yang dibunuh tenggat / gagal). Satu run lambat karena CPU host
+               padat, atau bug yang sudah diperbaiki, tidak menandai dokumen selamanya;
+  2) model     dokumen baru -> laju median (ms per paragraf+sel, atau per MB untuk format
+               tanpa hitungan) dari run terakhir dokumen lain, dikali fitur dokumen;
+  3) ambang    jumlah paragraf/sel di atas batas keras -> langsung lambat.
+Prediksi >= ANJAB_LAMBAT_MS -> jalur "lambat": slot admisi sendiri (slot_host "lambat",
+ANJAB_SLOT_LAMBAT, default 1), tenggat antre lebih panjang, dan prioritas CPU rendah (nice).
+
+Env:
+  ANJAB_BIAYA_DB      path SQLite; kosong = nonaktif (tanpa catatan, tanpa jalur lambat)
+  ANJAB_LAMBAT_MS     ambang prediksi jalur lambat dalam ms (default 10000)
+  ANJAB_LAMBAT_NICE   kenaikan nice proses jalur lambat (default 10)
+
+Dipakai CLI ekstrakanjab.py / ekstrakabk.py, zigot.py (jalur & tenggat sendiri), dan
+pantau_folder.py (pool terpisah). Gagal baca/tulis catatan tidak menggagalkan ekstraksi.
+
+Contoh:
+    ANJAB_BIAYA_DB=/var/lib/anjab/biaya.db python scripts/ekstrakanjab.py dokumen.docx
+    python scripts/biaya_dokumen.py laporan /var/lib/anjab/biaya.db --batas 20
+    python scripts/biaya_dokumen.py laporan /var/lib/anjab/biaya.db --per-sidik
+    python scripts/biaya_dokumen.py cek /var/lib/anjab/biaya.db dokumen.docx
+"""
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import contextlib
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+ENV_DB = "ANJAB_BIAYA_DB"
+AMBANG_MS_DEFAULT = 10000.0
+MAKS_PARAGRAF = 5000     # di atas ini langsung jalur lambat, tanpa menunggu riwayat
+MAKS_SEL = 20000
+MIN_SAMPEL_MODEL = 5     # riwayat minimal sebelum model laju dipakai
+SAMPEL_MODEL = 500       # catatan terbaru yang dipakai menghitung laju
+JENDELA_RIWAYAT = 5      # pengamatan terakhir per dokumen yang disimpan & dipakai prediksi
+# akar source extractor; versi berubah -> riwayat per dokumen versi lama tidak dipakai lagi
+SUMBER_AKAR = ("ekstrakanjab.py", "ekstrakabk.py")
+
+SKEMA = """
+CREATE TABLE IF NOT EXISTS biaya (
+    kunci TEXT PRIMARY KEY,
+    sidik TEXT,
+    file TEXT,
+    extractor TEXT,
+    ukuran INTEGER,
+    paragraf INTEGER,
+    sel INTEGER,
+    n INTEGER NOT NULL DEFAULT 0,
+    ms_terakhir REAL,
+    ms_maks REAL,
+    ms_total REAL NOT NULL DEFAULT 0,
+    rincian TEXT,
+    status TEXT,
+    jalur TEXT,
+    diperbarui REAL
+);
+CREATE INDEX IF NOT EXISTS biaya_ms_maks ON biaya(ms_maks DESC);
+CREATE INDEX IF NOT EXISTS biaya_diperbarui ON biaya(diperbarui DESC);
+CREATE TABLE IF NOT EXISTS amatan (
+    kunci TEXT NOT NULL,
+    versi TEXT,
+    ms REAL NOT NULL,
+    status TEXT,
+    waktu REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS amatan_kunci ON amatan(kunci, waktu DESC);
+"""
+
+# -------------------- KONFIGURASI --------------------
+
+def path_db():
+    return os.environ.get(ENV_DB) or None
+
+def _env_angka(nama, default):
+    try:
+        return float(os.environ.get(nama, default))
+    except ValueError:
+        return float(default)
+
+def ambang_ms() -> float:
+    return _env_angka("ANJAB_LAMBAT_MS", AMBANG_MS_DEFAULT)
+
+def versi_extractor() -> str:
+    from versi_sumber import versi
+    return versi(SUMBER_AKAR)
+
+def buka(path: str):
+    d = os.path.dirname(os.path.abspath(path))
+    os.makedirs(d, exist_ok=True)
+    con = sqlite3.connect(path, timeout=30)
+    try:
+        con.execute("PRAGMA journal_mode=WAL")  # banyak proses extractor menulis bersamaan
+    except sqlite3.OperationalError:
+        pass
+    con.executescript(SKEMA)
+    return con
+
+# -------------------- FITUR DOKUMEN --------------------
+
+_POLA_P = re.compile(rb"<w:p[ >/]")
+_POLA_TC = re.compile(rb"<w:tc[ >/]")
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for potong in iter(lambda: fh.read(1 << 20), b""):
+            h.update(potong)
+    return h.hexdigest()
+
+def fitur(path: str) -> dict:
+    """
+    Fitur murah sebelum parse: ukuran file; untuk OOXML juga jumlah paragraf & sel tabel,
+    dihitung dengan memindai word/document.xml secara streaming (tanpa parse XML).
+    """
+    hasil = {"ukuran": os.path.getsize(path), "paragraf": None, "sel": None}
+    import zipfile
+    try:
+        with zipfile.ZipFile(path) as z, z.open("word/document.xml") as fh:
+            n_p = n_tc = 0
+            sisa = b""
+            for potong in iter(lambda: fh.read(1 << 20), b""):
+                buf = sisa + potong
+                batas = max(0, len(buf) - 6)  # tag yang terpotong di ujung dihitung di potongan berikutnya
+                n_p += len(_POLA_P.findall(buf, 0, batas))
+                n_tc += len(_POLA_TC.findall(buf, 0, batas))
+                sisa = buf[batas:]
+            n_p += len(_POLA_P.findall(sisa))
+            n_tc += len(_POLA_TC.findall(sisa))
+        hasil["paragraf"], hasil["sel"] = n_p, n_tc
+    except (zipfile.BadZipFile, KeyError, OSError):
+        pass  # .doc / RTF / HTML: cukup ukuran
+    return hasil
+
+# -------------------- PREDIKSI --------------------
+
+def _laju(con, kolom_unit: str):
+    """Median ms per unit (paragraf+sel atau MB) dari catatan sukses terbaru; None bila riwayat kurang."""
+    baris = con.execute(
+        f"SELECT ms_terakhir, {kolom_unit} FROM biaya WHERE status = 'ok' AND {kolom_unit} > 0 "
+        "ORDER BY diperbarui DESC LIMIT ?", (SAMPEL_MODEL,)).fetchall()
+    laju = sorted(ms / unit for ms, unit in baris if ms is not None)
+    if len(laju) < MIN_SAMPEL_MODEL:
+        return None
+    return laju[len(laju) // 2]
+
+def prediksi(con, kunci: str, ftr: dict, versi=None) -> dict:
+    """return {"ms": perkiraan | None, "dasar": "riwayat" | "model" | "ambang" | None}."""
+    ms = sorted(r[0] for r in con.execute(
+        "SELECT ms FROM amatan WHERE kunci = ? AND versi IS ? ORDER BY waktu DESC, rowid DESC LIMIT ?",
+        (kunci, versi, JENDELA_RIWAYAT)))
+    if ms:
+        # median atas: satu pengamatan (mis. dibunuh tenggat) tetap dipakai apa adanya,
+        # satu pencilan di antara run normal tidak
+        return {"ms": ms[len(ms) // 2], "dasar": "riwayat"}
+    if (ftr.get("paragraf") or 0) >= MAKS_PARAGRAF or (ftr.get("sel") or 0) >= MAKS_SEL:
+        return {"ms": None, "dasar": "ambang"}
+    if ftr.get("paragraf") is not None:
+        unit = ftr["paragraf"] + ftr["sel"]
+        laju = _laju(con, "(paragraf + sel)")
+    else:
+        unit = ftr["ukuran"] / (1024 * 1024)
+        laju = _laju(con, "(ukuran / 1048576.0)")
+    if laju is None:
+        return {"ms": None, "dasar": None}
+    return {"ms": laju * unit, "dasar": "model"}
+
+def nilai_jalur(path: str, file_path: str) -> dict:
+    """
+    Tentukan jalur dokumen sebelum ekstraksi. return dict info (diteruskan ke catat()):
+      {"kunci", "versi", "fitur", "prediksi_ms", "dasar", "jalur": "normal" | "lambat"}
+    Gagal membaca DB -> jalur normal (dengan peringatan).
+    """
+    info = {"kunci": None, "versi": versi_extractor(), "fitur": None, "prediksi_ms": None, "dasar": None,
+            "jalur": "normal", "file": os.path.basename(file_path)}
+    try:
+        info["kunci"] = sha256_file(file_path)
+        info["fitur"] = fitur(file_path)
+    except OSError:
+        return info  # file tidak terbaca: biar extractor yang melaporkan
+    try:
+        with contextlib.closing(buka(path)) as con:
+            p = prediksi(con, info["kunci"], info["fitur"], info["versi"])
+    except sqlite3.Error as e:
+        print(f"⚠️ Gagal membaca catatan biaya {path}: {e}", file=sys.stderr)
+        return info
+    info["prediksi_ms"], info["dasar"] = p["ms"], p["dasar"]
+    if p["dasar"] == "ambang" or (p["ms"] is not None and p["ms"] >= ambang_ms()):
+        info["jalur"] = "lambat"
+    return info
+
+# -------------------- JALUR LAMBAT --------------------
+
+def turunkan_prioritas():
+    """Naikkan nice proses ini (jalur lambat tidak merebut CPU dokumen normal). Non-POSIX: no-op."""
+    try:
+        os.nice(int(_env_angka("ANJAB_LAMBAT_NICE", 10)))
+    except (AttributeError, OSError, ValueError):
+        pass
+
+def masuk_jalur_lambat(waktu=None):
+    """Context manager untuk CLI: prioritas rendah + slot admisi "lambat" dengan tenggat antre sendiri."""
+    from slot_host import slot
+    turunkan_prioritas()
+    return slot("lambat", waktu=waktu)
+
+# -------------------- CATAT --------------------
+
+def _rincian(waktu, status):
+    if not waktu:
+        return None
+    r = {}
+    for k in ("baca", "konversi"):
+        if k in waktu:
+            r[k] = round(waktu[k] * 1000, 1)
+    for k in ("antre", "bagian"):
+        if waktu.get(k):
+            r[k] = {n: round(dt * 1000, 1) for n, dt in waktu[k].items()}
+    if status != "ok" and waktu.get("fase"):
+        r["fase"] = waktu["fase"]  # fase saat gagal / dibunuh
+    return r
+
+def simpan(con, info: dict, extractor: str, status: str, durasi: float, waktu=None):
+    """
+    Upsert satu pengamatan: ringkasan per dokumen (biaya, untuk laporan; rincian waktu dari
+    run terburuk) + jendela JENDELA_RIWAYAT pengamatan terakhir (amatan, untuk prediksi).
+    durasi: detik sejak invokasi; lama antre slot (waktu["antre"]) dikurangkan.
+    """
+    # antre slot bukan biaya dokumen: lama menunggu ditentukan dokumen lain
+    antre = sum(((waktu or {}).get("antre") or {}).values())
+    ms = max(durasi - antre, 0.0) * 1000
+    ftr = info.get("fitur") or {}
+    rincian = _rincian(waktu, status)
+    sekarang = time.time()
+    versi = info["versi"] if "versi" in info else versi_extractor()
+    with con:
+        con.execute("INSERT INTO amatan (kunci, versi, ms, status, waktu) VALUES (?, ?, ?, ?, ?)",
+                    (info["kunci"], versi, ms, status, sekarang))
+        con.execute("""DELETE FROM amatan WHERE kunci = ? AND rowid NOT IN (
+                           SELECT rowid FROM amatan WHERE kunci = ? ORDER BY waktu DESC, rowid DESC LIMIT ?)""",
+                    (info["kunci"], info["kunci"], JENDELA_RIWAYAT))
+        con.execute(
+            """INSERT INTO biaya (kunci, sidik, file, extractor, ukuran, paragraf, sel, n, ms_terakhir, ms_maks,
+                                  ms_total, rincian, status, jalur, diperbarui)
+               VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(kunci) DO UPDATE SET
+                   sidik = COALESCE(excluded.sidik, biaya.sidik),
+                   file = excluded.file, extractor = excluded.extractor,
+                   n = biaya.n + 1, ms_terakhir = excluded.ms_terakhir,
+                   rincian = CASE WHEN excluded.ms_maks >= COALESCE(biaya.ms_maks, 0)
+                                  THEN COALESCE(excluded.rincian, biaya.rincian) ELSE biaya.rincian END,
+                   ms_maks = MAX(COALESCE(biaya.ms_maks, 0), excluded.ms_maks),
+                   ms_total = biaya.ms_total + excluded.ms_total,
+                   status = excluded.status, jalur = excluded.jalur, diperbarui = excluded.diperbarui""",
+            (info["kunci"], (waktu or {}).get("sidik"), info.get("file"), extractor, ftr.get("ukuran"),
+             ftr.get("paragraf"), ftr.get("sel"), ms, ms, ms,
+             json.dumps(rincian, ensure_ascii=False) if rincian else None, status, info.get("jalur"), sekarang))
+
+def catat(path: str, info, extractor: str, status: str, durasi: float, waktu=None):
+    """Seperti simpan(), tetapi kegagalan catatan biaya tidak boleh menggagalkan ekstraksi."""
+    if not path or not info or not info.get("kunci"):
+        return
+    try:
+        with contextlib.closing(buka(path)) as con:
+            simpan(con, info, extractor, status, durasi, waktu)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Gagal menulis catatan biaya {path}: {e}", file=sys.stderr)
+
+# -------------------- LAPORAN --------------------
+
+def laporan(con, batas=20, per_sidik=False):
+    """Dokumen (atau template) termahal, urut biaya terburuk."""
+    if per_sidik:
+        baris = con.execute(
+            """SELECT sidik, COUNT(*), MAX(ms_maks), SUM(ms_total) / SUM(n), SUM(status != 'ok')
+               FROM biaya GROUP BY sidik ORDER BY MAX(ms_maks) DESC LIMIT ?""", (batas,)).fetchall()
+        return [{"sidik": s, "dokumen": d, "ms_maks": round(m or 0, 1), "ms_rata": round(r or 0, 1), "bermasalah": b}
+                for s, d, m, r, b in baris]
+    baris = con.execute(
+        """SELECT kunci, file, extractor, sidik, ukuran, paragraf, sel, n, ms_maks, ms_total, ms_terakhir,
+                  rincian, status, jalur, diperbarui
+           FROM biaya ORDER BY ms_maks DESC LIMIT ?""", (batas,)).fetchall()
+    hasil = []
+    for (kunci, file, extractor, sidik, ukuran, paragraf, sel, n, ms_maks, ms_total, ms_terakhir,
+         rincian, status, jalur, diperbarui) in baris:
+        hasil.append({
+            "kunci": kunci, "file": file, "extractor": extractor, "sidik": sidik,
+            "ukuran": ukuran, "paragraf": paragraf, "sel": sel, "n": n,
+            "ms_maks": round(ms_maks or 0, 1), "ms_rata": round(ms_total / n, 1) if n else None,
+            "ms_terakhir": round(ms_terakhir or 0, 1), "status": status, "jalur": jalur,
+            "rincian": json.loads(rincian) if rincian else None,
+            "diperbarui": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(diperbarui)) if diperbarui else None,
+        })
+    return hasil
+
+def _cetak_tabel(rows, out=sys.stdout):
+    for r in rows:
+        rinci = r.get("rincian") or {}
+        bagian = sorted((rinci.get("bagian") or {}).items(), key=lambda kv: -kv[1])[:3]
+        teks_bagian = ", ".join(f"{k} {v:.0f}" for k, v in bagian)
+        fase = " ".join(f"{k} {rinci[k]:.0f}" for k in ("baca", "konversi") if k in rinci)
+        ukuran = f"{r['paragraf']}p/{r['sel']}sel" if r.get("paragraf") is not None else f"{(r['ukuran'] or 0) // 1024}KB"
+        print(f"{r['ms_maks']:>10.0f} ms  {r['status'] or '-':<8} {r['jalur'] or '-':<7} {ukuran:<16} "
+              f"{r['file'] or r['kunci'][:12]}  [{fase}{'; ' if fase and teks_bagian else ''}{teks_bagian}]", file=out)
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Catatan biaya ekstraksi per dokumen & jalur lambat.")
+    sub = ap.add_subparsers(dest="perintah", required=True)
+    p = sub.add_parser("laporan", help="dokumen termahal beserta rincian waktu")
+    p.add_argument("db")
+    p.add_argument("--batas", type=int, default=20)
+    p.add_argument("--per-sidik", action="store_true", help="agregasi per sidik template")
+    p.add_argument("--json", action="store_true", help="output JSON")
+    c = sub.add_parser("cek", help="prediksi biaya & jalur untuk satu dokumen")
+    c.add_argument("db")
+    c.add_argument("file")
+    args = ap.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if not os.path.isfile(args.db):
+        print(f"❌ Database biaya tidak ditemukan: {args.db}", file=sys.stderr)
+        return 1
+    try:
+        if args.perintah == "cek":
+            if not os.path.isfile(args.file):
+                print(f"❌ File tidak ditemukan: {args.file}", file=sys.stderr)
+                return 1
+            print(json.dumps(nilai_jalur(args.db, args.file), ensure_ascii=False))
+            return 0
+        with contextlib.closing(buka(args.db)) as con:
+            rows = laporan(con, args.batas, args.per_sidik)
+    except sqlite3.Error as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        return 1
+    if args.json or args.per_sidik:
+        print(json.dumps(rows, ensure_ascii=False, indent=None if args.json else 2))
+    else:
+        _cetak_tabel(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Pemecah dokumen bundel: satu .doc/.docx berisi banyak anjab (satu per jabatan), dipisah
+page break dan judul "NAMA JABATAN" berulang. extract_info mengasumsikan satu jabatan
+per file, jadi bundel dipecah dulu menjadi segmen blok lalu tiap segmen diekstrak sendiri.
+
+Batas segmen ditentukan dari aliran blok body (paragraf/tabel, urutan asli):
+- tiap paragraf body berlabel "NAMA JABATAN ... : nilai" (aturan extract_line_value)
+  membuka jabatan baru;
+- awal segmen = blok setelah page break / section break terakhir sebelum label itu;
+  tanpa break, paragraf judul kapital tepat di atas label (mis. "INFORMASI JABATAN")
+  ikut ke segmen baru.
+Dokumen dengan 0-1 label = satu segmen (hasil sama dengan extract_info).
+
+Ekstraksi per segmen memakai Document yang sama: isi body ditukar ke blok segmen lalu
+extract_from_doc dijalankan (tanpa parse ulang). Dengan --proses > 1 segmen dibagi ke
+beberapa proses; tiap proses mem-parse dokumen sekali.
+
+Output: list hasil extract_info per jabatan, tiap item mendapat kunci
+"segmen": {"ke", "dari", "blok_awal", "blok_akhir"}.
+
+Contoh:
+    python scripts/bundel_anjab.py bundel.docx --proses 4
+    python scripts/ekstrakanjab.py bundel.docx --bundel
+"""
+import io
+import os
+import sys
+import json
+import argparse
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+LABEL_NAMA = "NAMA JABATAN"
+MAKS_JUDUL = 3          # paragraf judul di atas label yang ikut ke segmen baru (tanpa break)
+MAKS_PANJANG_JUDUL = 80
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# -------------------- SEGMENTASI --------------------
+
+def _blok_body(doc):
+    """list elemen w:p / w:tbl anak langsung body, urutan dokumen (sama dengan iter_block_items)."""
+    return [el for el in doc.element.body.iterchildren() if el.tag in (W + "p", W + "tbl")]
+
+def _teks_p(el):
+    # sama dengan para_text: gabungan run langsung
+    return "".join(r.text or "" for r in el.iterchildren(W + "r")).strip()
+
+def _label_nama(el):
+    if el.tag != W + "p":
+        return False
+    t = _teks_p(el)
+    return LABEL_NAMA in t and len(t.split(":")) >= 2
+
+def _break_setelah(el):
+    """True bila blok ini diakhiri page break / section break (blok berikutnya di halaman baru)."""
+    if el.tag != W + "p":
+        return False
+    pPr = el.find(W + "pPr")
+    if pPr is not None and pPr.find(W + "sectPr") is not None:
+        return True
+    return any(br.get(W + "type") == "page" for br in el.iter(W + "br"))
+
+def _break_sebelum(el):
+    if el.tag != W + "p":
+        return False
+    pPr = el.find(W + "pPr")
+    if pPr is None:
+        return False
+    pb = pPr.find(W + "pageBreakBefore")
+    return pb is not None and pb.get(W + "val") not in ("0", "false", "off")
+
+def _judul(el):
+    """Paragraf judul dokumen (mis. "INFORMASI JABATAN"): huruf kapital, pendek, tanpa nomor/nilai."""
+    if el.tag != W + "p":
+        return False
+    t = _teks_p(el)
+    return (0 < len(t) <= MAKS_PANJANG_JUDUL and t == t.upper() and any(c.isalpha() for c in t)
+            and ":" not in t and not t[0].isdigit())
+
+def cari_segmen(blok):
+    """list (awal, akhir) index blok per jabatan; akhir eksklusif."""
+    label = [i for i, el in enumerate(blok) if _label_nama(el)]
+    if len(label) <= 1:
+        return [(0, len(blok))]
+    awal = [0]
+    for sebelum, i in zip(label, label[1:]):
+        batas = None
+        for j in range(i, sebelum, -1):
+            if _break_sebelum(blok[j]):
+                batas = j
+                break
+            if _break_setelah(blok[j - 1]):
+                batas = j
+                break
+        if batas is None:
+            batas = i
+            while batas - 1 > sebelum and i - (batas - 1) <= MAKS_JUDUL and _judul(blok[batas - 1]):
+                batas -= 1
+        awal.append(batas)
+    return list(zip(awal, awal[1:] + [len(blok)]))
+
+# -------------------- EKSTRAKSI --------------------
+
+def ekstrak_segmen(doc, segmen, nama_file):
+    """Ekstrak tiap (awal, akhir) pada Document yang sama dengan menukar isi body."""
+    import ekstrakanjab
+    body = doc.element.body
+    blok = _blok_body(doc)
+    sect_pr = body.find(W + "sectPr")
+    for el in blok:
+        body.remove(el)
+    hasil = []
+    try:
+        for awal, akhir in segmen:
+            for el in blok[awal:akhir]:
+                if sect_pr is not None:
+                    sect_pr.addprevious(el)
+                else:
+                    body.append(el)
+            try:
+                hasil.append(ekstrakanjab.extract_from_doc(doc, ekstrakanjab.doc_lines(doc), nama_file))
+            finally:
+                for el in blok[awal:akhir]:
+                    body.remove(el)
+    finally:
+        for el in blok:
+            if sect_pr is not None:
+                sect_pr.addprevious(el)
+            else:
+                body.append(el)
+    return hasil
+
+def _kerja(data, nama_file, segmen):
+    """Worker process pool: parse bytes .docx sekali, ekstrak beberapa segmen."""
+    from docx import Document
+    return ekstrak_segmen(Document(io.BytesIO(data)), segmen, nama_file)
+
+def baca(file_path):
+    import ekstrakanjab
+    ext = os.path.splitext(file_path)[-1].lower()
+    if ext in (".docx", ".doc"):
+        return ekstrakanjab.read_document(file_path)[0]
+    raise ValueError("File tidak didukung: " + file_path)
+
+def ekstrak_bundel(file_path, proses=1):
+    """list hasil per jabatan (lihat docstring modul)."""
+    doc = baca(file_path)
+    segmen = cari_segmen(_blok_body(doc))
+    nama_file = os.path.basename(file_path)
+    proses = max(1, min(proses, len(segmen)))
+    if proses == 1:
+        hasil = ekstrak_segmen(doc, segmen, nama_file)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        buf = io.BytesIO()
+        doc.save(buf)  # .doc: hasil pembacaan dikirim sebagai .docx, tidak dibaca/konversi ulang
+        data = buf.getvalue()
+        bagian = [segmen[k::proses] for k in range(proses)]
+        with ProcessPoolExecutor(max_workers=proses) as pool:
+            per_bagian = list(pool.map(_kerja, [data] * proses, [nama_file] * proses, bagian))
+        urut = {}
+        for seg_bagian, hasil_bagian in zip(bagian, per_bagian):
+            urut.update(zip(seg_bagian, hasil_bagian))
+        hasil = [urut[s] for s in segmen]
+    for ke, (data_jabatan, (awal, akhir)) in enumerate(zip(hasil, segmen), 1):
+        data_jabatan["segmen"] = {"ke": ke, "dari": len(segmen), "blok_awal": awal, "blok_akhir": akhir}
+    return hasil
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Pecah dokumen bundel multi-jabatan lalu ekstrak per jabatan.")
+    ap.add_argument("file")
+    ap.add_argument("--proses", type=int, default=1, help="jumlah proses ekstraksi paralel")
+    args = ap.parse_args(sys.argv[1:] if argv is None else argv)
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+    try:
+        hasil = ekstrak_bundel(args.file, args.proses)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        return 1
+    print(json.dumps(hasil, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Cek anggaran waktu start script extractor berbasis `python -X importtime`.
+
+Script extractor di-spawn sekali per upload, jadi biaya import dibayar di setiap
+request. Cek ini gagal (exit 1) bila:
+- import modul extractor melebihi anggaran (ms, median beberapa kali jalan), atau
+- jalur gagal-cepat CLI (argumen kurang / ekstensi tidak didukung) ikut memuat docx/lxml.
+
+Contoh:
+    python scripts/cek_waktu_impor.py
+    python scripts/cek_waktu_impor.py --budget-ms 30 --ulang 7
+Anggaran default bisa juga diatur lewat env ANJAB_IMPORT_BUDGET_MS.
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BUDGET_DEFAULT_MS = float(os.environ.get("ANJAB_IMPORT_BUDGET_MS", "40"))
+MODUL_BERAT = ("docx", "lxml")
+
+MODUL_EXTRACTOR = ("ekstrakanjab", "ekstrakabk")
+KASUS_GAGAL_CEPAT = (
+    ("ekstrakanjab.py",),                    # argumen kurang
+    ("ekstrakanjab.py", "dokumen.pdf"),      # ekstensi tidak didukung
+    ("ekstrakabk.py",),
+)
+
+
+def parse_importtime(stderr: str):
+    """
+    Parse output -X importtime.
+    return: list (nama_modul, kedalaman, self_us, kumulatif_us)
+    """
+    hasil = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # baris header "self [us] | cumulative | imported package"
+        raw = parts[2].rstrip()
+        nama = raw.lstrip()
+        kedalaman = (len(raw) - len(nama) - 1) // 2
+        hasil.append((nama, kedalaman, self_us, cum_us))
+    return hasil
+
+
+def jalankan(args):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=SCRIPTS_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    return proc.returncode, parse_importtime(proc.stderr)
+
+
+def modul_berat_dimuat(entries):
+    return sorted({n.split(".")[0] for n, _d, _s, _c in entries if n.split(".")[0] in MODUL_BERAT})
+
+
+def cek_import_modul(modul: str, ulang: int):
+    """Median waktu kumulatif import modul extractor (ms) + daftar modul berat yang ikut dimuat."""
+    sampel, berat = [], []
+    for _ in range(ulang):
+        _rc, entries = jalankan(["-c", f"import {modul}"])
+        cum = next((c for n, d, _s, c in entries if n == modul and d == 0), None)
+        if cum is not None:
+            sampel.append(cum / 1000.0)
+        berat = modul_berat_dimuat(entries)
+    ms = statistics.median(sampel) if sampel else float("inf")
+    return ms, berat
+
+
+def cek_gagal_cepat(args):
+    rc, entries = jalankan(list(args))
+    total_ms = sum(c for _n, d, _s, c in entries if d == 0) / 1000.0
+    return rc, total_ms, modul_berat_dimuat(entries)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Cek anggaran waktu import script extractor.")
+    ap.add_argument("--budget-ms", type=float, default=BUDGET_DEFAULT_MS,
+                    help=f"anggaran import per modul dalam ms (default {BUDGET_DEFAULT_MS:g})")
+    ap.add_argument("--ulang", type=int, default=5, help="jumlah pengukuran per modul (diambil median)")
+    args = ap.parse_args(argv)
+
+    gagal = False
+    # pemanasan: pastikan __pycache__ sudah ada agar pengukuran tidak termasuk kompilasi
+    for modul in MODUL_EXTRACTOR:
+        jalankan(["-c", f"import {modul}"])
+
+    for modul in MODUL_EXTRACTOR:
+        ms, berat = cek_import_modul(modul, args.ulang)
+        ok = ms <= args.budget_ms and not berat
+        gagal |= not ok
+        tanda = "✅" if ok else "❌"
+        info = f" (ikut memuat: {', '.join(berat)})" if berat else ""
+        print(f"{tanda} import {modul}: {ms:.1f} ms / anggaran {args.budget_ms:g} ms{info}")
+
+    for kasus in KASUS_GAGAL_CEPAT:
+        rc, total_ms, berat = cek_gagal_cepat(kasus)
+        ok = rc != 0 and not berat
+        gagal |= not ok
+        tanda = "✅" if ok else "❌"
+        info = f" (ikut memuat: {', '.join(berat)})" if berat else ""
+        print(f"{tanda} {' '.join(kasus)}: exit {rc}, import total {total_ms:.1f} ms{info}")
+
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
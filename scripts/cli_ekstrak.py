@@ -0,0 +1,65 @@
+"""
+Rangkaian jalan satu dokumen dari CLI extractor (ekstrakanjab.py / ekstrakabk.py):
+profil on-demand, slot admisi per host / jalur lambat, catatan biaya, metrik, lalu
+cetak JSON ke stdout. Dipakai bersama supaya kedua extractor tidak menyimpang.
+
+Hanya stdlib di level modul (dipanggil dari __main__, lihat cek_waktu_impor.py);
+modul opsional di-import hanya bila env-nya diisi.
+"""
+import os
+import sys
+import json
+import time
+import contextlib
+
+
+def jalankan_cli(extractor, fn, file_path, metrics_file=None):
+    """
+    Jalankan fn(file_path, waktu) -> data lalu cetak JSON.
+    extractor: "anjab" | "abk" (label metrik & catatan biaya).
+    return data; gagal = pesan ❌ ke stderr lalu sys.exit(1).
+    """
+    from metrik import catat, sampel_dokumen
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+    biaya_db = os.environ.get("ANJAB_BIAYA_DB")
+    waktu = {} if metrics_file or biaya_db else None
+    t_mulai = time.perf_counter()
+    profil_run = contextlib.nullcontext()
+    if os.environ.get("ANJAB_PROFILE_RATE") or os.environ.get("ANJAB_PROFILE_HASH"):
+        # profil on-demand (profil.py); hanya di-import bila diminta
+        from profil import mungkin_profil
+        profil_run = mungkin_profil(extractor, file_path)
+    slot_run = contextlib.nullcontext()
+    biaya = None
+    if biaya_db:
+        # catatan biaya per dokumen (biaya_dokumen.py): dokumen mahal masuk jalur lambat
+        import biaya_dokumen
+        biaya = biaya_dokumen.nilai_jalur(biaya_db, file_path)
+    if biaya and biaya["jalur"] == "lambat":
+        slot_run = biaya_dokumen.masuk_jalur_lambat(waktu)
+    elif os.environ.get("ANJAB_SLOT_PARSE"):
+        # admisi per host (slot_host.py): batasi ekstraksi bersamaan lintas proses
+        from slot_host import slot
+        slot_run = slot("parse", waktu=waktu)
+    try:
+        with slot_run, profil_run:
+            data = fn(file_path, waktu)
+        if waktu is not None:
+            waktu["fase"] = "serialisasi"
+        out = json.dumps(data, ensure_ascii=False)
+        print(out)
+    except Exception as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        if biaya:
+            biaya_dokumen.catat(biaya_db, biaya, extractor, "gagal", time.perf_counter() - t_mulai, waktu)
+        if metrics_file:
+            catat(metrics_file, sampel_dokumen(extractor, waktu, "gagal", waktu.get("fase", "baca"),
+                                               durasi=time.perf_counter() - t_mulai))
+        sys.exit(1)
+    if biaya:
+        biaya_dokumen.catat(biaya_db, biaya, extractor, "ok", time.perf_counter() - t_mulai, waktu)
+    if metrics_file:
+        catat(metrics_file, sampel_dokumen(extractor, waktu, "ok", output_bytes=len(out.encode("utf-8")),
+                                           durasi=time.perf_counter() - t_mulai))
+    return data
@@ -0,0 +1,136 @@
+"""
+Delta hasil ekstraksi terhadap ekstraksi sebelumnya untuk jabatan yang sama, supaya
+import ulang cukup menyentuh baris yang berubah (bukan hapus + insert semua tabel).
+
+Item list dicocokkan dengan kunci isi yang stabil (bukan nomor urut), mis. deskripsi
+tugas pokok, teks tanggung jawab, nama risiko. Kunci sama muncul lebih dari sekali ->
+dipasangkan berurutan. Hasil per bagian:
+
+  {"ditambah": [{"kunci", "posisi", "item"}],
+   "diubah":   [{"kunci", "posisi_lama", "posisi", "kolom", "item", ("tahapan": delta)}],
+   "dihapus":  [{"kunci", "posisi_lama", "item"}],
+   "tetap": n}
+
+posisi = index 0-based di list (urutan baris di tabel DB); kolom = kunci JSON yang berubah
+(kosong = isi sama, hanya pindah posisi).
+Field tunggal (nama, kode, unit kerja, kualifikasi, syarat, ...) dilaporkan di "jabatan".
+
+Contoh:
+    python scripts/ekstrakanjab.py revisi.docx --sebelumnya=lama.json   # output + "delta"
+    python scripts/delta_anjab.py lama.json baru.json
+"""
+import re
+import sys
+import json
+import hashlib
+
+# bagian list -> fungsi kunci isi item
+def _norm(s) -> str:
+    if isinstance(s, (list, tuple)):
+        return " | ".join(_norm(x) for x in s)
+    return re.sub(r"\s+", " ", str(s or "")).strip().lower()
+
+def _teks_butir(items):
+    return [it.get("text", "") for it in items or []]
+
+KUNCI_BAGIAN = {
+    "tugas_pokok": lambda t: _norm((t.get("uraian_tugas") or {}).get("deskripsi")),
+    "hasil_kerja": lambda h: _norm(_teks_butir(h.get("hasil_kerja"))),
+    "bahan_kerja": lambda b: _norm(b.get("bahan_kerja")),
+    "perangkat_kerja": lambda p: _norm(p.get("perangkat_kerja")),
+    "tanggung_jawab": lambda r: _norm(r.get("uraian")),
+    "wewenang": lambda r: _norm(r.get("uraian")),
+    "korelasi_jabatan": lambda k: _norm([k.get("jabatan"), k.get("unit_kerja_instansi")]),
+    "kondisi_lingkungan_kerja": lambda k: _norm(k.get("aspek")),
+    "risiko_bahaya": lambda r: _norm(r.get("nama_risiko")),
+}
+KUNCI_TAHAPAN = lambda th: _norm(th.get("tahapan"))
+
+FIELD_JABATAN = ("nama_jabatan", "kode_jabatan", "unit_kerja", "ikhtisar_jabatan", "kualifikasi_jabatan",
+                 "syarat_jabatan", "prestasi_yang_diharapkan", "kelas_jabatan")
+
+# -------------------- DELTA --------------------
+
+def _id_kunci(kunci: str) -> str:
+    return hashlib.sha1(kunci.encode("utf-8")).hexdigest()[:12]
+
+def _kolom_berubah(a: dict, b: dict):
+    return [k for k in b if a.get(k) != b.get(k)] + [k for k in a if k not in b]
+
+def delta_list(lama, baru, fungsi_kunci, sub=None):
+    """
+    Delta dua list item. sub: (nama, path_list, fungsi_kunci) untuk delta bertingkat
+    (tahapan di dalam uraian_tugas tugas pokok).
+    """
+    lama, baru = list(lama or []), list(baru or [])
+    antre = {}
+    for i, it in enumerate(lama):
+        antre.setdefault(fungsi_kunci(it), []).append(i)
+
+    hasil = {"ditambah": [], "diubah": [], "dihapus": [], "tetap": 0}
+    terpakai = set()
+    for j, it in enumerate(baru):
+        k = fungsi_kunci(it)
+        daftar = antre.get(k)
+        if not daftar:
+            hasil["ditambah"].append({"kunci": _id_kunci(k), "posisi": j, "item": it})
+            continue
+        i = daftar.pop(0)
+        terpakai.add(i)
+        if lama[i] == it and i == j:
+            hasil["tetap"] += 1
+            continue
+        ubah = {"kunci": _id_kunci(k), "posisi_lama": i, "posisi": j,
+                "kolom": _kolom_berubah(lama[i], it), "item": it}
+        if sub is not None:
+            nama, ambil, kunci_sub = sub
+            d = delta_list(ambil(lama[i]), ambil(it), kunci_sub)
+            if d["ditambah"] or d["diubah"] or d["dihapus"]:
+                ubah[nama] = d
+        hasil["diubah"].append(ubah)
+    for i, it in enumerate(lama):
+        if i not in terpakai:
+            hasil["dihapus"].append({"kunci": _id_kunci(fungsi_kunci(it)), "posisi_lama": i, "item": it})
+    return hasil
+
+def sidik(data: dict) -> str:
+    """Sidik isi (tanpa nama file / delta) untuk memastikan delta diterapkan pada dasar yang benar."""
+    isi = {k: v for k, v in data.items() if k not in ("file", "delta")}
+    return hashlib.sha1(json.dumps(isi, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+def hitung_delta(lama: dict, baru: dict) -> dict:
+    jabatan = {f: baru.get(f) for f in FIELD_JABATAN if lama.get(f) != baru.get(f)}
+    bagian = {}
+    for nama, fk in KUNCI_BAGIAN.items():
+        sub = None
+        if nama == "tugas_pokok":
+            sub = ("tahapan", lambda t: (t.get("uraian_tugas") or {}).get("detail_uraian_tugas"), KUNCI_TAHAPAN)
+        bagian[nama] = delta_list(lama.get(nama), baru.get(nama), fk, sub)
+    berubah = bool(jabatan) or any(d["ditambah"] or d["diubah"] or d["dihapus"] for d in bagian.values())
+    return {"dasar": sidik(lama), "berubah": berubah, "jabatan": jabatan, "bagian": bagian}
+
+def muat_sebelumnya(sumber):
+    """dict apa adanya, atau path file JSON output extract_info."""
+    if isinstance(sumber, dict):
+        return sumber
+    with open(sumber, encoding="utf-8") as fh:
+        return json.load(fh)
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("❌ Argumen tidak lengkap: butuh lama.json baru.json", file=sys.stderr)
+        return 1
+    try:
+        d = hitung_delta(muat_sebelumnya(argv[0]), muat_sebelumnya(argv[1]))
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        return 1
+    print(json.dumps(d, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
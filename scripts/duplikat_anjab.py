@@ -0,0 +1,299 @@
+"""
+Deteksi anjab hampir-duplikat dengan indeks MinHash + LSH persisten (SQLite).
+
+Teks ikhtisar_jabatan + tugas_pokok (uraian, tahapan, dst.) hasil extract_info di-shingle
+(3-gram kata), diringkas menjadi signature MinHash, lalu dipecah ke band LSH.
+Pencarian hanya membandingkan dokumen yang berbagi minimal satu band (sub-linear),
+kemudian skor kemiripan diestimasi dari signature.
+
+Contoh:
+    python scripts/duplikat_anjab.py bangun indeks.db arsip/          # bulk build
+    python scripts/duplikat_anjab.py tambah indeks.db baru.docx       # insert inkremental
+    python scripts/duplikat_anjab.py cari indeks.db upload.docx --ambang 0.6
+
+Input boleh dokumen .doc/.docx (diekstrak dulu) atau file .json output extract_info.
+Dokumen dikunci dengan sha256 isi file (sama dengan indeks_teks.py), bukan path: arsip yang
+dipindah/di-rename lalu diindeks ulang memperbarui entri yang sama, bukan menambah duplikat.
+Dokumen tanpa teks (kosong / tidak terbaca) tidak punya signature: tidak diindeks dan
+dilaporkan terpisah ("kosong"), bukan dianggap duplikat satu sama lain.
+"""
+import os
+import re
+import sys
+import json
+import array
+import sqlite3
+import hashlib
+import argparse
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+JUMLAH_PERM = 128
+JUMLAH_BAND = 32          # 32 band x 4 baris -> ambang LSH efektif ~0.42
+UKURAN_SHINGLE = 3
+AMBANG_DEFAULT = 0.5
+SEED = 20240611
+
+_PRIMA = (1 << 61) - 1
+_MAKS32 = (1 << 32) - 1
+EKSTENSI_DOKUMEN = (".doc", ".docx", ".json")
+
+# -------------------- SHINGLE + MINHASH --------------------
+
+def _kumpulkan_teks(v, out):
+    if isinstance(v, str):
+        out.append(v)
+    elif isinstance(v, dict):
+        for x in v.values():
+            _kumpulkan_teks(x, out)
+    elif isinstance(v, list):
+        for x in v:
+            _kumpulkan_teks(x, out)
+
+def teks_dokumen(data: dict) -> str:
+    """Gabungkan teks yang menentukan isi jabatan: ikhtisar + seluruh uraian tugas pokok."""
+    bagian = [data.get("ikhtisar_jabatan") or ""]
+    for t in data.get("tugas_pokok") or []:
+        _kumpulkan_teks(t.get("uraian_tugas"), bagian)
+    return " ".join(bagian)
+
+def shingles(teks: str, k: int = UKURAN_SHINGLE) -> set:
+    kata = re.findall(r"[0-9a-z]+", teks.lower())
+    if len(kata) < k:
+        return {" ".join(kata)} if kata else set()
+    return {" ".join(kata[i:i + k]) for i in range(len(kata) - k + 1)}
+
+def _hash64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+
+def _koefisien(n: int, seed: int = SEED):
+    import random
+    rnd = random.Random(seed)
+    return [(rnd.randrange(1, _PRIMA), rnd.randrange(0, _PRIMA)) for _ in range(n)]
+
+_KOEF = _koefisien(JUMLAH_PERM)
+
+def minhash(sh: set, koef=_KOEF):
+    """Signature MinHash (list int 32-bit). Himpunan kosong -> None (tidak ada yang dibandingkan)."""
+    if not sh:
+        return None
+    hs = [_hash64(s) for s in sh]
+    return [min(((a * h + b) % _PRIMA) & _MAKS32 for h in hs) for a, b in koef]
+
+def estimasi_jaccard(sig1, sig2) -> float:
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+def kunci_band(sig, jumlah_band=JUMLAH_BAND):
+    """Hash tiap band (r = perm / band baris) menjadi int64 bertanda (cocok untuk SQLite)."""
+    r = len(sig) // jumlah_band
+    hasil = []
+    for b in range(jumlah_band):
+        blok = array.array("I", sig[b * r:(b + 1) * r]).tobytes()
+        hasil.append(int.from_bytes(hashlib.blake2b(blok, digest_size=8).digest(), "little", signed=True))
+    return hasil
+
+# -------------------- INDEKS (SQLite) --------------------
+
+SKEMA = """
+CREATE TABLE IF NOT EXISTS meta (kunci TEXT PRIMARY KEY, nilai TEXT);
+CREATE TABLE IF NOT EXISTS dokumen (
+    id INTEGER PRIMARY KEY,
+    kunci TEXT UNIQUE NOT NULL,
+    file TEXT,
+    nama_jabatan TEXT,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS band (
+    band INTEGER NOT NULL,
+    hash INTEGER NOT NULL,
+    dok_id INTEGER NOT NULL REFERENCES dokumen(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_band ON band(band, hash);
+CREATE INDEX IF NOT EXISTS idx_band_dok ON band(dok_id);
+"""
+
+def buka_indeks(path: str):
+    con = sqlite3.connect(path)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA foreign_keys=ON")
+    con.executescript(SKEMA)
+    meta = dict(con.execute("SELECT kunci, nilai FROM meta"))
+    harap = {"perm": str(JUMLAH_PERM), "band": str(JUMLAH_BAND), "shingle": str(UKURAN_SHINGLE), "seed": str(SEED),
+             "kunci": "sha256"}
+    if not meta:
+        con.executemany("INSERT INTO meta VALUES (?, ?)", harap.items())
+        con.commit()
+    elif meta != harap:
+        con.close()
+        raise ValueError(f"Parameter indeks {path} berbeda ({meta}); bangun ulang indeks.")
+    return con
+
+def _sig_blob(sig) -> bytes:
+    return array.array("I", sig).tobytes()
+
+def _blob_sig(blob: bytes):
+    a = array.array("I")
+    a.frombytes(blob)
+    return a.tolist()
+
+# signature dokumen kosong di indeks lama (sebelum minhash mengembalikan None)
+_SIG_KOSONG = _sig_blob([_MAKS32] * JUMLAH_PERM)
+
+def simpan_dokumen(con, kunci: str, nama_jabatan: str, sig, file=None):
+    """
+    Insert/ganti satu dokumen beserta band LSH-nya (tanpa commit). sig None -> entri lama dihapus.
+    kunci: sha256 isi; file: path terakhir dokumen itu (informasi saja).
+    """
+    if sig is None:
+        con.execute("DELETE FROM dokumen WHERE kunci = ?", (kunci,))  # band ikut terhapus (CASCADE)
+        return None
+    lama = con.execute("SELECT id FROM dokumen WHERE kunci = ?", (kunci,)).fetchone()
+    if lama:
+        con.execute("DELETE FROM band WHERE dok_id = ?", (lama[0],))
+        con.execute("UPDATE dokumen SET file = ?, nama_jabatan = ?, signature = ? WHERE id = ?",
+                    (file, nama_jabatan, _sig_blob(sig), lama[0]))
+        dok_id = lama[0]
+    else:
+        dok_id = con.execute("INSERT INTO dokumen (kunci, file, nama_jabatan, signature) VALUES (?, ?, ?, ?)",
+                             (kunci, file, nama_jabatan, _sig_blob(sig))).lastrowid
+    con.executemany("INSERT INTO band (band, hash, dok_id) VALUES (?, ?, ?)",
+                    [(b, h, dok_id) for b, h in enumerate(kunci_band(sig))])
+    return dok_id
+
+def cari_kandidat(con, sig, ambang=AMBANG_DEFAULT, batas=10, kecuali=None):
+    """
+    Kandidat hampir-duplikat: dokumen yang berbagi >= 1 band, diurutkan skor estimasi Jaccard.
+    return: list {"kunci", "file", "nama_jabatan", "skor"}
+    """
+    if sig is None:
+        return []
+    ids = set()
+    for b, h in enumerate(kunci_band(sig)):
+        ids.update(r[0] for r in con.execute("SELECT dok_id FROM band WHERE band = ? AND hash = ?", (b, h)))
+    hasil = []
+    for dok_id in ids:
+        kunci, file, nama, blob = con.execute(
+            "SELECT kunci, file, nama_jabatan, signature FROM dokumen WHERE id = ?", (dok_id,)).fetchone()
+        if kunci == kecuali or blob == _SIG_KOSONG:
+            continue
+        skor = estimasi_jaccard(sig, _blob_sig(blob))
+        if skor >= ambang:
+            hasil.append({"kunci": kunci, "file": file, "nama_jabatan": nama, "skor": round(skor, 4)})
+    hasil.sort(key=lambda x: (-x["skor"], x["kunci"]))
+    return hasil[:batas]
+
+# -------------------- INPUT --------------------
+
+def signature_file(path: str):
+    """Dijalankan juga di process pool saat bulk build. return (kunci sha256, nama_jabatan, sig)."""
+    from indeks_teks import baca_dokumen  # kunci sama dengan indeks teks (<sha256>.json ekstrak_ulang)
+    kunci, data = baca_dokumen(path)
+    return kunci, data.get("nama_jabatan") or "", minhash(shingles(teks_dokumen(data)))
+
+def kumpulkan_input(paths):
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                hasil.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.lower().endswith(EKSTENSI_DOKUMEN) and not f.startswith("~$"))
+        else:
+            hasil.append(p)
+    return hasil
+
+# -------------------- CLI --------------------
+
+def cmd_bangun(args):
+    files = kumpulkan_input(args.input)
+    if not files:
+        print("❌ Tidak ada file .doc/.docx/.json", file=sys.stderr)
+        return 1
+    con = buka_indeks(args.indeks)
+    gagal = 0
+    if args.proses > 1 and len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.proses) as pool:
+            futs = [(f, pool.submit(signature_file, f)) for f in files]
+            hasil = []
+            for f, fut in futs:
+                try:
+                    hasil.append((f, *fut.result()))
+                except Exception as e:
+                    gagal += 1
+                    print(f"❌ {f}: {e}", file=sys.stderr)
+    else:
+        hasil = []
+        for f in files:
+            try:
+                hasil.append((f, *signature_file(f)))
+            except Exception as e:
+                gagal += 1
+                print(f"❌ {f}: {e}", file=sys.stderr)
+    kosong = [f for f, _kunci, _nama, sig in hasil if sig is None]
+    with con:
+        for f, kunci, nama, sig in hasil:
+            simpan_dokumen(con, kunci, nama, sig, os.path.abspath(f))
+    total = con.execute("SELECT COUNT(*) FROM dokumen").fetchone()[0]
+    con.close()
+    for f in kosong:
+        print(f"⚠️ {f}: tidak ada teks tugas/ikhtisar, tidak diindeks", file=sys.stderr)
+    print(json.dumps({"ditambahkan": len(hasil) - len(kosong), "kosong": len(kosong), "gagal": gagal,
+                      "total_indeks": total}, ensure_ascii=False))
+    return 0 if not gagal else 1
+
+def cmd_cari(args):
+    con = buka_indeks(args.indeks)
+    keluaran = []
+    for f in kumpulkan_input(args.input):
+        try:
+            kunci, nama, sig = signature_file(f)
+        except Exception as e:
+            print(f"❌ {f}: {e}", file=sys.stderr)
+            continue
+        keluaran.append({
+            "file": os.path.abspath(f),
+            "kunci": kunci,
+            "nama_jabatan": nama,
+            "kosong": sig is None,
+            # isi identik dengan dokumen terindeks = dokumen yang sama (mis. dipindah), bukan kandidat
+            "sudah_terindeks": con.execute("SELECT 1 FROM dokumen WHERE kunci = ?", (kunci,)).fetchone() is not None,
+            "kandidat": cari_kandidat(con, sig, args.ambang, args.batas, kecuali=kunci),
+        })
+        if args.simpan:
+            with con:
+                simpan_dokumen(con, kunci, nama, sig, os.path.abspath(f))
+    con.close()
+    print(json.dumps(keluaran, ensure_ascii=False, indent=2))
+    return 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Indeks MinHash/LSH untuk deteksi anjab hampir-duplikat.")
+    sub = ap.add_subparsers(dest="perintah", required=True)
+    for nama, bantuan in (("bangun", "bulk build dari arsip"), ("tambah", "insert inkremental")):
+        p = sub.add_parser(nama, help=bantuan)
+        p.add_argument("indeks", help="file indeks SQLite")
+        p.add_argument("input", nargs="+", help="file .doc/.docx/.json atau direktori")
+        p.add_argument("--proses", type=int, default=os.cpu_count() or 1, help="jumlah proses ekstraksi paralel")
+    p = sub.add_parser("cari", help="cari kandidat hampir-duplikat")
+    p.add_argument("indeks", help="file indeks SQLite")
+    p.add_argument("input", nargs="+", help="file .doc/.docx/.json")
+    p.add_argument("--ambang", type=float, default=AMBANG_DEFAULT, help="skor minimal (estimasi Jaccard)")
+    p.add_argument("--batas", type=int, default=10, help="jumlah kandidat maksimal per file")
+    p.add_argument("--simpan", action="store_true", help="tambahkan file ke indeks setelah dicari")
+    args = ap.parse_args(argv)
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+
+    try:
+        if args.perintah == "cari":
+            return cmd_cari(args)
+        return cmd_bangun(args)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Ekspor korpus hasil extract_info ke tabel kolumnar (Parquet / Arrow IPC) untuk analitik.
+
+Setiap bagian JSON diratakan menjadi tabel sendiri dengan kunci dokumen `dok_id`
+(sha256 dokumen; untuk output ekstrak_ulang.py = nama file <sha256>.json):
+
+  jabatan          satu baris per dokumen (identitas, unit kerja, ikhtisar, prestasi, kelas)
+  tugas_pokok      satu baris per tugas (no_tugas, deskripsi, kolom beban kerja)
+  tahapan          satu baris per tahapan (detail_tahapan sebagai list<string>)
+  butir_hasil      item hasil kerja bertingkat (bagian tugas_pokok / hasil_kerja, induk -> urutan)
+  hasil_kerja, bahan_kerja, perangkat_kerja, tanggung_jawab, wewenang,
+  korelasi_jabatan, kondisi_lingkungan_kerja, risiko_bahaya
+  kualifikasi      format panjang: (jenis, urutan, nilai)
+  syarat_jabatan   format panjang: (aspek, urutan, nilai); kondisi fisik -> "kondisi_fisik.<nama>"
+
+Kolom berulang (dok_id, bagian, jenis, aspek, unit kerja, kelas, ...) ditulis dictionary-encoded.
+Data ditulis per batch dokumen (--batch) sehingga memori tetap terbatas berapa pun besar korpus.
+Arrow IPC tidak mengizinkan penggantian kamus dalam satu file: begitu kamus satu kolom melewati
+MAKS_KAMUS nilai, tabel dilanjutkan ke file berikutnya (<tabel>.arrow, <tabel>-1.arrow, ...).
+Kompresi IPC hanya zstd / lz4 / none; snappy dan lainnya hanya untuk Parquet.
+Butuh pyarrow (opsional, hanya untuk script ini): pip install pyarrow
+
+Contoh:
+    python scripts/ekspor_kolom.py hasil/ --out kolom/ --format parquet
+    python -c "import pyarrow.dataset as ds; print(ds.dataset('kolom/tugas_pokok.parquet').to_table().num_rows)"
+    python scripts/ekspor_kolom.py hasil/ --out kolom/ --format arrow --kompresi lz4
+    python -c "import glob, pyarrow.dataset as ds; print(ds.dataset(sorted(glob.glob('kolom/tugas_pokok*.arrow')), format='arrow').to_table().num_rows)"
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+EKSTENSI_INPUT = (".json", ".doc", ".docx")
+BATCH_DEFAULT = 500
+MAKS_KAMUS = 1 << 16     # nilai unik per kolom dictionary dalam satu file .arrow
+KOMPRESI = {"parquet": ("zstd", "lz4", "snappy", "gzip", "brotli", "none"),
+            "arrow": ("zstd", "lz4", "none")}
+SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# tipe kolom: s = string, d = string dictionary-encoded, i = int32, l = list<string>
+UNIT_KERJA = [("JPT Utama", "unit_jpt_utama"), ("JPT Madya", "unit_jpt_madya"),
+              ("JPT Pratama", "unit_jpt_pratama"), ("Administrator", "unit_administrator"),
+              ("Pengawas", "unit_pengawas"), ("Pelaksana", "unit_pelaksana"),
+              ("Jabatan Fungsional", "unit_jabatan_fungsional")]
+
+# bagian list-of-dict datar: kolom JSON -> tipe
+BAGIAN_DATAR = {
+    "bahan_kerja": [("bahan_kerja", "l"), ("penggunaan_dalam_tugas", "l")],
+    "perangkat_kerja": [("perangkat_kerja", "l"), ("penggunaan_untuk_tugas", "l")],
+    "tanggung_jawab": [("uraian", "s")],
+    "wewenang": [("uraian", "s")],
+    "korelasi_jabatan": [("jabatan", "d"), ("unit_kerja_instansi", "d"), ("dalam_hal", "l")],
+    "kondisi_lingkungan_kerja": [("aspek", "d"), ("faktor", "d")],
+    "risiko_bahaya": [("nama_risiko", "d"), ("penyebab", "s")],
+}
+
+TABEL = {
+    "jabatan": [("dok_id", "s"), ("file", "s"), ("nama_jabatan", "s"), ("kode_jabatan", "d")]
+               + [(kolom, "d") for _k, kolom in UNIT_KERJA]
+               + [("ikhtisar_jabatan", "s"), ("prestasi_yang_diharapkan", "s"), ("kelas_jabatan", "d")],
+    "tugas_pokok": [("dok_id", "d"), ("no_tugas", "i"), ("no", "s"), ("deskripsi", "s"),
+                    ("jumlah_hasil", "s"), ("waktu_penyelesaian_jam", "s"),
+                    ("waktu_efektif", "s"), ("kebutuhan_pegawai", "s")],
+    "tahapan": [("dok_id", "d"), ("no_tugas", "i"), ("no_tahapan", "i"),
+                ("tahapan", "s"), ("detail_tahapan", "l")],
+    "butir_hasil": [("dok_id", "d"), ("bagian", "d"), ("no", "i"), ("urutan", "i"),
+                    ("induk", "i"), ("level", "i"), ("text", "s")],
+    "hasil_kerja": [("dok_id", "d"), ("no", "i"), ("satuan_hasil", "l")],
+    "kualifikasi": [("dok_id", "d"), ("jenis", "d"), ("urutan", "i"), ("nilai", "d")],
+    "syarat_jabatan": [("dok_id", "d"), ("aspek", "d"), ("urutan", "i"), ("nilai", "d")],
+}
+for _bagian, _kolom in BAGIAN_DATAR.items():
+    TABEL[_bagian] = [("dok_id", "d"), ("no", "i")] + _kolom
+
+# -------------------- PERATAAN --------------------
+
+def _int(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+def _butir(rows, dok_id, bagian, no, items, hitung, induk=None, level=0):
+    for it in items or []:
+        urutan = hitung[0] = hitung[0] + 1  # urutan unik per dokumen; induk merujuk ke sini
+        _tambah(rows, "butir_hasil", dok_id=dok_id, bagian=bagian, no=no, urutan=urutan,
+                induk=induk, level=level, text=it.get("text", ""))
+        _butir(rows, dok_id, bagian, no, it.get("children"), hitung, urutan, level + 1)
+
+def _tambah(rows, tabel, **nilai):
+    kolom = rows[tabel]
+    for nama, _tipe in TABEL[tabel]:
+        kolom[nama].append(nilai.get(nama))
+
+def ratakan(data: dict, dok_id: str, rows: dict):
+    """Tambahkan satu dokumen (dict extract_info) ke buffer kolom `rows`."""
+    unit = data.get("unit_kerja") or {}
+    hitung = [0]
+    _tambah(rows, "jabatan", dok_id=dok_id, file=data.get("file"),
+            nama_jabatan=data.get("nama_jabatan"), kode_jabatan=data.get("kode_jabatan"),
+            ikhtisar_jabatan=data.get("ikhtisar_jabatan"),
+            prestasi_yang_diharapkan=data.get("prestasi_yang_diharapkan"),
+            kelas_jabatan=data.get("kelas_jabatan"),
+            **{kolom: unit.get(k) for k, kolom in UNIT_KERJA})
+
+    for i, t in enumerate(data.get("tugas_pokok") or [], 1):
+        u = t.get("uraian_tugas") or {}
+        _tambah(rows, "tugas_pokok", dok_id=dok_id, no_tugas=i, no=t.get("no"),
+                deskripsi=u.get("deskripsi"), jumlah_hasil=u.get("jumlah_hasil"),
+                waktu_penyelesaian_jam=u.get("waktu_penyelesaian_(jam)"),
+                waktu_efektif=u.get("waktu_efektif"), kebutuhan_pegawai=u.get("kebutuhan_pegawai"))
+        for j, th in enumerate(u.get("detail_uraian_tugas") or [], 1):
+            _tambah(rows, "tahapan", dok_id=dok_id, no_tugas=i, no_tahapan=j,
+                    tahapan=th.get("tahapan"), detail_tahapan=list(th.get("detail_tahapan") or []))
+        _butir(rows, dok_id, "tugas_pokok", i, u.get("hasil_kerja"), hitung)
+
+    for h in data.get("hasil_kerja") or []:
+        no = _int(h.get("no"))
+        _tambah(rows, "hasil_kerja", dok_id=dok_id, no=no, satuan_hasil=list(h.get("satuan_hasil") or []))
+        _butir(rows, dok_id, "hasil_kerja", no, h.get("hasil_kerja"), hitung)
+
+    for bagian, kolom in BAGIAN_DATAR.items():
+        for r in data.get(bagian) or []:
+            _tambah(rows, bagian, dok_id=dok_id, no=_int(r.get("no")),
+                    **{k: (list(r.get(k) or []) if tipe == "l" else r.get(k)) for k, tipe in kolom})
+
+    kual = data.get("kualifikasi_jabatan") or {}
+    daftar = [("pendidikan_formal", kual.get("pendidikan_formal"))]
+    daftar += list((kual.get("pendidikan_dan_pelatihan") or {}).items())
+    daftar.append(("pengalaman_kerja", kual.get("pengalaman_kerja")))
+    for jenis, nilai in daftar:
+        for k, v in enumerate(nilai or [], 1):
+            _tambah(rows, "kualifikasi", dok_id=dok_id, jenis=jenis, urutan=k, nilai=v)
+
+    for aspek, nilai in (data.get("syarat_jabatan") or {}).items():
+        if isinstance(nilai, dict):
+            for sub, v in nilai.items():
+                _tambah(rows, "syarat_jabatan", dok_id=dok_id, aspek=f"{aspek}.{sub}", urutan=1, nilai=v)
+        else:
+            for k, v in enumerate(nilai or [], 1):
+                _tambah(rows, "syarat_jabatan", dok_id=dok_id, aspek=aspek, urutan=k, nilai=v)
+
+def buffer_kosong() -> dict:
+    return {t: {nama: [] for nama, _tipe in kolom} for t, kolom in TABEL.items()}
+
+# -------------------- PENULIS --------------------
+
+class PenulisKolom:
+    """
+    Satu writer per tabel (<out>/<tabel>.parquet atau .arrow), dibuka saat batch pertama.
+    Parquet: kamus kolom dictionary-encoded dibuat per batch (per row group).
+    Arrow IPC file tidak mengizinkan penggantian kamus, jadi kamus dipertahankan
+    antarbatch (hanya bertambah) dan writer cukup menulis deltanya; bila satu kamus
+    melewati maks_kamus, file ditutup dan tabel dilanjutkan ke file baru dengan kamus kosong.
+    """
+
+    def __init__(self, out_dir, fmt="parquet", kompresi="zstd", maks_kamus=MAKS_KAMUS):
+        if kompresi not in KOMPRESI[fmt]:
+            raise ValueError(f"Kompresi {kompresi!r} tidak didukung format {fmt} (pilih: {', '.join(KOMPRESI[fmt])})")
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise RuntimeError("pyarrow belum terpasang (pip install pyarrow)")
+        self.pa = pa
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.kompresi = kompresi
+        self.maks_kamus = maks_kamus
+        self.writer = {}
+        self.kamus = {}  # (tabel, kolom) -> (dict nilai->indeks, list nilai)
+        self.file = {t: [] for t in TABEL}
+        self.jumlah_baris = {t: 0 for t in TABEL}
+        os.makedirs(out_dir, exist_ok=True)
+
+    def _tipe(self, tipe):
+        pa = self.pa
+        return {"s": pa.string(), "d": pa.dictionary(pa.int32(), pa.string()),
+                "i": pa.int32(), "l": pa.list_(pa.string())}[tipe]
+
+    def schema(self, tabel):
+        return self.pa.schema([(nama, self._tipe(tipe)) for nama, tipe in TABEL[tabel]])
+
+    def _kolom_dict(self, tabel, nama, nilai):
+        pa = self.pa
+        if self.fmt == "parquet":  # tiap row group punya kamus sendiri
+            return pa.array(nilai, pa.string()).dictionary_encode()
+        indeks_map, isi = self.kamus.setdefault((tabel, nama), ({}, []))
+        indeks = []
+        for v in nilai:
+            if v is None:
+                indeks.append(None)
+                continue
+            i = indeks_map.get(v)
+            if i is None:
+                i = indeks_map[v] = len(isi)
+                isi.append(v)
+            indeks.append(i)
+        return pa.DictionaryArray.from_arrays(pa.array(indeks, pa.int32()), pa.array(isi, pa.string()))
+
+    def _buka(self, tabel, schema):
+        pa = self.pa
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            path = os.path.join(self.out_dir, tabel + ".parquet")
+            self.file[tabel].append(path)
+            return pq.ParquetWriter(path, schema, compression=self.kompresi, use_dictionary=True)
+        ke = len(self.file[tabel])
+        path = os.path.join(self.out_dir, tabel + (f"-{ke}" if ke else "") + ".arrow")
+        self.file[tabel].append(path)
+        opsi = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True,
+                                      compression=self.kompresi if self.kompresi != "none" else None)
+        return pa.ipc.new_file(path, schema, options=opsi)
+
+    def _arrays(self, tabel, kolom):
+        return [self._kolom_dict(tabel, nama, kolom[nama]) if tipe == "d"
+                else self.pa.array(kolom[nama], self._tipe(tipe)) for nama, tipe in TABEL[tabel]]
+
+    def _kamus_penuh(self, tabel):
+        return any(len(isi) > self.maks_kamus for (t, _nama), (_map, isi) in self.kamus.items() if t == tabel)
+
+    def tulis(self, rows: dict):
+        pa = self.pa
+        for tabel, kolom in rows.items():
+            n = len(next(iter(kolom.values())))
+            if not n:
+                continue
+            schema = self.schema(tabel)
+            arrays = self._arrays(tabel, kolom)
+            if tabel in self.writer and self._kamus_penuh(tabel):
+                # batch ini di file baru, dengan kamus berisi nilai batch ini saja
+                self.writer.pop(tabel).close()
+                for k in [k for k in self.kamus if k[0] == tabel]:
+                    del self.kamus[k]
+                arrays = self._arrays(tabel, kolom)
+            batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+            w = self.writer.get(tabel)
+            if w is None:
+                w = self.writer[tabel] = self._buka(tabel, schema)
+            if self.fmt == "parquet":
+                w.write_batch(batch)
+            else:
+                w.write(batch)
+            self.jumlah_baris[tabel] += n
+
+    def tutup(self):
+        for w in self.writer.values():
+            w.close()
+        self.writer.clear()
+
+# -------------------- INPUT --------------------
+
+def kumpulkan_input(paths):
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                hasil.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.lower().endswith(EKSTENSI_INPUT) and not f.startswith(("~$", "manifest-", "ringkasan-")))
+        else:
+            hasil.append(p)
+    return hasil
+
+def baca_dokumen(path: str):
+    """return (dok_id, data). JSON <sha256>.json (ekstrak_ulang.py) memakai nama filenya."""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    if ext.lower() == ".json":
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        dok_id = stem if SHA256_RE.match(stem) else hashlib.sha256(raw).hexdigest()
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            # mis. list hasil --bundel (bundel_anjab.py): bukan satu dokumen extract_info
+            raise ValueError(f"JSON bukan satu hasil extract_info (tipe {type(data).__name__})")
+        return dok_id, data
+    from ekstrakanjab import extract_info
+    with open(path, "rb") as fh:
+        dok_id = hashlib.sha256(fh.read()).hexdigest()
+    return dok_id, extract_info(path)
+
+def ekspor(files, out_dir, fmt="parquet", batch=BATCH_DEFAULT, kompresi="zstd", log=sys.stderr,
+           maks_kamus=MAKS_KAMUS):
+    penulis = PenulisKolom(out_dir, fmt, kompresi, maks_kamus)
+    rows, isi, ok, gagal = buffer_kosong(), 0, 0, 0
+    try:
+        for f in files:
+            try:
+                dok_id, data = baca_dokumen(f)
+                satu = buffer_kosong()  # diratakan terpisah: dokumen gagal tidak meninggalkan baris parsial
+                ratakan(data, dok_id, satu)
+            except Exception as e:
+                print(f"❌ {f}: {e}", file=log)
+                gagal += 1
+                continue
+            for t, kolom in satu.items():
+                for nama, nilai in kolom.items():
+                    rows[t][nama].extend(nilai)
+            ok += 1
+            isi += 1
+            if isi >= batch:
+                penulis.tulis(rows)
+                rows, isi = buffer_kosong(), 0
+        if isi:
+            penulis.tulis(rows)
+    finally:
+        penulis.tutup()
+    return {"dokumen": ok, "gagal": gagal, "format": fmt, "out": out_dir, "baris": penulis.jumlah_baris,
+            "file": {t: f for t, f in penulis.file.items() if f}}
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Ekspor hasil ekstraksi anjab ke tabel kolumnar (Parquet/Arrow).")
+    ap.add_argument("input", nargs="+", help="file .json hasil extract_info / .doc / .docx, atau direktori")
+    ap.add_argument("--out", required=True, help="direktori output (satu file per tabel)")
+    ap.add_argument("--format", choices=("parquet", "arrow"), default="parquet")
+    ap.add_argument("--batch", type=int, default=BATCH_DEFAULT, help="jumlah dokumen per batch tulis")
+    ap.add_argument("--kompresi", default="zstd", help="zstd / lz4 / none; snappy, gzip, brotli hanya parquet")
+    args = ap.parse_args(argv)
+    if args.kompresi not in KOMPRESI[args.format]:
+        print(f"❌ Kompresi {args.kompresi!r} tidak didukung format {args.format} "
+              f"(pilih: {', '.join(KOMPRESI[args.format])})", file=sys.stderr)
+        return 1
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+
+    files = kumpulkan_input(args.input)
+    if not files:
+        print("❌ Tidak ada file input (.json/.doc/.docx)", file=sys.stderr)
+        return 1
+    try:
+        ringkasan = ekspor(files, args.out, args.format, max(1, args.batch), args.kompresi)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(ringkasan, ensure_ascii=False))
+    return 0 if not ringkasan["gagal"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""
+Ekstraksi anjab massal dengan pipeline bertahap:
+
+  [konversi]  thread pool, tiap konversi meminjam slot profil LibreOffice (ruang_kerja.py)
+      |  antrean terbatas
+  [parsing]   process pool: Document()/pembaca native + semua extract_* (extract_from_doc)
+      |  antrean terbatas
+  [tulis]     satu thread: serialisasi JSON + tulis file output
+
+.docx langsung masuk tahap parsing; .doc masuk tahap konversi (default), atau dengan
+ANJAB_DOC_READER=native dicoba native dulu dan yang butuh LibreOffice dikembalikan
+worker parsing ke tahap konversi, lalu diparsing ulang dari .docx.
+Tiap tahap punya ukuran sendiri dan backlog-nya dilaporkan berkala ke stderr.
+Output: <out>/<stem>.json; stem yang dipakai beberapa input (subdirektori berbeda,
+x.doc + x.docx) menjadi <stem>-<hash path>.json.
+
+Contoh:
+    python scripts/ekstrak_massal.py arsip/ --out hasil/ --konversi 2 --parsing 4
+"""
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+EKSTENSI_DOKUMEN = (".doc", ".docx")
+_SELESAI = object()  # sentinel antrean
+
+
+# -------------------- WORKER (process pool) --------------------
+
+def kerjakan_parsing(file_path, docx_path=None):
+    """
+    Jalan di process pool. return (status, payload):
+      ("ok", dict) | ("butuh_konversi", None) | ("gagal", pesan)
+    """
+    import ekstrakanjab
+    ir = None
+    if os.environ.get("ANJAB_IR_CACHE"):
+        import ir_dokumen as ir  # cache representasi antara: hit = tanpa konversi & parse XML
+    try:
+        doc = ir.muat(file_path) if ir and not docx_path else None
+        dari_cache = doc is not None
+        if dari_cache:
+            lines = ekstrakanjab.doc_lines(doc)
+        elif docx_path:
+            doc, lines = ekstrakanjab.read_docx(docx_path)
+        elif os.path.splitext(file_path)[-1].lower() in (".docx", ".doc"):
+            from bacadoc import DocTidakDidukung
+            try:
+                # jenis dari isi file; Word biner yang butuh LibreOffice dikembalikan ke tahap konversi
+                doc, lines = ekstrakanjab.read_document(file_path, konversi=False)
+            except DocTidakDidukung:
+                return "butuh_konversi", None
+        else:
+            return "gagal", "File tidak didukung: " + file_path
+        if ir and not dari_cache:
+            ir.simpan(file_path, doc)  # kunci = hash file asal (.doc), bukan hasil konversi
+        return "ok", ekstrakanjab.extract_from_doc(doc, lines, file_path)
+    except Exception as e:
+        return "gagal", str(e)
+
+
+# -------------------- PIPELINE --------------------
+
+class PipelineMassal:
+    def __init__(self, out_dir, n_konversi=2, n_parsing=None, ukuran_antrean=8,
+                 laporan_detik=5.0, log=sys.stderr):
+        self.out_dir = out_dir
+        self.n_konversi = max(1, n_konversi)
+        self.n_parsing = max(1, n_parsing or (os.cpu_count() or 2))
+        self.q_konversi = queue.Queue(maxsize=ukuran_antrean)
+        self.q_parsing = queue.Queue(maxsize=ukuran_antrean)
+        self.q_tulis = queue.Queue(maxsize=ukuran_antrean * 4)
+        self.q_hasil = queue.Queue()  # tak terbatas: callback process pool tidak boleh blok
+        self.laporan_detik = laporan_detik
+        self.log = log
+
+        self._lock = threading.Lock()
+        self.aktif = {"konversi": 0, "parsing": 0, "tulis": 0}
+        self.total = 0
+        self.sisa = 0
+        self.statistik = {"ok": 0, "gagal": 0, "dikonversi": 0}
+        self.nama_output = {}  # file input -> nama file JSON (lihat _tetapkan_nama_output)
+        self.gagal = []
+        self._berhenti = threading.Event()
+
+    # ---------- util ----------
+    def _ubah_aktif(self, tahap, delta):
+        with self._lock:
+            self.aktif[tahap] += delta
+
+    def backlog(self):
+        with self._lock:
+            aktif = dict(self.aktif)
+            selesai = self.total - self.sisa
+        return {
+            "konversi": {"antre": self.q_konversi.qsize(), "aktif": aktif["konversi"], "worker": self.n_konversi},
+            "parsing": {"antre": self.q_parsing.qsize(), "aktif": aktif["parsing"], "worker": self.n_parsing},
+            "tulis": {"antre": self.q_tulis.qsize(), "aktif": aktif["tulis"], "worker": 1},
+            "selesai": selesai,
+            "total": self.total,
+        }
+
+    def _lapor(self):
+        while not self._berhenti.wait(self.laporan_detik):
+            b = self.backlog()
+            print(
+                f"[backlog] konversi {b['konversi']['antre']} antre/{b['konversi']['aktif']} aktif | "
+                f"parsing {b['parsing']['antre']} antre/{b['parsing']['aktif']} aktif | "
+                f"tulis {b['tulis']['antre']} antre | selesai {b['selesai']}/{b['total']}",
+                file=self.log, flush=True,
+            )
+
+    # ---------- tahap 1: konversi ----------
+    def _worker_konversi(self):
+        import ruang_kerja
+        from ekstrakanjab import convert_doc_to_docx_via_libreoffice
+        while True:
+            item = self.q_konversi.get()
+            if item is _SELESAI:
+                return
+            self._ubah_aktif("konversi", 1)
+            try:
+                with ruang_kerja.profil_libreoffice() as profil:
+                    # output di ruang kerja; direktorinya dihapus router setelah parsing
+                    docx_path = convert_doc_to_docx_via_libreoffice(item, profile_dir=profil)
+                with self._lock:
+                    self.statistik["dikonversi"] += 1
+                self.q_parsing.put((item, docx_path))
+            except Exception as e:
+                self.q_hasil.put((item, None, "gagal", f"konversi: {e}"))
+            finally:
+                self._ubah_aktif("konversi", -1)
+
+    # ---------- tahap 2: parsing/ekstraksi ----------
+    def _dispatcher_parsing(self, pool):
+        slot = threading.BoundedSemaphore(self.n_parsing * 2)  # batasi tugas in-flight di pool
+        while True:
+            item = self.q_parsing.get()
+            if item is _SELESAI:
+                return
+            file_path, docx_path = item
+            slot.acquire()
+            self._ubah_aktif("parsing", 1)
+            fut = pool.submit(kerjakan_parsing, file_path, docx_path)
+
+            def _selesai(f, file_path=file_path, docx_path=docx_path):
+                slot.release()
+                self._ubah_aktif("parsing", -1)
+                try:
+                    status, payload = f.result()
+                except Exception as e:
+                    status, payload = "gagal", str(e)
+                self.q_hasil.put((file_path, docx_path, status, payload))
+
+            fut.add_done_callback(_selesai)
+
+    # ---------- tahap 3: tulis ----------
+    def _worker_tulis(self):
+        while True:
+            item = self.q_tulis.get()
+            if item is _SELESAI:
+                return
+            file_path, data = item
+            self._ubah_aktif("tulis", 1)
+            try:
+                out = os.path.join(self.out_dir, self.nama_output[file_path])
+                tmp = out + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(data, fh, ensure_ascii=False)
+                os.replace(tmp, out)
+                with self._lock:
+                    self.statistik["ok"] += 1
+            except Exception as e:
+                self._catat_gagal(file_path, f"tulis: {e}")
+            finally:
+                self._ubah_aktif("tulis", -1)
+                with self._lock:
+                    self.sisa -= 1
+
+    def _catat_gagal(self, file_path, pesan):
+        with self._lock:
+            self.statistik["gagal"] += 1
+            self.gagal.append({"file": file_path, "error": pesan})
+        print(f"❌ {os.path.basename(file_path)}: {pesan}", file=self.log, flush=True)
+
+    # ---------- orkestrasi ----------
+    def _tetapkan_nama_output(self, files):
+        """
+        <stem>.json; stem yang dipakai lebih dari satu input (subdirektori berbeda, x.doc + x.docx)
+        diberi akhiran hash path supaya hasil tidak saling menimpa diam-diam. Deterministik
+        untuk himpunan input yang sama, jadi run ulang menimpa hasilnya sendiri.
+        """
+        import hashlib
+        from collections import Counter
+        stem = {f: os.path.splitext(os.path.basename(f))[0] for f in files}
+        jumlah = Counter(s.lower() for s in stem.values())
+        for f, s in stem.items():
+            if jumlah[s.lower()] > 1:
+                s += "-" + hashlib.sha1(os.path.abspath(f).encode("utf-8")).hexdigest()[:8]
+            self.nama_output[f] = s + ".json"
+
+    def _umpan(self, files):
+        from bacadoc import pembaca_native
+        paksa_lo = not pembaca_native()
+        for f in files:
+            if paksa_lo and f.lower().endswith(".doc"):
+                self.q_konversi.put(f)
+            else:
+                self.q_parsing.put((f, None))
+
+    def jalankan(self, files):
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._tetapkan_nama_output(files)
+        self.total = self.sisa = len(files)
+        t0 = time.perf_counter()
+
+        pool = ProcessPoolExecutor(max_workers=self.n_parsing)
+        threads = [threading.Thread(target=self._worker_konversi, daemon=True)
+                   for _ in range(self.n_konversi)]
+        threads.append(threading.Thread(target=self._dispatcher_parsing, args=(pool,), daemon=True))
+        penulis = threading.Thread(target=self._worker_tulis, daemon=True)
+        pelapor = threading.Thread(target=self._lapor, daemon=True)
+        pengumpan = threading.Thread(target=self._umpan, args=(files,), daemon=True)
+        for t in threads + [penulis, pelapor, pengumpan]:
+            t.start()
+
+        # router hasil parsing (thread utama)
+        menunggu = len(files)
+        while menunggu:
+            file_path, docx_path, status, payload = self.q_hasil.get()
+            if docx_path:
+                shutil.rmtree(os.path.dirname(docx_path), ignore_errors=True)
+            if status == "butuh_konversi":
+                self.q_konversi.put(file_path)
+                continue
+            menunggu -= 1
+            if status == "ok":
+                self.q_tulis.put((file_path, payload))
+            else:
+                self._catat_gagal(file_path, payload)
+                with self._lock:
+                    self.sisa -= 1
+
+        pengumpan.join()
+        for _ in range(self.n_konversi):
+            self.q_konversi.put(_SELESAI)
+        self.q_parsing.put(_SELESAI)
+        self.q_tulis.put(_SELESAI)
+        for t in threads + [penulis]:
+            t.join()
+        pool.shutdown()
+        self._berhenti.set()
+
+        ringkasan = dict(self.statistik, total=len(files), detik=round(time.perf_counter() - t0, 3))
+        ringkasan["gagal_detail"] = self.gagal
+        return ringkasan
+
+
+def kumpulkan_input(paths):
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                hasil.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.lower().endswith(EKSTENSI_DOKUMEN) and not f.startswith("~$"))
+        else:
+            hasil.append(p)
+    return hasil
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Ekstraksi anjab massal dengan pipeline bertahap.")
+    ap.add_argument("input", nargs="+", help="file .doc/.docx atau direktori")
+    ap.add_argument("--out", required=True, help="direktori output JSON")
+    ap.add_argument("--konversi", type=int, default=2, help="jumlah proses LibreOffice paralel")
+    ap.add_argument("--parsing", type=int, default=None, help="jumlah worker parsing (default: jumlah CPU)")
+    ap.add_argument("--antrean", type=int, default=8, help="ukuran antrean antar tahap")
+    ap.add_argument("--laporan-detik", type=float, default=5.0, help="interval laporan backlog")
+    args = ap.parse_args(argv)
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+
+    files = kumpulkan_input(args.input)
+    if not files:
+        print("❌ Tidak ada file .doc/.docx", file=sys.stderr)
+        return 1
+
+    pipeline = PipelineMassal(
+        args.out, n_konversi=args.konversi, n_parsing=args.parsing,
+        ukuran_antrean=args.antrean, laporan_detik=args.laporan_detik,
+    )
+    ringkasan = pipeline.jalankan(files)
+    print(json.dumps(ringkasan, ensure_ascii=False))
+    return 0 if not ringkasan["gagal"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Job ekstraksi ulang arsip dokumen (setelah heuristik ekstrakanjab.py berubah).
+
+- Manifest append-only (JSONL) per shard: sha256 input, versi extractor, status,
+  lokasi output, durasi, percobaan. Satu baris = satu hasil akhir dokumen.
+- Resume: dokumen yang sudah "ok" untuk (sha256, versi extractor) yang sama dilewati;
+  semua manifest-*.jsonl di direktori output dibaca, jadi jumlah shard boleh berubah.
+- Sharding: dokumen dibagi dengan int(sha256) % N; tiap host mengambil --shard i/N
+  dari direktori bersama.
+- Dokumen gagal dicoba ulang dengan backoff eksponensial; ringkasan ditulis di akhir.
+
+Contoh:
+    python scripts/ekstrak_ulang.py arsip/ --out hasil/ --shard 0/3 --proses 4
+"""
+import os
+import sys
+import json
+import time
+import socket
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+# Python < 3.11: concurrent.futures.TimeoutError bukan TimeoutError bawaan
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+EKSTENSI_DOKUMEN = (".doc", ".docx")
+# akar source yang menentukan hasil ekstraksi; modul lokal yang di-import (bacadoc,
+# bacaformat, ir_dokumen, ...) ikut diturunkan (versi_sumber.py). berubah -> diekstrak ulang
+SUMBER_AKAR = ("ekstrakanjab.py", "probe_identitas.py")
+
+# -------------------- UTIL --------------------
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for blok in iter(lambda: fh.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+def versi_extractor() -> str:
+    from versi_sumber import versi
+    return versi(SUMBER_AKAR)
+
+def parse_shard(teks: str):
+    try:
+        i, n = (int(x) for x in teks.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("format shard: i/N, mis. 0/3")
+    if n < 1 or not 0 <= i < n:
+        raise argparse.ArgumentTypeError("shard harus 0 <= i < N")
+    return i, n
+
+def kumpulkan_input(paths):
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                hasil.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.lower().endswith(EKSTENSI_DOKUMEN) and not f.startswith("~$"))
+        else:
+            hasil.append(p)
+    return hasil
+
+# -------------------- MANIFEST --------------------
+
+def baca_selesai(out_dir: str, versi: str) -> set:
+    """sha256 yang sudah berstatus ok untuk versi extractor ini (dari semua manifest)."""
+    selesai = set()
+    for nama in os.listdir(out_dir):
+        if not (nama.startswith("manifest-") and nama.endswith(".jsonl")):
+            continue
+        with open(os.path.join(out_dir, nama), encoding="utf-8") as fh:
+            for baris in fh:
+                try:
+                    e = json.loads(baris)
+                except ValueError:
+                    continue  # baris terakhir terpotong saat crash
+                if e.get("versi") == versi and e.get("status") == "ok":
+                    selesai.add(e["sha256"])
+    return selesai
+
+def tambah_manifest(fh, entri: dict):
+    fh.write(json.dumps(entri, ensure_ascii=False) + "\n")
+    fh.flush()
+    os.fsync(fh.fileno())
+
+# -------------------- WORKER --------------------
+
+def ekstrak_satu(file_path: str, out_path: str):
+    """Dijalankan di process pool. return durasi (detik)."""
+    from ekstrakanjab import extract_info
+    t0 = time.perf_counter()
+    data = extract_info(file_path)
+    tmp = out_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, ensure_ascii=False)
+    os.replace(tmp, out_path)
+    if os.environ.get("ANJAB_INDEKS_TEKS"):
+        import indeks_teks
+        indeks_teks.catat(os.environ["ANJAB_INDEKS_TEKS"], os.path.basename(out_path)[:-len(".json")], data)
+    return time.perf_counter() - t0
+
+# -------------------- JOB --------------------
+
+def jalankan(files, out_dir, shard=(0, 1), proses=1, coba=3, backoff=2.0, log=sys.stderr):
+    os.makedirs(out_dir, exist_ok=True)
+    i_shard, n_shard = shard
+    versi = versi_extractor()
+    selesai = baca_selesai(out_dir, versi)
+
+    # pilih dokumen milik shard ini yang belum selesai
+    antre, dilewati = [], 0
+    for f in files:
+        try:
+            h = sha256_file(f)
+        except OSError as e:
+            print(f"❌ {f}: {e}", file=log)
+            continue
+        if int(h, 16) % n_shard != i_shard:
+            continue
+        if h in selesai:
+            dilewati += 1
+            continue
+        selesai.add(h)  # duplikat isi di arsip cukup diekstrak sekali
+        antre.append((f, h))
+
+    manifest_path = os.path.join(out_dir, f"manifest-{i_shard}-of-{n_shard}.jsonl")
+    ringkasan = {"versi": versi, "shard": f"{i_shard}/{n_shard}", "host": socket.gethostname(),
+                 "total_shard": len(antre) + dilewati, "dilewati": dilewati, "ok": 0, "gagal": 0,
+                 "dicoba_ulang": 0, "gagal_detail": []}
+    t_mulai = time.perf_counter()
+
+    with open(manifest_path, "a", encoding="utf-8") as mf, \
+            ProcessPoolExecutor(max_workers=max(1, proses)) as pool:
+        percobaan = {h: 0 for _f, h in antre}
+        berjalan = {}
+        tertunda = [(0.0, f, h) for f, h in antre]  # (boleh_mulai_pada, file, sha256)
+
+        while tertunda or berjalan:
+            sekarang = time.monotonic()
+            siap = [t for t in tertunda if t[0] <= sekarang]
+            tertunda = [t for t in tertunda if t[0] > sekarang]
+            for _t, f, h in siap:
+                percobaan[h] += 1
+                out_path = os.path.join(out_dir, h + ".json")
+                berjalan[pool.submit(ekstrak_satu, f, out_path)] = (f, h, out_path)
+
+            if not berjalan:
+                time.sleep(max(0.0, min(t[0] for t in tertunda) - time.monotonic()))
+                continue
+            batas = min((t[0] for t in tertunda), default=None)
+            try:
+                fut = next(as_completed(berjalan, timeout=None if batas is None else max(0.0, batas - time.monotonic())))
+            except FuturesTimeoutError:
+                continue  # belum ada yang selesai sebelum coba ulang berikutnya jatuh tempo
+            f, h, out_path = berjalan.pop(fut)
+            entri = {"sha256": h, "file": f, "versi": versi, "percobaan": percobaan[h],
+                     "waktu": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+            try:
+                detik = fut.result()
+                entri.update(status="ok", output=out_path, detik=round(detik, 4))
+                ringkasan["ok"] += 1
+            except Exception as e:
+                if percobaan[h] < coba:
+                    jeda = backoff * (2 ** (percobaan[h] - 1))
+                    print(f"⚠️ {os.path.basename(f)}: {e} — coba lagi dalam {jeda:g} detik", file=log)
+                    ringkasan["dicoba_ulang"] += 1
+                    tertunda.append((time.monotonic() + jeda, f, h))
+                    continue
+                entri.update(status="gagal", error=str(e))
+                ringkasan["gagal"] += 1
+                ringkasan["gagal_detail"].append({"file": f, "sha256": h, "error": str(e)})
+                print(f"❌ {os.path.basename(f)}: {e}", file=log)
+            tambah_manifest(mf, entri)
+
+    ringkasan["detik"] = round(time.perf_counter() - t_mulai, 3)
+    with open(os.path.join(out_dir, f"ringkasan-{i_shard}-of-{n_shard}.json"), "w", encoding="utf-8") as fh:
+        json.dump(ringkasan, fh, ensure_ascii=False, indent=2)
+    return ringkasan
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Ekstraksi ulang arsip anjab (resumable, bisa di-shard).")
+    ap.add_argument("input", nargs="+", help="file .doc/.docx atau direktori arsip")
+    ap.add_argument("--out", required=True, help="direktori output JSON + manifest")
+    ap.add_argument("--shard", type=parse_shard, default=(0, 1), help="bagian kerja host ini, format i/N")
+    ap.add_argument("--proses", type=int, default=os.cpu_count() or 1, help="jumlah proses ekstraksi")
+    ap.add_argument("--coba", type=int, default=3, help="jumlah percobaan maksimal per dokumen")
+    ap.add_argument("--backoff", type=float, default=2.0, help="jeda awal (detik) sebelum coba ulang, berlipat 2")
+    args = ap.parse_args(argv)
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+
+    files = kumpulkan_input(args.input)
+    if not files:
+        print("❌ Tidak ada file .doc/.docx", file=sys.stderr)
+        return 1
+    ringkasan = jalankan(files, args.out, args.shard, args.proses, args.coba, args.backoff)
+    print(json.dumps(ringkasan, ensure_ascii=False))
+    return 0 if not ringkasan["gagal"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,24 @@
-import docx
+import os
 import json
-
-def extract_docx(filepath):
-    doc = docx.Document(filepath)
+import time
+
+def extract_docx(filepath, waktu=None):
+    # import ditunda: jalur gagal-cepat di CLI tidak perlu memuat docx/lxml
+    import docx
+    # waktu: dict opsional untuk metrik.py ("fase", "baca", "bagian")
+    if waktu is not None:
+        waktu["fase"] = "baca"
+    t0 = time.perf_counter()
+    if os.environ.get("ANJAB_IR_CACHE"):
+        # representasi antara ter-cache per hash input (ir_dokumen.py)
+        from ir_dokumen import muat_dokumen
+        doc = muat_dokumen(filepath, docx.Document)
+    else:
+        doc = docx.Document(filepath)
+    if waktu is not None:
+        waktu["baca"] = time.perf_counter() - t0
+        waktu["fase"] = "ekstrak"
+    t0 = time.perf_counter()
 
     result = {
         "nama_jabatan": "",
@@ -89,24 +105,24 @@ def extract_docx(filepath):
                     "pegawai_dibutuhkan": cells[colmap.get("pegawai_dibutuhkan", 0)]
                 })
 
+    if waktu is not None:
+        waktu.setdefault("bagian", {})["tabel"] = time.perf_counter() - t0
     return result
 
 import sys
 
 if __name__ == "__main__":
+    from metrik import ambil_path
+    metrics_file, argv = ambil_path(sys.argv)
     file_path = globals().get("__file_path__", None)
 
     if not file_path:
-        if len(sys.argv) >= 2:
-            file_path = sys.argv[1]
+        if len(argv) >= 2:
+            file_path = argv[1]
 
     if file_path:
-        try:
-            data = extract_docx(file_path)
-            print(json.dumps(data, ensure_ascii=False))
-        except Exception as e:
-            print(f"❌ Error: {str(e)}", file=sys.stderr)
-            sys.exit(1)
+        from cli_ekstrak import jalankan_cli
+        jalankan_cli("abk", extract_docx, file_path, metrics_file)
     else:
         print("❌ Argumen tidak lengkap: butuh file .doc/.docx", file=sys.stderr)
         sys.exit(1)
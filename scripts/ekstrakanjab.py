@@ -1,13 +1,25 @@
 import os
 import re
 import json
-import tempfile
-import subprocess
-from docx import Document
-from docx.oxml.ns import qn
+import time
+import weakref
+
+# Catatan: python-docx (dan lxml) sengaja TIDAK di-import di level modul.
+# Script ini di-spawn sekali per upload, jadi jalur yang gagal cepat
+# (argumen kurang / ekstensi tidak didukung) tidak perlu membayar biaya import docx.
 
 # -------------------- UTIL --------------------
 
+def qn(tag: str) -> str:
+    """
+    Wrapper lazy untuk docx.oxml.ns.qn. Panggilan pertama meng-import docx lalu
+    mengganti nama global `qn` dengan fungsi aslinya (tanpa overhead setelahnya).
+    """
+    global qn
+    from docx.oxml.ns import qn as _qn
+    qn = _qn
+    return _qn(tag)
+
 def clean(text: str) -> str:
     # Samakan dengan versi Anda (hapus BEL \u0007, CR, TAB, VT, FF)
     return re.sub(r'[\u0007\r\t\x0b\x0c]', '', (text or '')).strip()
@@ -392,32 +404,401 @@ def _smart_split(text: str):
 # -------------------- READER --------------------
 
 def read_docx(file_path):
+    from docx import Document
     doc = Document(file_path)
-    lines = [para_text(p) for p in doc.paragraphs if para_text(p)]
-    return doc, lines
+    return doc, doc_lines(doc)
+
+def doc_lines(doc):
+    return [para_text(p) for p in doc.paragraphs if para_text(p)]
 
-def convert_doc_to_docx_via_libreoffice(src_path: str) -> str:
+def convert_doc_to_docx_via_libreoffice(src_path: str, profile_dir: str | None = None,
+                                        outdir: str | None = None) -> str:
     """
-    Konversi .doc -> .docx via LibreOffice headless. Return path .docx di temp.
+    Konversi .doc -> .docx via LibreOffice headless. Return path .docx hasil konversi.
+    profile_dir: direktori profil LibreOffice terpisah (wajib bila beberapa soffice jalan bersamaan).
+    outdir: direktori output (mis. dari ruang_kerja); default direktori baru di ruang kerja,
+            pemanggil bertanggung jawab menghapusnya.
     """
-    tmpdir = tempfile.mkdtemp(prefix="doc2docx_")
-    cmd = [
-        "soffice", "--headless", "--convert-to", "docx", src_path, "--outdir", tmpdir
-    ]
+    import subprocess
+
+    if outdir is None:
+        import ruang_kerja
+        outdir = ruang_kerja.buat_direktori("doc2docx_")
+    cmd = [os.environ.get("SOFFICE_BIN") or "soffice", "--headless"]
+    if profile_dir:
+        from pathlib import Path
+        cmd.append("-env:UserInstallation=" + Path(profile_dir).resolve().as_uri())
+    cmd += ["--convert-to", "docx", src_path, "--outdir", outdir]
     try:
         subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     except Exception as e:
         raise RuntimeError(f"Gagal konversi .doc ke .docx dengan LibreOffice: {e}")
     base = os.path.splitext(os.path.basename(src_path))[0]
-    out = os.path.join(tmpdir, base + ".docx")
+    out = os.path.join(outdir, base + ".docx")
     if not os.path.exists(out):
         raise RuntimeError("File hasil konversi .docx tidak ditemukan.")
     return out
 
-def read_doc(file_path):
-    # Gantikan COM: konversi ke .docx lalu baca dengan python-docx
-    docx_path = convert_doc_to_docx_via_libreoffice(file_path)
-    return read_docx(docx_path)
+def read_doc(file_path, waktu=None, konversi=True):
+    """
+    Baca .doc (Word 97-2003):
+    default: konversi ke .docx via LibreOffice lalu baca dengan python-docx.
+    ANJAB_DOC_READER=native: pembaca native (bacadoc.py) dulu -> python-docx Document tanpa
+    proses eksternal; dokumen yang tidak ditangani native tetap lewat LibreOffice.
+    waktu: dict opsional, diisi durasi konversi ("konversi") bila jalur LibreOffice dipakai.
+    konversi=False: raise DocTidakDidukung alih-alih menjalankan LibreOffice (pipeline massal
+    punya tahap konversi sendiri).
+    """
+    from bacadoc import dokumen_dari_doc, DocTidakDidukung, pembaca_native
+    if pembaca_native():
+        try:
+            doc = dokumen_dari_doc(file_path)
+            return doc, doc_lines(doc)
+        except DocTidakDidukung:
+            if not konversi:
+                raise
+            # terenkripsi / pra-Word 97 / struktur tidak dikenal -> LibreOffice
+    elif not konversi:
+        raise DocTidakDidukung("ANJAB_DOC_READER bukan native")
+    if waktu is not None:
+        waktu["fase"] = "konversi"
+    import ruang_kerja
+    from slot_host import slot
+    # slot konversi per host (slot_host.py) dulu, baru profil LibreOffice & direktori output
+    # di ruang kerja terkelola; direktori output selalu dihapus
+    with slot("konversi", waktu=waktu), ruang_kerja.direktori("doc2docx_") as outdir, \
+            ruang_kerja.profil_libreoffice() as profil:
+        t0 = time.perf_counter()
+        docx_path = convert_doc_to_docx_via_libreoffice(file_path, profil, outdir)
+        if waktu is not None:
+            waktu["konversi"] = time.perf_counter() - t0
+            waktu["fase"] = "baca"
+        return read_docx(docx_path)  # Document() memuat seluruh part ke memori
+
+def read_document(file_path, waktu=None, konversi=True):
+    """
+    Baca .doc/.docx berdasarkan isi file (bacaformat.py), bukan ekstensi: .doc yang sebenarnya
+    OOXML dibaca python-docx, RTF/HTML/MHT dengan pembaca native ringan; hanya Word biner
+    (OLE) dan format tak dikenal yang lewat read_doc (LibreOffice, atau native bila diaktifkan).
+    konversi: diteruskan ke read_doc.
+    """
+    from bacaformat import tebak_format, dokumen_dari_format
+    fmt = tebak_format(file_path)
+    if fmt == "docx":
+        return read_docx(file_path)
+    if fmt in ("rtf", "html", "mht"):
+        doc = dokumen_dari_format(file_path, fmt)
+        return doc, doc_lines(doc)
+    if fmt == "ole" or file_path.lower().endswith(".doc"):
+        return read_doc(file_path, waktu, konversi)
+    return read_docx(file_path)  # biar python-docx yang melaporkan file rusak
+
+# -------------------- GAYA & PENOMORAN TERESOLUSI (CACHE PER DOKUMEN) --------------------
+# Indentasi dan numPr sering tidak ditulis langsung di paragraf, tapi diwarisi dari
+# style (rantai basedOn) atau dari level penomoran. styles.xml & numbering.xml dibaca
+# sekali per dokumen menjadi dict; klasifikasi paragraf cukup lookup + baca w:pPr langsung.
+# Urutan prioritas (sama dengan Word): docDefaults < style < level numbering < langsung.
+
+_cache_gaya = weakref.WeakKeyDictionary()  # DocumentPart -> dict gaya
+
+def _int_attr(el, nama):
+    if el is None:
+        return None
+    v = el.get(qn(nama))
+    try:
+        return int(v) if v is not None else None
+    except ValueError:
+        return None
+
+def _baca_ppr(pPr):
+    """(left, first, numId, ilvl) dari satu w:pPr; None = tidak diset. first < 0 berarti hanging."""
+    left = first = numId = ilvl = None
+    if pPr is None:
+        return left, first, numId, ilvl
+    ind = pPr.find(qn('w:ind'))
+    if ind is not None:
+        left = _int_attr(ind, 'w:left')
+        if left is None:
+            left = _int_attr(ind, 'w:start')
+        hanging = _int_attr(ind, 'w:hanging')
+        first = -hanging if hanging is not None else _int_attr(ind, 'w:firstLine')
+    numPr = pPr.find(qn('w:numPr'))
+    if numPr is not None:
+        numId = _int_attr(numPr.find(qn('w:numId')), 'w:val')
+        ilvl = _int_attr(numPr.find(qn('w:ilvl')), 'w:val')
+    return left, first, numId, ilvl
+
+def _timpa(dasar, atas):
+    return tuple(b if b is not None else a for a, b in zip(dasar, atas))
+
+def _part_terkait(part, jenis):
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    try:
+        return part.part_related_by(getattr(RT, jenis)).element
+    except (KeyError, AttributeError):
+        return None
+
+def _bangun_gaya(part):
+    g = {"gaya": {}, "default": (None, None, None, None), "num": {}, "fmt": {}, "ind_lvl": {}}
+
+    styles = _part_terkait(part, "STYLES")
+    if styles is not None:
+        dd = styles.find(qn('w:docDefaults'))
+        ppr_def = dd.find(f"{qn('w:pPrDefault')}/{qn('w:pPr')}") if dd is not None else None
+        g["default"] = _baca_ppr(ppr_def)
+
+        mentah, default_id = {}, None
+        for st in styles.findall(qn('w:style')):
+            if st.get(qn('w:type')) != "paragraph":
+                continue
+            sid = st.get(qn('w:styleId'))
+            based = st.find(qn('w:basedOn'))
+            mentah[sid] = (based.get(qn('w:val')) if based is not None else None, _baca_ppr(st.find(qn('w:pPr'))))
+            if st.get(qn('w:default')) in ("1", "true", "on") and default_id is None:
+                default_id = sid
+
+        def resolusi(sid, jejak):
+            if sid in g["gaya"]:
+                return g["gaya"][sid]
+            if sid not in mentah or sid in jejak:  # style hilang / basedOn melingkar
+                return g["default"]
+            jejak.add(sid)
+            induk, ppr = mentah[sid]
+            hasil = _timpa(resolusi(induk, jejak) if induk else g["default"], ppr)
+            g["gaya"][sid] = hasil
+            return hasil
+
+        for sid in mentah:
+            resolusi(sid, set())
+        g["gaya"][None] = g["gaya"].get(default_id, g["default"])  # paragraf tanpa pStyle
+
+    numbering = _part_terkait(part, "NUMBERING")
+    if numbering is not None:
+        for num in numbering.findall(qn('w:num')):
+            absId_el = num.find(qn('w:abstractNumId'))
+            numId = _int_attr(num, 'w:numId')
+            if numId is not None and absId_el is not None:
+                g["num"].setdefault(numId, absId_el.get(qn('w:val')))
+        for absnum in numbering.findall(qn('w:abstractNum')):
+            absId = absnum.get(qn('w:abstractNumId'))
+            if absId in g["fmt"]:
+                continue
+            fmt, ind = {}, {}
+            for lvl in absnum.findall(qn('w:lvl')):
+                ilvl = _int_attr(lvl, 'w:ilvl')
+                nf = lvl.find(qn('w:numFmt'))
+                if nf is not None and nf.get(qn('w:val')):
+                    fmt.setdefault(ilvl, nf.get(qn('w:val')))
+                left, first, _n, _i = _baca_ppr(lvl.find(qn('w:pPr')))
+                ind.setdefault(ilvl, (left, first))
+            g["fmt"][absId] = fmt
+            g["ind_lvl"][absId] = ind
+    return g
+
+def gaya_dokumen(part):
+    """Dict gaya teresolusi untuk DocumentPart (dibangun sekali per dokumen)."""
+    g = _cache_gaya.get(part)
+    if g is None:
+        g = _cache_gaya[part] = _bangun_gaya(part)
+    return g
+
+def format_nomor(part, numId, ilvl):
+    """(absId, numFmt asli) untuk numId/ilvl; fallback level 0 seperti sebelumnya."""
+    g = gaya_dokumen(part)
+    absId = g["num"].get(numId)
+    if absId is None:
+        return None, None
+    fmt = g["fmt"].get(absId, {})
+    return absId, fmt.get(ilvl) or fmt.get(0)
+
+def gaya_paragraf(g, pPr):
+    """(left, first, numId, ilvl) dari style paragraf (pStyle, else style default, else docDefaults)."""
+    sid = None
+    if pPr is not None:
+        ps = pPr.find(qn('w:pStyle'))
+        sid = ps.get(qn('w:val')) if ps is not None else None
+    return g["gaya"].get(sid) or g["gaya"].get(None) or g["default"]
+
+def properti_paragraf(p):
+    """
+    (indent_twips, numId, ilvl) efektif paragraf: pPr langsung di atas style (basedOn
+    sudah diresolusi) dan indentasi level numbering. indent = left + hanging.
+    """
+    return properti_ppr(gaya_dokumen(p.part), p._p.pPr)
+
+def properti_ppr(g, pPr):
+    """Seperti properti_paragraf, untuk w:pPr mentah + dict gaya_dokumen (dipakai ir_dokumen.py)."""
+    left, first, numId, ilvl = _baca_ppr(pPr)
+    dasar = gaya_paragraf(g, pPr)
+
+    numId = numId if numId is not None else dasar[2]
+    ilvl = ilvl if ilvl is not None else dasar[3]
+    if numId is not None and ilvl is None:
+        ilvl = 0
+
+    kiri, awal = dasar[0], dasar[1]
+    absId = g["num"].get(numId) if numId else None
+    if absId is not None:
+        lv_kiri, lv_awal = g["ind_lvl"].get(absId, {}).get(ilvl, (None, None))
+        kiri = lv_kiri if lv_kiri is not None else kiri
+        awal = lv_awal if lv_awal is not None else awal
+    kiri = left if left is not None else kiri
+    awal = first if first is not None else awal
+
+    indent = (kiri or 0) + (-awal if (awal is not None and awal < 0) else 0)
+    return indent, numId, ilvl
+
+# -------------------- LAYOUT TEMPLATE (CACHE) --------------------
+# Hampir semua file anjab berasal dari beberapa template resmi. Header tiap tabel
+# dihitung sekali per dokumen (siapkan_layout) dan dipakai bersama semua extractor.
+# Sidik struktur (jumlah tabel, jumlah kolom, teks header tiap tabel) + versi source
+# extractor (versi_sumber.py) menjadi kunci cache peran tabel (bagian -> index tabel)
+# untuk bagian yang dipilih lewat scoring. Index dari cache hanya dipakai bila terbukti
+# tetap skor tertinggi, jadi hasil tidak bergantung pada riwayat cache. Opt-in:
+#   ANJAB_LAYOUT_CACHE=/path/layout.json   aktif, simpan di file ini
+#   ANJAB_LAYOUT_CACHE=on                  aktif, default ~/.cache/anjab/layout.json (XDG_CACHE_HOME)
+#   ANJAB_LAYOUT_CACHE=off                 nonaktif (default)
+# File hanya ditulis bila ada sidik/peran baru; baca-gabung-tulis dilakukan di bawah flock
+# (<file>.lock, sama dengan metrik.py) supaya proses extractor bersamaan tidak saling
+# menghapus entri yang baru dipelajari proses lain.
+
+LAYOUT_CACHE_MAKS = 500
+_cache_layout = None  # dimuat sekali per proses
+
+def path_cache_layout():
+    """File cache layout, atau None bila nonaktif."""
+    v = (os.environ.get("ANJAB_LAYOUT_CACHE") or "").strip()
+    if v.lower() in ("", "0", "off", "false"):
+        return None
+    if v.lower() in ("1", "on", "true"):
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "anjab", "layout.json")
+    return v
+
+def _muat_cache_layout():
+    global _cache_layout
+    if _cache_layout is None:
+        _cache_layout = {}
+        path = path_cache_layout()
+        if path:
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    data = json.load(fh)
+                if isinstance(data, dict):
+                    _cache_layout = data
+            except (OSError, ValueError):
+                pass
+    return _cache_layout
+
+def siapkan_layout(doc):
+    """
+    Hitung header tiap tabel sekali + sidik template, lalu ambil peran tabel dari cache.
+    return dict: {"sidik", "kunci", "tables", "headers", "peran": {bagian: index}, "baru": bool}
+    kunci = sidik + versi source extractor (None bila cache nonaktif): heuristik berubah,
+    peran lama tidak dipakai lagi.
+    """
+    import hashlib
+    tables = doc.tables
+    headers = [table_header_cells(t) for t in tables]
+    struktur = [[len(t.columns), h] for t, h in zip(tables, headers)]
+    sidik = hashlib.sha1(json.dumps(struktur, ensure_ascii=False).encode("utf-8")).hexdigest()
+    kunci, peran = None, {}
+    if path_cache_layout():
+        from versi_sumber import versi
+        kunci = f"{sidik}-{versi(('ekstrakanjab.py',))}"
+        peran = _muat_cache_layout().get(kunci) or {}
+    return {"sidik": sidik, "kunci": kunci, "tables": tables, "headers": headers,
+            "peran": dict(peran), "baru": False}
+
+def _catat_peran(layout, bagian, nilai):
+    if layout["peran"].get(bagian) != nilai:
+        layout["peran"][bagian] = nilai
+        layout["baru"] = True
+
+def simpan_layout(layout):
+    """Tulis peran tabel hasil discovery ke cache (atomik). Gagal tulis tidak fatal."""
+    path = path_cache_layout()
+    if not layout or not layout["baru"] or not path or not layout["kunci"]:
+        return
+    global _cache_layout
+    try:
+        import fcntl
+    except ImportError:  # non-POSIX: tanpa kunci antarproses
+        fcntl = None
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + ".lock", "a") as kunci:
+            if fcntl:
+                fcntl.flock(kunci, fcntl.LOCK_EX)
+            try:
+                # baca ulang di bawah kunci: proses lain mungkin sudah menambah sidik sejak cache dimuat
+                try:
+                    with open(path, encoding="utf-8") as fh:
+                        cache = json.load(fh)
+                    if not isinstance(cache, dict):
+                        cache = {}
+                except (OSError, ValueError):
+                    cache = {}
+                cache.pop(layout["kunci"], None)  # pindah ke ekor: yang paling lama tidak dipakai dibuang duluan
+                cache[layout["kunci"]] = layout["peran"]
+                while len(cache) > LAYOUT_CACHE_MAKS:
+                    cache.pop(next(iter(cache)))
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(cache, fh, ensure_ascii=False)
+                os.replace(tmp, path)
+            finally:
+                if fcntl:
+                    fcntl.flock(kunci, fcntl.LOCK_UN)
+        _cache_layout = cache
+        layout["baru"] = False
+    except OSError:
+        pass
+
+def tabel_berheader(doc, layout, cocok):
+    """
+    list (table, headers) yang header-nya memenuhi cocok(headers), urut dokumen.
+    Dengan layout: header tidak dihitung ulang (sudah dihitung di siapkan_layout).
+    """
+    if layout is None:
+        hasil = []
+        for t in doc.tables:
+            h = table_header_cells(t)
+            if h and cocok(h):
+                hasil.append((t, h))
+        return hasil
+    return [(t, h) for t, h in zip(layout["tables"], layout["headers"]) if h and cocok(h)]
+
+def tabel_skor_terbaik(doc, layout, bagian, skor, minimal, batas_atas=None):
+    """
+    Tabel dengan skor(t) tertinggi (yang pertama bila seri) bila >= minimal, else None.
+    Dengan layout: index dari cache dipakai hanya bila terbukti tetap tertinggi; tabel lain
+    yang batas_atas(t) (perkiraan murah, selalu >= skor(t)) tidak bisa menyamai/melampauinya
+    tidak di-skor. Hasil selalu sama dengan scoring penuh.
+    """
+    tables = layout["tables"] if layout is not None else doc.tables
+    if layout is not None:
+        idx = layout["peran"].get(bagian)
+        if isinstance(idx, int) and 0 <= idx < len(tables):
+            sc = skor(tables[idx])
+
+            def kalah(i, t):
+                # tabel sebelum idx menang bila skornya sama, sesudahnya harus lebih tinggi
+                ambang = sc + (i > idx)
+                return (batas_atas is not None and batas_atas(t) < ambang) or skor(t) < ambang
+
+            if sc >= minimal and all(kalah(i, t) for i, t in enumerate(tables) if i != idx):
+                return tables[idx]
+    candidate, best, best_idx = None, -1, None
+    for i, t in enumerate(tables):
+        sc = skor(t)
+        if sc > best:
+            best, candidate, best_idx = sc, t, i
+    if candidate is None or best < minimal:
+        return None
+    if layout is not None:
+        _catat_peran(layout, bagian, best_idx)
+    return candidate
 
 # -------------------- EXTRACTORS (preserve JSON shape) --------------------
 
@@ -461,7 +842,7 @@ def extract_block(start_marker, end_marker, lines):
         return "\n".join(lines[start_idx:end_idx]).strip()
     return "---"
 
-def extract_kualifikasi(doc):
+def extract_kualifikasi(doc, layout=None):
     """
     Baca tabel KUALIFIKASI JABATAN (3 kolom, 6+ baris) dengan dukungan alias label:
     - 'Pendidikan Formal'         -> pendidikan_formal
@@ -531,15 +912,9 @@ def extract_kualifikasi(doc):
         labels = [tidy(r.cells[0].text).lower() for r in tbl.rows[:probe]]
         return sum(any(lab in x for lab in LABELS_FOR_SCORE) for x in labels)
 
-    candidate = None
-    best = -1
-    for t in doc.tables:
-        sc = table_score(t)
-        if sc > best:
-            best = sc
-            candidate = t
-
-    if not candidate or best < 2:
+    candidate = tabel_skor_terbaik(doc, layout, "kualifikasi", table_score, 2,
+                                   lambda t: min(6, len(t.rows)))  # skor <= jumlah baris probe
+    if candidate is None:
         return result
 
     # ===== Helper matcher =====
@@ -613,7 +988,7 @@ def extract_deskripsi_dan_tahapan_cell(cell):
 
 # ---------- Bagian tabel: gunakan table_header_cells() untuk map kolom ----------
 
-def extract_tugas_pokok(doc):
+def extract_tugas_pokok(doc, layout=None):
     """
     Ekstrak tabel TUGAS POKOK menjadi list item:
     - deskripsi (teks uraian)
@@ -624,9 +999,6 @@ def extract_tugas_pokok(doc):
     - Mengabaikan baris total/rekap: "JUMLAH", "JUMLAH PEGAWAI", "PEMBULATAN".
     - Tidak mengabaikan baris biasa hanya karena mengandung kata 'jumlah' di tengah kalimat.
     """
-    import re
-    from docx.oxml.ns import qn
-
     # ---------- util dasar ----------
     def tidy(s: str) -> str:
         # buang kontrol & whitespace berlebih
@@ -639,55 +1011,21 @@ def extract_tugas_pokok(doc):
     # ---------- akses numbering Word ----------
     def get_numpr(p):
         try:
-            pPr = p._p.pPr
-            if pPr is None:
-                return None, None
-            numPr = pPr.find(qn('w:numPr'))
-            if numPr is None:
-                return None, None
-            numId_elm = numPr.find(qn('w:numId'))
-            ilvl_elm  = numPr.find(qn('w:ilvl'))
-            numId = int(numId_elm.val) if (numId_elm is not None and numId_elm.val is not None) else None
-            ilvl  = int(ilvl_elm.val)  if (ilvl_elm  is not None and ilvl_elm.val  is not None) else 0
+            _ind, numId, ilvl = properti_paragraf(p)
             return numId, ilvl
         except Exception:
             return None, None
 
     def get_numfmt(doc, numId, ilvl):
         try:
-            numbering = doc.part.numbering_part.element
-            for num in numbering.findall(qn('w:num')):
-                if str(num.get(qn('w:numId'))) == str(numId):
-                    absId_elm = num.find(qn('w:abstractNumId'))
-                    if absId_elm is None:
-                        break
-                    absId = absId_elm.get(qn('w:val'))
-                    for absnum in numbering.findall(qn('w:abstractNum')):
-                        if str(absnum.get(qn('w:abstractNumId'))) == str(absId):
-                            # cari level tepat
-                            for lvl in absnum.findall(qn('w:lvl')):
-                                if str(lvl.get(qn('w:ilvl'))) == str(ilvl):
-                                    nf = lvl.find(qn('w:numFmt'))
-                                    if nf is not None and nf.get(qn('w:val')):
-                                        return nf.get(qn('w:val')).lower()
-                            # fallback lvl=0
-                            for lvl in absnum.findall(qn('w:lvl')):
-                                if str(lvl.get(qn('w:ilvl'))) == "0":
-                                    nf = lvl.find(qn('w:numFmt'))
-                                    if nf is not None and nf.get(qn('w:val')):
-                                        return nf.get(qn('w:val')).lower()
-                    break
+            nf = format_nomor(doc.part, numId, ilvl)[1]
+            return nf.lower() if nf else None
         except Exception:
-            pass
-        return None
+            return None
 
     def indent_twips(p):
         try:
-            pf = p.paragraph_format
-            left  = pf.left_indent.twips if pf.left_indent else 0
-            first = pf.first_line_indent.twips if pf.first_line_indent else 0
-            hang  = -first if (first is not None and first < 0) else 0
-            return int(left + hang)
+            return properti_paragraf(p)[0]
         except Exception:
             return 0
 
@@ -827,69 +1165,66 @@ def extract_tugas_pokok(doc):
     # ---------- proses utama ----------
     tugas_list = []
 
-    for table in doc.tables:
-        headers = table_header_cells(table)  # helper existing -> list lowercase header names
-        if not headers:
-            continue
-        if ("uraian tugas" in headers) and ("hasil kerja" in headers):
-            uraian_idx = headers.index("uraian tugas")
-            hasil_idx  = headers.index("hasil kerja")
+    for table, headers in tabel_berheader(
+            doc, layout, lambda h: "uraian tugas" in h and "hasil kerja" in h):
+        uraian_idx = headers.index("uraian tugas")
+        hasil_idx  = headers.index("hasil kerja")
 
-            # iterasi baris isi
-            for r in table.rows[1:]:
-                cells = r.cells
-                if len(cells) <= max(uraian_idx, hasil_idx):
-                    continue
+        # iterasi baris isi
+        for r in table.rows[1:]:
+            cells = r.cells
+            if len(cells) <= max(uraian_idx, hasil_idx):
+                continue
 
-                # Skip baris total/rekap/footer
-                if row_is_total_or_footer(cells):
-                    continue
+            # Skip baris total/rekap/footer
+            if row_is_total_or_footer(cells):
+                continue
 
-                deskripsi, detail_uraian = parse_uraian_cell_to_struct(cells[uraian_idx])
-                hasil_items = extract_bulleted_items(cells[hasil_idx])
+            deskripsi, detail_uraian = parse_uraian_cell_to_struct(cells[uraian_idx])
+            hasil_items = extract_bulleted_items(cells[hasil_idx])
 
-                # Normalisasi & filter baris kosong
-                norm_desc = tidy(deskripsi).strip(". -").strip()
-                low_desc  = norm_desc.lower()
+            # Normalisasi & filter baris kosong
+            norm_desc = tidy(deskripsi).strip(". -").strip()
+            low_desc  = norm_desc.lower()
 
-                # --- Skip hanya jika "JUMLAH" dsb sebagai label standalone,
-                #     BUKAN jika kata 'jumlah' muncul sebagai bagian kalimat biasa.
-                if low_desc in TOTAL_KEYS or re.fullmatch(r'jumlah\.?', low_desc):
-                    continue
+            # --- Skip hanya jika "JUMLAH" dsb sebagai label standalone,
+            #     BUKAN jika kata 'jumlah' muncul sebagai bagian kalimat biasa.
+            if low_desc in TOTAL_KEYS or re.fullmatch(r'jumlah\.?', low_desc):
+                continue
 
-                # buang baris yang benar-benar kosong
-                if low_desc in {"", "...........", ".........."}:
+            # buang baris yang benar-benar kosong
+            if low_desc in {"", "...........", ".........."}:
+                continue
+            if not hasil_items:
+                raw_h = tidy(extract_bullet_marked_text_cell(cells[hasil_idx])).strip(". -").strip().lower()
+                if raw_h in {"", "...........", "..........", "-", "–", "—"}:
+                    # seluruh kolom kanan kosong → kemungkinan bukan baris tugas
                     continue
-                if not hasil_items:
-                    raw_h = tidy(extract_bullet_marked_text_cell(cells[hasil_idx])).strip(". -").strip().lower()
-                    if raw_h in {"", "...........", "..........", "-", "–", "—"}:
-                        # seluruh kolom kanan kosong → kemungkinan bukan baris tugas
-                        continue
-
-                tugas_list.append({
-                    "no": str(len(tugas_list) + 1),
-                    "uraian_tugas": {
-                        "deskripsi": norm_desc,
-                        "detail_uraian_tugas": detail_uraian,
-                        "hasil_kerja": hasil_items,
-                        "jumlah_hasil": "",
-                        "waktu_penyelesaian_(jam)": "",
-                        "waktu_efektif": "",
-                        "kebutuhan_pegawai": ""
-                    }
-                })
 
-            # ---- tambahan safety: bila masih ada footer nyasar di ekor, drop trailing ----
-            while tugas_list:
-                tail = tugas_list[-1]["uraian_tugas"]["deskripsi"].strip().lower()
-                if (tail in TOTAL_KEYS) or re.fullmatch(r'jumlah\.?', tail):
-                    tugas_list.pop()
-                else:
-                    break
+            tugas_list.append({
+                "no": str(len(tugas_list) + 1),
+                "uraian_tugas": {
+                    "deskripsi": norm_desc,
+                    "detail_uraian_tugas": detail_uraian,
+                    "hasil_kerja": hasil_items,
+                    "jumlah_hasil": "",
+                    "waktu_penyelesaian_(jam)": "",
+                    "waktu_efektif": "",
+                    "kebutuhan_pegawai": ""
+                }
+            })
+
+        # ---- tambahan safety: bila masih ada footer nyasar di ekor, drop trailing ----
+        while tugas_list:
+            tail = tugas_list[-1]["uraian_tugas"]["deskripsi"].strip().lower()
+            if (tail in TOTAL_KEYS) or re.fullmatch(r'jumlah\.?', tail):
+                tugas_list.pop()
+            else:
+                break
 
     return tugas_list
 
-def extract_hasil_kerja(doc):
+def extract_hasil_kerja(doc, layout=None):
     """
     Ekstrak tabel '7. HASIL KERJA' menjadi:
       [
@@ -902,100 +1237,96 @@ def extract_hasil_kerja(doc):
     """
     hasil_list = []
 
-    for table in doc.tables:
-        headers = table_header_cells(table)  # pastikan helper ini ada di module-level
-        if not headers:
-            continue
-        if ("hasil kerja" in headers) and ("satuan hasil" in headers):
-            hasil_idx = headers.index("hasil kerja")
-            satuan_idx = headers.index("satuan hasil")
+    for table, headers in tabel_berheader(
+            doc, layout, lambda h: "hasil kerja" in h and "satuan hasil" in h):
+        hasil_idx = headers.index("hasil kerja")
+        satuan_idx = headers.index("satuan hasil")
 
-            for r in table.rows[1:]:
-                cells = r.cells
-                if len(cells) <= max(hasil_idx, satuan_idx):
-                    continue
+        for r in table.rows[1:]:
+            cells = r.cells
+            if len(cells) <= max(hasil_idx, satuan_idx):
+                continue
 
-                # Kolom "Hasil Kerja" — nested
-                try:
-                    hasil_items = extract_bulleted_items(cells[hasil_idx]) or []
-                except Exception:
-                    raw_hasil = (extract_bullet_marked_text_cell(cells[hasil_idx]) or "").strip()
-                    hasil_items = ([{"text": raw_hasil, "children": []}] if raw_hasil else [])
+            # Kolom "Hasil Kerja" — nested
+            try:
+                hasil_items = extract_bulleted_items(cells[hasil_idx]) or []
+            except Exception:
+                raw_hasil = (extract_bullet_marked_text_cell(cells[hasil_idx]) or "").strip()
+                hasil_items = ([{"text": raw_hasil, "children": []}] if raw_hasil else [])
 
-                # Kolom "Satuan Hasil" — array flat
-                try:
-                    satuan_raw = extract_bullet_marked_text_cell(cells[satuan_idx]) or ""
-                    satuan_items = split_items(satuan_raw) or []
-                except Exception:
-                    satuan_items = []
-
-                # skip jika benar-benar kosong
-                is_hasil_empty = not hasil_items or all(
-                    (not it.get("text") and not (it.get("children") or [])) for it in hasil_items
-                )
-                is_satuan_empty = not (satuan_items or [])
-                if is_hasil_empty and is_satuan_empty:
-                    continue
+            # Kolom "Satuan Hasil" — array flat
+            try:
+                satuan_raw = extract_bullet_marked_text_cell(cells[satuan_idx]) or ""
+                satuan_items = split_items(satuan_raw) or []
+            except Exception:
+                satuan_items = []
+
+            # skip jika benar-benar kosong
+            is_hasil_empty = not hasil_items or all(
+                (not it.get("text") and not (it.get("children") or [])) for it in hasil_items
+            )
+            is_satuan_empty = not (satuan_items or [])
+            if is_hasil_empty and is_satuan_empty:
+                continue
 
-                hasil_list.append({
-                    "no": str(len(hasil_list) + 1),
-                    "hasil_kerja": hasil_items,
-                    "satuan_hasil": satuan_items
-                })
+            hasil_list.append({
+                "no": str(len(hasil_list) + 1),
+                "hasil_kerja": hasil_items,
+                "satuan_hasil": satuan_items
+            })
 
     return hasil_list
 
-def extract_bahan_kerja(doc):
+def extract_bahan_kerja(doc, layout=None):
     bahan_list = []
-    for table in doc.tables:
-        headers = table_header_cells(table)
-        if not headers:
-            continue
-        if ("bahan kerja" in headers) and ("penggunaan dalam tugas" in headers):
-            b_idx = headers.index("bahan kerja")
-            p_idx = headers.index("penggunaan dalam tugas")
-            for r in table.rows[1:]:
-                cells = r.cells
-                if len(cells) <= max(b_idx, p_idx):
-                    continue
-                bahan_items = split_items(extract_bullet_marked_text_cell(cells[b_idx])) or []
-                penggunaan_items = split_items(extract_bullet_marked_text_cell(cells[p_idx])) or []
-                bahan_list.append({
-                    "no": str(len(bahan_list) + 1),
-                    "bahan_kerja": bahan_items,
-                    "penggunaan_dalam_tugas": penggunaan_items
-                })
+    for table, headers in tabel_berheader(
+            doc, layout, lambda h: "bahan kerja" in h and "penggunaan dalam tugas" in h):
+        b_idx = headers.index("bahan kerja")
+        p_idx = headers.index("penggunaan dalam tugas")
+        for r in table.rows[1:]:
+            cells = r.cells
+            if len(cells) <= max(b_idx, p_idx):
+                continue
+            bahan_items = split_items(extract_bullet_marked_text_cell(cells[b_idx])) or []
+            penggunaan_items = split_items(extract_bullet_marked_text_cell(cells[p_idx])) or []
+            bahan_list.append({
+                "no": str(len(bahan_list) + 1),
+                "bahan_kerja": bahan_items,
+                "penggunaan_dalam_tugas": penggunaan_items
+            })
     return bahan_list
 
-def extract_perangkat_kerja(doc):
+def extract_perangkat_kerja(doc, layout=None):
     perangkat_list = []
     try:
-        for table in doc.tables:
-            headers = table_header_cells(table)
-            if not headers:
-                continue
-            if ("perangkat kerja" in headers) and any("penggunaan" in h for h in headers):
-                perangkat_idx = headers.index("perangkat kerja")
-                penggunaan_idx = next((i for i, h in enumerate(headers) if "penggunaan" in h), None)
-                for r in table.rows[1:]:
-                    cells = r.cells
-                    perangkat_raw = extract_bullet_marked_text_cell(cells[perangkat_idx])
-                    penggunaan_raw = extract_bullet_marked_text_cell(cells[penggunaan_idx]) if penggunaan_idx is not None else ""
-                    perangkat_list.append({
-                        "no": str(len(perangkat_list) + 1),
-                        "perangkat_kerja": split_items(perangkat_raw),
-                        "penggunaan_untuk_tugas": split_items(penggunaan_raw)
-                    })
-                break
+        for table, headers in tabel_berheader(
+                doc, layout, lambda h: "perangkat kerja" in h and any("penggunaan" in x for x in h)):
+            perangkat_idx = headers.index("perangkat kerja")
+            penggunaan_idx = next((i for i, h in enumerate(headers) if "penggunaan" in h), None)
+            for r in table.rows[1:]:
+                cells = r.cells
+                perangkat_raw = extract_bullet_marked_text_cell(cells[perangkat_idx])
+                penggunaan_raw = extract_bullet_marked_text_cell(cells[penggunaan_idx]) if penggunaan_idx is not None else ""
+                perangkat_list.append({
+                    "no": str(len(perangkat_list) + 1),
+                    "perangkat_kerja": split_items(perangkat_raw),
+                    "penggunaan_untuk_tugas": split_items(penggunaan_raw)
+                })
+            break
     except Exception as e:
         print(f"❌ Gagal ekstrak perangkat kerja: {e}")
     return perangkat_list
 
-def extract_table_after_heading(doc, heading_keywords=("tanggung jawab",), required_headers=("no.", "uraian")):
+def extract_table_after_heading(doc, heading_keywords=("tanggung jawab",), required_headers=("no.", "uraian"),
+                                layout=None):
     """
     Util umum: cari heading paragraf (contains any keyword), ambil tabel pertama setelahnya
     yang headernya mengandung required_headers.
+    layout: header tabel diambil dari siapkan_layout, tidak dihitung ulang.
     """
+    header_tabel = {}
+    if layout is not None:
+        header_tabel = {t._tbl: h for t, h in zip(layout["tables"], layout["headers"])}
     seen_heading = False
     for kind, obj in iter_block_items(doc):
         if kind == "p":
@@ -1003,15 +1334,17 @@ def extract_table_after_heading(doc, heading_keywords=("tanggung jawab",), requi
             if any(k in txt for k in heading_keywords):
                 seen_heading = True
         elif kind == "t" and seen_heading:
-            headers = table_header_cells(obj)
+            headers = header_tabel.get(obj._tbl)
+            if headers is None:
+                headers = table_header_cells(obj)
             if all(h in headers for h in required_headers):
                 return obj
             # kalau tabel pertama tidak cocok, lanjut cari tabel berikutnya sampai cocok
     return None
 
-def extract_tanggung_jawab(doc):
+def extract_tanggung_jawab(doc, layout=None):
     tanggung_list = []
-    table = extract_table_after_heading(doc, ("tanggung jawab",), ("no.", "uraian"))
+    table = extract_table_after_heading(doc, ("tanggung jawab",), ("no.", "uraian"), layout)
     if not table:
         return tanggung_list
     headers = table_header_cells(table)
@@ -1025,9 +1358,9 @@ def extract_tanggung_jawab(doc):
         })
     return tanggung_list
 
-def extract_wewenang(doc):
+def extract_wewenang(doc, layout=None):
     wewenang_list = []
-    table = extract_table_after_heading(doc, ("wewenang",), ("no.", "uraian"))
+    table = extract_table_after_heading(doc, ("wewenang",), ("no.", "uraian"), layout)
     if not table:
         return wewenang_list
     headers = table_header_cells(table)
@@ -1041,89 +1374,83 @@ def extract_wewenang(doc):
         })
     return wewenang_list
 
-def extract_korelasi_jabatan(doc):
+def extract_korelasi_jabatan(doc, layout=None):
     korelasi_list = []
-    try:
-        for table in doc.tables:
-            headers = table_header_cells(table)
-            if not headers:
-                continue
-            if ("jabatan" in headers
+
+    def cocok(headers):
+        return ("jabatan" in headers
                 and any(h in headers for h in ["unit kerja/instansi", "unit kerja", "instansi"])
-                and any("dalam hal" in h for h in headers)):
-                jabatan_idx = headers.index("jabatan")
-                unit_idx = next((i for i, h in enumerate(headers) if "unit kerja" in h or "instansi" in h), None)
-                hal_idx = next((i for i, h in enumerate(headers) if "dalam hal" in h), None)
-                for r in table.rows[1:]:
-                    cells = r.cells
-                    jabatan_raw = extract_bullet_marked_text_cell(cells[jabatan_idx])
-                    unit_raw = extract_bullet_marked_text_cell(cells[unit_idx]) if unit_idx is not None else ""
-                    hal_raw = extract_bullet_marked_text_cell(cells[hal_idx]) if hal_idx is not None else ""
-                    jabatan_items = " ".join([i.strip() for i in jabatan_raw.split("|||") if i.strip()])
-                    unit_items = " ".join([i.strip() for i in unit_raw.split("|||") if i.strip()])
-                    hal_items = split_items(hal_raw)
-                    korelasi_list.append({
-                        "no": str(len(korelasi_list) + 1),
-                        "jabatan": jabatan_items,
-                        "unit_kerja_instansi": unit_items,
-                        "dalam_hal": hal_items
-                    })
-                break
+                and any("dalam hal" in h for h in headers))
+
+    try:
+        for table, headers in tabel_berheader(doc, layout, cocok):
+            jabatan_idx = headers.index("jabatan")
+            unit_idx = next((i for i, h in enumerate(headers) if "unit kerja" in h or "instansi" in h), None)
+            hal_idx = next((i for i, h in enumerate(headers) if "dalam hal" in h), None)
+            for r in table.rows[1:]:
+                cells = r.cells
+                jabatan_raw = extract_bullet_marked_text_cell(cells[jabatan_idx])
+                unit_raw = extract_bullet_marked_text_cell(cells[unit_idx]) if unit_idx is not None else ""
+                hal_raw = extract_bullet_marked_text_cell(cells[hal_idx]) if hal_idx is not None else ""
+                jabatan_items = " ".join([i.strip() for i in jabatan_raw.split("|||") if i.strip()])
+                unit_items = " ".join([i.strip() for i in unit_raw.split("|||") if i.strip()])
+                hal_items = split_items(hal_raw)
+                korelasi_list.append({
+                    "no": str(len(korelasi_list) + 1),
+                    "jabatan": jabatan_items,
+                    "unit_kerja_instansi": unit_items,
+                    "dalam_hal": hal_items
+                })
+            break
     except Exception as e:
         print(f"❌ Gagal ekstrak korelasi jabatan: {e}")
     return korelasi_list
 
-def extract_kondisi_lingkungan_kerja(doc):
+def extract_kondisi_lingkungan_kerja(doc, layout=None):
     kondisi_list = []
     try:
-        for table in doc.tables:
-            headers = table_header_cells(table)
-            if not headers:
-                continue
-            if ("aspek" in headers) and ("faktor" in headers):
-                aspek_idx = headers.index("aspek")
-                faktor_idx = headers.index("faktor")
-                for r in table.rows[1:]:
-                    aspek_raw = extract_bullet_marked_text_cell(r.cells[aspek_idx])
-                    faktor_raw = extract_bullet_marked_text_cell(r.cells[faktor_idx])
-                    aspek_items = " ".join([i.strip() for i in aspek_raw.split("|||") if i.strip()])
-                    faktor_items = " ".join([i.strip() for i in faktor_raw.split("|||") if i.strip()])
-                    kondisi_list.append({
-                        "no": str(len(kondisi_list) + 1),
-                        "aspek": aspek_items,
-                        "faktor": faktor_items
-                    })
-                break
+        for table, headers in tabel_berheader(
+                doc, layout, lambda h: "aspek" in h and "faktor" in h):
+            aspek_idx = headers.index("aspek")
+            faktor_idx = headers.index("faktor")
+            for r in table.rows[1:]:
+                aspek_raw = extract_bullet_marked_text_cell(r.cells[aspek_idx])
+                faktor_raw = extract_bullet_marked_text_cell(r.cells[faktor_idx])
+                aspek_items = " ".join([i.strip() for i in aspek_raw.split("|||") if i.strip()])
+                faktor_items = " ".join([i.strip() for i in faktor_raw.split("|||") if i.strip()])
+                kondisi_list.append({
+                    "no": str(len(kondisi_list) + 1),
+                    "aspek": aspek_items,
+                    "faktor": faktor_items
+                })
+            break
     except Exception as e:
         print(f"❌ Gagal ekstrak kondisi lingkungan kerja: {e}")
     return kondisi_list
 
-def extract_risiko_bahaya(doc):
+def extract_risiko_bahaya(doc, layout=None):
     risiko_list = []
     try:
-        for table in doc.tables:
-            headers = table_header_cells(table)
-            if not headers:
-                continue
-            if ("nama risiko" in headers) and ("penyebab" in headers):
-                risiko_idx = headers.index("nama risiko")
-                penyebab_idx = headers.index("penyebab")
-                for r in table.rows[1:]:
-                    risiko_raw = extract_bullet_marked_text_cell(r.cells[risiko_idx])
-                    penyebab_raw = extract_bullet_marked_text_cell(r.cells[penyebab_idx])
-                    risiko_items = " ".join([i.strip() for i in risiko_raw.split("|||") if i.strip()])
-                    penyebab_items = " ".join([i.strip() for i in penyebab_raw.split("|||") if i.strip()])
-                    risiko_list.append({
-                        "no": str(len(risiko_list) + 1),
-                        "nama_risiko": risiko_items,
-                        "penyebab": penyebab_items
-                    })
-                break
+        for table, headers in tabel_berheader(
+                doc, layout, lambda h: "nama risiko" in h and "penyebab" in h):
+            risiko_idx = headers.index("nama risiko")
+            penyebab_idx = headers.index("penyebab")
+            for r in table.rows[1:]:
+                risiko_raw = extract_bullet_marked_text_cell(r.cells[risiko_idx])
+                penyebab_raw = extract_bullet_marked_text_cell(r.cells[penyebab_idx])
+                risiko_items = " ".join([i.strip() for i in risiko_raw.split("|||") if i.strip()])
+                penyebab_items = " ".join([i.strip() for i in penyebab_raw.split("|||") if i.strip()])
+                risiko_list.append({
+                    "no": str(len(risiko_list) + 1),
+                    "nama_risiko": risiko_items,
+                    "penyebab": penyebab_items
+                })
+            break
     except Exception as e:
         print(f"❌ Gagal ekstrak risiko bahaya: {e}")
     return risiko_list
 
-def extract_syarat_jabatan(doc):
+def extract_syarat_jabatan(doc, layout=None):
     result = {
         "keterampilan_kerja": [],
         "bakat_kerja": [],
@@ -1142,8 +1469,6 @@ def extract_syarat_jabatan(doc):
         "fungsi_pekerja": []
     }
 
-    import re
-
     # ---------- Helpers ----------
     def tidy(s: str) -> str:
         s = (s or "").replace("\u00A0", " ")
@@ -1250,13 +1575,9 @@ def extract_syarat_jabatan(doc):
                 score += 1
         return score
 
-    candidate, best = None, -1
-    for t in doc.tables:
-        sc = table_score(t)
-        if sc > best:
-            best = sc
-            candidate = t
-    if not candidate or best <= 0:
+    candidate = tabel_skor_terbaik(doc, layout, "syarat_jabatan", table_score, 1,
+                                   lambda t: len(t.rows))  # skor <= jumlah baris
+    if candidate is None:
         return result
 
     # ---------- Parse baris per baris ----------
@@ -1371,52 +1692,109 @@ def extract_prestasi_dan_kelas(doc):
 
 # -------------------- ORKESTRATOR --------------------
 
-def extract_info(file_path):
+def extract_info(file_path, waktu=None, sebelumnya=None):
+    """
+    waktu: dict opsional untuk instrumentasi (metrik.py). Diisi:
+      "fase" (fase berjalan/terakhir), "baca", "konversi", "bagian" {nama: detik}.
+    sebelumnya: hasil ekstraksi lama jabatan yang sama (dict / path JSON); bila diisi,
+      output mendapat kunci "delta" (lihat delta_anjab.py).
+    """
+    if waktu is not None:
+        waktu["fase"] = "baca"
+    t0 = time.perf_counter()
     ext = os.path.splitext(file_path)[-1].lower()
-    if ext == ".docx":
-        doc, lines = read_docx(file_path)
-    elif ext == ".doc":
-        doc, lines = read_doc(file_path)  # konversi via LibreOffice, lalu python-docx
+    if ext in (".docx", ".doc") and os.environ.get("ANJAB_IR_CACHE"):
+        # representasi antara ter-cache per hash input (ir_dokumen.py): hit = tanpa konversi & parse XML
+        from ir_dokumen import muat_dokumen
+        doc = muat_dokumen(file_path, lambda p: read_document(p, waktu)[0])
+        lines = doc_lines(doc)
+    elif ext in (".docx", ".doc"):
+        doc, lines = read_document(file_path, waktu)  # jenis dari isi file, LibreOffice hanya bila perlu
     else:
         raise ValueError("File tidak didukung: " + file_path)
-
-    prestasi, kelas = extract_prestasi_dan_kelas(doc)
-    return {
+    if waktu is not None:
+        waktu["baca"] = time.perf_counter() - t0
+
+    data = extract_from_doc(doc, lines, file_path, waktu)
+    if sebelumnya is not None:
+        from delta_anjab import hitung_delta, muat_sebelumnya
+        data["delta"] = hitung_delta(muat_sebelumnya(sebelumnya), data)
+    return data
+
+def extract_from_doc(doc, lines, file_path, waktu=None):
+    """Jalankan semua extractor pada dokumen yang sudah dibaca (dipakai juga oleh pipeline massal)."""
+    if waktu is not None:
+        waktu["fase"] = "ekstrak"
+        bagian = waktu.setdefault("bagian", {})
+
+    def ukur(nama, fn, *args):
+        if waktu is None:
+            return fn(*args)
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            bagian[nama] = time.perf_counter() - t0
+
+    layout = ukur("layout", siapkan_layout, doc)
+    if waktu is not None:
+        waktu["sidik"] = layout["sidik"]  # kunci template untuk catatan biaya (biaya_dokumen.py)
+    prestasi, kelas = ukur("prestasi_dan_kelas", extract_prestasi_dan_kelas, doc)
+    data = {
         "file": os.path.basename(file_path),
-        "nama_jabatan": extract_line_value("NAMA JABATAN", lines),
-        "kode_jabatan": extract_line_value("KODE JABATAN", lines),
-        "unit_kerja": extract_unit_kerja(lines),
-        "ikhtisar_jabatan": extract_block("IKHTISAR JABATAN", "KUALIFIKASI JABATAN", lines),
-        "kualifikasi_jabatan": extract_kualifikasi(doc),
-        "tugas_pokok": extract_tugas_pokok(doc),
-        "hasil_kerja": extract_hasil_kerja(doc),
-        "bahan_kerja": extract_bahan_kerja(doc),
-        "perangkat_kerja": extract_perangkat_kerja(doc),
-        "tanggung_jawab": extract_tanggung_jawab(doc),
-        "wewenang": extract_wewenang(doc),
-        "korelasi_jabatan": extract_korelasi_jabatan(doc),
-        "kondisi_lingkungan_kerja": extract_kondisi_lingkungan_kerja(doc),
-        "risiko_bahaya": extract_risiko_bahaya(doc),
-        "syarat_jabatan": extract_syarat_jabatan(doc),
+        "nama_jabatan": ukur("nama_jabatan", extract_line_value, "NAMA JABATAN", lines),
+        "kode_jabatan": ukur("kode_jabatan", extract_line_value, "KODE JABATAN", lines),
+        "unit_kerja": ukur("unit_kerja", extract_unit_kerja, lines),
+        "ikhtisar_jabatan": ukur("ikhtisar_jabatan", extract_block, "IKHTISAR JABATAN", "KUALIFIKASI JABATAN", lines),
+        "kualifikasi_jabatan": ukur("kualifikasi_jabatan", extract_kualifikasi, doc, layout),
+        "tugas_pokok": ukur("tugas_pokok", extract_tugas_pokok, doc, layout),
+        "hasil_kerja": ukur("hasil_kerja", extract_hasil_kerja, doc, layout),
+        "bahan_kerja": ukur("bahan_kerja", extract_bahan_kerja, doc, layout),
+        "perangkat_kerja": ukur("perangkat_kerja", extract_perangkat_kerja, doc, layout),
+        "tanggung_jawab": ukur("tanggung_jawab", extract_tanggung_jawab, doc, layout),
+        "wewenang": ukur("wewenang", extract_wewenang, doc, layout),
+        "korelasi_jabatan": ukur("korelasi_jabatan", extract_korelasi_jabatan, doc, layout),
+        "kondisi_lingkungan_kerja": ukur("kondisi_lingkungan_kerja", extract_kondisi_lingkungan_kerja, doc, layout),
+        "risiko_bahaya": ukur("risiko_bahaya", extract_risiko_bahaya, doc, layout),
+        "syarat_jabatan": ukur("syarat_jabatan", extract_syarat_jabatan, doc, layout),
         "prestasi_yang_diharapkan": prestasi,
         "kelas_jabatan": kelas
     }
+    simpan_layout(layout)
+    return data
 
 # -------------------- CLI --------------------
 
 if __name__ == "__main__":
     import sys
+    from metrik import ambil_path
+    metrics_file, argv = ambil_path(sys.argv)
+    if len(argv) >= 2 and argv[1] == "--probe":
+        # mode probe: identitas + jenis dokumen tanpa ekstraksi penuh (probe_identitas.py)
+        from probe_identitas import main as probe_main
+        sys.exit(probe_main(argv[2:]))
+    if len(argv) >= 2 and argv[1].lower().endswith(".zip"):
+        # arsip kiriman unit kerja: banyak dokumen, output NDJSON per anggota (arsip_zip.py)
+        from arsip_zip import main as arsip_main
+        sys.exit(arsip_main(argv[1:]))
+    if "--bundel" in argv:
+        # dokumen bundel multi-jabatan -> list hasil per jabatan (bundel_anjab.py)
+        from bundel_anjab import main as bundel_main
+        sys.exit(bundel_main([a for a in argv[1:] if a != "--bundel"]))
+    sebelumnya = next((a.split("=", 1)[1] for a in argv if a.startswith("--sebelumnya=")), None)
+    argv = [a for a in argv if not a.startswith("--sebelumnya=")]
     file_path = globals().get("__file_path__", None)
-    if not file_path and len(sys.argv) >= 2:
-        file_path = sys.argv[1]
+    if not file_path and len(argv) >= 2:
+        file_path = argv[1]
 
     if file_path:
-        try:
-            data = extract_info(file_path)
-            print(json.dumps(data, ensure_ascii=False))
-        except Exception as e:
-            print(f"❌ Error: {str(e)}", file=sys.stderr)
-            sys.exit(1)
+        from cli_ekstrak import jalankan_cli
+        data = jalankan_cli("anjab", lambda path, waktu: extract_info(path, waktu, sebelumnya),
+                            file_path, metrics_file)
+        if os.environ.get("ANJAB_INDEKS_TEKS"):
+            # indeks teks penuh inkremental (indeks_teks.py); non-fatal
+            import indeks_teks
+            indeks_teks.catat(os.environ["ANJAB_INDEKS_TEKS"], indeks_teks.sha256_file(file_path), data)
     else:
         print("❌ Argumen tidak lengkap: butuh file .doc/.docx", file=sys.stderr)
         sys.exit(1)
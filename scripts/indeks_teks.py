@@ -0,0 +1,302 @@
+"""
+Indeks teks penuh (SQLite FTS5, ranking BM25) atas hasil extract_info: uraian tugas,
+tahapan, hasil kerja, bahan kerja, dan perangkat kerja. Untuk menjawab "jabatan mana
+yang sudah mencakup tugas X" tanpa grep JSON / scan ILIKE.
+
+Indeks diperbarui inkremental:
+- lewat subperintah `tambah` / `bangun`,
+- otomatis setiap ekstraksi bila env ANJAB_INDEKS_TEKS=/path/indeks.db diset
+  (CLI ekstrakanjab.py & ekstrak_ulang.py; gagal indeks tidak menggagalkan ekstraksi).
+Dokumen dikunci dengan sha256 file; isi yang tidak berubah tidak ditulis ulang.
+
+Contoh:
+    python scripts/indeks_teks.py bangun teks.db hasil/
+    python scripts/indeks_teks.py cari teks.db "menyusun rencana kerja" --bagian uraian_tugas,tahapan
+    python scripts/indeks_teks.py cari teks.db 'arsip NEAR(digital, 5)' --mentah
+"""
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+ENV_INDEKS = "ANJAB_INDEKS_TEKS"
+EKSTENSI_DOKUMEN = (".doc", ".docx", ".json")
+SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+BAGIAN = ("uraian_tugas", "tahapan", "hasil_kerja", "bahan_kerja", "perangkat_kerja")
+
+SKEMA = """
+CREATE TABLE IF NOT EXISTS dokumen (
+    id INTEGER PRIMARY KEY,
+    kunci TEXT UNIQUE NOT NULL,
+    file TEXT,
+    nama_jabatan TEXT,
+    kode_jabatan TEXT,
+    sidik TEXT,
+    diperbarui REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS teks USING fts5(
+    isi,
+    bagian UNINDEXED,
+    rujukan UNINDEXED,
+    dok_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# -------------------- DOKUMEN -> BARIS TEKS --------------------
+
+def _teks_butir(items, out):
+    for it in items or []:
+        if it.get("text"):
+            out.append(it["text"])
+        _teks_butir(it.get("children"), out)
+
+def baris_teks(data: dict):
+    """yield (bagian, rujukan, isi) untuk satu hasil extract_info."""
+    for t in data.get("tugas_pokok") or []:
+        no = t.get("no") or ""
+        u = t.get("uraian_tugas") or {}
+        if u.get("deskripsi"):
+            yield "uraian_tugas", f"tugas {no}", u["deskripsi"]
+        for j, th in enumerate(u.get("detail_uraian_tugas") or [], 1):
+            isi = " ".join([th.get("tahapan") or ""] + list(th.get("detail_tahapan") or [])).strip()
+            if isi:
+                yield "tahapan", f"tugas {no} / tahapan {j}", isi
+        hasil = []
+        _teks_butir(u.get("hasil_kerja"), hasil)
+        if hasil:
+            yield "hasil_kerja", f"tugas {no}", " ; ".join(hasil)
+    for h in data.get("hasil_kerja") or []:
+        hasil = []
+        _teks_butir(h.get("hasil_kerja"), hasil)
+        isi = " ; ".join(hasil + list(h.get("satuan_hasil") or []))
+        if isi:
+            yield "hasil_kerja", f"hasil kerja {h.get('no') or ''}", isi
+    for bagian, kolom in (("bahan_kerja", ("bahan_kerja", "penggunaan_dalam_tugas")),
+                          ("perangkat_kerja", ("perangkat_kerja", "penggunaan_untuk_tugas"))):
+        for r in data.get(bagian) or []:
+            isi = " ; ".join(x for k in kolom for x in (r.get(k) or []) if x)
+            if isi:
+                yield bagian, f"{bagian.replace('_', ' ')} {r.get('no') or ''}", isi
+
+# -------------------- INDEKS (SQLite FTS5) --------------------
+
+def buka_indeks(path: str):
+    con = sqlite3.connect(path, timeout=30)
+    con.execute("PRAGMA journal_mode=WAL")  # pembaca tidak terblokir oleh ekstraksi yang menulis
+    try:
+        con.executescript(SKEMA)
+    except sqlite3.OperationalError as e:
+        con.close()
+        raise ValueError(f"SQLite tanpa dukungan FTS5: {e}")
+    return con
+
+def simpan_dokumen(con, kunci: str, data: dict) -> bool:
+    """Insert/ganti teks satu dokumen (tanpa commit). return False bila isi tidak berubah."""
+    baris = list(baris_teks(data))
+    sidik = hashlib.sha1(json.dumps([data.get("nama_jabatan"), data.get("kode_jabatan"), baris],
+                                    ensure_ascii=False).encode("utf-8")).hexdigest()
+    lama = con.execute("SELECT id, sidik FROM dokumen WHERE kunci = ?", (kunci,)).fetchone()
+    if lama and lama[1] == sidik:
+        return False
+    nilai = (data.get("file"), data.get("nama_jabatan"), data.get("kode_jabatan"), sidik, time.time())
+    if lama:
+        dok_id = lama[0]
+        con.execute("DELETE FROM teks WHERE dok_id = ?", (dok_id,))
+        con.execute("UPDATE dokumen SET file = ?, nama_jabatan = ?, kode_jabatan = ?, sidik = ?, diperbarui = ? "
+                    "WHERE id = ?", nilai + (dok_id,))
+    else:
+        dok_id = con.execute("INSERT INTO dokumen (kunci, file, nama_jabatan, kode_jabatan, sidik, diperbarui) "
+                             "VALUES (?, ?, ?, ?, ?, ?)", (kunci,) + nilai).lastrowid
+    con.executemany("INSERT INTO teks (isi, bagian, rujukan, dok_id) VALUES (?, ?, ?, ?)",
+                    [(isi, bagian, rujukan, dok_id) for bagian, rujukan, isi in baris])
+    return True
+
+def hapus_dokumen(con, kunci: str):
+    lama = con.execute("SELECT id FROM dokumen WHERE kunci = ?", (kunci,)).fetchone()
+    if lama:
+        con.execute("DELETE FROM teks WHERE dok_id = ?", (lama[0],))
+        con.execute("DELETE FROM dokumen WHERE id = ?", (lama[0],))
+
+def query_aman(teks: str) -> str:
+    """Teks bebas -> query FTS5: tiap kata di-quote (semua kata wajib ada, tanpa sintaks operator)."""
+    kata = re.findall(r"\w+", teks, re.UNICODE)
+    return " ".join('"' + k.replace('"', '""') + '"' for k in kata)
+
+def cari(con, query: str, batas=10, bagian=None, mentah=False, per_dokumen=3):
+    """
+    Jabatan yang paling relevan untuk `query` (BM25, makin kecil makin relevan).
+    return: list {"kunci", "file", "nama_jabatan", "kode_jabatan", "skor", "jumlah_cocok", "cocok": [...]}
+    """
+    q = query if mentah else query_aman(query)
+    if not q:
+        return []
+    sql = ("SELECT teks.dok_id, bm25(teks) AS skor, teks.bagian, teks.rujukan, "
+           "snippet(teks, 0, '[', ']', '…', 16) FROM teks WHERE teks MATCH ?")
+    param = [q]
+    if bagian:
+        sql += f" AND teks.bagian IN ({','.join('?' * len(bagian))})"
+        param += list(bagian)
+    sql += " ORDER BY skor LIMIT ?"  # cukup baris teratas; jumlah_cocok dihitung di dalamnya
+    param.append(max(batas * 50, 500))
+
+    per_dok = {}
+    for dok_id, skor, bag, rujukan, cuplikan in con.execute(sql, param):
+        h = per_dok.get(dok_id)
+        if h is None:
+            if len(per_dok) >= batas:
+                continue
+            h = per_dok[dok_id] = {"skor": round(skor, 4), "jumlah_cocok": 0, "cocok": []}
+        h["jumlah_cocok"] += 1
+        if len(h["cocok"]) < per_dokumen:
+            h["cocok"].append({"bagian": bag, "rujukan": rujukan, "cuplikan": cuplikan, "skor": round(skor, 4)})
+
+    hasil = []
+    for dok_id, h in per_dok.items():
+        kunci, file, nama, kode = con.execute(
+            "SELECT kunci, file, nama_jabatan, kode_jabatan FROM dokumen WHERE id = ?", (dok_id,)).fetchone()
+        hasil.append({"kunci": kunci, "file": file, "nama_jabatan": nama, "kode_jabatan": kode, **h})
+    return hasil
+
+def catat(path: str, kunci: str, data: dict):
+    """Hook inkremental untuk extractor: tambahkan hasil ke indeks (non-fatal)."""
+    try:
+        con = buka_indeks(path)
+        try:
+            with con:
+                simpan_dokumen(con, kunci, data)
+        finally:
+            con.close()
+    except Exception as e:
+        print(f"⚠️ Gagal memperbarui indeks teks {path}: {e}", file=sys.stderr)
+
+# -------------------- INPUT --------------------
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for blok in iter(lambda: fh.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+def baca_dokumen(path: str):
+    """return (kunci, data). JSON <sha256>.json (ekstrak_ulang.py) memakai nama filenya."""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    if ext.lower() == ".json":
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if not isinstance(data, dict):
+            # mis. list hasil --bundel (bundel_anjab.py): bukan satu dokumen extract_info
+            raise ValueError(f"JSON bukan satu hasil extract_info (tipe {type(data).__name__})")
+        return (stem if SHA256_RE.match(stem) else sha256_file(path)), data
+    from ekstrakanjab import extract_info
+    return sha256_file(path), extract_info(path)
+
+def kumpulkan_input(paths):
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                hasil.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.lower().endswith(EKSTENSI_DOKUMEN)
+                             and not f.startswith(("~$", "manifest-", "ringkasan-")))
+        else:
+            hasil.append(p)
+    return hasil
+
+# -------------------- CLI --------------------
+
+def cmd_bangun(args):
+    files = kumpulkan_input(args.input)
+    if not files:
+        print("❌ Tidak ada file .doc/.docx/.json", file=sys.stderr)
+        return 1
+    con = buka_indeks(args.indeks)
+    ditulis = sama = gagal = 0
+    for i, f in enumerate(files, 1):
+        try:
+            kunci, data = baca_dokumen(f)
+            # baris teks disusun sebelum SQL pertama: data aneh gagal tanpa menulis apa pun
+            berubah = simpan_dokumen(con, kunci, data)
+        except Exception as e:
+            gagal += 1
+            print(f"❌ {f}: {e}", file=sys.stderr)
+            continue
+        if berubah:
+            ditulis += 1
+        else:
+            sama += 1
+        if i % 500 == 0:
+            con.commit()
+    con.commit()
+    total = con.execute("SELECT COUNT(*) FROM dokumen").fetchone()[0]
+    con.execute("INSERT INTO teks(teks) VALUES ('optimize')")  # gabungkan segmen FTS setelah bulk
+    con.commit()
+    con.close()
+    print(json.dumps({"ditulis": ditulis, "tidak_berubah": sama, "gagal": gagal, "total_indeks": total},
+                     ensure_ascii=False))
+    return 0 if not gagal else 1
+
+def cmd_cari(args):
+    con = buka_indeks(args.indeks)
+    bagian = [b.strip() for b in args.bagian.split(",") if b.strip()] if args.bagian else None
+    t0 = time.perf_counter()
+    try:
+        hasil = cari(con, args.query, args.batas, bagian, args.mentah)
+    except sqlite3.OperationalError as e:
+        con.close()
+        raise ValueError(f"Query FTS tidak valid: {e}")
+    con.close()
+    print(json.dumps({"query": args.query, "ms": round((time.perf_counter() - t0) * 1000, 2),
+                      "hasil": hasil}, ensure_ascii=False, indent=2))
+    return 0
+
+def cmd_hapus(args):
+    con = buka_indeks(args.indeks)
+    with con:
+        for kunci in args.kunci:
+            hapus_dokumen(con, kunci)
+    con.close()
+    return 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Indeks teks penuh (FTS5/BM25) tugas pokok & hasil kerja anjab.")
+    sub = ap.add_subparsers(dest="perintah", required=True)
+    for nama, bantuan in (("bangun", "bulk build dari arsip"), ("tambah", "insert/update inkremental")):
+        p = sub.add_parser(nama, help=bantuan)
+        p.add_argument("indeks", help="file indeks SQLite")
+        p.add_argument("input", nargs="+", help="file .doc/.docx/.json atau direktori")
+    p = sub.add_parser("cari", help="cari jabatan berdasarkan teks tugas")
+    p.add_argument("indeks", help="file indeks SQLite")
+    p.add_argument("query", help="teks bebas (semua kata wajib ada)")
+    p.add_argument("--batas", type=int, default=10, help="jumlah jabatan maksimal")
+    p.add_argument("--bagian", help="batasi bagian, pisah koma: " + ",".join(BAGIAN))
+    p.add_argument("--mentah", action="store_true", help="query memakai sintaks FTS5 apa adanya")
+    p = sub.add_parser("hapus", help="hapus dokumen dari indeks")
+    p.add_argument("indeks", help="file indeks SQLite")
+    p.add_argument("kunci", nargs="+", help="sha256 dokumen")
+    args = ap.parse_args(argv)
+    from ruang_kerja import pasang_sigterm
+    pasang_sigterm()
+
+    try:
+        if args.perintah == "cari":
+            return cmd_cari(args)
+        if args.perintah == "hapus":
+            return cmd_hapus(args)
+        return cmd_bangun(args)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+Representasi antara (IR) dokumen, ter-cache per hash input, untuk ekstraksi ulang cepat.
+
+Saat heuristik diubah lalu arsip diekstrak ulang, sebagian besar waktu habis di konversi
+.doc (LibreOffice) dan parse XML Document(). IR menyimpan hanya yang dibaca extractor:
+urutan blok, teks per paragraf (run vs hyperlink), numPr langsung, numbering dari style,
+indentasi efektif, format numbering per level, dan tabel sebagai grid sel (span/vMerge).
+Cache hit -> Document minimal dibangun ulang dari IR (bacadoc.bangun_docx di atas
+template mini), tanpa konversi dan tanpa parse XML dokumen asal; extractor tidak berubah.
+
+Format IR = representasi blok bacadoc.py (lihat komentar di atas paragraf_baru) dengan
+kunci tambahan "segmen", "num_pr", "gaya_num" (paragraf) dan "kolom" (tabel).
+File: <dir>/<sha[:2]>/<sha256 input>.ir = zlib(marshal((versi_ir(), blok, abstrak, num)))
+versi_ir() = VERSI_IR + hash source pembaca/extractor (versi_sumber.py): perbaikan di
+bacadoc/bacaformat/ekstrakanjab (isi blok, indentasi efektif, numbering) otomatis
+membuat IR lama miss, lalu ditimpa saat disimpan ulang.
+
+Konfigurasi (env):
+  ANJAB_IR_CACHE=/path/dir   aktif, simpan di direktori ini
+  ANJAB_IR_CACHE=on          aktif, default ~/.cache/anjab/ir (XDG_CACHE_HOME)
+  ANJAB_IR_CACHE=off         nonaktif (default)
+
+Dokumen dengan struktur yang belum bisa diwakili IR (gridBefore/gridAfter pada baris
+tabel) tidak di-cache dan selalu dibaca penuh. Naikkan VERSI_IR bila format IR berubah.
+
+Contoh:
+    ANJAB_IR_CACHE=on python scripts/ekstrak_massal.py arsip/ --out hasil/
+    python scripts/ir_dokumen.py dokumen.doc        # bangun IR + ringkasan
+"""
+import os
+import sys
+import zlib
+import marshal
+import hashlib
+
+VERSI_IR = 1
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_TBL, _W_R, _W_HYPERLINK = W + "p", W + "tbl", W + "r", W + "hyperlink"
+_W_TR, _W_TC, _W_TCPR, _W_TRPR = W + "tr", W + "tc", W + "tcPr", W + "trPr"
+_W_BR, _W_PPR, _W_NUMPR = W + "br", W + "pPr", W + "numPr"
+_W_VAL, _W_TYPE = W + "val", W + "type"
+
+
+class IrTidakDidukung(Exception):
+    """Struktur dokumen tidak bisa diwakili IR; dokumen dibaca penuh tanpa cache."""
+
+# -------------------- KONFIGURASI --------------------
+
+def dir_cache():
+    """Direktori cache IR, atau None bila nonaktif."""
+    v = (os.environ.get("ANJAB_IR_CACHE") or "").strip()
+    if v.lower() in ("", "0", "off", "false"):
+        return None
+    if v.lower() in ("1", "on", "true"):
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "anjab", "ir")
+    return v
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for blok in iter(lambda: fh.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+def versi_ir() -> str:
+    from versi_sumber import versi
+    return f"{VERSI_IR}-{versi(('ir_dokumen.py',))}"
+
+def path_ir(sha: str, direktori=None) -> str:
+    return os.path.join(direktori or dir_cache(), sha[:2], sha + ".ir")
+
+# -------------------- DOCUMENT -> IR --------------------
+
+def _int_val(el):
+    if el is None:
+        return None
+    try:
+        return int(el.get(_W_VAL))
+    except (TypeError, ValueError):
+        return None
+
+def _paragraf(p_el, g):
+    from ekstrakanjab import gaya_paragraf, properti_ppr
+    segmen, page_break = [], False
+    for ch in p_el:
+        if ch.tag == _W_R:
+            segmen.append([ch.text, False])
+            page_break = page_break or any(br.get(_W_TYPE) == "page" for br in ch.iter(_W_BR))
+        elif ch.tag == _W_HYPERLINK:
+            segmen.append([ch.text, True])
+    par = {"teks": "".join(t for t, _h in segmen), "num_id": None, "ilvl": None,
+           "kiri": None, "gantung": None, "page_break": page_break, "num_pr": False}
+    if any(h for _t, h in segmen):
+        par["segmen"] = segmen
+    pPr = p_el.find(_W_PPR)
+    numPr = pPr.find(_W_NUMPR) if pPr is not None else None
+    if numPr is not None:
+        par["num_pr"] = True
+        par["num_id"] = _int_val(numPr.find(W + "numId"))
+        par["ilvl"] = _int_val(numPr.find(W + "ilvl"))
+    _l, _f, num_gaya, ilvl_gaya = gaya_paragraf(g, pPr)
+    if num_gaya is not None or ilvl_gaya is not None:
+        par["gaya_num"] = [num_gaya, ilvl_gaya]
+    indent = properti_ppr(g, pPr)[0]
+    if indent:
+        par["kiri"] = indent
+    return par
+
+def _tabel(tbl_el, g):
+    grid = tbl_el.find(W + "tblGrid")
+    baris = []
+    for tr in tbl_el.findall(_W_TR):
+        trPr = tr.find(_W_TRPR)
+        if trPr is not None and (trPr.find(W + "gridBefore") is not None or trPr.find(W + "gridAfter") is not None):
+            raise IrTidakDidukung("baris tabel dengan gridBefore/gridAfter")
+        row = []
+        for tc in tr.findall(_W_TC):
+            tcPr = tc.find(_W_TCPR)
+            span, vmerge = 1, None
+            if tcPr is not None:
+                span = _int_val(tcPr.find(W + "gridSpan")) or 1
+                vm = tcPr.find(W + "vMerge")
+                if vm is not None:
+                    vmerge = "restart" if vm.get(_W_VAL) == "restart" else "continue"
+            row.append({"paragraf": [_paragraf(p, g) for p in tc.findall(_W_P)],
+                        "span": span, "vmerge": vmerge})
+        baris.append(row)
+    return {"baris": baris, "kolom": len(grid.findall(W + "gridCol")) if grid is not None else 0}
+
+def ir_dari_dokumen(doc):
+    """python-docx Document -> (blok, abstrak, num). Raise IrTidakDidukung."""
+    from ekstrakanjab import gaya_dokumen
+    g = gaya_dokumen(doc.part)
+    blok = []
+    for child in doc.element.body.iterchildren():
+        if child.tag == _W_P:
+            blok.append(("p", _paragraf(child, g)))
+        elif child.tag == _W_TBL:
+            blok.append(("t", _tabel(child, g)))
+    # hanya format numbering yang dibaca extractor (format_nomor); indentasi sudah efektif di paragraf
+    abstrak = {}
+    for absId, fmt in g["fmt"].items():
+        if fmt:
+            levels = [None] * (max(fmt) + 1)
+            for ilvl, f in fmt.items():
+                levels[ilvl] = {"fmt": f}
+            abstrak[absId] = levels
+    num = {numId: absId for numId, absId in g["num"].items() if absId in abstrak}
+    return blok, abstrak, num
+
+# -------------------- IR -> DOCUMENT --------------------
+
+_template = {}
+
+def template_mini() -> bytes:
+    """Paket .docx minimal (document, styles, numbering kosong) — jauh lebih cepat dibuka dari template bawaan."""
+    if "docx" not in _template:
+        import io
+        import zipfile
+        ns = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        rel = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+        ct = "application/vnd.openxmlformats-officedocument.wordprocessingml"
+        isi = {
+            "[Content_Types].xml":
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                f'<Override PartName="/word/document.xml" ContentType="{ct}.document.main+xml"/>'
+                f'<Override PartName="/word/styles.xml" ContentType="{ct}.styles+xml"/>'
+                f'<Override PartName="/word/numbering.xml" ContentType="{ct}.numbering+xml"/>'
+                '</Types>',
+            "_rels/.rels":
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'<Relationship Id="rId1" Type="{rel}/officeDocument" Target="word/document.xml"/>'
+                '</Relationships>',
+            "word/_rels/document.xml.rels":
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'<Relationship Id="rId1" Type="{rel}/styles" Target="styles.xml"/>'
+                f'<Relationship Id="rId2" Type="{rel}/numbering" Target="numbering.xml"/>'
+                '</Relationships>',
+            "word/document.xml":
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {ns}><w:body/></w:document>',
+            "word/styles.xml":
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:styles {ns}/>',
+            "word/numbering.xml":
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:numbering {ns}/>',
+        }
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as z:
+            for nama, xml in isi.items():
+                z.writestr(nama, xml)
+        _template["docx"] = buf.getvalue()
+    return _template["docx"]
+
+def dokumen_dari_ir(ir):
+    import io
+    from bacadoc import bangun_docx
+    blok, abstrak, num = ir
+    return bangun_docx(blok, abstrak, num, dasar=io.BytesIO(template_mini()))
+
+# -------------------- CACHE --------------------
+
+def muat(file_path, sha=None):
+    """Document dari cache IR, atau None (cache nonaktif / miss / file IR rusak / versi lama)."""
+    direktori = dir_cache()
+    if not direktori:
+        return None
+    try:
+        sha = sha or sha256_file(file_path)
+        with open(path_ir(sha, direktori), "rb") as fh:
+            versi, blok, abstrak, num = marshal.loads(zlib.decompress(fh.read()))
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+    if versi != versi_ir():
+        return None
+    return dokumen_dari_ir((blok, abstrak, num))
+
+def simpan(file_path, doc, sha=None) -> bool:
+    """Simpan IR dokumen (atomik). Gagal / tidak didukung -> False, tidak fatal."""
+    direktori = dir_cache()
+    if not direktori:
+        return False
+    try:
+        sha = sha or sha256_file(file_path)
+        data = zlib.compress(marshal.dumps((versi_ir(),) + ir_dari_dokumen(doc)), 1)
+        path = path_ir(sha, direktori)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+        return True
+    except IrTidakDidukung:
+        return False
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Gagal menyimpan cache IR: {e}", file=sys.stderr)
+        return False
+
+def muat_dokumen(file_path, baca):
+    """
+    Document untuk file_path: dari cache IR bila ada, else baca(file_path) lalu IR disimpan.
+    baca: fungsi path -> Document (jalur normal: Document() / pembaca native / LibreOffice).
+    """
+    if not dir_cache() or not isinstance(file_path, (str, os.PathLike)):
+        return baca(file_path)  # file-like (mis. anggota zip) tidak punya kunci cache
+    try:
+        sha = sha256_file(file_path)
+    except OSError:
+        return baca(file_path)
+    doc = muat(file_path, sha)
+    if doc is None:
+        doc = baca(file_path)
+        simpan(file_path, doc, sha)
+    return doc
+
+# -------------------- CLI (debug) --------------------
+
+if __name__ == "__main__":
+    SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    if len(sys.argv) < 2:
+        print("❌ Argumen tidak lengkap: butuh file .doc/.docx", file=sys.stderr)
+        sys.exit(1)
+    import ekstrakanjab
+    f = sys.argv[1]
+    try:
+        doc = (ekstrakanjab.read_docx(f) if f.lower().endswith(".docx") else ekstrakanjab.read_doc(f))[0]
+        blok, abstrak, num = ir_dari_dokumen(doc)
+    except (IrTidakDidukung, ValueError, RuntimeError, OSError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    ukuran = len(zlib.compress(marshal.dumps((versi_ir(), blok, abstrak, num)), 1))
+    n_p = sum(1 for k, _ in blok if k == "p")
+    print(f"{f}: {n_p} paragraf, {len(blok) - n_p} tabel, {len(num)} num, IR {ukuran} byte")
@@ -0,0 +1,174 @@
+"""
+Metrik extractor untuk textfile collector node_exporter (format eksposisi Prometheus).
+
+Aktif bila env ANJAB_METRICS_FILE diisi (atau argumen CLI --metrics-file=PATH), mis.:
+    ANJAB_METRICS_FILE=/var/lib/node_exporter/textfile/anjab.prom python scripts/ekstrakanjab.py a.docx
+
+Tiap proses extractor berumur pendek, jadi nilai counter/histogram diakumulasi di file
+state JSON di samping file .prom (<file>.state.json). Update dilakukan di bawah flock
+(<file>.lock) sehingga invokasi bersamaan teragregasi dengan benar, lalu file .prom
+ditulis ulang secara atomik (tulis ke .tmp lalu os.replace).
+"""
+import os
+import sys
+import json
+
+ENV_FILE = "ANJAB_METRICS_FILE"
+ARG_FILE = "--metrics-file="
+
+BUCKET_DETIK = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BUCKET_BYTE = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# nama metrik -> (tipe, help, bucket)
+DEFINISI = {
+    "anjab_extract_documents_total": ("counter", "Dokumen yang diproses extractor, per status.", None),
+    "anjab_extract_failures_total": ("counter", "Kegagalan extractor per fase.", None),
+    "anjab_extract_duration_seconds": ("histogram", "Durasi total satu dokumen (baca + ekstrak + serialisasi).", BUCKET_DETIK),
+    "anjab_extract_read_seconds": ("histogram", "Durasi membaca dokumen (termasuk konversi bila ada).", BUCKET_DETIK),
+    "anjab_extract_conversion_seconds": ("histogram", "Durasi konversi .doc -> .docx via LibreOffice.", BUCKET_DETIK),
+    "anjab_extract_queue_seconds": ("histogram", "Lama menunggu slot admisi per host (slot_host.py).", BUCKET_DETIK),
+    "anjab_extract_section_seconds": ("histogram", "Durasi per bagian ekstraksi.", BUCKET_DETIK),
+    "anjab_extract_output_bytes": ("histogram", "Ukuran output JSON per dokumen.", BUCKET_BYTE),
+}
+
+# -------------------- KONFIGURASI --------------------
+
+def ambil_path(argv):
+    """
+    Ambil path file metrik dari argv (--metrics-file=PATH) atau env ANJAB_METRICS_FILE.
+    return: (path | None, argv tanpa opsi metrik)
+    """
+    path = os.environ.get(ENV_FILE) or None
+    sisa = []
+    for a in argv:
+        if a.startswith(ARG_FILE):
+            path = a[len(ARG_FILE):] or None
+        else:
+            sisa.append(a)
+    return path, sisa
+
+# -------------------- SAMPEL --------------------
+
+def sampel_dokumen(extractor, waktu, status, fase_gagal=None, output_bytes=None, durasi=None):
+    """
+    Susun sampel satu invokasi extractor dari dict `waktu` yang diisi extract_info/extract_docx:
+      {"fase": str, "baca": detik, "konversi": detik, "antre": {slot: detik}, "bagian": {nama: detik}}
+    return: list (nama_metrik, labels(dict), nilai)
+    """
+    lbl = {"extractor": extractor}
+    s = [("anjab_extract_documents_total", dict(lbl, status=status), 1)]
+    if fase_gagal:
+        s.append(("anjab_extract_failures_total", dict(lbl, phase=fase_gagal), 1))
+    if durasi is not None:
+        s.append(("anjab_extract_duration_seconds", lbl, durasi))
+    if "baca" in waktu:
+        s.append(("anjab_extract_read_seconds", lbl, waktu["baca"]))
+    if "konversi" in waktu:
+        s.append(("anjab_extract_conversion_seconds", lbl, waktu["konversi"]))
+    for jenis, dt in waktu.get("antre", {}).items():
+        s.append(("anjab_extract_queue_seconds", dict(lbl, slot=jenis), dt))
+    for bagian, dt in waktu.get("bagian", {}).items():
+        s.append(("anjab_extract_section_seconds", dict(lbl, section=bagian), dt))
+    if output_bytes is not None:
+        s.append(("anjab_extract_output_bytes", lbl, output_bytes))
+    return s
+
+# -------------------- STATE + AGREGASI --------------------
+
+def _kunci_label(labels: dict) -> str:
+    return json.dumps(sorted(labels.items()), ensure_ascii=False)
+
+def gabung(state: dict, sampel):
+    """Tambahkan sampel ke state: {metrik: {kunci_label: nilai | {"bucket": [...], "sum", "count"}}}."""
+    for nama, labels, nilai in sampel:
+        tipe, _help, bucket = DEFINISI[nama]
+        seri = state.setdefault(nama, {})
+        k = _kunci_label(labels)
+        if tipe == "counter":
+            seri[k] = seri.get(k, 0) + nilai
+            continue
+        h = seri.setdefault(k, {"bucket": [0] * len(bucket), "sum": 0.0, "count": 0})
+        for i, batas in enumerate(bucket):
+            if nilai <= batas:
+                h["bucket"][i] += 1
+        h["sum"] += nilai
+        h["count"] += 1
+    return state
+
+def _fmt_label(labels) -> str:
+    if not labels:
+        return ""
+    isi = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + isi + "}"
+
+def _fmt_angka(v) -> str:
+    if isinstance(v, float):
+        return repr(v) if v != int(v) else str(int(v))
+    return str(v)
+
+def render(state: dict) -> str:
+    """Render state ke format eksposisi teks Prometheus."""
+    out = []
+    for nama, (tipe, help_, bucket) in DEFINISI.items():
+        seri = state.get(nama)
+        if not seri:
+            continue
+        out.append(f"# HELP {nama} {help_}")
+        out.append(f"# TYPE {nama} {tipe}")
+        for k in sorted(seri):
+            labels = [tuple(x) for x in json.loads(k)]
+            v = seri[k]
+            if tipe == "counter":
+                out.append(f"{nama}{_fmt_label(labels)} {_fmt_angka(v)}")
+                continue
+            dasar = nama
+            for batas, n in zip(bucket, v["bucket"]):
+                out.append(f"{dasar}_bucket{_fmt_label(labels + [('le', _fmt_angka(float(batas)))])} {n}")
+            out.append(f"{dasar}_bucket{_fmt_label(labels + [('le', '+Inf')])} {v['count']}")
+            out.append(f"{dasar}_sum{_fmt_label(labels)} {_fmt_angka(round(v['sum'], 6))}")
+            out.append(f"{dasar}_count{_fmt_label(labels)} {v['count']}")
+    return "\n".join(out) + "\n"
+
+def tulis_atomik(path: str, isi: str):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(isi)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+def simpan(path: str, sampel):
+    """Gabungkan sampel ke state bersama (di bawah flock) lalu tulis ulang file .prom."""
+    try:
+        import fcntl
+    except ImportError:  # non-POSIX: tanpa kunci antarproses
+        fcntl = None
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".lock", "a") as kunci:
+        if fcntl:
+            fcntl.flock(kunci, fcntl.LOCK_EX)
+        try:
+            path_state = path + ".state.json"
+            try:
+                with open(path_state, encoding="utf-8") as fh:
+                    state = json.load(fh)
+            except (FileNotFoundError, ValueError):
+                state = {}
+            gabung(state, sampel)
+            tulis_atomik(path_state, json.dumps(state, ensure_ascii=False))
+            tulis_atomik(path, render(state))
+        finally:
+            if fcntl:
+                fcntl.flock(kunci, fcntl.LOCK_UN)
+
+def catat(path, sampel):
+    """Seperti simpan(), tetapi kegagalan metrik tidak boleh menggagalkan ekstraksi."""
+    if not path:
+        return
+    try:
+        simpan(path, sampel)
+    except Exception as e:
+        print(f"⚠️ Gagal menulis metrik {path}: {e}", file=sys.stderr)
@@ -0,0 +1,279 @@
+"""
+Model hasil ekstraksi (Anjab & ABK) sebagai record ber-__slots__, untuk dipakai langsung
+dari Python tanpa lewat stdout/JSON.
+
+Dict hasil extractor menyimpan ulang string kunci di setiap elemen ({"text", "children"},
+{"tahapan", "detail_tahapan"}, ...). Record di sini hanya menyimpan nilainya, jadi
+job massal yang menahan ribuan dokumen di memori jauh lebih hemat. Bentuk JSON lama
+dibuat hanya saat diminta lewat to_dict() / to_json() dan identik dengan output CLI.
+
+Contoh:
+    from model_anjab import ekstrak_anjab, ekstrak_abk
+    a = ekstrak_anjab("upload.docx")
+    a.nama_jabatan, len(a.tugas_pokok), a.tugas_pokok[0].uraian_tugas.deskripsi
+    a.to_dict()   # dict bentuk lama (sama dengan json.loads(stdout ekstrakanjab.py))
+"""
+import json
+import typing
+from dataclasses import dataclass, field, fields, is_dataclass
+
+# nama field Python -> kunci JSON (yang bukan identifier valid)
+_ALIAS = {
+    "waktu_penyelesaian_jam": "waktu_penyelesaian_(jam)",
+    "jpt_utama": "JPT Utama",
+    "jpt_madya": "JPT Madya",
+    "jpt_pratama": "JPT Pratama",
+    "administrator": "Administrator",
+    "pengawas": "Pengawas",
+    "pelaksana": "Pelaksana",
+    "jabatan_fungsional": "Jabatan Fungsional",
+}
+
+# -------------------- KONVERSI --------------------
+
+_skema = {}  # cls -> [(nama_field, kunci_json, cls_record | None, list_of_record: bool)]
+
+
+def _skema_kelas(cls):
+    s = _skema.get(cls)
+    if s is None:
+        hints = typing.get_type_hints(cls)
+        s = []
+        for f in fields(cls):
+            tipe = hints[f.name]
+            arg = typing.get_args(tipe)
+            if typing.get_origin(tipe) is list and arg and is_dataclass(arg[0]):
+                s.append((f.name, _ALIAS.get(f.name, f.name), arg[0], True))
+            elif is_dataclass(tipe):
+                s.append((f.name, _ALIAS.get(f.name, f.name), tipe, False))
+            else:
+                s.append((f.name, _ALIAS.get(f.name, f.name), None, False))
+        _skema[cls] = s
+    return s
+
+
+def _dari_dict(cls, d):
+    kw = {}
+    for nama, kunci, sub, banyak in _skema_kelas(cls):
+        if kunci not in d:
+            continue  # pakai default field
+        v = d[kunci]
+        if sub is not None and v is not None:
+            v = [_dari_dict(sub, x) for x in v] if banyak else _dari_dict(sub, v)
+        kw[nama] = v
+    return cls(**kw)
+
+
+def _ke_dict(obj):
+    out = {}
+    for nama, kunci, sub, banyak in _skema_kelas(type(obj)):
+        v = getattr(obj, nama)
+        if sub is not None and v is not None:
+            v = [_ke_dict(x) for x in v] if banyak else _ke_dict(v)
+        elif isinstance(v, list):
+            v = list(v)
+        out[kunci] = v
+    return out
+
+
+class _Record:
+    __slots__ = ()
+
+    @classmethod
+    def dari_dict(cls, d: dict):
+        """Bangun record dari dict bentuk JSON extractor."""
+        return _dari_dict(cls, d)
+
+    def to_dict(self) -> dict:
+        """Dict dengan bentuk & urutan kunci yang sama dengan output CLI."""
+        return _ke_dict(self)
+
+    def to_json(self, **kw) -> str:
+        kw.setdefault("ensure_ascii", False)
+        return json.dumps(self.to_dict(), **kw)
+
+# -------------------- RECORD BERSAMA --------------------
+
+@dataclass(slots=True)
+class Butir(_Record):
+    """Item bertingkat {"text", "children"} (hasil kerja)."""
+    text: str = ""
+    children: list["Butir"] = field(default_factory=list)
+
+# -------------------- ANJAB --------------------
+
+@dataclass(slots=True)
+class UnitKerja(_Record):
+    jpt_utama: str = "---"
+    jpt_madya: str = "---"
+    jpt_pratama: str = "---"
+    administrator: str = "---"
+    pengawas: str = "---"
+    pelaksana: str = "---"
+    jabatan_fungsional: str = "---"
+
+
+@dataclass(slots=True)
+class PendidikanPelatihan(_Record):
+    diklat_penjenjangan: list[str] = field(default_factory=list)
+    diklat_teknis: list[str] = field(default_factory=list)
+    diklat_fungsional: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Kualifikasi(_Record):
+    pendidikan_formal: list[str] = field(default_factory=list)
+    pendidikan_dan_pelatihan: PendidikanPelatihan = field(default_factory=PendidikanPelatihan)
+    pengalaman_kerja: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Tahapan(_Record):
+    tahapan: str = ""
+    detail_tahapan: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class UraianTugas(_Record):
+    deskripsi: str = ""
+    detail_uraian_tugas: list[Tahapan] = field(default_factory=list)
+    hasil_kerja: list[Butir] = field(default_factory=list)
+    jumlah_hasil: str = ""
+    waktu_penyelesaian_jam: str = ""
+    waktu_efektif: str = ""
+    kebutuhan_pegawai: str = ""
+
+
+@dataclass(slots=True)
+class TugasPokok(_Record):
+    no: str = ""
+    uraian_tugas: UraianTugas = field(default_factory=UraianTugas)
+
+
+@dataclass(slots=True)
+class HasilKerja(_Record):
+    no: str = ""
+    hasil_kerja: list[Butir] = field(default_factory=list)
+    satuan_hasil: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BahanKerja(_Record):
+    no: str = ""
+    bahan_kerja: list[str] = field(default_factory=list)
+    penggunaan_dalam_tugas: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PerangkatKerja(_Record):
+    no: str = ""
+    perangkat_kerja: list[str] = field(default_factory=list)
+    penggunaan_untuk_tugas: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Uraian(_Record):
+    """Baris tanggung jawab / wewenang."""
+    no: str = ""
+    uraian: str = ""
+
+
+@dataclass(slots=True)
+class KorelasiJabatan(_Record):
+    no: str = ""
+    jabatan: str = ""
+    unit_kerja_instansi: str = ""
+    dalam_hal: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class KondisiLingkungan(_Record):
+    no: str = ""
+    aspek: str = ""
+    faktor: str = ""
+
+
+@dataclass(slots=True)
+class RisikoBahaya(_Record):
+    no: str = ""
+    nama_risiko: str = ""
+    penyebab: str = ""
+
+
+@dataclass(slots=True)
+class KondisiFisik(_Record):
+    jenis_kelamin: str = ""
+    umur: str = ""
+    tinggi_badan: str = ""
+    berat_badan: str = ""
+    postur_badan: str = ""
+    penampilan: str = ""
+    keadaan_fisik: str = ""
+
+
+@dataclass(slots=True)
+class SyaratJabatan(_Record):
+    keterampilan_kerja: list[str] = field(default_factory=list)
+    bakat_kerja: list[str] = field(default_factory=list)
+    temperamen_kerja: list[str] = field(default_factory=list)
+    minat_kerja: list[str] = field(default_factory=list)
+    upaya_fisik: list[str] = field(default_factory=list)
+    kondisi_fisik: KondisiFisik = field(default_factory=KondisiFisik)
+    fungsi_pekerja: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Anjab(_Record):
+    file: str = ""
+    nama_jabatan: str = "---"
+    kode_jabatan: str = "---"
+    unit_kerja: UnitKerja = field(default_factory=UnitKerja)
+    ikhtisar_jabatan: str = ""
+    kualifikasi_jabatan: Kualifikasi = field(default_factory=Kualifikasi)
+    tugas_pokok: list[TugasPokok] = field(default_factory=list)
+    hasil_kerja: list[HasilKerja] = field(default_factory=list)
+    bahan_kerja: list[BahanKerja] = field(default_factory=list)
+    perangkat_kerja: list[PerangkatKerja] = field(default_factory=list)
+    tanggung_jawab: list[Uraian] = field(default_factory=list)
+    wewenang: list[Uraian] = field(default_factory=list)
+    korelasi_jabatan: list[KorelasiJabatan] = field(default_factory=list)
+    kondisi_lingkungan_kerja: list[KondisiLingkungan] = field(default_factory=list)
+    risiko_bahaya: list[RisikoBahaya] = field(default_factory=list)
+    syarat_jabatan: SyaratJabatan = field(default_factory=SyaratJabatan)
+    prestasi_yang_diharapkan: str = "---"
+    kelas_jabatan: str = "---"
+
+# -------------------- ABK --------------------
+
+@dataclass(slots=True)
+class TugasAbk(_Record):
+    uraian_tugas: str = ""
+    tahapan: list[str] = field(default_factory=list)
+    satuan_hasil: str = ""
+    waktu_penyelesaian: str = ""
+    waktu_kerja_efektif: str = ""
+    beban_kerja: str = ""
+    pegawai_dibutuhkan: str = ""
+
+
+@dataclass(slots=True)
+class Abk(_Record):
+    nama_jabatan: str = ""
+    unit_kerja: str = ""
+    ikhtisar_jabatan: str = ""
+    tugas_pokok: list[TugasAbk] = field(default_factory=list)
+    jumlah_pegawai_dibutuhkan: str = ""
+    pembulatan: str = ""
+
+# -------------------- API --------------------
+
+def ekstrak_anjab(file_path, waktu=None) -> Anjab:
+    """Seperti ekstrakanjab.extract_info, tapi mengembalikan record Anjab."""
+    from ekstrakanjab import extract_info
+    return Anjab.dari_dict(extract_info(file_path, waktu))
+
+
+def ekstrak_abk(file_path, waktu=None) -> Abk:
+    """Seperti ekstrakabk.extract_docx, tapi mengembalikan record Abk."""
+    from ekstrakabk import extract_docx
+    return Abk.dari_dict(extract_docx(file_path, waktu))
@@ -0,0 +1,389 @@
+"""
+Daemon watch-folder: unit kerja menaruh dokumen anjab/ABK di folder bersama, daemon ini
+menunggu file stabil, mengelompokkan kedatangan menjadi batch, lalu mengekstrak dengan
+paralelisme terbatas (extract_info untuk anjab, extract_docx untuk ABK; jenis ditentukan
+probe_identitas.py).
+
+- Linux: inotify lewat ctypes (tanpa dependensi); OS lain: polling direktori.
+- File dianggap stabil bila ukuran + mtime tidak berubah selama --stabil detik
+  (penyalinan lewat SMB/FTP sering menulis bertahap).
+- Batch dikirim bila sudah --batch file atau file siap tertua menunggu --jeda detik.
+- Berhasil: <out>/<nama>.json, file asli dipindah ke <out>/asli/.
+  Gagal: file asli dipindah ke <karantina>/ beserta <nama>.<ext>.error.json.
+  File yang tetap 0 byte setelah stabil langsung dikarantina (tidak ditunggu selamanya).
+  Nama yang sudah dipakai (a.doc + a.docx, kiriman ulang) diberi akhiran
+  -<tanggal>-<pid>[-n], baik untuk file asli maupun JSON, sehingga tidak saling menimpa.
+- Metrik (opsional): --metrics-file=PATH / ANJAB_METRICS_FILE, sama dengan extractor.
+- Catatan biaya (opsional, ANJAB_BIAYA_DB, biaya_dokumen.py): file yang diperkirakan mahal
+  dikirim ke pool jalur lambat terpisah (ANJAB_SLOT_LAMBAT proses, nice) dan diselesaikan
+  di luar batch, sehingga batch berikutnya tidak menunggu dokumen patologis.
+
+Contoh:
+    python scripts/pantau_folder.py /srv/drop --out /srv/hasil --karantina /srv/karantina --proses 4
+    python scripts/pantau_folder.py /srv/drop --out /srv/hasil --karantina /srv/karantina --sekali
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import struct
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+EKSTENSI_DOKUMEN = (".doc", ".docx")
+ABAIKAN_AKHIRAN = (".tmp", ".part", ".crdownload", ".partial")
+
+# -------------------- PENGAMAT (inotify / polling) --------------------
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+_EVENT = struct.Struct("iIII")
+
+
+def _buka_inotify(folder):
+    """return fd inotify yang mengawasi folder, atau None bila tidak tersedia."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+        if libc.inotify_add_watch(fd, os.fsencode(folder), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+class Pengamat:
+    """tunggu(timeout) -> set nama file yang (mungkin) berubah; None = pindai ulang seluruh folder."""
+
+    def __init__(self, folder, interval_poll=2.0, paksa_poll=False):
+        self.folder = folder
+        self.interval_poll = interval_poll
+        self.fd = None if paksa_poll else _buka_inotify(folder)
+        self.mode = "inotify" if self.fd is not None else "polling"
+
+    def tunggu(self, timeout):
+        if self.fd is None:
+            time.sleep(min(timeout, self.interval_poll))
+            return None
+        import select
+        try:
+            siap, _w, _x = select.select([self.fd], [], [], timeout)
+        except InterruptedError:
+            return set()
+        if not siap:
+            return set()
+        nama = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            i = 0
+            while i + _EVENT.size <= len(buf):
+                _wd, mask, _cookie, panjang = _EVENT.unpack_from(buf, i)
+                i += _EVENT.size
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if panjang:
+                    nama.add(os.fsdecode(buf[i:i + panjang].rstrip(b"\0")))
+                i += panjang
+        return nama
+
+    def tutup(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+# -------------------- WORKER --------------------
+
+def _tulis_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def _abaikan_sigint():
+    # Ctrl+C ditangani proses utama (selesaikan batch), bukan dilempar ke worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _inisialisasi_lambat():
+    from biaya_dokumen import turunkan_prioritas
+    _abaikan_sigint()
+    turunkan_prioritas()
+
+def proses_file(path, out_path, biaya=None):
+    """
+    Dijalankan di process pool. return dict ringkas; exception = gagal.
+    out_path: path JSON (sudah unik, dipilih proses utama). biaya: info nilai_jalur.
+    """
+    from probe_identitas import probe
+    t0 = time.perf_counter()
+    waktu = {}
+    try:
+        jenis = probe(path)["jenis"]
+    except Exception:
+        jenis = "unknown"  # biar extractor penuh yang menentukan
+    try:
+        if jenis == "abk":
+            from ekstrakabk import extract_docx
+            data = extract_docx(path, waktu)
+        else:
+            from ekstrakanjab import extract_info
+            data = extract_info(path, waktu)
+    except Exception:
+        if biaya:
+            from biaya_dokumen import catat, path_db
+            catat(path_db(), biaya, "abk" if jenis == "abk" else "anjab", "gagal", time.perf_counter() - t0, waktu)
+        raise
+    if biaya:
+        from biaya_dokumen import catat, path_db
+        catat(path_db(), biaya, "abk" if jenis == "abk" else "anjab", "ok", time.perf_counter() - t0, waktu)
+    _tulis_json(out_path, data)
+    return {"jenis": "abk" if jenis == "abk" else "anjab", "output": out_path, "waktu": waktu,
+            "output_bytes": os.path.getsize(out_path), "detik": time.perf_counter() - t0}
+
+# -------------------- DAEMON --------------------
+
+def _layak(nama):
+    low = nama.lower()
+    return (low.endswith(EKSTENSI_DOKUMEN) and not nama.startswith(("~$", "."))
+            and not low.endswith(ABAIKAN_AKHIRAN))
+
+def _path_unik(dir_tujuan, nama, dipesan=()):
+    """Path di dir_tujuan yang belum ada dan belum dipesan (output yang sedang ditulis worker)."""
+    tujuan = os.path.join(dir_tujuan, nama)
+    stem, ext = os.path.splitext(nama)
+    cap = f"{stem}-{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+    k = 1
+    while os.path.exists(tujuan) or tujuan in dipesan:
+        tujuan = os.path.join(dir_tujuan, (cap if k == 1 else f"{cap}-{k}") + ext)
+        k += 1
+    return tujuan
+
+def _pindah_unik(src, dir_tujuan):
+    os.makedirs(dir_tujuan, exist_ok=True)
+    tujuan = _path_unik(dir_tujuan, os.path.basename(src))
+    shutil.move(src, tujuan)
+    return tujuan
+
+
+class PantauFolder:
+    def __init__(self, folder, out_dir, karantina, proses=2, batch=20, jeda=5.0, stabil=2.0,
+                 interval_poll=2.0, paksa_poll=False, metrics_file=None, log=sys.stderr):
+        self.folder = os.path.abspath(folder)
+        self.out_dir = out_dir
+        self.dir_asli = os.path.join(out_dir, "asli")
+        self.karantina = karantina
+        self.proses = max(1, proses)
+        self.batch = max(1, batch)
+        self.jeda = jeda
+        self.stabil = stabil
+        self.metrics_file = metrics_file
+        self.log = log
+        self.pengamat = Pengamat(self.folder, interval_poll, paksa_poll)
+        self.kandidat = {}  # path -> (ukuran, mtime, sejak_monotonic)
+        self.siap = []      # [(path, siap_sejak)]
+        self.berhenti = False
+        self.statistik = {"batch": 0, "ok": 0, "gagal": 0}
+        self.biaya_db = os.environ.get("ANJAB_BIAYA_DB") or None
+        self.lambat_jalan = {}  # future jalur lambat -> (path, output); dipanen di luar batch
+        self.dipesan = set()    # path output JSON yang sedang dikerjakan worker
+        for d in (out_dir, self.dir_asli, karantina):
+            os.makedirs(d, exist_ok=True)
+
+    def _daftar(self, nama_set):
+        if nama_set is None:
+            try:
+                nama_set = os.listdir(self.folder)
+            except FileNotFoundError:
+                return
+        sudah = {p for p, _t in self.siap}
+        for n in nama_set:
+            p = os.path.join(self.folder, n)
+            if _layak(n) and p not in self.kandidat and p not in sudah:
+                self.kandidat[p] = (-1, -1, time.monotonic())
+
+    def _cek_stabil(self):
+        sekarang = time.monotonic()
+        for p, (ukuran, mtime, sejak) in list(self.kandidat.items()):
+            try:
+                st = os.stat(p)
+            except FileNotFoundError:
+                del self.kandidat[p]
+                continue
+            if (st.st_size, st.st_mtime_ns) != (ukuran, mtime):
+                self.kandidat[p] = (st.st_size, st.st_mtime_ns, sekarang)
+            elif sekarang - sejak >= self.stabil:
+                del self.kandidat[p]
+                if st.st_size > 0:
+                    self.siap.append((p, sekarang))
+                else:
+                    self.statistik["gagal"] += 1
+                    self._karantina(p, "File kosong (0 byte)")
+
+    def _harus_kirim(self, paksa=False):
+        if not self.siap:
+            return False
+        return paksa or len(self.siap) >= self.batch or time.monotonic() - self.siap[0][1] >= self.jeda
+
+    def _karantina(self, f, pesan):
+        try:
+            tujuan = _pindah_unik(f, self.karantina)
+            _tulis_json(tujuan + ".error.json",  # dengan ekstensi: a.doc & a.docx tidak berbagi file error
+                        {"file": os.path.basename(f), "error": pesan,
+                         "waktu": time.strftime("%Y-%m-%dT%H:%M:%S%z")})
+        except OSError as e:
+            print(f"❌ Gagal memindah {f} ke karantina: {e}", file=self.log)
+        print(f"❌ {os.path.basename(f)}: {pesan}", file=self.log)
+
+    def _kirim(self, pool, f, biaya):
+        """Submit satu file; nama output JSON dipesan di sini agar worker paralel tidak bertabrakan."""
+        out = _path_unik(self.out_dir, os.path.splitext(os.path.basename(f))[0] + ".json", self.dipesan)
+        self.dipesan.add(out)
+        return pool.submit(proses_file, f, out, biaya), (f, out)
+
+    def _selesai(self, item, fut, sampel):
+        f, out = item
+        self.dipesan.discard(out)
+        try:
+            info = fut.result()
+        except Exception as e:
+            self.statistik["gagal"] += 1
+            self._karantina(f, str(e))
+            if self.metrics_file:
+                from metrik import sampel_dokumen
+                sampel += sampel_dokumen("anjab", {}, "gagal", "ekstrak")
+            return
+        self.statistik["ok"] += 1
+        try:
+            _pindah_unik(f, self.dir_asli)
+        except OSError as e:
+            print(f"⚠️ Gagal memindah {f}: {e}", file=self.log)
+        if self.metrics_file:
+            from metrik import sampel_dokumen
+            sampel += sampel_dokumen(info["jenis"], info["waktu"], "ok",
+                                     output_bytes=info["output_bytes"], durasi=info["detik"])
+
+    def _panen_lambat(self, tunggu=False):
+        """Proses hasil jalur lambat yang sudah selesai (tunggu=True: semuanya)."""
+        if not self.lambat_jalan:
+            return
+        from concurrent.futures import wait
+        selesai = wait(self.lambat_jalan).done if tunggu else [f for f in self.lambat_jalan if f.done()]
+        sampel = []
+        for fut in selesai:
+            item = self.lambat_jalan.pop(fut)
+            self._selesai(item, fut, sampel)
+            print(f"🐢 {os.path.basename(item[0])} selesai di jalur lambat", file=self.log)
+        if sampel:
+            from metrik import catat
+            catat(self.metrics_file, sampel)
+
+    def _proses_batch(self, pool, pool_lambat=None):
+        files, self.siap = [p for p, _t in self.siap[:self.batch]], self.siap[self.batch:]
+        t0 = time.perf_counter()
+        sampel = []
+        futs = {}
+        for f in files:
+            biaya = None
+            if pool_lambat is not None:
+                from biaya_dokumen import nilai_jalur
+                biaya = nilai_jalur(self.biaya_db, f)
+            if biaya and biaya["jalur"] == "lambat":
+                fut, item = self._kirim(pool_lambat, f, biaya)
+                self.lambat_jalan[fut] = item
+            else:
+                fut, item = self._kirim(pool, f, biaya)
+                futs[fut] = item
+        for fut in as_completed(futs):
+            self._selesai(futs[fut], fut, sampel)
+        self.statistik["batch"] += 1
+        if sampel:
+            from metrik import catat
+            catat(self.metrics_file, sampel)
+        print(json.dumps({"batch": len(files), "detik": round(time.perf_counter() - t0, 3),
+                          "sisa_siap": len(self.siap), "menunggu_stabil": len(self.kandidat),
+                          "jalur_lambat": len(self.lambat_jalan), **self.statistik}, ensure_ascii=False),
+              file=self.log)
+
+    def jalankan(self, sekali=False):
+        print(f"👀 Memantau {self.folder} ({self.pengamat.mode})", file=self.log)
+        self._daftar(None)
+        pool_lambat = None
+        if self.biaya_db:
+            from slot_host import batas_slot
+            pool_lambat = ProcessPoolExecutor(max_workers=max(1, batas_slot("lambat")),
+                                              initializer=_inisialisasi_lambat)
+        with ProcessPoolExecutor(max_workers=self.proses, initializer=_abaikan_sigint) as pool:
+            while not self.berhenti:
+                tick = min(0.5, self.stabil / 2 or 0.5)
+                sibuk = self.kandidat or self.siap or self.lambat_jalan
+                self._daftar(self.pengamat.tunggu(tick if sibuk else 5.0))
+                self._cek_stabil()
+                if self._harus_kirim(paksa=sekali and not self.kandidat):
+                    self._proses_batch(pool, pool_lambat)
+                self._panen_lambat()
+                if sekali and not self.kandidat and not self.siap:
+                    break
+            while self.siap and self.berhenti:  # selesaikan file yang sudah stabil sebelum keluar
+                self._proses_batch(pool, pool_lambat)
+        self._panen_lambat(tunggu=True)
+        if pool_lambat is not None:
+            pool_lambat.shutdown()
+        self.pengamat.tutup()
+        return self.statistik
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    from metrik import ambil_path
+    metrics_file, argv = ambil_path(sys.argv if argv is None else ["pantau_folder.py"] + list(argv))
+    ap = argparse.ArgumentParser(description="Daemon watch-folder untuk ingest dokumen anjab/ABK secara batch.")
+    ap.add_argument("folder", help="folder drop yang dipantau")
+    ap.add_argument("--out", required=True, help="direktori output JSON (file asli dipindah ke <out>/asli)")
+    ap.add_argument("--karantina", required=True, help="direktori file gagal + <nama>.error.json")
+    ap.add_argument("--proses", type=int, default=os.cpu_count() or 1, help="jumlah proses ekstraksi paralel")
+    ap.add_argument("--batch", type=int, default=20, help="jumlah file maksimal per batch")
+    ap.add_argument("--jeda", type=float, default=5.0, help="detik tunggu mengumpulkan batch (debounce)")
+    ap.add_argument("--stabil", type=float, default=2.0, help="detik ukuran/mtime tidak berubah sebelum diproses")
+    ap.add_argument("--poll", type=float, default=2.0, help="interval polling bila inotify tidak tersedia")
+    ap.add_argument("--paksa-poll", action="store_true", help="pakai polling walau inotify tersedia (mis. NFS/SMB)")
+    ap.add_argument("--sekali", action="store_true", help="proses isi folder saat ini lalu keluar")
+    args = ap.parse_args(argv[1:])
+
+    if not os.path.isdir(args.folder):
+        print(f"❌ Folder tidak ditemukan: {args.folder}", file=sys.stderr)
+        return 1
+    daemon = PantauFolder(args.folder, args.out, args.karantina, args.proses, args.batch, args.jeda,
+                          args.stabil, args.poll, args.paksa_poll, metrics_file)
+
+    def _stop(_signum, _frame):
+        daemon.berhenti = True
+    for sig in (getattr(signal, "SIGTERM", None), signal.SIGINT):
+        if sig is not None:
+            signal.signal(sig, _stop)
+
+    statistik = daemon.jalankan(sekali=args.sekali)
+    print(json.dumps(statistik, ensure_ascii=False))
+    return 0 if not statistik["gagal"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Probe identitas dokumen: baca word/document.xml secara streaming (tanpa python-docx)
+dan berhenti begitu NAMA JABATAN + KODE JABATAN ditemukan, supaya route bisa menolak
+duplikat / jenis dokumen yang salah sebelum ekstraksi penuh.
+
+Nilai yang dikembalikan sama dengan yang akan ditemukan extract_line_value
+(paragraf level body, label huruf besar, nilai = bagian setelah ":" pertama).
+Jenis dokumen:
+  "anjab"   -> ada paragraf body berlabel NAMA JABATAN
+  "abk"     -> ada tabel uraian tugas dengan kolom beban kerja (nama diambil dari tabel
+               identitas pola ekstrakabk.py bila ada). Kolom "kebutuhan pegawai" /
+               "pegawai yang dibutuhkan" saja tidak cukup: kolom itu juga ada di tabel
+               tugas pokok anjab.
+  "unknown" -> tidak dikenali; termasuk NAMA JABATAN yang hanya ada di baris tabel tanpa
+               tabel beban kerja (banyak anjab menaruh identitas di tabel), sehingga
+               pemanggil tetap menjalankan ekstraksi anjab penuh
+
+Contoh:
+    python scripts/probe_identitas.py upload.docx
+    python scripts/ekstrakanjab.py --probe upload.docx
+"""
+import os
+import sys
+import json
+import time
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY, W_P, W_TBL, W_TR, W_TC = W + "body", W + "p", W + "tbl", W + "tr", W + "tc"
+W_R, W_HYPERLINK = W + "r", W + "hyperlink"
+
+LABEL_NAMA = "NAMA JABATAN"
+LABEL_KODE = "KODE JABATAN"
+PENANDA_ABK = "beban kerja"  # kolom penentu tabel ABK (sama dengan colmap ekstrakabk.py)
+
+# -------------------- PEMBACA STREAMING --------------------
+
+def _teks_run(r) -> str:
+    out = []
+    for e in r:
+        tag = e.tag
+        if tag == W + "t":
+            out.append(e.text or "")
+        elif tag in (W + "tab", W + "ptab"):
+            out.append("\t")
+        elif tag == W + "br":
+            out.append("\n" if e.get(W + "type", "textWrapping") == "textWrapping" else "")
+        elif tag == W + "cr":
+            out.append("\n")
+        elif tag == W + "noBreakHyphen":
+            out.append("-")
+    return "".join(out)
+
+def _teks_p(p, dengan_hyperlink=False) -> str:
+    # sama dengan para_text(): hanya run anak langsung (Paragraph.runs)
+    out = []
+    for e in p:
+        if e.tag == W_R:
+            out.append(_teks_run(e))
+        elif dengan_hyperlink and e.tag == W_HYPERLINK:
+            out.extend(_teks_run(r) for r in e if r.tag == W_R)
+    return "".join(out)
+
+def _baris_tabel(tbl):
+    """Teks sel per baris (gridSpan diulang seperti row.cells python-docx)."""
+    for tr in tbl.iter(W_TR):
+        sel = []
+        for tc in tr:
+            if tc.tag != W_TC:
+                continue
+            teks = "\n".join(_teks_p(p, True) for p in tc.iter(W_P))
+            span = tc.find(f"{W}tcPr/{W}gridSpan")
+            n = int(span.get(W + "val", "1")) if span is not None else 1
+            sel.extend([teks] * max(1, n))
+        yield sel
+
+def iter_blok_docx(path):
+    """yield ("p", teks) / ("baris", [teks_sel]) untuk anak langsung w:body, berurutan. path boleh file-like."""
+    import zipfile
+    import xml.etree.ElementTree as ET
+
+    with zipfile.ZipFile(path) as z, z.open("word/document.xml") as fh:
+        depth, body = 0, None
+        for ev, el in ET.iterparse(fh, events=("start", "end")):
+            if ev == "start":
+                depth += 1
+                if body is None and el.tag == W_BODY:
+                    body = el
+                continue
+            depth -= 1
+            if body is None or depth != 2:
+                continue
+            if el.tag == W_P:
+                yield "p", _teks_p(el)
+            elif el.tag == W_TBL:
+                for sel in _baris_tabel(el):
+                    yield "baris", sel
+            body.remove(el)  # buang blok yang sudah dibaca agar memori tetap kecil
+
+def iter_blok(path, data=None):
+    """data: isi file (bytes) bila dokumen tidak ada di disk (mis. anggota arsip zip); path = nama."""
+    ext = os.path.splitext(path)[-1].lower()
+    if ext not in (".docx", ".doc"):
+        raise ValueError("File tidak didukung: " + path)
+    from bacaformat import tebak_format  # jenis dari isi file: .doc bisa saja OOXML/RTF/HTML
+    fmt = tebak_format(path if data is None else data)
+    if fmt in ("rtf", "html", "mht"):
+        from bacaformat import iter_teks_format
+        return iter_teks_format(path if data is None else data, fmt)
+    if fmt == "docx" or (ext == ".docx" and fmt != "ole"):
+        if data is not None:
+            import io
+            return iter_blok_docx(io.BytesIO(data))
+        return iter_blok_docx(path)
+    from bacadoc import iter_teks_doc
+    if data is None:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    return iter_teks_doc(data)
+
+# -------------------- PROBE --------------------
+
+def _nilai_label(label, line):
+    # replikasi extract_line_value untuk satu baris
+    if label in line:
+        parts = line.split(":")
+        if len(parts) >= 2:
+            return parts[1].strip()
+    return None
+
+def _kv_abk(cells):
+    # replikasi pola key/value di ekstrakabk.extract_docx
+    cells = [c.strip() for c in cells]
+    if len(cells) >= 3 and cells[1] == ":":
+        return cells[0], cells[2]
+    if len(cells) >= 2:
+        return cells[0], cells[1]
+    if len(cells) == 1 and ":" in cells[0]:
+        k, v = cells[0].split(":", 1)
+        return k, v
+    return None, None
+
+def probe(file_path, data=None):
+    """
+    data: isi file (bytes) opsional, lihat iter_blok.
+    return dict: {"file", "jenis", "nama_jabatan", "kode_jabatan", "berhenti_awal", "ms"}
+    nama/kode "---" bila tidak ditemukan (sama dengan extract_line_value).
+    """
+    t0 = time.perf_counter()
+    nama = kode = None
+    abk_nama = None
+    abk_tabel = False
+    berhenti_awal = False
+
+    for jenis_blok, isi in iter_blok(file_path, data):
+        if jenis_blok == "p":
+            line = isi
+            if not line:  # sama dengan filter doc_lines()
+                continue
+            if nama is None:
+                nama = _nilai_label(LABEL_NAMA, line)
+            if kode is None:
+                kode = _nilai_label(LABEL_KODE, line)
+            if nama is not None and kode is not None:
+                berhenti_awal = True
+                break
+            continue
+        # baris tabel
+        low = [c.strip().lower() for c in isi]
+        if any("uraian tugas" in c for c in low) and any(PENANDA_ABK in c for c in low):
+            abk_tabel = True
+        key, val = _kv_abk(isi)
+        if key and abk_nama is None and "nama jabatan" in key.lower():
+            abk_nama = val.strip()
+        if nama is None and abk_nama is not None and abk_tabel:
+            berhenti_awal = True
+            break
+
+    if nama is not None:
+        jenis = "anjab"
+        kode_out = kode if kode is not None else "---"
+        nama_out = nama
+    elif abk_tabel:
+        jenis = "abk"
+        nama_out, kode_out = (abk_nama or "---"), "---"
+    else:
+        jenis, nama_out, kode_out = "unknown", "---", "---"
+
+    return {
+        "file": os.path.basename(file_path),
+        "jenis": jenis,
+        "nama_jabatan": nama_out,
+        "kode_jabatan": kode_out,
+        "berhenti_awal": berhenti_awal,
+        "ms": round((time.perf_counter() - t0) * 1000, 2),
+    }
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("❌ Argumen tidak lengkap: butuh file .doc/.docx", file=sys.stderr)
+        return 1
+    try:
+        print(json.dumps(probe(argv[0]), ensure_ascii=False))
+    except Exception as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Profil on-demand untuk ekstraksi (dipakai CLI ekstrakanjab.py & ekstrakabk.py).
+Nonaktif kecuali env diset; modul ini baru di-import bila ANJAB_PROFILE_RATE/HASH ada.
+
+Konfigurasi (env):
+  ANJAB_PROFILE_RATE      fraksi run yang diprofil, 0..1 (mis. 0.05 = 5%)
+  ANJAB_PROFILE_HASH      prefix sha256 dokumen yang selalu diprofil (pisah koma)
+  ANJAB_PROFILE_MODE      cprofile (default, file .pstats) | sampler (stack sampler, file .collapsed)
+  ANJAB_PROFILE_INTERVAL_MS  interval sampler (default 2)
+  ANJAB_PROFILE_MIN_MS    simpan hanya bila run lebih lambat dari ini (default 0)
+  ANJAB_PROFILE_DIR       direktori output (default <tempdir>/anjab-profil)
+  ANJAB_PROFILE_MAX_FILES batas jumlah file (default 200; file tertua dihapus)
+  ANJAB_PROFILE_MAX_MB    batas ukuran total (default 200)
+
+Nama file: <extractor>-<sha256[:12]>-<durasi>ms-<waktu>-<pid>.pstats|.collapsed
+.collapsed bisa langsung dipakai flamegraph.pl / speedscope.
+
+Contoh:
+    ANJAB_PROFILE_RATE=1 python scripts/ekstrakanjab.py lambat.docx > /dev/null
+    python scripts/profil.py ringkas /tmp/anjab-profil/anjab-*.pstats
+"""
+import os
+import sys
+import time
+import random
+import hashlib
+import tempfile
+import threading
+import contextlib
+
+# -------------------- KONFIGURASI --------------------
+
+def dir_profil() -> str:
+    return os.environ.get("ANJAB_PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "anjab-profil")
+
+def _env_float(nama, default):
+    try:
+        return float(os.environ.get(nama, default))
+    except ValueError:
+        return default
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for blok in iter(lambda: fh.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+def perlu_profil(sha: str) -> bool:
+    prefix = [p.strip().lower() for p in os.environ.get("ANJAB_PROFILE_HASH", "").split(",") if p.strip()]
+    if any(sha.startswith(p) for p in prefix):
+        return True
+    rate = _env_float("ANJAB_PROFILE_RATE", 0.0)
+    return rate > 0 and random.random() < rate
+
+# -------------------- STACK SAMPLER --------------------
+
+class StackSampler:
+    """Ambil stack thread target tiap interval (sys._current_frames) -> hitungan collapsed-stack."""
+
+    def __init__(self, interval=0.002, thread_id=None):
+        self.interval = interval
+        self.tid = thread_id or threading.get_ident()
+        self.hitung = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="anjab-sampler", daemon=True)
+
+    def _loop(self):
+        label = {}
+        while not self._stop.wait(self.interval):
+            f = sys._current_frames().get(self.tid)
+            tumpukan = []
+            while f is not None:
+                co = f.f_code
+                nama = label.get(co)
+                if nama is None:
+                    nama = label[co] = f"{co.co_name}@{os.path.basename(co.co_filename)}:{co.co_firstlineno}"
+                tumpukan.append(nama)
+                f = f.f_back
+            if tumpukan:
+                k = ";".join(reversed(tumpukan))
+                self.hitung[k] = self.hitung.get(k, 0) + 1
+
+    def mulai(self):
+        self._thread.start()
+
+    def berhenti(self):
+        self._stop.set()
+        self._thread.join()
+
+    def tulis(self, path):
+        with open(path, "w", encoding="utf-8") as fh:
+            for k, n in sorted(self.hitung.items(), key=lambda x: -x[1]):
+                fh.write(f"{k} {n}\n")
+
+# -------------------- DIREKTORI TERBATAS --------------------
+
+def pangkas(direktori=None):
+    """Hapus file tertua sampai jumlah & ukuran di bawah batas."""
+    direktori = direktori or dir_profil()
+    maks_file = int(_env_float("ANJAB_PROFILE_MAX_FILES", 200))
+    maks_byte = int(_env_float("ANJAB_PROFILE_MAX_MB", 200) * 1024 * 1024)
+    try:
+        entri = [e for e in os.scandir(direktori) if e.is_file() and e.name.endswith((".pstats", ".collapsed"))]
+    except FileNotFoundError:
+        return
+    entri = sorted(((e.stat().st_mtime, e.stat().st_size, e.path) for e in entri), reverse=True)
+    total = 0
+    for i, (_mt, ukuran, path) in enumerate(entri):
+        total += ukuran
+        if i >= maks_file or total > maks_byte:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+# -------------------- HOOK --------------------
+
+@contextlib.contextmanager
+def mungkin_profil(extractor: str, file_path: str):
+    """
+    Context manager untuk membungkus satu ekstraksi. Bila run ini terpilih, profil
+    ditulis setelah blok selesai (juga saat exception). Kegagalan profil tidak fatal.
+    """
+    try:
+        sha = sha256_file(file_path)
+        aktif = perlu_profil(sha)
+    except OSError:
+        aktif = False
+    if not aktif:
+        yield
+        return
+
+    mode = os.environ.get("ANJAB_PROFILE_MODE", "cprofile").lower()
+    if mode == "sampler":
+        prof = StackSampler(_env_float("ANJAB_PROFILE_INTERVAL_MS", 2.0) / 1000)
+        prof.mulai()
+    else:
+        import cProfile
+        prof = cProfile.Profile()
+        prof.enable()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = int((time.perf_counter() - t0) * 1000)
+        if mode == "sampler":
+            prof.berhenti()
+        else:
+            prof.disable()
+        try:
+            if ms >= _env_float("ANJAB_PROFILE_MIN_MS", 0):
+                direktori = dir_profil()
+                os.makedirs(direktori, exist_ok=True)
+                ext = ".collapsed" if mode == "sampler" else ".pstats"
+                nama = f"{extractor}-{sha[:12]}-{ms}ms-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}{ext}"
+                path = os.path.join(direktori, nama)
+                if mode == "sampler":
+                    prof.tulis(path + ".tmp")
+                else:
+                    prof.dump_stats(path + ".tmp")
+                os.replace(path + ".tmp", path)
+                pangkas(direktori)
+                print(f"📈 Profil disimpan: {path}", file=sys.stderr)
+        except Exception as e:
+            print(f"⚠️ Gagal menyimpan profil: {e}", file=sys.stderr)
+
+def aktif_dari_env() -> bool:
+    return bool(os.environ.get("ANJAB_PROFILE_RATE") or os.environ.get("ANJAB_PROFILE_HASH"))
+
+# -------------------- CLI --------------------
+
+def ringkas(path, n=25, fh=sys.stdout):
+    """Top fungsi: .pstats diurut cumulative; .collapsed dijumlah per frame (self & total)."""
+    if path.endswith(".pstats"):
+        import pstats
+        pstats.Stats(path, stream=fh).strip_dirs().sort_stats("cumulative").print_stats(n)
+        return
+    sendiri, total, sampel = {}, {}, 0
+    with open(path, encoding="utf-8") as f:
+        for baris in f:
+            tumpukan, _sp, n_str = baris.rstrip("\n").rpartition(" ")
+            c = int(n_str)
+            sampel += c
+            frame = tumpukan.split(";")
+            sendiri[frame[-1]] = sendiri.get(frame[-1], 0) + c
+            for fr in set(frame):
+                total[fr] = total.get(fr, 0) + c
+    print(f"{sampel} sampel — {path}", file=fh)
+    print(f"{'total%':>7} {'self%':>7}  frame", file=fh)
+    for fr, c in sorted(total.items(), key=lambda x: -x[1])[:n]:
+        print(f"{c * 100 / sampel:7.1f} {sendiri.get(fr, 0) * 100 / sampel:7.1f}  {fr}", file=fh)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2 or argv[0] != "ringkas":
+        print("❌ Pemakaian: profil.py ringkas <file.pstats|file.collapsed>...", file=sys.stderr)
+        return 1
+    for p in argv[1:]:
+        try:
+            ringkas(p)
+        except (OSError, ValueError) as e:
+            print(f"❌ {p}: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Ruang kerja (scratch) terkelola untuk extractor: hasil konversi .doc -> .docx,
+file sementara, dan profil LibreOffice.
+
+Konfigurasi (env):
+  ANJAB_SCRATCH_DIR          direktori induk, mis. /dev/shm/anjab (tmpfs)
+                             default: <tempdir sistem>/anjab-scratch
+  ANJAB_SCRATCH_QUOTA_MB     kuota total direktori kerja (default 512)
+  ANJAB_SCRATCH_STALE_MENIT  umur direktori yatim yang dianggap basi (default 60)
+  ANJAB_LO_PROFILES          jumlah slot profil LibreOffice yang dipakai ulang (default maks(4, jumlah CPU))
+
+Struktur:
+  <root>/run-<pid>-<acak>/     satu per proses; dihapus saat proses keluar (normal, exception;
+                               SIGTERM bila entry point CLI memanggil pasang_sigterm())
+  <root>/lo-profile-<slot>/    profil LibreOffice, dipakai ulang antarproses (dikunci per slot)
+  <root>/anjab-*/              direktori upload dari route Next.js
+
+Saat pertama dipakai, direktori run-* milik proses yang sudah mati (dan anjab-* yang
+lebih tua dari batas basi) dibersihkan.
+
+Modul ini tidak mengubah handler sinyal sebagai efek samping (host yang meng-import
+extractor punya semantik sinyalnya sendiri); hanya CLI yang memasang pasang_sigterm().
+"""
+import os
+import sys
+import time
+import shutil
+import atexit
+import tempfile
+import threading
+import contextlib
+
+PREFIX_RUN = "run-"
+PREFIX_PROFIL = "lo-profile-"
+PREFIX_UPLOAD = "anjab-"
+
+
+class RuangKerjaPenuh(RuntimeError):
+    pass
+
+
+_status = {"run": None, "pid": None}
+_kunci_run = threading.Lock()
+
+# -------------------- KONFIGURASI --------------------
+
+def root_dir() -> str:
+    return os.environ.get("ANJAB_SCRATCH_DIR") or os.path.join(tempfile.gettempdir(), "anjab-scratch")
+
+def kuota_byte() -> int:
+    return int(float(os.environ.get("ANJAB_SCRATCH_QUOTA_MB", "512")) * 1024 * 1024)
+
+def batas_basi_detik() -> float:
+    return float(os.environ.get("ANJAB_SCRATCH_STALE_MENIT", "60")) * 60
+
+def jumlah_slot_profil() -> int:
+    return max(1, int(os.environ.get("ANJAB_LO_PROFILES") or max(4, os.cpu_count() or 1)))
+
+# -------------------- UTIL --------------------
+
+def _pid_hidup(pid: int):
+    """True/False; None bila tidak bisa dipastikan (Windows: os.kill(pid, 0) bukan probe)."""
+    if os.name == "nt":
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def ukuran_dir(path: str) -> int:
+    total = 0
+    stack = [path]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        else:
+                            total += e.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+def pemakaian() -> int:
+    """Total byte direktori run-* dan anjab-* (profil LibreOffice tidak dihitung kuota)."""
+    root = root_dir()
+    try:
+        nama = os.listdir(root)
+    except FileNotFoundError:
+        return 0
+    return sum(ukuran_dir(os.path.join(root, n)) for n in nama
+               if n.startswith((PREFIX_RUN, PREFIX_UPLOAD)))
+
+def bersihkan_basi(sekarang=None) -> list:
+    """Hapus run-* milik proses mati / tidak dikenal yang sudah basi, dan anjab-* yang basi."""
+    root = root_dir()
+    sekarang = sekarang or time.time()
+    batas = batas_basi_detik()
+    dihapus = []
+    try:
+        entri = list(os.scandir(root))
+    except FileNotFoundError:
+        return dihapus
+    for e in entri:
+        if not e.is_dir(follow_symlinks=False) or e.path == _status["run"]:
+            continue
+        try:
+            umur = sekarang - e.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            continue
+        basi = False
+        if e.name.startswith(PREFIX_RUN):
+            try:
+                pid = int(e.name[len(PREFIX_RUN):].split("-")[0])
+            except ValueError:
+                pid = None
+            hidup = _pid_hidup(pid) if pid else None
+            basi = (hidup is False) or (hidup is None and umur > batas)
+        elif e.name.startswith(PREFIX_UPLOAD):
+            basi = umur > batas
+        if basi:
+            shutil.rmtree(e.path, ignore_errors=True)
+            dihapus.append(e.path)
+    return dihapus
+
+# -------------------- RUN DIR --------------------
+
+def _hapus_run():
+    # handler atexit ikut terwarisi saat fork: hanya pemilik run dir yang menghapus
+    if _status["run"] and _status.get("pid") == os.getpid():
+        shutil.rmtree(_status["run"], ignore_errors=True)
+        _status["run"] = None
+
+def pasang_sigterm():
+    """
+    SIGTERM -> SystemExit agar blok finally/atexit tetap jalan (hanya bila belum ada handler).
+    Dipanggil dari entry point CLI saja, bukan dari fungsi library.
+    """
+    try:
+        import signal
+        if threading.current_thread() is not threading.main_thread():
+            return
+        if signal.getsignal(signal.SIGTERM) in (signal.SIG_DFL, None):
+            def _keluar(signum, _frame):
+                signal.signal(signum, signal.SIG_IGN)  # sinyal berikutnya tidak memotong pembersihan
+                sys.exit(128 + signum)
+            signal.signal(signal.SIGTERM, _keluar)
+    except (ImportError, ValueError, AttributeError):
+        pass
+
+def run_dir() -> str:
+    """Direktori kerja milik proses ini (dibuat sekali, dihapus saat exit)."""
+    with _kunci_run:
+        return _run_dir()
+
+def _run_dir() -> str:
+    if _status["run"] and os.getpid() == _status.get("pid") and os.path.isdir(_status["run"]):
+        return _status["run"]
+    root = root_dir()
+    os.makedirs(root, exist_ok=True)
+    if _status.get("pid") != os.getpid():
+        # proses baru (termasuk hasil fork): jangan pakai/hapus run dir milik induk
+        _status.update(run=None, pid=os.getpid())
+        bersihkan_basi()
+        atexit.register(_hapus_run)
+    _status["run"] = tempfile.mkdtemp(prefix=f"{PREFIX_RUN}{os.getpid()}-", dir=root)
+    return _status["run"]
+
+def buat_direktori(prefix: str = "tmp_") -> str:
+    """Buat direktori sementara di run dir setelah cek kuota. Pemanggil wajib hapus()."""
+    base = run_dir()
+    kuota = kuota_byte()
+    if kuota > 0 and pemakaian() >= kuota:
+        bersihkan_basi()
+        terpakai = pemakaian()
+        if terpakai >= kuota:
+            raise RuangKerjaPenuh(
+                f"Ruang kerja penuh: {terpakai / 1048576:.1f} MB dari kuota {kuota / 1048576:.1f} MB ({root_dir()})")
+    return tempfile.mkdtemp(prefix=prefix, dir=base)
+
+def hapus(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+
+@contextlib.contextmanager
+def direktori(prefix: str = "tmp_"):
+    """Context manager: direktori sementara yang selalu dihapus saat keluar blok."""
+    path = buat_direktori(prefix)
+    try:
+        yield path
+    finally:
+        hapus(path)
+
+# -------------------- PROFIL LIBREOFFICE --------------------
+
+@contextlib.contextmanager
+def profil_libreoffice(slot=None):
+    """
+    Pinjam direktori profil LibreOffice yang dipakai ulang (start soffice jauh lebih cepat
+    dengan profil yang sudah terinisialisasi). Tiap slot dikunci flock agar satu profil
+    tidak dipakai dua soffice sekaligus. slot=None: ambil slot bebas pertama.
+    """
+    root = root_dir()
+    os.makedirs(root, exist_ok=True)
+    try:
+        import fcntl
+    except ImportError:  # non-POSIX: profil per proses
+        fcntl = None
+    n = jumlah_slot_profil()
+    if fcntl is None:
+        path = os.path.join(root, f"{PREFIX_PROFIL}{os.getpid()}")
+        os.makedirs(path, exist_ok=True)
+        try:
+            yield path
+        finally:
+            hapus(path)
+        return
+
+    urutan = [slot % n] if slot is not None else list(range(n))
+    kunci = None
+    for i in urutan:
+        fh = open(os.path.join(root, f"{PREFIX_PROFIL}{i}.lock"), "a")
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            kunci, terpilih = fh, i
+            break
+        except BlockingIOError:
+            fh.close()
+    if kunci is None:  # semua slot sibuk: tunggu slot yang ditentukan pid
+        terpilih = urutan[os.getpid() % len(urutan)]
+        kunci = open(os.path.join(root, f"{PREFIX_PROFIL}{terpilih}.lock"), "a")
+        fcntl.flock(kunci, fcntl.LOCK_EX)
+    try:
+        path = os.path.join(root, f"{PREFIX_PROFIL}{terpilih}")
+        os.makedirs(path, exist_ok=True)
+        yield path
+    finally:
+        fcntl.flock(kunci, fcntl.LOCK_UN)
+        kunci.close()
@@ -0,0 +1,165 @@
+"""
+Kontrol admisi lintas proses per host: tiap upload men-spawn extractor sendiri (dan tiap
+.doc bisa men-spawn soffice), jadi lonjakan upload membuat CPU oversubscribed dan semua
+dokumen melambat bersama. Modul ini membatasi jumlah pekerjaan bersamaan dengan slot
+lock-file (flock) tanpa layanan pusat:
+
+  <root>/slot/<jenis>-<i>.lock   i = 0..batas-1; pemegang flock = pemakai slot
+
+Jenis slot & batas (env):
+  ANJAB_SLOT_KONVERSI   konversi LibreOffice bersamaan (default maks(1, CPU // 2); 0 = tanpa batas)
+  ANJAB_SLOT_PARSE      ekstraksi bersamaan di CLI extractor (default 0 = nonaktif; "auto" = jumlah CPU)
+  ANJAB_SLOT_LAMBAT     ekstraksi dokumen jalur lambat bersamaan (biaya_dokumen.py; default 1)
+  ANJAB_SLOT_TIMEOUT    detik maksimal menunggu slot sebelum gagal (default 120)
+  ANJAB_SLOT_TIMEOUT_LAMBAT  idem untuk slot lambat (default 600)
+  ANJAB_SLOT_DIR        direktori lock (default <ANJAB_SCRATCH_DIR>/slot)
+
+Lama antre dicatat ke waktu["antre"][jenis] -> metrik anjab_extract_queue_seconds{slot}.
+Lock dilepas kernel saat proses mati, jadi slot tidak pernah bocor. Non-POSIX (tanpa fcntl):
+admisi tidak dibatasi.
+
+Contoh:
+    ANJAB_SLOT_PARSE=auto python scripts/ekstrakanjab.py dokumen.docx
+    python scripts/slot_host.py          # status pemakaian slot
+"""
+import os
+import sys
+import json
+import time
+import random
+import contextlib
+
+JENIS_SLOT = ("konversi", "parse", "lambat")
+
+
+class SlotPenuh(RuntimeError):
+    pass
+
+# -------------------- KONFIGURASI --------------------
+
+def dir_slot() -> str:
+    d = os.environ.get("ANJAB_SLOT_DIR")
+    if d:
+        return d
+    import ruang_kerja
+    return os.path.join(ruang_kerja.root_dir(), "slot")
+
+def batas_slot(jenis: str) -> int:
+    """Jumlah slot untuk jenis; 0 = tanpa batas."""
+    cpu = os.cpu_count() or 1
+    if jenis == "konversi":
+        nilai, default = os.environ.get("ANJAB_SLOT_KONVERSI"), max(1, cpu // 2)
+    elif jenis == "lambat":
+        nilai, default = os.environ.get("ANJAB_SLOT_LAMBAT"), 1
+    else:
+        nilai, default = os.environ.get("ANJAB_SLOT_PARSE"), 0
+    if not nilai:
+        return default
+    if nilai.strip().lower() == "auto":
+        return cpu
+    try:
+        return max(0, int(nilai))
+    except ValueError:
+        return default
+
+def timeout_default(jenis=None) -> float:
+    nama, default = ("ANJAB_SLOT_TIMEOUT_LAMBAT", 600.0) if jenis == "lambat" else ("ANJAB_SLOT_TIMEOUT", 120.0)
+    try:
+        return float(os.environ.get(nama, default))
+    except ValueError:
+        return default
+
+def _path_lock(jenis, i):
+    return os.path.join(dir_slot(), f"{jenis}-{i}.lock")
+
+# -------------------- SLOT --------------------
+
+def _coba_ambil(fcntl, jenis, n):
+    """Coba semua slot sekali (mulai dari posisi acak agar beban tersebar); return (i, fh) | None."""
+    mulai = random.randrange(n)
+    for k in range(n):
+        i = (mulai + k) % n
+        fh = open(_path_lock(jenis, i), "a")
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return i, fh
+        except BlockingIOError:
+            fh.close()
+    return None
+
+@contextlib.contextmanager
+def slot(jenis: str, timeout=None, waktu=None):
+    """
+    Context manager: tunggu sampai ada slot `jenis` yang bebas (polling flock non-blocking
+    dengan backoff), pegang selama blok berjalan. Lewat `timeout` detik -> SlotPenuh.
+    waktu: dict opsional; lama antre ditulis ke waktu["antre"][jenis].
+    """
+    n = batas_slot(jenis)
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    if n <= 0 or fcntl is None:
+        yield None
+        return
+
+    os.makedirs(dir_slot(), exist_ok=True)
+    timeout = timeout_default(jenis) if timeout is None else timeout
+    fase = None
+    if waktu is not None:
+        fase = waktu.get("fase")
+        waktu["fase"] = "antre"
+    t0 = time.monotonic()
+    jeda = 0.01
+    dapat = _coba_ambil(fcntl, jenis, n)
+    while dapat is None:
+        sisa = t0 + timeout - time.monotonic()
+        if sisa <= 0:
+            raise SlotPenuh(f"Server sibuk: antrean slot {jenis} melebihi {timeout:g} detik ({n} slot terpakai)")
+        time.sleep(min(sisa, jeda * random.uniform(0.5, 1.5)))
+        jeda = min(jeda * 2, 0.25)
+        dapat = _coba_ambil(fcntl, jenis, n)
+    if waktu is not None:
+        waktu.setdefault("antre", {})[jenis] = time.monotonic() - t0
+        if fase is None:
+            waktu.pop("fase", None)
+        else:
+            waktu["fase"] = fase
+    i, fh = dapat
+    try:
+        yield i
+    finally:
+        fcntl.flock(fh, fcntl.LOCK_UN)
+        fh.close()
+
+def status() -> dict:
+    """{jenis: {"batas": n, "terpakai": m}} — dicek dengan flock non-blocking per slot."""
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    hasil = {}
+    for jenis in JENIS_SLOT:
+        n = batas_slot(jenis)
+        terpakai = 0
+        if fcntl is not None and os.path.isdir(dir_slot()):
+            for i in range(n):
+                path = _path_lock(jenis, i)
+                if not os.path.exists(path):
+                    continue
+                with open(path, "a") as fh:
+                    try:
+                        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        fcntl.flock(fh, fcntl.LOCK_UN)
+                    except BlockingIOError:
+                        terpakai += 1
+        hasil[jenis] = {"batas": n, "terpakai": terpakai}
+    return hasil
+
+# -------------------- CLI --------------------
+
+if __name__ == "__main__":
+    SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    print(json.dumps({"dir": dir_slot(), "slot": status()}, ensure_ascii=False))
@@ -0,0 +1,181 @@
+"""
+Generator fixture .doc (Word 97 biner) minimal untuk tests/test_bacadoc.py.
+
+Hanya menulis struktur yang dibaca bacadoc.py: FIB, piece table tunggal (UTF-16),
+FKP PAPX (tabel/list/indent, istd), PlfLst/PlfLfo satu list, STSH opsional (style
+paragraf), dibungkus CFB dua stream.
+Jalankan ulang bila isi fixture diubah:
+    python scripts/tests/fixtures/buat_doc.py scripts/tests/fixtures/daftar.doc
+"""
+import struct, sys
+
+def sprm(s, op): return struct.pack("<H", s) + op
+def b1(v): return bytes([v])
+def h(v): return struct.pack("<h", v)
+def i4(v): return struct.pack("<i", v)
+
+IN_TABLE = sprm(0x2416, b1(1))
+def TTP(centers, merges):
+    n = len(centers) - 1
+    rest = bytes([n]) + b"".join(h(c) for c in centers)
+    for hm, vm in merges:
+        rest += struct.pack("<H", (hm & 3) | ((vm & 3) << 5)) + b"\0" * 18
+    return IN_TABLE + sprm(0x2417, b1(1)) + struct.pack("<H", 0xD608) + struct.pack("<H", len(rest) + 1) + rest
+def LIST(ilfo, ilvl): return sprm(0x460B, h(ilfo)) + sprm(0x260A, b1(ilvl))
+
+def stsh(gaya):
+    """gaya: list (istd_base, grpprl) untuk istd 0..n-1; semua style paragraf."""
+    stshi = struct.pack("<9H", len(gaya), 10, 1, 0x5B, 0x0F, 0, 0, 0, 0)
+    out = struct.pack("<H", len(stshi)) + stshi
+    for k, (base, g) in enumerate(gaya):
+        nama = f"Gaya{k}".encode("utf-16-le")
+        upx = struct.pack("<H", k) + g
+        std = (struct.pack("<5H", k, 1 | (base << 4), 2 | (0 << 4), 0, 0)
+               + struct.pack("<H", len(nama) // 2) + nama + b"\0\0"
+               + struct.pack("<H", len(upx)) + upx + b"\0" * (len(upx) % 2)
+               + struct.pack("<H", 0))
+        out += struct.pack("<H", len(std)) + std
+    return out
+
+def build(paras, gaya=(), prm=0):
+    """paras: list of (text_with_terminator, grpprl[, istd]); prm: PRM piece (fast-save)"""
+    paras = [(p[0], p[1], p[2] if len(p) > 2 else 0) for p in paras]
+    text = "".join(t for t, _g, _s in paras)
+    text_fc = 1024
+    wd = bytearray(1024)
+    wd += text.encode("utf-16-le")
+    # FKP pages
+    while len(wd) % 512: wd += b"\0"
+    fc = text_fc
+    runs = []
+    for t, g, istd in paras:
+        runs.append((fc, fc + 2 * len(t), struct.pack("<H", istd) + g)); fc += 2 * len(t)
+    pages = []
+    idx = 0
+    while idx < len(runs):
+        chunk = runs[idx: idx + 8]; idx += 8
+        page = bytearray(512)
+        crun = len(chunk)
+        rgfc = [r[0] for r in chunk] + [chunk[-1][1]]
+        struct.pack_into(f"<{crun+1}I", page, 0, *rgfc)
+        top = 511
+        for k, (_a, _b, g) in enumerate(chunk):
+            blob = g
+            L = len(blob)
+            if L % 2:
+                data = bytes([(L + 1) // 2]) + blob
+            else:
+                data = b"\0" + bytes([L // 2]) + blob
+            start = (top - len(data)) & ~1
+            page[start:start + len(data)] = data
+            top = start
+            page[4 * (crun + 1) + 13 * k] = start // 2
+        page[511] = crun
+        pages.append((len(wd) // 512, rgfc[0]))
+        wd += page
+    table = bytearray()
+    def put(b):
+        off = len(table); table.extend(b); return off, len(b)
+    # CLX
+    clx = b"\x02" + struct.pack("<I", 4 * 2 + 8) + struct.pack("<ii", 0, len(text)) + struct.pack("<HIH", 0, text_fc, prm)
+    fcClx = put(clx)
+    # PlcBtePapx
+    n = len(pages)
+    plc = struct.pack(f"<{n+1}I", *([p[1] for p in pages] + [fc])) + struct.pack(f"<{n}I", *[p[0] for p in pages])
+    fcPapx = put(plc)
+    # PlfLst
+    lst = h(1) + i4(1234) + i4(0) + b"\xff\xff" * 9 + b"\0\0"
+    lvls = b""
+    for lv in range(9):
+        papx = sprm(0x840F, h(360 * (lv + 1)))
+        lvlf = i4(1) + bytes([4 if lv == 0 else 0]) + b"\0" * 10 + b"\0" + i4(0) + i4(0) + bytes([0, len(papx)]) + b"\0\0"
+        assert len(lvlf) == 28
+        lvls += lvlf + papx + struct.pack("<H", 0)
+    fcLst = put(lst)
+    put(lvls)
+    lfo = i4(1) + i4(1234) + i4(0) + i4(0) + bytes([0, 0, 0, 0]) + i4(0)
+    fcLfo = put(lfo)
+    if gaya:
+        fclcb_stsh = put(stsh(gaya))
+    # FIB
+    struct.pack_into("<HH", wd, 0, 0xA5EC, 0xC1)
+    struct.pack_into("<H", wd, 0x0A, 0x0200)
+    struct.pack_into("<H", wd, 32, 14)
+    struct.pack_into("<H", wd, 62, 22)
+    struct.pack_into("<i", wd, 76, len(text))
+    struct.pack_into("<H", wd, 152, 93)
+    def fclcb(i, v): struct.pack_into("<II", wd, 154 + 8 * i, *v)
+    fclcb(33, fcClx); fclcb(13, fcPapx); fclcb(73, fcLst); fclcb(74, fcLfo)
+    if gaya:
+        fclcb(1, fclcb_stsh)
+    return bytes(wd), bytes(table)
+
+def cfb(streams):
+    SS = 512
+    def pad(b):
+        b = b + b"\0" * (-len(b) % SS)
+        if len(b) < 4096: b += b"\0" * (4096 - len(b))
+        return b
+    body = bytearray(); fat = []; entries = []
+    for name, data in streams:
+        start = len(body) // SS
+        p = pad(data); body += p
+        ns = len(p) // SS
+        fat += [start + k + 1 for k in range(ns - 1)] + [0xFFFFFFFE]
+        entries.append((name, start, len(p)))
+    dir_start = len(body) // SS
+    d = bytearray()
+    def ent(name, tipe, start, size, child=0xFFFFFFFF, right=0xFFFFFFFF):
+        e = bytearray(128)
+        nm = name.encode("utf-16-le") + b"\0\0"
+        e[:len(nm)] = nm
+        struct.pack_into("<H", e, 0x40, len(nm)); e[0x42] = tipe
+        struct.pack_into("<III", e, 0x44, 0xFFFFFFFF, right, child)
+        struct.pack_into("<IQ", e, 0x74, start, size)
+        return e
+    d += ent("Root Entry", 5, 0xFFFFFFFE, 0, child=1)
+    for k, (name, start, size) in enumerate(entries):
+        d += ent(name, 2, start, size, right=(k + 2) if k + 1 < len(entries) else 0xFFFFFFFF)
+    d += b"\0" * (-len(d) % SS)
+    body += d
+    fat += [dir_start + k + 1 for k in range(len(d) // SS - 1)] + [0xFFFFFFFE]
+    fat_start = len(body) // SS
+    nfat = (len(fat) + 1 + 127) // 128
+    fat += [0xFFFFFFFD] * nfat
+    fat += [0xFFFFFFFF] * (-len(fat) % 128)
+    body += struct.pack(f"<{len(fat)}I", *fat)
+    hdr = bytearray(512)
+    hdr[:8] = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+    struct.pack_into("<HHHHH", hdr, 0x18, 0x3E, 3, 0xFFFE, 9, 6)
+    struct.pack_into("<8I", hdr, 0x2C, nfat, dir_start, 0, 4096, 0xFFFFFFFE, 0, 0xFFFFFFFE, 0)
+    difat = [fat_start + k for k in range(nfat)] + [0xFFFFFFFF] * (109 - nfat)
+    struct.pack_into("<109I", hdr, 0x4C, *difat)
+    return bytes(hdr) + bytes(body)
+
+# -------------------- ISI FIXTURE --------------------
+
+def isi_daftar():
+    """Paragraf: list 2 level (level 0 lowerLetter), tabel dengan sel gabung, page break."""
+    c3 = [0, 1000, 2000, 4000]
+    return [
+        ("INFORMASI JABATAN\r", b""),
+        ("1. NAMA JABATAN : Analis \x13 PAGE \x14Data\x15 Kepegawaian\r", sprm(0x840F, h(720))),
+        ("Menyusun rencana\r", LIST(1, 0)), ("Rincian bulanan\r", LIST(1, 1)), ("Melapor\r", LIST(1, 0)),
+        # baris 1: 3 sel biasa; baris 2-3: sel pertama digabung vertikal; baris 4: 2 sel lebar beda
+        ("Pendidikan\x07", IN_TABLE), (":\x07", IN_TABLE), ("S1 Hukum\x07", IN_TABLE),
+        ("\x07", TTP(c3, [(0, 0)] * 3)),
+        ("Diklat\x07", IN_TABLE), (":\x07", IN_TABLE), ("PIM IV\x07", IN_TABLE),
+        ("\x07", TTP(c3, [(0, 3), (0, 0), (0, 0)])),
+        ("\x07", IN_TABLE), (":\x07", IN_TABLE), ("Kearsipan\x07", IN_TABLE),
+        ("\x07", TTP(c3, [(0, 1), (0, 0), (0, 0)])),
+        ("Pengalaman\x07", IN_TABLE), ("2 tahun\x07", IN_TABLE),
+        ("\x07", TTP([0, 2000, 4000], [(0, 0)] * 2)),
+        ("\x0cHALAMAN DUA\r", b""),
+        ("Penutup\x0bbaris dua\r", b""),
+    ]
+
+
+if __name__ == "__main__":
+    wd, tbl = build(isi_daftar())
+    with open(sys.argv[1], "wb") as fh:
+        fh.write(cfb([("WordDocument", wd), ("1Table", tbl)]))
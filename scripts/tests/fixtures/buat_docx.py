@@ -0,0 +1,115 @@
+"""
+Generator fixture .docx tabel tugas pokok untuk tests/test_tugas_pokok.py.
+
+- tugas_langsung.docx: indent & numPr ditulis langsung di paragraf (seperti dokumen lama);
+  output extract_tugas_pokok-nya dibekukan di tugas_langsung.json.
+- tugas_gaya.docx: indent & numPr diwarisi dari style paragraf (rantai basedOn).
+
+Jalankan ulang bila isi fixture diubah:
+    python scripts/tests/fixtures/buat_docx.py scripts/tests/fixtures
+"""
+import os
+import sys
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+HEADER = ["No", "Uraian Tugas", "Hasil Kerja", "Jumlah Hasil", "Waktu Penyelesaian (jam)"]
+
+
+def _numbering(doc):
+    """abstractNum 90: level 0 decimal, level 1 lowerLetter (indent per level); num 90 & 91."""
+    numbering = doc.part.numbering_part.element
+    lvl = "".join(
+        f'<w:lvl w:ilvl="{i}"><w:start w:val="1"/><w:numFmt w:val="{fmt}"/>'
+        f'<w:lvlText w:val="%{i + 1}."/><w:pPr><w:ind w:left="{360 * (i + 1)}" w:hanging="360"/></w:pPr></w:lvl>'
+        for i, fmt in enumerate(("decimal", "lowerLetter")))
+    numbering.append(parse_xml(f'<w:abstractNum {nsdecls("w")} w:abstractNumId="90">{lvl}</w:abstractNum>'))
+    for num_id in (90, 91):
+        numbering.append(parse_xml(f'<w:num {nsdecls("w")} w:numId="{num_id}"><w:abstractNumId w:val="90"/></w:num>'))
+
+
+def _gaya(doc, style_id, ppr="", based_on=None):
+    based = f'<w:basedOn w:val="{based_on}"/>' if based_on else ""
+    doc.styles.element.append(parse_xml(
+        f'<w:style {nsdecls("w")} w:type="paragraph" w:styleId="{style_id}"><w:name w:val="{style_id}"/>'
+        f'{based}<w:pPr>{ppr}</w:pPr></w:style>'))
+
+
+def _paragraf(cell, teks, ppr="", pertama=False):
+    p = cell.paragraphs[0] if pertama else cell.add_paragraph()
+    p.add_run(teks)
+    if ppr:
+        p._p.insert(0, parse_xml(f'<w:pPr {nsdecls("w")}>{ppr}</w:pPr>'))
+    return p
+
+
+def _tabel(doc, baris):
+    """baris: list (uraian_paragraf [(teks, ppr)], hasil)."""
+    doc.add_paragraph("TUGAS POKOK")
+    t = doc.add_table(rows=1, cols=len(HEADER))
+    for c, h in zip(t.rows[0].cells, HEADER):
+        c.text = h
+    for k, (uraian, hasil) in enumerate(baris, 1):
+        cells = t.add_row().cells
+        cells[0].text = str(k)
+        for i, (teks, ppr) in enumerate(uraian):
+            _paragraf(cells[1], teks, ppr, pertama=i == 0)
+        cells[2].text = hasil
+    return t
+
+
+def numpr(num_id, ilvl):
+    return f'<w:numPr><w:ilvl w:val="{ilvl}"/><w:numId w:val="{num_id}"/></w:numPr>'
+
+
+def ind(left, hanging=None):
+    return f'<w:ind w:left="{left}"' + (f' w:hanging="{hanging}"' if hanging is not None else "") + "/>"
+
+
+def tugas_langsung():
+    doc = Document()
+    _numbering(doc)
+    _tabel(doc, [
+        ([("Menyusun rencana kerja unit", ""), ("Tahapan:", ""),
+          ("Mengumpulkan data", numpr(90, 0)), ("Data kepegawaian", numpr(90, 1)),
+          ("Data anggaran", numpr(90, 1)), ("Menganalisis kebutuhan", numpr(90, 0))],
+         "Dokumen rencana kerja"),
+        ([("Mengolah data jabatan", ""), ("Tahapan:", ""),
+          ("Memeriksa formulir", ind(360)), ("Kelengkapan isian", ind(720, 360)),
+          ("Merekap hasil", ind(360)), ("Menyusun laporan", "")],
+         "Laporan olah data"),
+        ([("Melaksanakan tugas lain", ""), ("Tahapan:", ""),
+          ("1. Menerima disposisi", ""), ("a. Membaca arahan", ""), ("2. Melapor", "")],
+         "Laporan"),
+    ])
+    return doc
+
+
+def tugas_gaya():
+    doc = Document()
+    _numbering(doc)
+    _gaya(doc, "TahapAtas", numpr(91, 0))
+    _gaya(doc, "TahapBawah", '<w:numPr><w:ilvl w:val="1"/></w:numPr>', based_on="TahapAtas")
+    _gaya(doc, "IndenDasar", ind(360))
+    _gaya(doc, "IndenSub", ind(1080), based_on="IndenDasar")
+    _gaya(doc, "IndenSubTurunan", based_on="IndenSub")
+    gaya = lambda sid: f'<w:pStyle w:val="{sid}"/>'  # noqa: E731
+    _tabel(doc, [
+        ([("Menyusun rencana kerja unit", ""), ("Tahapan:", ""),
+          ("Mengumpulkan data", gaya("TahapAtas")), ("Data kepegawaian", gaya("TahapBawah")),
+          ("Menganalisis kebutuhan", gaya("TahapAtas"))],
+         "Dokumen rencana kerja"),
+        ([("Mengolah data jabatan", ""), ("Tahapan:", ""),
+          ("Memeriksa formulir", gaya("IndenDasar")), ("Kelengkapan isian", gaya("IndenSubTurunan")),
+          ("Merekap hasil", gaya("IndenSub") + ind(360))],
+         "Laporan olah data"),
+    ])
+    return doc
+
+
+if __name__ == "__main__":
+    out = sys.argv[1]
+    tugas_langsung().save(os.path.join(out, "tugas_langsung.docx"))
+    tugas_gaya().save(os.path.join(out, "tugas_gaya.docx"))
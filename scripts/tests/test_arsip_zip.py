@@ -0,0 +1,53 @@
+"""Ekstraksi arsip .zip (arsip_zip.py): anggota rusak dilaporkan gagal, anggota lain tetap jalan."""
+import zipfile
+
+import pytest
+
+pytest.importorskip("docx")
+
+import arsip_zip  # noqa: E402
+
+
+def _docx_bytes(tmp_path):
+    from docx import Document
+    doc = Document()
+    doc.add_paragraph("INFORMASI JABATAN")
+    doc.add_paragraph("1. NAMA JABATAN : Analis Data Kepegawaian")
+    p = tmp_path / "a.docx"
+    doc.save(str(p))
+    return p.read_bytes()
+
+
+@pytest.fixture
+def arsip(tmp_path):
+    """zip: satu docx sehat, satu .doc tersimpan (stored) dengan CRC rusak, satu bukan dokumen."""
+    path = tmp_path / "kiriman.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("unit/a.docx", _docx_bytes(tmp_path), compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("unit/rusak.doc", b"ISI-ANGGOTA-RUSAK" * 8, compress_type=zipfile.ZIP_STORED)
+        zf.writestr("foto.jpg", b"\xff\xd8")
+    raw = path.read_bytes()
+    path.write_bytes(raw.replace(b"ISI-ANGGOTA-RUSAK", b"ISI-ANGGOTA-RUSAX", 1))
+    return str(path)
+
+
+@pytest.mark.parametrize("proses", [1, 2])
+def test_anggota_rusak_gagal_bukan_crash(arsip, proses):
+    baris = {b["anggota"]: b for b in arsip_zip.ekstrak_arsip(arsip, proses=proses)}
+    assert baris["foto.jpg"]["status"] == "dilewati"
+    assert baris["unit/rusak.doc"]["status"] == "gagal"
+    assert "CRC" in baris["unit/rusak.doc"]["error"]
+    assert baris["unit/a.docx"]["status"] == "ok"
+    assert baris["unit/a.docx"]["jenis"] == "anjab"
+
+
+def test_batas_jumlah_anggota(arsip):
+    with pytest.raises(arsip_zip.ArsipDitolak):
+        list(arsip_zip.ekstrak_arsip(arsip, maks_anggota=1))
+
+
+def test_bukan_zip(tmp_path):
+    p = tmp_path / "x.zip"
+    p.write_bytes(b"bukan zip")
+    with pytest.raises(arsip_zip.ArsipDitolak):
+        list(arsip_zip.ekstrak_arsip(str(p)))
@@ -0,0 +1,115 @@
+"""Pembaca native .doc (bacadoc.py) terhadap fixture biner kecil (fixtures/buat_doc.py)."""
+import os
+
+import pytest
+
+from conftest import FIXTURES
+
+pytest.importorskip("docx")
+
+import bacadoc  # noqa: E402
+from ekstrakanjab import format_nomor, properti_paragraf  # noqa: E402
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+@pytest.fixture(scope="module")
+def doc():
+    return bacadoc.dokumen_dari_doc(os.path.join(FIXTURES, "daftar.doc"))
+
+
+def _paragraf(doc, teks):
+    return next(p for p in doc.paragraphs if p.text == teks)
+
+
+def test_teks_dan_field(doc):
+    teks = [p.text for p in doc.paragraphs]
+    assert teks[:2] == ["INFORMASI JABATAN", "1. NAMA JABATAN : Analis Data Kepegawaian"]
+    assert "Penutup\nbaris dua" in teks
+
+
+def test_list_format_nomor(doc):
+    # numbering dokumen asal tidak boleh tertimpa numbering bawaan template python-docx
+    _indent, num_id, ilvl = properti_paragraf(_paragraf(doc, "Menyusun rencana"))
+    assert (num_id, ilvl) == (1, 0)
+    assert format_nomor(doc.part, 1, 0) == ("0", "lowerLetter")
+    assert format_nomor(doc.part, 1, 1) == ("0", "decimal")
+    assert properti_paragraf(_paragraf(doc, "Rincian bulanan"))[1:] == (1, 1)
+
+
+def test_sel_gabung(doc):
+    (tabel,) = doc.tables
+    assert [[c.text for c in r.cells] for r in tabel.rows] == [
+        ["Pendidikan", ":", "S1 Hukum"],
+        ["Diklat", ":", "PIM IV"],
+        ["Diklat", ":", "Kearsipan"],          # vMerge continue -> sel atas
+        ["Pengalaman", "Pengalaman", "2 tahun"],  # gridSpan 2
+    ]
+
+
+def test_page_break(doc):
+    def ada_page_break(p):
+        return any(br.get(W + "type") == "page" for br in p._p.iter(W + "br"))
+
+    assert ada_page_break(_paragraf(doc, "HALAMAN DUA"))
+    assert not any(ada_page_break(p) for p in doc.paragraphs if p.text != "HALAMAN DUA")
+
+
+def test_bukan_doc():
+    with pytest.raises(bacadoc.DocTidakDidukung):
+        bacadoc.dokumen_dari_doc(b"bukan dokumen word")
+
+
+
+# -------------------- style & fast-save: tolak, bukan hasil yang diam-diam berbeda --------------------
+
+@pytest.fixture(scope="module")
+def buat_doc():
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("buat_doc", os.path.join(FIXTURES, "buat_doc.py"))
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def _tulis(buat_doc, tmp_path, paras, **kw):
+    wd, tbl = buat_doc.build(paras, **kw)
+    path = tmp_path / "x.doc"
+    path.write_bytes(buat_doc.cfb([("WordDocument", wd), ("1Table", tbl)]))
+    return str(path)
+
+
+def test_numbering_dari_style_ditolak(buat_doc, tmp_path):
+    # istd 2 mewarisi numbering dari istd 1 (istdBase); paragraf tidak punya ilfo langsung
+    gaya = [(0xFFF, b""), (0, buat_doc.LIST(1, 0)), (1, b"")]
+    path = _tulis(buat_doc, tmp_path, [("Judul\r", b""), ("Butir\r", b"", 2)], gaya=gaya)
+    with pytest.raises(bacadoc.DocTidakDidukung, match="Numbering dari style"):
+        bacadoc.dokumen_dari_doc(path)
+
+
+def test_indent_dari_style_ditolak(buat_doc, tmp_path):
+    gaya = [(0xFFF, b""), (0, buat_doc.sprm(0x840F, buat_doc.h(720)))]
+    path = _tulis(buat_doc, tmp_path, [("Judul\r", b""), ("Menjorok\r", b"", 1)], gaya=gaya)
+    with pytest.raises(bacadoc.DocTidakDidukung, match="Indent dari style"):
+        bacadoc.dokumen_dari_doc(path)
+
+
+def test_list_langsung_menimpa_style(buat_doc, tmp_path):
+    # style punya numbering + indent, tapi paragraf menulis list sendiri (indent dari level list)
+    gaya = [(0xFFF, b""), (0, buat_doc.LIST(1, 0) + buat_doc.sprm(0x840F, buat_doc.h(720)))]
+    paras = [("Judul\r", b""), ("Butir\r", buat_doc.LIST(1, 1), 1)]
+    doc = bacadoc.dokumen_dari_doc(_tulis(buat_doc, tmp_path, paras, gaya=gaya))
+    assert properti_paragraf(_paragraf(doc, "Butir"))[1:] == (1, 1)
+
+
+def test_fast_save_ditolak(buat_doc, tmp_path):
+    path = _tulis(buat_doc, tmp_path, [("Judul\r", b"")], prm=0x0102)
+    with pytest.raises(bacadoc.DocTidakDidukung, match="fast-save"):
+        bacadoc.dokumen_dari_doc(path)
+
+
+def test_default_libreoffice(monkeypatch):
+    monkeypatch.delenv("ANJAB_DOC_READER", raising=False)
+    assert not bacadoc.pembaca_native()
+    monkeypatch.setenv("ANJAB_DOC_READER", "native")
+    assert bacadoc.pembaca_native()
@@ -0,0 +1,83 @@
+"""Sniffing format + pembaca RTF/HTML native (bacaformat.py) terhadap fixture teks kecil."""
+import io
+import os
+import zipfile
+
+import pytest
+
+from conftest import FIXTURES
+
+pytest.importorskip("docx")
+
+import bacaformat  # noqa: E402
+from ekstrakanjab import format_nomor, properti_paragraf  # noqa: E402
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+FORMAT = ["rtf", "html"]
+
+
+@pytest.fixture(scope="module", params=FORMAT)
+def doc(request):
+    return bacaformat.dokumen_dari_format(os.path.join(FIXTURES, "daftar." + request.param))
+
+
+def _paragraf(doc, teks):
+    return next(p for p in doc.paragraphs if p.text == teks)
+
+
+@pytest.mark.parametrize("fmt", FORMAT)
+def test_tebak_format(fmt):
+    assert bacaformat.tebak_format(os.path.join(FIXTURES, "daftar." + fmt)) == fmt
+
+
+def test_tebak_format_lain():
+    assert bacaformat.tebak_format(os.path.join(FIXTURES, "daftar.doc")) == "ole"
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("word/document.xml", "<w:document/>")
+    assert bacaformat.tebak_format(buf.getvalue()) == "docx"
+    assert bacaformat.tebak_format(b"teks biasa") == "lain"
+
+
+def test_teks(doc):
+    teks = [p.text for p in doc.paragraphs]
+    assert teks[:2] == ["INFORMASI JABATAN", "1. NAMA JABATAN : Analis Data Kepegawaian"]
+    assert teks[-1] == "Penutup\nbaris dua – café"
+
+
+def test_list(doc):
+    indent, num_id, ilvl = properti_paragraf(_paragraf(doc, "Menyusun rencana"))
+    assert num_id is not None and ilvl == 0 and indent == 1080
+    assert properti_paragraf(_paragraf(doc, "Rincian bulanan"))[1:] == (num_id, 1)
+    assert properti_paragraf(_paragraf(doc, "Melapor"))[1:] == (num_id, 0)
+    # format ditebak dari teks nomor yang dirender ("a." / "1.")
+    assert format_nomor(doc.part, num_id, 0)[1] == "lowerLetter"
+    assert format_nomor(doc.part, num_id, 1)[1] == "decimal"
+
+
+def test_sel_gabung(doc):
+    (tabel,) = doc.tables
+    assert [[c.text for c in r.cells] for r in tabel.rows] == [
+        ["Pendidikan", ":", "S1 Hukum"],
+        ["Diklat", ":", "PIM IV"],
+        ["Diklat", ":", "Kearsipan"],
+        ["Pengalaman", "Pengalaman", "2 tahun"],
+    ]
+
+
+def test_page_break(doc):
+    def ada_page_break(p):
+        return any(br.get(W + "type") == "page" for br in p._p.iter(W + "br"))
+
+    assert [p.text for p in doc.paragraphs if ada_page_break(p)] == ["HALAMAN DUA"]
+
+
+def test_mht():
+    with open(os.path.join(FIXTURES, "daftar.html"), "rb") as fh:
+        html = fh.read()
+    mht = (b"MIME-Version: 1.0\r\nContent-Type: multipart/related; boundary=\"----=_batas\"\r\n\r\n"
+           b"------=_batas\r\nContent-Type: text/html; charset=\"utf-8\"\r\n"
+           b"Content-Transfer-Encoding: 8bit\r\n\r\n" + html + b"\r\n------=_batas--\r\n")
+    assert bacaformat.tebak_format(mht) == "mht"
+    doc = bacaformat.dokumen_dari_format(mht)
+    assert doc.tables[0].rows[2].cells[0].text == "Diklat"
@@ -0,0 +1,75 @@
+"""Catatan biaya per dokumen (biaya_dokumen.py): prediksi dari jendela riwayat terbaru per versi."""
+import contextlib
+
+import pytest
+
+import biaya_dokumen
+
+
+@pytest.fixture
+def dok(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANJAB_LAMBAT_MS", "1000")
+    monkeypatch.setattr(biaya_dokumen, "versi_extractor", lambda: "v1")
+    f = tmp_path / "a.doc"
+    f.write_bytes(b"bukan zip" * 100)
+    return str(tmp_path / "biaya.db"), str(f)
+
+
+def _run(db, f, detik, status="ok", waktu=None):
+    info = biaya_dokumen.nilai_jalur(db, f)
+    biaya_dokumen.catat(db, info, "anjab", status, detik, waktu)
+    return info
+
+
+def test_dokumen_baru_jalur_normal(dok):
+    db, f = dok
+    info = biaya_dokumen.nilai_jalur(db, f)
+    assert info["jalur"] == "normal" and info["dasar"] is None
+    assert info["versi"] == "v1" and info["kunci"] == biaya_dokumen.sha256_file(f)
+    assert info["fitur"]["paragraf"] is None and info["fitur"]["ukuran"] == 900
+
+
+def test_satu_run_lambat_tidak_menandai_selamanya(dok):
+    db, f = dok
+    _run(db, f, 5.0, "gagal")  # mis. dibunuh tenggat saat host padat
+    info = biaya_dokumen.nilai_jalur(db, f)
+    assert (info["dasar"], info["jalur"], info["prediksi_ms"]) == ("riwayat", "lambat", 5000)
+    _run(db, f, 0.1)
+    _run(db, f, 0.2)
+    info = biaya_dokumen.nilai_jalur(db, f)
+    assert info["jalur"] == "normal" and info["prediksi_ms"] == pytest.approx(200)
+
+
+def test_jendela_riwayat_dibatasi(dok):
+    db, f = dok
+    for _ in range(biaya_dokumen.JENDELA_RIWAYAT + 3):
+        _run(db, f, 0.1)
+    with contextlib.closing(biaya_dokumen.buka(db)) as con:
+        assert con.execute("SELECT COUNT(*) FROM amatan").fetchone()[0] == biaya_dokumen.JENDELA_RIWAYAT
+        assert con.execute("SELECT n FROM biaya").fetchone()[0] == biaya_dokumen.JENDELA_RIWAYAT + 3
+
+
+def test_versi_baru_tidak_memakai_riwayat_lama(dok, monkeypatch):
+    db, f = dok
+    _run(db, f, 5.0)
+    monkeypatch.setattr(biaya_dokumen, "versi_extractor", lambda: "v2")
+    info = biaya_dokumen.nilai_jalur(db, f)
+    assert info["dasar"] != "riwayat" and info["jalur"] == "normal"
+
+
+def test_simpan_mengurangkan_antre(dok):
+    db, f = dok
+    _run(db, f, 3.0, waktu={"antre": {"normal": 2.5}})
+    with contextlib.closing(biaya_dokumen.buka(db)) as con:
+        ms, = con.execute("SELECT ms FROM amatan").fetchone()
+        ms_terakhir, ms_maks, status = con.execute("SELECT ms_terakhir, ms_maks, status FROM biaya").fetchone()
+    assert ms == pytest.approx(500) and ms_terakhir == pytest.approx(500) and ms_maks == pytest.approx(500)
+    assert status == "ok"
+    assert biaya_dokumen.nilai_jalur(db, f)["jalur"] == "normal"
+
+
+def test_dokumen_besar_langsung_jalur_lambat(dok, monkeypatch):
+    db, f = dok
+    monkeypatch.setattr(biaya_dokumen, "fitur", lambda p: {"ukuran": 1, "paragraf": biaya_dokumen.MAKS_PARAGRAF, "sel": 0})
+    info = biaya_dokumen.nilai_jalur(db, f)
+    assert (info["dasar"], info["jalur"]) == ("ambang", "lambat")
@@ -0,0 +1,73 @@
+"""Pemecah bundel (bundel_anjab.py): dua jabatan dipisah page break -> dua hasil extract_info."""
+import json
+
+import pytest
+
+pytest.importorskip("docx")
+from docx import Document  # noqa: E402
+from docx.enum.text import WD_BREAK  # noqa: E402
+
+import bundel_anjab  # noqa: E402
+import ekstrakanjab  # noqa: E402
+
+HEADER = ["No", "Uraian Tugas", "Hasil Kerja", "Jumlah Hasil", "Waktu Penyelesaian (jam)"]
+JABATAN = [("Analis Data", "Menyusun rencana analisis"), ("Pranata Komputer", "Memelihara jaringan")]
+
+
+def _jabatan(doc, nama, tugas, page_break=False):
+    doc.add_paragraph("INFORMASI JABATAN")
+    doc.add_paragraph(f"NAMA JABATAN : {nama}")
+    doc.add_paragraph("KODE JABATAN : -")
+    doc.add_paragraph("TUGAS POKOK")
+    t = doc.add_table(rows=2, cols=len(HEADER))
+    for c, h in zip(t.rows[0].cells, HEADER):
+        c.text = h
+    for c, v in zip(t.rows[1].cells, ["1", tugas, "Dokumen", "12", "2"]):
+        c.text = v
+    p = doc.add_paragraph("Demikian")
+    if page_break:
+        p.add_run().add_break(WD_BREAK.PAGE)
+
+
+def _simpan(path, daftar, page_break=True):
+    doc = Document()
+    for k, (nama, tugas) in enumerate(daftar):
+        _jabatan(doc, nama, tugas, page_break and k < len(daftar) - 1)
+    doc.save(path)
+    return str(path)
+
+
+def _tanpa_segmen(data):
+    return json.loads(json.dumps({k: v for k, v in data.items() if k not in ("segmen", "file")}))
+
+
+@pytest.mark.parametrize("proses", [1, 2])
+def test_dua_jabatan_dipisah_page_break(tmp_path, proses):
+    bundel = _simpan(tmp_path / "bundel.docx", JABATAN)
+    hasil = bundel_anjab.ekstrak_bundel(bundel, proses)
+    assert [h["nama_jabatan"] for h in hasil] == ["Analis Data", "Pranata Komputer"]
+    # 6 blok per jabatan (5 paragraf + 1 tabel); segmen kedua mulai setelah page break
+    assert [h["segmen"] for h in hasil] == [
+        {"ke": 1, "dari": 2, "blok_awal": 0, "blok_akhir": 6},
+        {"ke": 2, "dari": 2, "blok_awal": 6, "blok_akhir": 12}]
+    for k, (h, jab) in enumerate(zip(hasil, JABATAN)):
+        tunggal = ekstrakanjab.extract_info(_simpan(tmp_path / f"tunggal{k}.docx", [jab]))
+        assert _tanpa_segmen(h) == _tanpa_segmen(tunggal)
+        assert h["tugas_pokok"][0]["uraian_tugas"]["deskripsi"] == jab[1]
+
+
+def test_tanpa_break_judul_ikut_segmen_baru(tmp_path):
+    bundel = _simpan(tmp_path / "bundel.docx", JABATAN, page_break=False)
+    hasil = bundel_anjab.ekstrak_bundel(bundel)
+    # "INFORMASI JABATAN" di atas label kedua ikut ke segmen kedua
+    assert [(h["segmen"]["blok_awal"], h["segmen"]["blok_akhir"]) for h in hasil] == [(0, 6), (6, 12)]
+
+
+def test_satu_jabatan_sama_dengan_extract_info(tmp_path):
+    f = _simpan(tmp_path / "satu.docx", JABATAN[:1])
+    hasil = bundel_anjab.ekstrak_bundel(f)
+    assert len(hasil) == 1 and _tanpa_segmen(hasil[0]) == _tanpa_segmen(ekstrakanjab.extract_info(f))
+    doc = ekstrakanjab.read_docx(f)[0]
+    n = len(bundel_anjab._blok_body(doc))
+    assert bundel_anjab.ekstrak_segmen(doc, [(0, n)], "satu.docx")
+    assert len(bundel_anjab._blok_body(doc)) == n  # body dikembalikan utuh
@@ -0,0 +1,66 @@
+"""Delta hasil ekstraksi (delta_anjab.py): item dipindah, disisipkan, dihapus."""
+import copy
+
+import delta_anjab
+
+
+def _tugas(deskripsi, *tahapan):
+    return {"no": "", "uraian_tugas": {"deskripsi": deskripsi, "detail_uraian_tugas": [
+        {"tahapan": t, "detail_tahapan": []} for t in tahapan]}}
+
+
+def _terapkan(lama, d, panjang):
+    """Susun ulang list baru dari list lama + delta (seperti importer DB)."""
+    baru = [None] * panjang
+    for u in d["diubah"] + d["ditambah"]:
+        baru[u["posisi"]] = u["item"]
+    for j, it in enumerate(baru):
+        if it is None:
+            baru[j] = lama[j]  # "tetap": isi & posisi sama
+    return baru
+
+
+LAMA = {
+    "nama_jabatan": "Analis Data", "kelas_jabatan": "9",
+    "tugas_pokok": [_tugas("Menyusun rencana", "Mengumpulkan data", "Menganalisis"),
+                    _tugas("Mengolah data"),
+                    _tugas("Menyusun laporan"),
+                    _tugas("Mengarsipkan dokumen")],
+    "wewenang": [{"no": "1", "uraian": "Meminta data"}],
+}
+
+
+def test_pindah_sisip_hapus():
+    baru = copy.deepcopy(LAMA)
+    rencana, olah, laporan, arsip = baru["tugas_pokok"]
+    rencana["uraian_tugas"]["detail_uraian_tugas"].reverse()
+    baru["tugas_pokok"] = [olah, rencana, _tugas("Memantau kinerja"), arsip]  # laporan dihapus
+    baru["kelas_jabatan"] = "8"
+
+    d = delta_anjab.hitung_delta(LAMA, baru)
+    assert d["berubah"] and d["jabatan"] == {"kelas_jabatan": "8"}
+    tp = d["bagian"]["tugas_pokok"]
+    assert tp["tetap"] == 1  # arsip: isi & posisi sama
+    assert [(u["posisi_lama"], u["posisi"], u["kolom"]) for u in tp["diubah"]] == [
+        (1, 0, []), (0, 1, ["uraian_tugas"])]
+    tahapan = tp["diubah"][1]["tahapan"]
+    assert [(u["posisi_lama"], u["posisi"]) for u in tahapan["diubah"]] == [(1, 0), (0, 1)]
+    assert [(u["posisi"], u["item"]["uraian_tugas"]["deskripsi"]) for u in tp["ditambah"]] == [(2, "Memantau kinerja")]
+    assert [(u["posisi_lama"], u["item"]["uraian_tugas"]["deskripsi"]) for u in tp["dihapus"]] == [(2, "Menyusun laporan")]
+    assert tp["dihapus"][0]["kunci"] == delta_anjab._id_kunci("menyusun laporan")
+    assert d["bagian"]["wewenang"] == {"ditambah": [], "diubah": [], "dihapus": [], "tetap": 1}
+    assert _terapkan(LAMA["tugas_pokok"], tp, len(baru["tugas_pokok"])) == baru["tugas_pokok"]
+    assert d["dasar"] == delta_anjab.sidik(dict(LAMA, file="lain.docx"))
+
+
+def test_kunci_kembar_dipasangkan_berurutan():
+    lama = [{"uraian": "Meminta data", "no": "1"}, {"uraian": "Meminta  DATA", "no": "2"}]
+    baru = [{"uraian": "meminta data", "no": "1"}]
+    d = delta_anjab.delta_list(lama, baru, delta_anjab.KUNCI_BAGIAN["wewenang"])
+    assert [(u["posisi_lama"], u["kolom"]) for u in d["diubah"]] == [(0, ["uraian"])]
+    assert [u["posisi_lama"] for u in d["dihapus"]] == [1]
+
+
+def test_tanpa_perubahan():
+    d = delta_anjab.hitung_delta(LAMA, copy.deepcopy(LAMA))
+    assert not d["berubah"] and d["bagian"]["tugas_pokok"]["tetap"] == 4
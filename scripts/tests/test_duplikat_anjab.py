@@ -0,0 +1,52 @@
+"""Indeks hampir-duplikat (duplikat_anjab.py): kunci sha256 isi, bukan path."""
+import json
+import shutil
+
+import duplikat_anjab
+
+URAIAN = ("menyusun rencana kerja tahunan unit kepegawaian berdasarkan data jabatan "
+          "mengolah data formasi pegawai dan menyusun laporan analisis beban kerja")
+
+
+def _tulis(path, ikhtisar, nama="Analis Data"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"nama_jabatan": nama, "ikhtisar_jabatan": ikhtisar,
+            "tugas_pokok": [{"uraian_tugas": {"deskripsi": URAIAN, "detail_uraian_tugas": []}}]}
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+def _jalan(capsys, *argv):
+    rc = duplikat_anjab.main(list(argv))
+    return rc, json.loads(capsys.readouterr().out)
+
+
+def test_pindah_file_tidak_menambah_entri(tmp_path, capsys):
+    db = str(tmp_path / "indeks.db")
+    a = _tulis(tmp_path / "arsip" / "a.json", "melaksanakan analisis jabatan di lingkungan instansi")
+    _rc, ringkas = _jalan(capsys, "bangun", db, a, "--proses", "1")
+    assert ringkas["total_indeks"] == 1
+
+    pindah = tmp_path / "arsip_baru" / "a_rename.json"
+    pindah.parent.mkdir()
+    shutil.move(a, pindah)
+    _rc, ringkas = _jalan(capsys, "bangun", db, str(pindah), "--proses", "1")
+    assert ringkas["total_indeks"] == 1
+
+    # isi identik: dokumen yang sama, bukan kandidat duplikat dirinya sendiri
+    _rc, (hasil,) = _jalan(capsys, "cari", db, str(pindah))
+    assert hasil["sudah_terindeks"] and hasil["kandidat"] == []
+
+    mirip = _tulis(tmp_path / "upload.json", "melaksanakan analisis jabatan di lingkungan instansi pusat")
+    _rc, (hasil,) = _jalan(capsys, "cari", db, mirip)
+    assert not hasil["sudah_terindeks"]
+    (kandidat,) = hasil["kandidat"]
+    assert kandidat["file"] == str(pindah) and kandidat["skor"] >= duplikat_anjab.AMBANG_DEFAULT
+
+
+def test_dokumen_kosong_tidak_diindeks(tmp_path, capsys):
+    db = str(tmp_path / "indeks.db")
+    kosong = tmp_path / "kosong.json"
+    kosong.write_text(json.dumps({"nama_jabatan": "X", "tugas_pokok": []}), encoding="utf-8")
+    _rc, ringkas = _jalan(capsys, "bangun", db, str(kosong), "--proses", "1")
+    assert (ringkas["kosong"], ringkas["total_indeks"]) == (1, 0)
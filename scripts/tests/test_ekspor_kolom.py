@@ -0,0 +1,83 @@
+"""Ekspor kolumnar (ekspor_kolom.py): round-trip Parquet & Arrow IPC, batas kamus IPC, kompresi."""
+import glob
+import json
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds  # noqa: E402
+
+import ekspor_kolom  # noqa: E402
+
+
+def _dokumen(k):
+    return {
+        "file": f"jab{k}.docx", "nama_jabatan": f"Jabatan {k}", "kode_jabatan": None,
+        "unit_kerja": {"Administrator": "Biro Umum", "Pengawas": f"Subbagian {k % 2}"},
+        "ikhtisar_jabatan": "Melakukan kegiatan", "kelas_jabatan": "7",
+        "tugas_pokok": [{"no": "1", "uraian_tugas": {
+            "deskripsi": f"Menyusun laporan {k}", "jumlah_hasil": "12",
+            "detail_uraian_tugas": [{"tahapan": "Mengumpulkan data", "detail_tahapan": ["a", "b"]}],
+            "hasil_kerja": [{"text": "Laporan", "children": [{"text": "Lampiran"}]}]}}],
+        "wewenang": [{"no": "1", "uraian": "Meminta data"}],
+        "kualifikasi_jabatan": {"pendidikan_formal": ["S1"], "pengalaman_kerja": []},
+        "syarat_jabatan": {"bakat_kerja": ["G", "V"], "kondisi_fisik": {"jenis_kelamin": "-"}},
+    }
+
+
+@pytest.fixture
+def korpus(tmp_path):
+    d = tmp_path / "hasil"
+    d.mkdir()
+    for k in range(5):
+        (d / f"{k:064x}.json").write_text(json.dumps(_dokumen(k)), encoding="utf-8")
+    return str(d)
+
+
+def _baca(out, tabel, fmt):
+    files = sorted(glob.glob(os.path.join(out, tabel + ("*.arrow" if fmt == "arrow" else ".parquet"))))
+    return ds.dataset(files, format="arrow" if fmt == "arrow" else "parquet").to_table()
+
+
+@pytest.mark.parametrize("fmt,kompresi", [("parquet", "zstd"), ("parquet", "snappy"),
+                                          ("arrow", "zstd"), ("arrow", "lz4"), ("arrow", "none")])
+def test_round_trip(korpus, tmp_path, fmt, kompresi):
+    out = str(tmp_path / "kolom")
+    r = ekspor_kolom.ekspor(ekspor_kolom.kumpulkan_input([korpus]), out, fmt, batch=2, kompresi=kompresi)
+    assert (r["dokumen"], r["gagal"]) == (5, 0)
+    jab = _baca(out, "jabatan", fmt).to_pydict()
+    assert jab["dok_id"] == [f"{k:064x}" for k in range(5)]
+    assert jab["nama_jabatan"] == [f"Jabatan {k}" for k in range(5)]
+    assert jab["unit_pengawas"] == [f"Subbagian {k % 2}" for k in range(5)]
+    assert jab["kode_jabatan"] == [None] * 5
+    tahapan = _baca(out, "tahapan", fmt).to_pydict()
+    assert tahapan["detail_tahapan"] == [["a", "b"]] * 5
+    butir = _baca(out, "butir_hasil", fmt).to_pydict()
+    assert butir["text"][:2] == ["Laporan", "Lampiran"] and butir["induk"][:2] == [None, 1]
+    syarat = _baca(out, "syarat_jabatan", fmt).to_pydict()
+    assert syarat["aspek"][:3] == ["bakat_kerja", "bakat_kerja", "kondisi_fisik.jenis_kelamin"]
+    assert r["baris"]["tugas_pokok"] == 5 and "korelasi_jabatan" not in r["file"]
+
+
+def test_kamus_ipc_dibatasi(korpus, tmp_path):
+    out = str(tmp_path / "kolom")
+    r = ekspor_kolom.ekspor(ekspor_kolom.kumpulkan_input([korpus]), out, "arrow", batch=2, maks_kamus=3)
+    # dok_id unik per dokumen: kamus 2 -> 4 nilai (> 3) -> batch kedua pindah ke file baru,
+    # batch ketiga (kamus 2 -> 3) tetap di file itu
+    assert [os.path.basename(f) for f in r["file"]["tugas_pokok"]] == ["tugas_pokok.arrow", "tugas_pokok-1.arrow"]
+    for f in r["file"]["tugas_pokok"]:
+        with pa.ipc.open_file(f) as rd:
+            assert len(rd.read_all().column("dok_id").combine_chunks().dictionary) <= 3
+    semua = ds.dataset(r["file"]["tugas_pokok"], format="arrow").to_table()
+    assert semua.column("deskripsi").to_pylist() == [
+        f"Menyusun laporan {k}" for k in range(5)]
+
+
+def test_snappy_ditolak_untuk_ipc(korpus, tmp_path, capsys):
+    out = str(tmp_path / "kolom")
+    assert ekspor_kolom.main([korpus, "--out", out, "--format", "arrow", "--kompresi", "snappy"]) == 1
+    assert "snappy" in capsys.readouterr().err
+    assert not os.path.exists(out)
+    with pytest.raises(ValueError):
+        ekspor_kolom.PenulisKolom(out, "arrow", "snappy")
@@ -0,0 +1,53 @@
+"""Pipeline ekstraksi massal (ekstrak_massal.py): hasil = extract_info, nama output unik, gagal tercatat."""
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import FIXTURES
+
+pytest.importorskip("docx")
+import ekstrak_massal  # noqa: E402
+import ekstrakanjab  # noqa: E402
+
+
+def _jalankan(files, out):
+    return ekstrak_massal.PipelineMassal(str(out), n_konversi=1, n_parsing=2, laporan_detik=60).jalankan(files)
+
+
+def test_hasil_sama_dengan_extract_info(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANJAB_DOC_READER", "native")
+    masuk = tmp_path / "arsip"
+    (masuk / "sub").mkdir(parents=True)
+    for nama in ("tugas_langsung.docx", "tugas_gaya.docx", "daftar.doc"):
+        shutil.copy(os.path.join(FIXTURES, nama), masuk / nama)
+    shutil.copy(os.path.join(FIXTURES, "tugas_gaya.docx"), masuk / "sub" / "tugas_gaya.docx")
+    (masuk / "rusak.docx").write_bytes(b"bukan docx")
+    files = ekstrak_massal.kumpulkan_input([str(masuk)])
+
+    r = _jalankan(files, tmp_path / "hasil")
+    assert (r["ok"], r["gagal"], r["total"], r["dikonversi"]) == (4, 1, 5, 0)
+    assert [os.path.basename(g["file"]) for g in r["gagal_detail"]] == ["rusak.docx"]
+
+    keluar = sorted(os.listdir(tmp_path / "hasil"))
+    assert "tugas_langsung.json" in keluar and "daftar.json" in keluar
+    # stem dipakai dua input -> dua output berakhiran hash path, tidak saling menimpa
+    gaya = [n for n in keluar if n.startswith("tugas_gaya-")]
+    assert len(gaya) == 2 and "tugas_gaya.json" not in keluar
+    for nama in ("tugas_langsung", "daftar"):
+        with open(tmp_path / "hasil" / f"{nama}.json", encoding="utf-8") as fh:
+            hasil = json.load(fh)
+        ext = ".doc" if nama == "daftar" else ".docx"
+        assert hasil == json.loads(json.dumps(ekstrakanjab.extract_info(str(masuk / (nama + ext)))))
+
+
+def test_doc_tanpa_libreoffice_gagal_tercatat(tmp_path, monkeypatch):
+    monkeypatch.delenv("ANJAB_DOC_READER", raising=False)  # default: .doc lewat tahap konversi
+    monkeypatch.setenv("PATH", str(tmp_path))  # soffice tidak ditemukan
+    f = tmp_path / "daftar.doc"
+    shutil.copy(os.path.join(FIXTURES, "daftar.doc"), f)
+    r = _jalankan([str(f)], tmp_path / "hasil")
+    assert (r["ok"], r["gagal"]) == (0, 1)
+    assert r["gagal_detail"][0]["error"].startswith("konversi:")
+    assert os.listdir(tmp_path / "hasil") == []
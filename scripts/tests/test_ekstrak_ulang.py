@@ -0,0 +1,40 @@
+"""Job ekstraksi ulang (ekstrak_ulang.py): coba ulang dengan backoff + resume dari manifest."""
+import json
+import os
+import time
+
+import ekstrak_ulang
+
+
+def _kerja_palsu(file_path, out_path):
+    """Pengganti ekstrak_satu di pool: "gagal" gagal sekali, "lambat" makan waktu."""
+    isi = open(file_path, encoding="utf-8").read()
+    penanda = file_path + ".sudah"
+    if isi == "gagal" and not os.path.exists(penanda):
+        open(penanda, "w").close()
+        raise RuntimeError("gagal sementara")
+    if isi == "lambat":
+        time.sleep(1.0)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        json.dump({"isi": isi}, fh)
+    return 0.0
+
+
+def test_coba_ulang_saat_belum_ada_future_selesai(tmp_path, monkeypatch):
+    # "gagal" dijadwalkan ulang 0.1 detik lagi sementara "lambat" masih jalan: tunggu
+    # as_completed habis waktunya (concurrent.futures.TimeoutError di Python 3.10)
+    monkeypatch.setattr(ekstrak_ulang, "ekstrak_satu", _kerja_palsu)
+    monkeypatch.setattr(ekstrak_ulang, "versi_extractor", lambda: "uji")
+    files = []
+    for isi in ("gagal", "lambat"):
+        p = tmp_path / f"{isi}.docx"
+        p.write_text(isi, encoding="utf-8")
+        files.append(str(p))
+    out = tmp_path / "hasil"
+    log = open(os.devnull, "w")
+    ringkasan = ekstrak_ulang.jalankan(files, str(out), proses=2, coba=3, backoff=0.1, log=log)
+    assert (ringkasan["ok"], ringkasan["gagal"], ringkasan["dicoba_ulang"]) == (2, 0, 1)
+
+    # resume: semua sudah ok untuk versi yang sama
+    ringkasan = ekstrak_ulang.jalankan(files, str(out), proses=2, coba=3, backoff=0.1, log=log)
+    assert (ringkasan["ok"], ringkasan["dilewati"]) == (0, 2)
@@ -0,0 +1,64 @@
+"""Cache IR (ir_dokumen.py): output extract_info saat hit sama persis dengan miss dan tanpa cache."""
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import FIXTURES
+
+pytest.importorskip("docx")
+import ekstrakanjab  # noqa: E402
+import ir_dokumen  # noqa: E402
+
+
+def _ekstrak(path):
+    return json.dumps(ekstrakanjab.extract_info(path), ensure_ascii=False, sort_keys=True)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANJAB_DOC_READER", "native")
+    monkeypatch.delenv("ANJAB_IR_CACHE", raising=False)
+    return str(tmp_path / "ir")
+
+
+@pytest.mark.parametrize("nama", ["tugas_langsung.docx", "tugas_gaya.docx", "daftar.doc"])
+def test_hit_sama_dengan_miss(tmp_path, monkeypatch, cache, nama):
+    f = str(tmp_path / nama)
+    shutil.copy(os.path.join(FIXTURES, nama), f)
+    tanpa_cache = _ekstrak(f)
+
+    monkeypatch.setenv("ANJAB_IR_CACHE", cache)
+    miss = _ekstrak(f)
+    path = ir_dokumen.path_ir(ir_dokumen.sha256_file(f), cache)
+    assert os.path.exists(path)
+
+    def jangan_baca(*a, **k):
+        raise AssertionError("cache hit tidak boleh membaca dokumen asal")
+    monkeypatch.setattr(ekstrakanjab, "read_document", jangan_baca)
+    hit = _ekstrak(f)
+    assert hit == miss == tanpa_cache
+
+
+def test_versi_berbeda_miss(tmp_path, monkeypatch, cache):
+    f = str(tmp_path / "tugas_langsung.docx")
+    shutil.copy(os.path.join(FIXTURES, "tugas_langsung.docx"), f)
+    monkeypatch.setenv("ANJAB_IR_CACHE", cache)
+    _ekstrak(f)
+    assert ir_dokumen.muat(f) is not None
+    monkeypatch.setattr(ir_dokumen, "versi_ir", lambda: "lain")
+    assert ir_dokumen.muat(f) is None
+
+
+def test_cache_rusak_dibaca_penuh(tmp_path, monkeypatch, cache):
+    f = str(tmp_path / "tugas_gaya.docx")
+    shutil.copy(os.path.join(FIXTURES, "tugas_gaya.docx"), f)
+    tanpa_cache = _ekstrak(f)
+    monkeypatch.setenv("ANJAB_IR_CACHE", cache)
+    path = ir_dokumen.path_ir(ir_dokumen.sha256_file(f), cache)
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as fh:
+        fh.write(b"rusak")
+    assert _ekstrak(f) == tanpa_cache
+    assert ir_dokumen.muat(f) is not None  # ditimpa IR valid
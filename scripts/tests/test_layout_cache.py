@@ -0,0 +1,69 @@
+"""Cache layout template (ekstrakanjab.py): output sama dengan/tanpa cache hangat."""
+import json
+
+import pytest
+
+pytest.importorskip("docx")
+
+import ekstrakanjab  # noqa: E402
+import versi_sumber  # noqa: E402
+
+KUAT = ["Diklat Penjenjangan", "Diklat Teknis", "Diklat Fungsional", "Pengalaman Kerja", "Lain-lain"]
+LEMAH = ["Diklat Teknis", "Catatan", "Keterangan", "Lain-lain", "Penutup"]
+
+
+def _tulis(path, urutan):
+    """Dua tabel kualifikasi dengan header identik (sidik template sama), isi beda."""
+    from docx import Document
+    doc = Document()
+    doc.add_paragraph("INFORMASI JABATAN")
+    doc.add_paragraph("1. NAMA JABATAN : Analis Data Kepegawaian")
+    for label_isi in urutan:
+        t = doc.add_table(rows=6, cols=3)
+        for r, label in zip(t.rows, ["Pendidikan Formal"] + label_isi):
+            r.cells[0].text, r.cells[1].text, r.cells[2].text = label, ":", label + " isi"
+    doc.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    path = tmp_path / "layout.json"
+    monkeypatch.setattr(ekstrakanjab, "_cache_layout", None)
+    return path
+
+
+def _ekstrak(path, monkeypatch, cache_path):
+    monkeypatch.setenv("ANJAB_LAYOUT_CACHE", str(cache_path) if cache_path else "off")
+    return json.dumps(ekstrakanjab.extract_info(path), ensure_ascii=False, sort_keys=True)
+
+
+def test_cache_nonaktif_default(monkeypatch):
+    monkeypatch.delenv("ANJAB_LAYOUT_CACHE", raising=False)
+    assert ekstrakanjab.path_cache_layout() is None
+    monkeypatch.setenv("ANJAB_LAYOUT_CACHE", "on")
+    assert ekstrakanjab.path_cache_layout().endswith("layout.json")
+
+
+def test_output_sama_dengan_cache_hangat(tmp_path, cache, monkeypatch):
+    a = _tulis(tmp_path / "a.docx", [KUAT, LEMAH])
+    b = _tulis(tmp_path / "b.docx", [LEMAH, KUAT])  # template sama, tabel terbaik pindah
+    tanpa = {p: _ekstrak(p, monkeypatch, None) for p in (a, b)}
+
+    assert _ekstrak(a, monkeypatch, cache) == tanpa[a]  # cache dingin -> belajar index 0
+    (peran,) = json.loads(cache.read_text(encoding="utf-8")).values()
+    assert peran["kualifikasi"] == 0
+    # index 0 di b masih lolos skor minimal tetapi bukan yang tertinggi: tidak boleh dipakai
+    assert _ekstrak(b, monkeypatch, cache) == tanpa[b]
+    assert _ekstrak(a, monkeypatch, cache) == tanpa[a]
+    assert json.loads(tanpa[b])["kualifikasi_jabatan"]["pendidikan_dan_pelatihan"]["diklat_fungsional"]
+
+
+def test_kunci_cache_ikut_versi_source(tmp_path, cache, monkeypatch):
+    a = _tulis(tmp_path / "a.docx", [KUAT, LEMAH])
+    monkeypatch.setattr(versi_sumber, "versi", lambda akar: "lama")
+    _ekstrak(a, monkeypatch, cache)
+    doc = ekstrakanjab.read_document(a)[0]
+    assert ekstrakanjab.siapkan_layout(doc)["peran"] == {"kualifikasi": 0}
+    monkeypatch.setattr(versi_sumber, "versi", lambda akar: "baru")
+    assert ekstrakanjab.siapkan_layout(doc)["peran"] == {}
@@ -0,0 +1,23 @@
+"""Daemon watch-folder (pantau_folder.py): karantina file kosong dengan nama error unik."""
+import json
+import os
+
+import pantau_folder
+
+
+def test_karantina_a_doc_dan_a_docx(tmp_path):
+    drop, out, karantina = tmp_path / "drop", tmp_path / "hasil", tmp_path / "karantina"
+    drop.mkdir()
+    for nama in ("a.doc", "a.docx"):
+        (drop / nama).write_bytes(b"")  # 0 byte: dikarantina tanpa ekstraksi
+    daemon = pantau_folder.PantauFolder(str(drop), str(out), str(karantina), proses=1, jeda=0,
+                                        stabil=0.05, interval_poll=0.05, paksa_poll=True,
+                                        log=open(os.devnull, "w"))
+    statistik = daemon.jalankan(sekali=True)
+
+    assert statistik["gagal"] == 2
+    assert sorted(os.listdir(karantina)) == ["a.doc", "a.doc.error.json", "a.docx", "a.docx.error.json"]
+    for nama in ("a.doc", "a.docx"):
+        with open(karantina / (nama + ".error.json"), encoding="utf-8") as fh:
+            assert json.load(fh)["file"] == nama
+    assert os.listdir(drop) == []
@@ -0,0 +1,32 @@
+"""Probe identitas (probe_identitas.py): jenis anjab/abk dari tabel."""
+import pytest
+
+pytest.importorskip("docx")
+
+import probe_identitas  # noqa: E402
+
+
+def _docx(path, header):
+    """Identitas di tabel (bukan paragraf body) + tabel uraian tugas dengan header tertentu."""
+    from docx import Document
+    doc = Document()
+    t = doc.add_table(rows=2, cols=3)
+    for r, (k, v) in zip(t.rows, (("Nama Jabatan", "Analis Data"), ("Unit Kerja", "Biro Umum"))):
+        r.cells[0].text, r.cells[1].text, r.cells[2].text = k, ":", v
+    t = doc.add_table(rows=2, cols=len(header))
+    for c, h in zip(t.rows[0].cells, header):
+        c.text = h
+    doc.save(str(path))
+    return str(path)
+
+
+def test_anjab_dengan_kolom_kebutuhan_pegawai_bukan_abk(tmp_path):
+    path = _docx(tmp_path / "anjab.docx", ["No", "Uraian Tugas", "Hasil Kerja", "Kebutuhan Pegawai"])
+    assert probe_identitas.probe(path)["jenis"] == "unknown"  # route anjab lanjut ekstraksi penuh
+
+
+def test_tabel_beban_kerja_abk(tmp_path):
+    path = _docx(tmp_path / "abk.docx",
+                 ["No", "Uraian Tugas", "Beban Kerja", "Pegawai yang Dibutuhkan"])
+    hasil = probe_identitas.probe(path)
+    assert (hasil["jenis"], hasil["nama_jabatan"]) == ("abk", "Analis Data")
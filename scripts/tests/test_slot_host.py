@@ -0,0 +1,90 @@
+"""Kontrol admisi lintas proses (slot_host.py): batas slot berlaku antarproses."""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import SCRIPTS_DIR
+
+pytest.importorskip("fcntl")
+import slot_host  # noqa: E402
+
+# pegang slot parse, tulis penanda, tunggu file "lepas" lalu keluar
+PEMEGANG = """
+import os, sys, time
+import slot_host
+d = sys.argv[1]
+with slot_host.slot("parse", timeout=10) as i:
+    open(os.path.join(d, "pegang-%d" % os.getpid()), "w").write(str(time.time()))
+    while not os.path.exists(os.path.join(d, "lepas")):
+        time.sleep(0.02)
+"""
+
+
+@pytest.fixture
+def env_slot(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANJAB_SLOT_DIR", str(tmp_path / "slot"))
+    monkeypatch.setenv("ANJAB_SLOT_PARSE", "1")
+    return dict(os.environ, PYTHONPATH=SCRIPTS_DIR)
+
+
+def _pemegang(tmp_path, env):
+    return subprocess.Popen([sys.executable, "-c", PEMEGANG, str(tmp_path)], env=env)
+
+
+def _tunggu(kondisi, batas=10.0):
+    akhir = time.monotonic() + batas
+    while not kondisi():
+        assert time.monotonic() < akhir, "timeout"
+        time.sleep(0.02)
+
+
+def _dipegang(tmp_path):
+    return [n for n in os.listdir(tmp_path) if n.startswith("pegang-")]
+
+
+def test_batas_berlaku_lintas_proses(tmp_path, env_slot):
+    p = _pemegang(tmp_path, env_slot)
+    try:
+        _tunggu(lambda: _dipegang(tmp_path))
+        assert slot_host.status()["parse"] == {"batas": 1, "terpakai": 1}
+        waktu = {"fase": "parse"}
+        with pytest.raises(slot_host.SlotPenuh):
+            with slot_host.slot("parse", timeout=0.3, waktu=waktu):
+                pass
+        assert waktu["fase"] == "antre"  # fase saat gagal, untuk catatan biaya
+        # proses kedua ikut antre: belum memegang slot selama pemegang pertama hidup
+        q = _pemegang(tmp_path, env_slot)
+        time.sleep(0.5)
+        assert len(_dipegang(tmp_path)) == 1
+        (tmp_path / "lepas").touch()
+        assert p.wait(10) == 0 and q.wait(10) == 0
+        assert len(_dipegang(tmp_path)) == 2
+    finally:
+        (tmp_path / "lepas").touch()
+        p.kill()
+    # lock dilepas saat proses selesai
+    waktu = {"fase": "parse"}
+    with slot_host.slot("parse", timeout=1, waktu=waktu) as i:
+        assert i == 0
+    assert waktu["fase"] == "parse" and waktu["antre"]["parse"] < 1
+
+
+def test_lock_dilepas_saat_proses_mati(tmp_path, env_slot):
+    p = _pemegang(tmp_path, env_slot)
+    _tunggu(lambda: _dipegang(tmp_path))
+    p.kill()
+    p.wait(10)
+    with slot_host.slot("parse", timeout=2):
+        assert slot_host.status()["parse"]["terpakai"] == 1
+    assert slot_host.status()["parse"]["terpakai"] == 0
+
+
+def test_batas_nol_tanpa_admisi(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANJAB_SLOT_DIR", str(tmp_path / "slot"))
+    monkeypatch.setenv("ANJAB_SLOT_PARSE", "0")
+    with slot_host.slot("parse") as i:
+        assert i is None
+    assert not os.path.exists(tmp_path / "slot")
@@ -0,0 +1,60 @@
+"""Indent/numPr teresolusi (properti_paragraf, format_nomor) dan klasifikasi tugas pokok."""
+import json
+import os
+
+import pytest
+
+from conftest import FIXTURES
+
+pytest.importorskip("docx")
+
+import ekstrakanjab  # noqa: E402
+from ekstrakanjab import format_nomor, properti_paragraf  # noqa: E402
+
+
+def _baca(nama):
+    return ekstrakanjab.read_docx(os.path.join(FIXTURES, nama))[0]
+
+
+def _paragraf(doc, teks):
+    return next(p for t in doc.tables for c in t.columns[1].cells for p in c.paragraphs if p.text == teks)
+
+
+def _tahapan(doc):
+    return [[(d["tahapan"], d["detail_tahapan"]) for d in t["uraian_tugas"]["detail_uraian_tugas"]]
+            for t in ekstrakanjab.extract_tugas_pokok(doc)]
+
+
+def test_langsung_properti():
+    doc = _baca("tugas_langsung.docx")
+    assert properti_paragraf(_paragraf(doc, "Mengumpulkan data")) == (360 + 360, 90, 0)
+    assert properti_paragraf(_paragraf(doc, "Data kepegawaian")) == (720 + 360, 90, 1)
+    assert properti_paragraf(_paragraf(doc, "Kelengkapan isian")) == (720 + 360, None, None)
+    assert format_nomor(doc.part, 90, 1) == ("90", "lowerLetter")
+    assert format_nomor(doc.part, 90, 5) == ("90", "decimal")  # level tak ada -> level 0
+
+
+def test_langsung_sama_dengan_baseline():
+    # dokumen dengan format langsung: output harus identik byte dengan sebelum resolusi style
+    with open(os.path.join(FIXTURES, "tugas_langsung.json"), encoding="utf-8") as fh:
+        baseline = fh.read().rstrip("\n")
+    hasil = ekstrakanjab.extract_tugas_pokok(_baca("tugas_langsung.docx"))
+    assert json.dumps(hasil, ensure_ascii=False, indent=2) == baseline
+
+
+def test_gaya_properti():
+    doc = _baca("tugas_gaya.docx")
+    # numPr dari style; TahapBawah hanya menimpa ilvl, numId diwarisi lewat basedOn
+    assert properti_paragraf(_paragraf(doc, "Mengumpulkan data")) == (720, 91, 0)
+    assert properti_paragraf(_paragraf(doc, "Data kepegawaian")) == (1080, 91, 1)
+    # indent dari rantai basedOn; indent langsung menimpa style
+    assert properti_paragraf(_paragraf(doc, "Memeriksa formulir")) == (360, None, None)
+    assert properti_paragraf(_paragraf(doc, "Kelengkapan isian")) == (1080, None, None)
+    assert properti_paragraf(_paragraf(doc, "Merekap hasil")) == (360, None, None)
+
+
+def test_gaya_klasifikasi():
+    assert _tahapan(_baca("tugas_gaya.docx")) == [
+        [("Mengumpulkan data", ["Data kepegawaian"]), ("Menganalisis kebutuhan", [])],
+        [("Memeriksa formulir", ["Kelengkapan isian"]), ("Merekap hasil", [])],
+    ]
@@ -0,0 +1,7 @@
+"""Anggaran waktu import extractor (cek_waktu_impor.py) ikut dijalankan pytest."""
+import cek_waktu_impor
+
+
+def test_anggaran_import(capsys):
+    rc = cek_waktu_impor.main(["--ulang", "3"])
+    assert rc == 0, capsys.readouterr().out
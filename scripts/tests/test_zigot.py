@@ -0,0 +1,89 @@
+"""Server zigot (zigot.py): satu permintaan bolak-balik dan anak yang lewat tenggat dibunuh."""
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import FIXTURES, SCRIPTS_DIR
+
+pytest.importorskip("docx")
+if not hasattr(os, "fork"):
+    pytest.skip("zigot butuh os.fork", allow_module_level=True)
+import biaya_dokumen  # noqa: E402
+import ekstrakanjab  # noqa: E402
+import zigot  # noqa: E402
+
+# server dengan ekstrak yang menggantung untuk file "lambat*" (dipakai anak hasil fork)
+SERVER = """
+import sys, time
+import zigot
+asli = zigot.ekstrak
+def ekstrak(req, waktu=None):
+    if "lambat" in req["file"]:
+        time.sleep(60)
+    return asli(req, waktu)
+zigot.ekstrak = ekstrak
+sys.exit(zigot.main(sys.argv[1:]))
+"""
+
+
+@pytest.fixture
+def server(tmp_path):
+    sock = str(tmp_path / "zigot.sock")
+    env = dict(os.environ, PYTHONPATH=SCRIPTS_DIR, ANJAB_BIAYA_DB=str(tmp_path / "biaya.db"),
+               ANJAB_LAMBAT_MS="500")
+    p = subprocess.Popen([sys.executable, "-c", SERVER, "layani", "--socket", sock, "--maks", "2", "--batas", "1"],
+                         env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    akhir = time.monotonic() + 20
+    while not os.path.exists(sock):
+        assert p.poll() is None, p.stderr.read()
+        assert time.monotonic() < akhir, "server tidak siap"
+        time.sleep(0.05)
+    yield p, sock
+    if p.poll() is None:
+        p.kill()
+        p.wait()
+
+
+def _berhenti(p):
+    p.send_signal(signal.SIGTERM)
+    out, _err = p.communicate(timeout=20)
+    assert p.returncode == 0
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_permintaan_dan_tenggat(server, tmp_path, monkeypatch):
+    p, sock = server
+    f = str(tmp_path / "tugas_langsung.docx")
+    shutil.copy(os.path.join(FIXTURES, "tugas_langsung.docx"), f)
+    balasan = zigot.kirim(f, sock, jenis="anjab", batas=30)
+    assert balasan["ok"] and balasan["jenis"] == "anjab"
+    assert balasan["data"] == json.loads(json.dumps(ekstrakanjab.extract_info(f), ensure_ascii=False))
+
+    lambat = str(tmp_path / "lambat.docx")
+    shutil.copy(os.path.join(FIXTURES, "tugas_gaya.docx"), lambat)
+    t0 = time.monotonic()
+    balasan = zigot.kirim(lambat, sock, jenis="anjab", batas=30)
+    assert time.monotonic() - t0 < 10
+    assert balasan == {"ok": False, "error": "Ekstraksi melebihi batas waktu 1 detik"}
+
+    # server tetap melayani setelah anak dibunuh
+    assert zigot.kirim(f, sock, jenis="anjab", batas=30)["ok"]
+    assert _berhenti(p) == {"dilayani": 2, "gagal": 0, "dibunuh": 1, "lambat": 0}
+
+    # induk mencatat anak yang dibunuh: dokumen itu berikutnya masuk jalur lambat
+    monkeypatch.setenv("ANJAB_LAMBAT_MS", "500")
+    info = biaya_dokumen.nilai_jalur(str(tmp_path / "biaya.db"), lambat)
+    assert (info["dasar"], info["jalur"]) == ("riwayat", "lambat")
+
+
+def test_file_tidak_ada(server, tmp_path):
+    p, sock = server
+    balasan = zigot.kirim(str(tmp_path / "tidak_ada.docx"), sock, batas=30)
+    assert not balasan["ok"] and "tidak ditemukan" in balasan["error"]
+    assert _berhenti(p)["dilayani"] == 1
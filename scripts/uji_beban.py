@@ -0,0 +1,278 @@
+"""
+Uji beban jalur ekstraksi: memutar ulang korpus dokumen dengan kontrak pemanggilan yang
+sama dengan route (`python scripts/ekstrakanjab.py <file>` / `ekstrakabk.py <file>`,
+stdout di-pipe) pada beberapa level konkurensi, lalu mencatat per level:
+latensi p50/p95/p99, throughput, CPU (detik CPU per dokumen & core terpakai) dan RSS puncak.
+
+- Closed loop (default): N pekerja, masing-masing langsung mengambil dokumen berikutnya.
+- Open loop (--laju R): kedatangan Poisson R dokumen/detik; latensi dihitung sejak jadwal
+  kedatangan (termasuk antre), jadi saturasi terlihat sebagai p99 yang meledak.
+- CPU & RSS per proses anak diambil dari os.wait4 (POSIX); di Windows kolom ini kosong.
+- --banding hasil_lama.json: bandingkan kurva saturasi antar rilis.
+
+Contoh:
+    python scripts/uji_beban.py korpus/ --konkurensi 1,2,4,8 --jumlah 40 --out beban.json
+    python scripts/uji_beban.py korpus/ --konkurensi 4 --laju 3 --durasi 60
+    python scripts/uji_beban.py korpus/ --perintah "{python} scripts/ekstrakanjab.py --probe {file}"
+"""
+import os
+import sys
+import json
+import time
+import random
+import shlex
+import socket
+import argparse
+import platform
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+EKSTENSI_DOKUMEN = (".doc", ".docx")
+
+# -------------------- KORPUS --------------------
+
+def kumpulkan_input(paths):
+    hasil = []
+    for p in paths:
+        if os.path.isdir(p):
+            for root, _dirs, files in os.walk(p):
+                hasil.extend(os.path.join(root, f) for f in sorted(files)
+                             if f.lower().endswith(EKSTENSI_DOKUMEN) and not f.startswith("~$"))
+        else:
+            hasil.append(p)
+    return hasil
+
+def perintah_untuk(files, template=None):
+    """list (file, argv). Tanpa template: skrip dipilih per dokumen seperti route (anjab / ABK)."""
+    from probe_identitas import probe
+    hasil = []
+    for f in files:
+        if template:
+            argv = [a.replace("{python}", sys.executable).replace("{file}", f) for a in shlex.split(template)]
+        else:
+            try:
+                jenis = probe(f)["jenis"]
+            except Exception:
+                jenis = "anjab"
+            skrip = "ekstrakabk.py" if jenis == "abk" else "ekstrakanjab.py"
+            argv = [sys.executable, os.path.join(SCRIPTS_DIR, skrip), f]
+        hasil.append((f, argv))
+    return hasil
+
+# -------------------- SATU PEMANGGILAN --------------------
+
+def jalankan_satu(argv, env):
+    """Spawn seperti route: stdout/stderr di-pipe. return dict latensi, exit, cpu, rss."""
+    t0 = time.perf_counter()
+    p = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    err = []
+    t_err = threading.Thread(target=lambda: err.append(p.stderr.read()), daemon=True)
+    t_err.start()
+    out = p.stdout.read()
+    t_err.join()
+    cpu = rss = None
+    if hasattr(os, "wait4"):
+        _pid, status, ru = os.wait4(p.pid, 0)
+        p.returncode = os.waitstatus_to_exitcode(status)
+        cpu = ru.ru_utime + ru.ru_stime
+        # ru_maxrss: KiB di Linux, byte di macOS
+        rss = ru.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    else:
+        p.wait()
+    p.stdout.close()
+    p.stderr.close()
+    return {"detik": time.perf_counter() - t0, "exit": p.returncode, "cpu": cpu, "rss": rss,
+            "output_bytes": len(out), "stderr": (err[0] if err else b"")[-300:].decode("utf-8", "replace")}
+
+# -------------------- LEVEL --------------------
+
+def persentil(nilai, q):
+    if not nilai:
+        return None
+    s = sorted(nilai)
+    k = (len(s) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+def jalankan_level(daftar, konkurensi, env, jumlah=None, durasi=None, laju=None, pemanasan=0, seed=1):
+    """
+    Satu level beban. Berhenti setelah `jumlah` dokumen (atau `durasi` detik kedatangan).
+    return dict statistik level.
+    """
+    rnd = random.Random(seed)
+    hasil, kunci = [], threading.Lock()
+    jumlah = jumlah or (None if durasi else len(daftar))
+
+    slot = threading.BoundedSemaphore(konkurensi)
+
+    def tugas(idx, jadwal, lepas=False):
+        f, argv = daftar[idx % len(daftar)]
+        mulai = time.perf_counter()
+        try:
+            r = jalankan_satu(argv, env)
+        finally:
+            if lepas:
+                slot.release()
+        r["antre"] = max(0.0, mulai - jadwal)
+        r["latensi"] = time.perf_counter() - jadwal  # open loop: termasuk waktu antre
+        r["file"] = os.path.basename(f)
+        r["indeks"] = idx
+        with kunci:
+            hasil.append(r)
+
+    # pemanasan: cache OS, bytecode, cache layout — tidak dihitung
+    for i in range(pemanasan):
+        jalankan_satu(daftar[i % len(daftar)][1], env)
+
+    t_mulai = time.perf_counter()
+    cpu_awal = os.times()
+    with ThreadPoolExecutor(max_workers=konkurensi) as pool:
+        i = 0
+        jadwal = t_mulai
+        while True:
+            if jumlah is not None and i >= jumlah:
+                break
+            if durasi is not None and jadwal - t_mulai >= durasi:
+                break
+            if laju:
+                jeda = jadwal - time.perf_counter()
+                if jeda > 0:
+                    time.sleep(jeda)
+                pool.submit(tugas, i, jadwal)
+                jadwal += rnd.expovariate(laju)
+            else:
+                # closed loop: kirim hanya saat ada pekerja bebas supaya durasi bisa dihormati
+                slot.acquire()
+                jadwal = time.perf_counter()
+                if durasi is not None and jadwal - t_mulai >= durasi:
+                    slot.release()
+                    break
+                pool.submit(tugas, i, jadwal, True)
+            i += 1
+    dinding = time.perf_counter() - t_mulai
+    cpu_akhir = os.times()
+
+    ok = [r for r in hasil if r["exit"] == 0]
+    lat = [r["latensi"] for r in ok]
+    cpu = [r["cpu"] for r in hasil if r["cpu"] is not None]
+    rss = [r["rss"] for r in hasil if r["rss"] is not None]
+    cpu_anak = (cpu_akhir.children_user + cpu_akhir.children_system) - \
+               (cpu_awal.children_user + cpu_awal.children_system)
+    return {
+        "konkurensi": konkurensi,
+        "laju_target": laju,
+        "dokumen": len(hasil),
+        "ok": len(ok),
+        "gagal": len(hasil) - len(ok),
+        "detik": round(dinding, 3),
+        "throughput": round(len(ok) / dinding, 3) if dinding else None,
+        "p50": _bulat(persentil(lat, 0.50)),
+        "p95": _bulat(persentil(lat, 0.95)),
+        "p99": _bulat(persentil(lat, 0.99)),
+        "maks": _bulat(max(lat) if lat else None),
+        "antre_p95": _bulat(persentil([r["antre"] for r in ok], 0.95)),
+        "cpu_per_dokumen": _bulat(sum(cpu) / len(cpu) if cpu else None),
+        "core_terpakai": round(cpu_anak / dinding, 2) if dinding else None,
+        "rss_puncak_mb": round(max(rss) / 1048576, 1) if rss else None,
+        "contoh_error": next((r["stderr"] for r in hasil if r["exit"] != 0), None),
+    }
+
+def _bulat(x):
+    return round(x, 4) if x is not None else None
+
+# -------------------- META + BANDING --------------------
+
+def meta_run(template):
+    m = {"host": socket.gethostname(), "cpu": os.cpu_count(), "python": platform.python_version(),
+         "platform": platform.platform(), "waktu": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+         "perintah": template or "route (ekstrakanjab.py / ekstrakabk.py)"}
+    try:
+        from ekstrak_ulang import versi_extractor
+        m["versi_extractor"] = versi_extractor()
+    except Exception:
+        pass
+    try:
+        m["commit"] = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPTS_DIR,
+                                     capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return m
+
+def cetak_tabel(levels, lama=None, fh=sys.stderr):
+    kol = ("konkurensi", "laju_target", "throughput", "p50", "p95", "p99", "core_terpakai", "rss_puncak_mb", "gagal")
+    print("  ".join(f"{k:>13}" for k in kol), file=fh)
+    acuan = {}
+    if lama:
+        acuan = {(l["konkurensi"], l.get("laju_target")): l for l in lama.get("level", [])}
+    for l in levels:
+        print("  ".join(f"{'-' if l[k] is None else l[k]!s:>13}" for k in kol), file=fh)
+        a = acuan.get((l["konkurensi"], l.get("laju_target")))
+        if a:
+            sel = []
+            for k in kol[2:]:
+                if l.get(k) is not None and a.get(k):
+                    sel.append(f"{(l[k] - a[k]) / a[k] * 100:+.0f}%")
+                else:
+                    sel.append("-")
+            print("  ".join(f"{'':>13}" for _ in kol[:2]) + "  " + "  ".join(f"{s:>13}" for s in sel), file=fh)
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Uji beban jalur ekstraksi (kurva saturasi).")
+    ap.add_argument("input", nargs="+", help="file .doc/.docx atau direktori korpus")
+    ap.add_argument("--konkurensi", default="1,2,4,8", help="level konkurensi, pisah koma")
+    ap.add_argument("--jumlah", type=int, help="dokumen per level (default: ukuran korpus)")
+    ap.add_argument("--durasi", type=float, help="detik per level (alternatif --jumlah)")
+    ap.add_argument("--laju", type=float, help="open loop: kedatangan Poisson, dokumen/detik")
+    ap.add_argument("--pemanasan", type=int, default=1, help="pemanggilan pemanasan per level (tidak dihitung)")
+    ap.add_argument("--perintah", help="template perintah, mis. \"{python} scripts/ekstrakanjab.py --probe {file}\"")
+    ap.add_argument("--acak", action="store_true", help="acak urutan korpus")
+    ap.add_argument("--out", help="simpan hasil JSON (untuk --banding di rilis berikutnya)")
+    ap.add_argument("--banding", help="hasil JSON rilis sebelumnya")
+    args = ap.parse_args(argv)
+
+    files = kumpulkan_input(args.input)
+    if not files:
+        print("❌ Tidak ada file .doc/.docx", file=sys.stderr)
+        return 1
+    try:
+        levels_k = [int(x) for x in args.konkurensi.split(",") if x.strip()]
+    except ValueError:
+        print("❌ --konkurensi harus daftar angka, mis. 1,2,4", file=sys.stderr)
+        return 1
+    if args.acak:
+        random.Random(7).shuffle(files)
+
+    daftar = perintah_untuk(files, args.perintah)
+    env = dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONUTF8="1")
+    lama = None
+    if args.banding:
+        with open(args.banding, encoding="utf-8") as fh:
+            lama = json.load(fh)
+
+    levels = []
+    for k in levels_k:
+        l = jalankan_level(daftar, k, env, args.jumlah, args.durasi, args.laju, args.pemanasan)
+        levels.append(l)
+        print(f"⏱️ konkurensi {k}: {l['throughput']} dok/detik, p99 {l['p99']} detik", file=sys.stderr)
+
+    hasil = {"meta": meta_run(args.perintah), "korpus": len(files), "level": levels}
+    cetak_tabel(levels, lama)
+    if args.out:
+        tmp = args.out + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(hasil, fh, ensure_ascii=False, indent=2)
+        os.replace(tmp, args.out)
+    print(json.dumps(hasil, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
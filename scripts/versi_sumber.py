@@ -0,0 +1,55 @@
+"""
+Versi source: hash isi modul lokal (scripts/) yang menentukan suatu hasil, diturunkan
+dari import modul akarnya secara transitif, bukan dari daftar yang dirawat tangan.
+
+Import dibaca dengan regex per baris (termasuk import lazy di dalam fungsi); blok
+`if __name__ == "__main__":` diabaikan karena hanya wiring CLI. Modul operasional
+(admisi slot, scratch dir) dikecualikan: tidak memengaruhi isi hasil.
+
+Dipakai ekstrak_ulang.py (versi extractor di manifest) dan ir_dokumen.py (versi cache IR).
+Hanya stdlib; hasil di-cache per proses.
+"""
+import os
+import re
+import hashlib
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BUKAN_SUMBER = ("slot_host.py", "ruang_kerja.py")
+
+_IMPORT_RE = re.compile(r"^\s*(?:from|import)\s+([A-Za-z_]\w*)", re.M)
+_MAIN = '\nif __name__ == "__main__":'
+_cache = {}
+
+
+def sumber(akar):
+    """list (nama_file, isi_bytes) modul lokal yang dicapai dari akar, urut nama."""
+    hasil, antre = {}, list(akar)
+    while antre:
+        nama = antre.pop()
+        p = os.path.join(SCRIPTS_DIR, nama)
+        if nama in hasil or nama in BUKAN_SUMBER or not os.path.isfile(p):
+            continue
+        with open(p, "rb") as fh:
+            hasil[nama] = fh.read()
+        teks = hasil[nama].decode("utf-8", "replace").split(_MAIN, 1)[0]
+        antre.extend(m + ".py" for m in _IMPORT_RE.findall(teks))
+    return sorted(hasil.items())
+
+
+def versi(akar) -> str:
+    """12 hex pertama sha256 atas (nama, isi) semua source yang dicapai dari akar."""
+    akar = tuple(akar)
+    if akar not in _cache:
+        h = hashlib.sha256()
+        for nama, isi in sumber(akar):
+            h.update(nama.encode() + b"\0" + isi)
+        _cache[akar] = h.hexdigest()[:12]
+    return _cache[akar]
+
+
+if __name__ == "__main__":
+    import sys
+    akar = sys.argv[1:] or ["ekstrakanjab.py"]
+    print(versi(akar))
+    for nama, _isi in sumber(akar):
+        print(" ", nama)
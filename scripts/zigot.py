@@ -0,0 +1,426 @@
+"""
+Server zigot pre-fork: import docx/lxml/extractor sekali, panaskan cache, gc.freeze(),
+lalu fork() satu proses anak per permintaan. Tiap dokumen tetap terisolasi (crash /
+leak / memori besar hilang bersama anaknya) tanpa membayar biaya import tiap upload;
+heap yang sudah hangat dibagi copy-on-write.
+
+Protokol (unix socket, satu permintaan per koneksi, satu baris JSON tiap arah):
+  -> {"file": "/abs/dok.docx", "jenis": "auto"|"anjab"|"abk", "sebelumnya": "/abs/lama.json"?}
+  <- {"ok": true, "jenis": "anjab", "data": {...}}  |  {"ok": false, "error": "..."}
+
+- Anak maksimal --maks bersamaan; koneksi berikutnya menunggu di backlog socket.
+- Anak yang melewati --batas detik di-SIGKILL; klien menerima error dari induk.
+- Dengan ANJAB_BIAYA_DB (biaya_dokumen.py) induk membaca permintaan sebelum fork dan
+  memisahkan dokumen mahal ke jalur lambat: --maks-lambat anak sendiri (tidak memakai
+  jatah --maks), tenggat --batas-lambat, nice lebih tinggi; sisanya antre di induk.
+  Anak yang dibunuh / mati dicatat induk ke catatan biaya.
+- --batas-mem MB: RLIMIT_AS per anak (dokumen rusak yang meledakkan memori).
+- jenis "auto" ditentukan probe_identitas.py (sama dengan pantau_folder.py).
+- Hanya POSIX (butuh os.fork + AF_UNIX).
+
+Contoh:
+    python scripts/zigot.py layani --socket /run/anjab/zigot.sock --maks 4 --batas 60
+    python scripts/zigot.py kirim dokumen.docx --socket /run/anjab/zigot.sock   # stdout = JSON extractor
+"""
+import os
+import sys
+import gc
+import json
+import time
+import errno
+import random
+import signal
+import socket
+import argparse
+import selectors
+import collections
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+SOCKET_DEFAULT = os.environ.get("ANJAB_ZIGOT_SOCKET", "/tmp/anjab-zigot.sock")
+MAKS_PERMINTAAN = 64 * 1024
+MAKS_ANTRE_LAMBAT = 64
+
+# -------------------- PEMANASAN --------------------
+
+def panaskan(dokumen_contoh=None):
+    """Import semua modul berat + parse template default; opsional ekstraksi penuh satu dokumen."""
+    import docx
+    import lxml.etree  # noqa: F401
+    import ekstrakanjab
+    import ekstrakabk
+    import probe_identitas  # noqa: F401
+    import delta_anjab  # noqa: F401
+    docx.Document()  # registrasi kelas oxml + parse template bawaan
+    if dokumen_contoh:
+        try:
+            if probe_identitas.probe(dokumen_contoh)["jenis"] == "abk":
+                ekstrakabk.extract_docx(dokumen_contoh)
+            else:
+                ekstrakanjab.extract_info(dokumen_contoh)
+        except Exception as e:
+            print(f"⚠️ Pemanasan gagal ({dokumen_contoh}): {e}", file=sys.stderr)
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        # objek hasil pemanasan tidak lagi disentuh GC -> halaman heap tetap dibagi setelah fork
+        gc.freeze()
+
+# -------------------- ANAK --------------------
+
+def _baca_baris(conn, batas=MAKS_PERMINTAAN):
+    buf = b""
+    while b"\n" not in buf:
+        potong = conn.recv(4096)
+        if not potong:
+            break
+        buf += potong
+        if len(buf) > batas:
+            raise ValueError("permintaan terlalu besar")
+    return buf.split(b"\n", 1)[0]
+
+def _kirim(conn, obj):
+    conn.sendall((json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8"))
+
+def ekstrak(req, waktu=None):
+    path = req.get("file")
+    if not path or not os.path.isfile(path):
+        raise FileNotFoundError(f"File tidak ditemukan: {path}")
+    jenis = req.get("jenis") or "auto"
+    if jenis == "auto":
+        from probe_identitas import probe
+        try:
+            jenis = "abk" if probe(path)["jenis"] == "abk" else "anjab"
+        except Exception:
+            jenis = "anjab"  # biar extractor penuh yang menentukan
+    if jenis == "abk":
+        from ekstrakabk import extract_docx
+        return jenis, extract_docx(path, waktu)
+    from ekstrakanjab import extract_info
+    return jenis, extract_info(path, waktu, req.get("sebelumnya"))
+
+def layani_anak(conn, batas_mem_mb=None, req=None, biaya=None):
+    """
+    Dijalankan di proses anak; tidak pernah return (os._exit). exit 0 = balasan terkirim.
+    req: permintaan yang sudah dibaca induk (mode catatan biaya); biaya: info nilai_jalur.
+    """
+    kode = 3
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        random.seed()  # state random induk ikut ter-fork
+        if batas_mem_mb:
+            import resource
+            b = int(batas_mem_mb * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (b, b))
+        if biaya and biaya["jalur"] == "lambat":
+            from biaya_dokumen import turunkan_prioritas
+            turunkan_prioritas()
+        waktu = {} if biaya else None
+        t0 = time.perf_counter()
+        jenis = "anjab"
+        try:
+            if req is None:
+                req = json.loads(_baca_baris(conn).decode("utf-8"))
+            jenis, data = ekstrak(req, waktu)
+            balasan = {"ok": True, "jenis": jenis, "data": data}
+        except MemoryError:
+            balasan = {"ok": False, "error": "Memori anak melebihi batas"}
+        except Exception as e:
+            balasan = {"ok": False, "error": str(e)}
+        _kirim(conn, balasan)
+        if biaya:
+            from biaya_dokumen import catat, path_db
+            catat(path_db(), biaya, jenis, "ok" if balasan["ok"] else "gagal", time.perf_counter() - t0, waktu)
+        kode = 0
+    except BaseException:
+        pass
+    finally:
+        try:
+            conn.close()
+        finally:
+            os._exit(kode)
+
+# -------------------- INDUK --------------------
+
+class Zigot:
+    def __init__(self, socket_path, maks=2, batas=120.0, batas_mem_mb=None, log=sys.stderr,
+                 maks_lambat=1, batas_lambat=None):
+        self.socket_path = socket_path
+        self.maks = max(1, maks)
+        self.batas = batas
+        self.batas_mem_mb = batas_mem_mb
+        self.log = log
+        self.maks_lambat = max(1, maks_lambat)
+        self.batas_lambat = batas_lambat or batas * 5
+        self.biaya_db = os.environ.get("ANJAB_BIAYA_DB") or None
+        self.anak = {}  # pid -> (conn, tenggat, info biaya | None)
+        self.antre_lambat = collections.deque()  # (conn, req, info) menunggu slot jalur lambat
+        self.berhenti = False
+        self.statistik = {"dilayani": 0, "gagal": 0, "dibunuh": 0, "lambat": 0}
+
+    def _buka_socket(self):
+        if os.path.exists(self.socket_path):
+            uji = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                uji.connect(self.socket_path)
+                raise RuntimeError(f"Server lain sudah aktif di {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)  # sisa server yang mati
+            finally:
+                uji.close()
+        srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        srv.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        srv.listen(128)
+        srv.setblocking(False)
+        return srv
+
+    @staticmethod
+    def _lambat(info):
+        return bool(info) and info["jalur"] == "lambat"
+
+    def _jumlah(self, lambat):
+        return sum(1 for _c, _t, info in self.anak.values() if self._lambat(info) == lambat)
+
+    def _fork(self, srv, conn, req=None, info=None):
+        lambat = self._lambat(info)
+        pid = os.fork()
+        if pid == 0:
+            srv.close()
+            layani_anak(conn, self.batas_mem_mb, req, info)
+        if info is not None:
+            info["mulai"] = time.monotonic()
+        self.anak[pid] = (conn, time.monotonic() + (self.batas_lambat if lambat else self.batas), info)
+        if lambat:
+            self.statistik["lambat"] += 1
+
+    def _terima(self, srv, conn):
+        """
+        Mode catatan biaya: baca permintaan di induk lalu tentukan jalur. Dokumen lambat
+        saat jalurnya penuh diantre di induk. Tanpa ANJAB_BIAYA_DB: langsung fork seperti biasa.
+        """
+        if not self.biaya_db:
+            self._fork(srv, conn)
+            return
+        try:
+            conn.settimeout(5.0)
+            req = json.loads(_baca_baris(conn).decode("utf-8"))
+            conn.settimeout(None)
+        except (OSError, ValueError) as e:
+            try:
+                _kirim(conn, {"ok": False, "error": f"Permintaan tidak valid: {e}"})
+            except OSError:
+                pass
+            conn.close()
+            return
+        info = None
+        if req.get("file") and os.path.isfile(req["file"]):
+            from biaya_dokumen import nilai_jalur
+            info = nilai_jalur(self.biaya_db, req["file"])
+            info["jenis"] = req.get("jenis") or "auto"
+        if self._lambat(info) and self._jumlah(True) >= self.maks_lambat:
+            if len(self.antre_lambat) >= MAKS_ANTRE_LAMBAT:
+                _kirim(conn, {"ok": False, "error": "Server sibuk (antrean jalur lambat penuh), coba lagi"})
+                conn.close()
+                return
+            self.antre_lambat.append((conn, req, info))
+            return
+        self._fork(srv, conn, req, info)
+
+    def _jalankan_antre(self, srv):
+        while self.antre_lambat and self._jumlah(True) < self.maks_lambat:
+            conn, req, info = self.antre_lambat.popleft()
+            self._fork(srv, conn, req, info)
+
+    def _tuai(self):
+        """Reap anak yang selesai; bunuh yang lewat tenggat. Induk membalas bila anak tidak sempat."""
+        sekarang = time.monotonic()
+        for pid, (_conn, tenggat, _info) in list(self.anak.items()):
+            if sekarang > tenggat:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        while self.anak:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            conn, tenggat, info = self.anak.pop(pid, (None, 0, None))
+            if conn is None:
+                continue
+            if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+                self.statistik["dilayani"] += 1
+            else:
+                if os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGKILL and time.monotonic() > tenggat:
+                    self.statistik["dibunuh"] += 1
+                    batas = self.batas_lambat if self._lambat(info) else self.batas
+                    pesan = f"Ekstraksi melebihi batas waktu {batas:g} detik"
+                    status_biaya = "dibunuh"
+                else:
+                    status_biaya = "gagal"
+                    self.statistik["gagal"] += 1
+                    pesan = (f"Proses ekstraksi berhenti oleh sinyal {os.WTERMSIG(status)}"
+                             if os.WIFSIGNALED(status) else
+                             f"Proses ekstraksi keluar dengan kode {os.WEXITSTATUS(status)}")
+                print(f"⚠️ pid {pid}: {pesan}", file=self.log)
+                try:
+                    _kirim(conn, {"ok": False, "error": pesan})
+                except OSError:
+                    pass
+                if info is not None:
+                    # anak tidak sempat mencatat sendiri: dokumen ini akan masuk jalur lambat berikutnya
+                    from biaya_dokumen import catat
+                    catat(self.biaya_db, info, info["jenis"], status_biaya, time.monotonic() - info["mulai"])
+            conn.close()
+
+    def _tenggat_terdekat(self):
+        if not self.anak:
+            return 1.0
+        return max(0.0, min(t for _c, t, _i in self.anak.values()) - time.monotonic())
+
+    def jalankan(self):
+        srv = self._buka_socket()
+        # SIGCHLD membangunkan selector lewat wakeup fd -> slot dibebaskan tanpa polling
+        r_bangun, w_bangun = socket.socketpair()
+        r_bangun.setblocking(False)
+        w_bangun.setblocking(False)
+        signal.set_wakeup_fd(w_bangun.fileno())
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        sel = selectors.DefaultSelector()
+        sel.register(r_bangun, selectors.EVENT_READ, "bangun")
+        terdaftar = False
+        print(f"🧬 Zigot siap di {self.socket_path} (pid {os.getpid()}, maks {self.maks} anak)", file=self.log)
+        try:
+            while not self.berhenti:
+                # slot penuh -> berhenti accept; koneksi menunggu di backlog kernel
+                # (jalur lambat punya jatah sendiri, tidak menghalangi accept)
+                penuh = self._jumlah(False) >= self.maks
+                if not penuh and not terdaftar:
+                    sel.register(srv, selectors.EVENT_READ, "srv")
+                    terdaftar = True
+                elif penuh and terdaftar:
+                    sel.unregister(srv)
+                    terdaftar = False
+                for kunci, _ev in sel.select(timeout=min(1.0, self._tenggat_terdekat() + 0.01)):
+                    if kunci.data == "bangun":
+                        try:
+                            while r_bangun.recv(512):
+                                pass
+                        except (BlockingIOError, InterruptedError):
+                            pass
+                    elif self._jumlah(False) < self.maks:
+                        try:
+                            conn, _addr = srv.accept()
+                        except (BlockingIOError, InterruptedError):
+                            continue
+                        conn.setblocking(True)
+                        try:
+                            self._terima(srv, conn)
+                        except OSError as e:
+                            if e.errno not in (errno.EAGAIN, errno.ENOMEM):
+                                raise
+                            print(f"⚠️ fork gagal: {e}", file=self.log)
+                            _kirim(conn, {"ok": False, "error": "Server sibuk, coba lagi"})
+                            conn.close()
+                self._tuai()
+                self._jalankan_antre(srv)
+            # berhenti: tidak menerima permintaan baru, tunggu anak yang berjalan (tetap dengan tenggat)
+            while self.antre_lambat:
+                conn, _req, _info = self.antre_lambat.popleft()
+                try:
+                    _kirim(conn, {"ok": False, "error": "Server berhenti, coba lagi"})
+                except OSError:
+                    pass
+                conn.close()
+            while self.anak:
+                self._tuai()
+                time.sleep(min(0.05, self._tenggat_terdekat() + 0.01))
+        finally:
+            signal.set_wakeup_fd(-1)
+            sel.close()
+            srv.close()
+            r_bangun.close()
+            w_bangun.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        return self.statistik
+
+# -------------------- KLIEN --------------------
+
+def kirim(file_path, socket_path=SOCKET_DEFAULT, jenis="auto", sebelumnya=None, batas=300.0):
+    """Kirim satu dokumen ke zigot; return dict balasan."""
+    req = {"file": os.path.abspath(file_path), "jenis": jenis}
+    if sebelumnya:
+        req["sebelumnya"] = os.path.abspath(sebelumnya)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(batas)
+        s.connect(socket_path)
+        _kirim(s, req)
+        baris = _baca_baris(s, batas=1 << 31)
+    if not baris:
+        raise RuntimeError("Koneksi ditutup tanpa balasan")
+    return json.loads(baris.decode("utf-8"))
+
+# -------------------- CLI --------------------
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Server zigot pre-fork untuk ekstraksi anjab/ABK terisolasi.")
+    sub = ap.add_subparsers(dest="perintah", required=True)
+    a = sub.add_parser("layani", help="jalankan server")
+    a.add_argument("--socket", default=SOCKET_DEFAULT, help="path unix socket")
+    a.add_argument("--maks", type=int, default=os.cpu_count() or 1, help="anak bersamaan maksimal")
+    a.add_argument("--batas", type=float, default=120.0, help="detik maksimal per dokumen sebelum SIGKILL")
+    a.add_argument("--batas-mem", type=float, default=None, help="batas memori (MB) per anak")
+    a.add_argument("--maks-lambat", type=int, default=1, help="anak jalur lambat bersamaan (ANJAB_BIAYA_DB)")
+    a.add_argument("--batas-lambat", type=float, default=None, help="detik maksimal jalur lambat (default 5x --batas)")
+    a.add_argument("--pemanasan", default=None, help="dokumen contoh untuk memanaskan jalur ekstraksi")
+    k = sub.add_parser("kirim", help="ekstrak satu dokumen lewat server")
+    k.add_argument("file")
+    k.add_argument("--socket", default=SOCKET_DEFAULT)
+    k.add_argument("--jenis", choices=("auto", "anjab", "abk"), default="auto")
+    k.add_argument("--sebelumnya", default=None, help="JSON ekstraksi sebelumnya (delta, anjab)")
+    k.add_argument("--batas", type=float, default=300.0)
+    args = ap.parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.perintah == "kirim":
+        try:
+            balasan = kirim(args.file, args.socket, args.jenis, args.sebelumnya, args.batas)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"❌ Error: {str(e)}", file=sys.stderr)
+            return 1
+        if not balasan.get("ok"):
+            print(f"❌ Error: {balasan.get('error')}", file=sys.stderr)
+            return 1
+        print(json.dumps(balasan["data"], ensure_ascii=False))
+        return 0
+
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        print("❌ Mode zigot butuh os.fork dan unix socket (POSIX)", file=sys.stderr)
+        return 1
+    panaskan(args.pemanasan)
+    zigot = Zigot(args.socket, args.maks, args.batas, args.batas_mem,
+                  maks_lambat=args.maks_lambat, batas_lambat=args.batas_lambat)
+
+    def _stop(_signum, _frame):
+        zigot.berhenti = True
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, _stop)
+    try:
+        statistik = zigot.jalankan()
+    except (OSError, RuntimeError) as e:
+        print(f"❌ Error: {str(e)}", file=sys.stderr)
+        return 1
+    print(json.dumps(statistik, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
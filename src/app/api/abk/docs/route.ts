@@ -32,6 +32,13 @@ function getPythonBin() {
     return process.env.PYTHON_BIN || "python3";
 }
 
+/** Direktori scratch bersama extractor (ANJAB_SCRATCH_DIR, mis. tmpfs); default sama dengan ruang_kerja.root_dir() */
+async function getScratchDir() {
+    const dir = process.env.ANJAB_SCRATCH_DIR || path.join(os.tmpdir(), "anjab-scratch");
+    await fs.mkdir(dir, {recursive: true});
+    return dir;
+}
+
 export async function POST(req: NextRequest) {
     try {
         const user = getUserFromReq(req);
@@ -80,7 +87,7 @@ export async function POST(req: NextRequest) {
         }
 
         const scriptPath = path.resolve(process.cwd(), "scripts", "ekstrakabk.py");
-        const sessionTmpDir = await fs.mkdtemp(path.join(os.tmpdir(), "anjab-abk-"));
+        const sessionTmpDir = await fs.mkdtemp(path.join(await getScratchDir(), "anjab-abk-"));
 
         try {
             // 1) Simpan file ke temp unik
@@ -28,6 +28,13 @@ function getPythonBin() {
     return process.env.PYTHON_BIN || "python";
 }
 
+/** Direktori scratch bersama extractor (ANJAB_SCRATCH_DIR, mis. tmpfs); default sama dengan ruang_kerja.root_dir() */
+async function getScratchDir() {
+    const dir = process.env.ANJAB_SCRATCH_DIR || path.join(os.tmpdir(), "anjab-scratch");
+    await fs.mkdir(dir, {recursive: true});
+    return dir;
+}
+
 /** =================== ROUTE =================== */
 export async function POST(req: NextRequest) {
     try {
@@ -77,7 +84,7 @@ export async function POST(req: NextRequest) {
 
         // Siapkan eksekusi extractor
         const scriptPath = path.resolve(process.cwd(), "scripts", "ekstrakanjab.py");
-        const sessionTmpDir = await fs.mkdtemp(path.join(os.tmpdir(), "anjab-"));
+        const sessionTmpDir = await fs.mkdtemp(path.join(await getScratchDir(), "anjab-"));
 
         try {
             const ext = path.extname(file.name) || ".doc";
@@ -91,11 +98,35 @@ export async function POST(req: NextRequest) {
             const buffer = Buffer.from(await file.arrayBuffer());
             await writeWithRetry(tempDocPath, buffer);
 
+            const pythonBin = getPythonBin();
+            const spawnEnv = buildSpawnEnv();
+
+            // Probe cepat (streaming, tanpa ekstraksi penuh): tolak jenis dokumen salah & duplikat lebih awal
+            const probe = await runProbe(pythonBin, scriptPath, tempDocPath, spawnEnv);
+            if (probe?.jenis === "abk") {
+                await safeUnlink(tempDocPath);
+                return NextResponse.json(
+                    {error: "Dokumen terdeteksi sebagai ABK, bukan Anjab"},
+                    {status: 422}
+                );
+            }
+            if (probe?.jenis === "anjab" && probe.nama_jabatan && probe.nama_jabatan !== "---") {
+                const dupProbe = await pool.query(
+                    'SELECT id FROM jabatan WHERE LOWER(TRIM(nama_jabatan)) = LOWER(TRIM($1)) LIMIT 1',
+                    [probe.nama_jabatan]
+                );
+                if (dupProbe.rows.length > 0) {
+                    await safeUnlink(tempDocPath);
+                    return NextResponse.json(
+                        {error: `Upload gagal, Anjab dengan nama "${probe.nama_jabatan}" sudah ada`},
+                        {status: 409}
+                    );
+                }
+            }
+
             // Jalankan python extractor
             let stdoutData = "";
             let stderrData = "";
-            const pythonBin = getPythonBin();
-            const spawnEnv = buildSpawnEnv();
 
             const exitCode: number = await new Promise((resolve, reject) => {
                 const child = spawn(pythonBin, [scriptPath, tempDocPath], {
@@ -512,6 +543,50 @@ export async function POST(req: NextRequest) {
 }
 
 /* ================= Helpers ================= */
+type ProbeResult = {
+    jenis: "anjab" | "abk" | "unknown";
+    nama_jabatan: string;
+    kode_jabatan: string;
+};
+
+/** Batas waktu probe (ms); probe yang macet tidak boleh menggantung request */
+const PROBE_TIMEOUT_MS = Number(process.env.ANJAB_PROBE_TIMEOUT_MS) || 5000;
+
+/** Jalankan `ekstrakanjab.py --probe`; null bila probe gagal / timeout (ekstraksi penuh tetap jalan) */
+async function runProbe(
+    pythonBin: string,
+    scriptPath: string,
+    docPath: string,
+    env: NodeJS.ProcessEnv
+): Promise<ProbeResult | null> {
+    return new Promise((resolve) => {
+        let out = "";
+        const child = spawn(pythonBin, [scriptPath, "--probe", docPath], {
+            windowsHide: true,
+            env,
+            stdio: ["ignore", "pipe", "ignore"],
+        });
+        const timer = setTimeout(() => {
+            child.kill("SIGKILL");
+            resolve(null);
+        }, PROBE_TIMEOUT_MS);
+        child.stdout.on("data", (d) => (out += d.toString()));
+        child.on("error", () => {
+            clearTimeout(timer);
+            resolve(null);
+        });
+        child.on("close", (code) => {
+            clearTimeout(timer);
+            if (code !== 0) return resolve(null);
+            try {
+                resolve(JSON.parse(out) as ProbeResult);
+            } catch {
+                resolve(null);
+            }
+        });
+    });
+}
+
 async function writeWithRetry(filePath: string, data: Buffer, maxTry = 3) {
     let attempt = 0;
     const sleep = (ms: number) => new Promise((r) => setTimeout(r, ms));